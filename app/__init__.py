@@ -13,8 +13,11 @@ from flask import Flask
 from sqlalchemy import event
 
 from app.models import db
-from app.rank import get_preferences
 from app.schema import ensure_schema
+from app.services.author_index import install_author_index_listeners
+from app.services.dashboard_cache import install_data_version_listeners
+from app.services.preferences import get_preferences
+from app.services.term_vectors import install_term_vector_listeners
 
 LOGGER = logging.getLogger(__name__)
 
@@ -146,6 +149,11 @@ def _validate_config(config: dict, *, config_path: Path | None = None) -> None:
         raise ValueError("'scraper.feed_urls' must be a list of non-empty strings")
     if feed_url and (not isinstance(feed_url, str) or not feed_url.strip()):
         raise ValueError("'scraper.feed_url' must be a non-empty string")
+    memory_budget_mb = scraper.get("memory_budget_mb")
+    if memory_budget_mb is not None and (
+        isinstance(memory_budget_mb, bool) or not isinstance(memory_budget_mb, int) or memory_budget_mb <= 0
+    ):
+        raise ValueError("'scraper.memory_budget_mb' must be a positive integer")
 
     ingest = config.get("ingest")
     if ingest is not None:
@@ -171,6 +179,10 @@ def _validate_config(config: dict, *, config_path: Path | None = None) -> None:
         if user_agent is not None and (not isinstance(user_agent, str) or not user_agent.strip()):
             raise ValueError("'ingest.user_agent' must be a non-empty string when provided")
 
+        async_http = ingest.get("async_http")
+        if async_http is not None and not isinstance(async_http, bool):
+            raise ValueError("'ingest.async_http' must be a boolean")
+
         rate_limit = ingest.get("rate_limit")
         if rate_limit is not None:
             if not isinstance(rate_limit, dict):
@@ -403,10 +415,13 @@ def create_app(config_overrides: dict | None = None) -> Flask:
     _validate_config(app.config["SCRAPER_CONFIG"], config_path=config_path)
 
     db.init_app(app)
+    install_data_version_listeners()
+    install_author_index_listeners()
+    install_term_vector_listeners()
     with app.app_context():
         _configure_sqlite_pragmas(db.engine)
         db.create_all()
-        ensure_schema()
+        ensure_schema(skip_if_current=True)
     _reclaim_orphaned_scrape_runs(app)
 
     _register_blueprints(app)
@@ -421,6 +436,15 @@ def create_app(config_overrides: dict | None = None) -> Flask:
 
     app.jinja_env.globals["ARXIV_CATEGORY_NAMES"] = ARXIV_CATEGORY_NAMES
 
+    from app.services.thumbnail_generator import VARIANT_WIDTHS, preview_formats
+
+    app.jinja_env.globals["PREVIEW_WIDTHS"] = VARIANT_WIDTHS
+    app.jinja_env.globals["preview_formats"] = preview_formats
+
+    from app.routes.dashboard import preview_version
+
+    app.jinja_env.globals["preview_version"] = preview_version
+
     def _safe_url_args(mapping: object) -> dict:
         """Drop werkzeug-reserved (``_``-prefixed) keys before splatting into ``url_for``.
 
@@ -7,27 +7,63 @@ import os
 import sys
 import tempfile
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from typing import cast
 
 from app import create_app
-from app.ingest.http_client import create_session
+from app.ingest.http_client import async_http_enabled, create_session
 from app.models import Paper, db
 from app.search_.text import now_utc
+from app.services.backfill_progress import BackfillTracker
+from app.services.ranking import resolve_ranking_preferences
 
 Emit = Callable[[str], None]
 
 DEFAULT_BATCH_SIZE = 50
 DEFAULT_DELAY_SECONDS = 1.0
 EMBEDDINGS_BATCH_SIZE = 64
+DEFAULT_WORKERS = 4
+
+# Remote host each network backfill talks to. Each gets its own rate-limit bucket
+# (``create_session(rate_limit_scope=...)``) and ``run_all_backfills`` never runs two
+# backfills against the same host at once; local steps share the "local" lane.
+BACKFILL_HOSTS = {
+    "abstracts": "local",
+    "embeddings": "local",
+    "citations": "api.semanticscholar.org",
+    "openalex": "api.openalex.org",
+    "comments": "export.arxiv.org",
+    "huggingface": "huggingface.co",
+    "github": "api.github.com",
+    "thumbnails": "arxiv.org",
+}
+
+# Ordering constraints for the concurrent ``all`` run: OpenAlex only fills citation
+# counts Semantic Scholar left empty; comments and Hugging Face discover the code links
+# the GitHub step looks up (mirrors the scrape pipeline's enrichment ordering); and the
+# abstract cleanup runs before anything that reads abstract text. Comments and Hugging
+# Face each rewrite ``resource_links`` from their own batch snapshot, so they run one
+# after the other or the later commit drops the links the earlier one added.
+BACKFILL_DEPENDENCIES = {
+    "embeddings": ("abstracts",),
+    "comments": ("abstracts",),
+    "huggingface": ("comments",),
+    "openalex": ("citations",),
+    "github": ("comments", "huggingface"),
+}
+
+# Backfills that recompute paper_score from their own batch snapshot. When they run
+# concurrently one may score a row before another's commit lands, so the ``all`` run
+# finishes with a single rescore pass if any of them changed something.
+_SCORE_WRITERS = ("citations", "openalex", "comments", "huggingface")
 
 
 def _positive_int(value: str) -> int:
     """argparse type for --batch-size: reject <= 0.
 
-    A non-positive batch size makes SQLite read ``LIMIT -1`` as unlimited while the
-    offset cursor never advances, so the offset-paginated backfill loops spin
-    forever. Fail fast at parse time instead.
+    A non-positive batch size makes SQLite read ``LIMIT -1`` as unlimited, so a
+    keyset loop would load the whole table in one batch. Fail fast at parse time.
     """
     ivalue = int(value)
     if ivalue < 1:
@@ -35,7 +71,7 @@ def _positive_int(value: str) -> int:
     return ivalue
 
 
-def _recompute_paper_score(paper: Paper, config: dict | None) -> float:
+def _recompute_paper_score(paper: Paper, preferences: Mapping[str, float]) -> float:
     from app.services.ranking import compute_paper_score
 
     paper.paper_score = compute_paper_score(
@@ -47,11 +83,20 @@ def _recompute_paper_score(paper: Paper, config: dict | None) -> float:
         citation_count=paper.citation_count,
         acceptance_status=paper.acceptance_status,
         interest_similarity=paper.interest_similarity,
-        config=config,
+        preferences=preferences,
     )
     return float(paper.paper_score or 0.0)
 
 
+def _bulk_session(app, name: str, *, pool_size: int = 1):
+    return create_session(
+        pool_size=pool_size,
+        scraper_config=app.config.get("SCRAPER_CONFIG"),
+        rate_limit_profile="bulk",
+        rate_limit_scope=BACKFILL_HOSTS[name],
+    )
+
+
 def _paper_index_paths(index_dir: Path) -> tuple[Path, Path]:
     return index_dir / "papers.index", index_dir / "id_map.json"
 
@@ -79,12 +124,13 @@ def rebuild_semantic_index(app, *, batch_size: int = EMBEDDINGS_BATCH_SIZE, emit
         service = EmbeddingService(Path(staging_dir))
 
         with app.app_context():
-            offset = 0
+            last_seen_id = 0
             while True:
-                papers = Paper.query.order_by(Paper.id).offset(offset).limit(batch_size).all()
+                papers = Paper.query.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
                     break
 
+                last_seen_id = papers[-1].id
                 batch_number += 1
                 paper_ids = [paper.id for paper in papers]
                 texts = [f"{paper.title} {paper.abstract_text or ''}" for paper in papers]
@@ -93,7 +139,6 @@ def rebuild_semantic_index(app, *, batch_size: int = EMBEDDINGS_BATCH_SIZE, emit
                 emit(
                     f"Index rebuild batch {batch_number}: indexed {added}/{len(papers)} papers (total {total_indexed})"
                 )
-                offset += batch_size
 
         service.save()
         staging_index_path, staging_id_map_path = _paper_index_paths(Path(staging_dir))
@@ -128,29 +173,26 @@ def backfill_citations(
     from app.enrich.citations import fetch_citations_batch
 
     total_updated = 0
-    last_seen_id = 0
-    session = create_session(pool_size=1, scraper_config=app.config.get("SCRAPER_CONFIG"), rate_limit_profile="bulk")
+    session = _bulk_session(app, "citations")
 
     try:
         with app.app_context():
             scraper_config = app.config.get("SCRAPER_CONFIG")
+            score_preferences = resolve_ranking_preferences(scraper_config)
+            candidates = Paper.query.filter(Paper.arxiv_id.is_not(None), Paper.citation_count.is_(None))
+            tracker = BackfillTracker.start("citations", candidates, emit=emit)
+            last_seen_id = tracker.cursor
             while True:
-                papers = (
-                    Paper.query.filter(
-                        Paper.id > last_seen_id,
-                        Paper.arxiv_id.is_not(None),
-                        Paper.citation_count.is_(None),
-                    )
-                    .order_by(Paper.id)
-                    .limit(batch_size)
-                    .all()
-                )
+                papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
+                    tracker.finish()
                     break
 
                 last_seen_id = papers[-1].id
                 arxiv_ids = [paper.arxiv_id for paper in papers if paper.arxiv_id]
-                citation_data = fetch_citations_batch(arxiv_ids, session=session)
+                citation_data = fetch_citations_batch(
+                    arxiv_ids, session=session, async_http=async_http_enabled(scraper_config)
+                )
                 updated_now = 0
                 timestamp = now_utc()
 
@@ -169,14 +211,14 @@ def backfill_citations(
                             "updated_at": timestamp.isoformat(),
                         }
                         paper.citation_updated_at = timestamp
-                        _recompute_paper_score(paper, scraper_config)
+                        _recompute_paper_score(paper, score_preferences)
                     updated_now += 1
 
-                db.session.commit()
+                tracker.checkpoint(last_seen_id, processed=len(papers))
                 total_updated += updated_now
                 emit(
                     f"Citations batch through paper {last_seen_id}: "
-                    f"updated {updated_now}/{len(papers)} papers (total {total_updated})"
+                    f"updated {updated_now}/{len(papers)} papers (total {total_updated}; {tracker.describe()})"
                 )
                 if delay_seconds > 0:
                     time.sleep(delay_seconds)
@@ -193,33 +235,32 @@ def backfill_openalex(
     delay_seconds: float = DEFAULT_DELAY_SECONDS,
     emit: Emit = print,
 ) -> int:
+    from app.enrich import PROVIDER_STATS
     from app.enrich.openalex import fetch_openalex_batch
+    from app.services.enrichment_providers.openalex_provider import OPENALEX_CONCURRENCY
 
     total_updated = 0
-    last_seen_id = 0
-    session = create_session(pool_size=1, scraper_config=app.config.get("SCRAPER_CONFIG"), rate_limit_profile="bulk")
+    session = _bulk_session(app, "openalex", pool_size=OPENALEX_CONCURRENCY)
     email = ((app.config.get("SCRAPER_CONFIG") or {}).get("openalex") or {}).get("email") or None
 
     try:
         with app.app_context():
             scraper_config = app.config.get("SCRAPER_CONFIG")
+            score_preferences = resolve_ranking_preferences(scraper_config)
+            candidates = Paper.query.filter(Paper.arxiv_id.is_not(None), Paper.openalex_id.is_(None))
+            tracker = BackfillTracker.start("openalex", candidates, emit=emit)
+            last_seen_id = tracker.cursor
             while True:
-                papers = (
-                    Paper.query.filter(
-                        Paper.id > last_seen_id,
-                        Paper.arxiv_id.is_not(None),
-                        Paper.openalex_id.is_(None),
-                    )
-                    .order_by(Paper.id)
-                    .limit(batch_size)
-                    .all()
-                )
+                papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
+                    tracker.finish()
                     break
 
                 last_seen_id = papers[-1].id
                 arxiv_ids = [paper.arxiv_id for paper in papers if paper.arxiv_id]
-                openalex_data = fetch_openalex_batch(arxiv_ids, session=session, email=email)
+                openalex_data = fetch_openalex_batch(
+                    arxiv_ids, session=session, email=email, async_http=async_http_enabled(scraper_config)
+                )
                 updated_now = 0
                 timestamp = now_utc()
 
@@ -241,14 +282,15 @@ def backfill_openalex(
                             "updated_at": timestamp.isoformat(),
                         }
                         paper.citation_updated_at = timestamp
-                        _recompute_paper_score(paper, scraper_config)
+                        _recompute_paper_score(paper, score_preferences)
                     updated_now += 1
 
-                db.session.commit()
+                tracker.checkpoint(last_seen_id, processed=len(papers))
                 total_updated += updated_now
                 emit(
                     f"OpenAlex batch through paper {last_seen_id}: "
-                    f"updated {updated_now}/{len(papers)} papers (total {total_updated})"
+                    f"updated {updated_now}/{len(papers)} papers (total {total_updated}; {tracker.describe()}) "
+                    f"[{PROVIDER_STATS.describe('openalex')}]"
                 )
                 if delay_seconds > 0:
                     time.sleep(delay_seconds)
@@ -270,24 +312,19 @@ def backfill_comments(
     from app.services.venues import parse_venue
 
     total_updated = 0
-    last_seen_id = 0
-    session = create_session(pool_size=1, scraper_config=app.config.get("SCRAPER_CONFIG"), rate_limit_profile="bulk")
+    session = _bulk_session(app, "comments")
 
     try:
         with app.app_context():
             scraper_config = app.config.get("SCRAPER_CONFIG")
+            score_preferences = resolve_ranking_preferences(scraper_config)
+            candidates = Paper.query.filter(Paper.arxiv_id.is_not(None), Paper.arxiv_comment.is_(None))
+            tracker = BackfillTracker.start("comments", candidates, emit=emit)
+            last_seen_id = tracker.cursor
             while True:
-                papers = (
-                    Paper.query.filter(
-                        Paper.id > last_seen_id,
-                        Paper.arxiv_id.is_not(None),
-                        Paper.arxiv_comment.is_(None),
-                    )
-                    .order_by(Paper.id)
-                    .limit(batch_size)
-                    .all()
-                )
+                papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
+                    tracker.finish()
                     break
 
                 last_seen_id = papers[-1].id
@@ -310,14 +347,14 @@ def backfill_comments(
 
                     new_links = extract_resource_links(paper.abstract_text, comment, data.get("doi", ""))
                     paper.resource_links = merge_resource_links(paper.resource_links_list, new_links)
-                    _recompute_paper_score(paper, scraper_config)
+                    _recompute_paper_score(paper, score_preferences)
                     updated_now += 1
 
-                db.session.commit()
+                tracker.checkpoint(last_seen_id, processed=len(papers))
                 total_updated += updated_now
                 emit(
                     f"Comments batch through paper {last_seen_id}: "
-                    f"updated {updated_now}/{len(papers)} papers (total {total_updated})"
+                    f"updated {updated_now}/{len(papers)} papers (total {total_updated}; {tracker.describe()})"
                 )
                 if delay_seconds > 0:
                     time.sleep(delay_seconds)
@@ -334,29 +371,28 @@ def backfill_github(
     delay_seconds: float = DEFAULT_DELAY_SECONDS,
     emit: Emit = print,
 ) -> int:
-    from app.enrich import GitHubProvider, extract_github_repo
+    from app.enrich import PROVIDER_STATS, GitHubProvider, extract_github_repo
+    from app.services.enrichment_providers.github import GITHUB_CONCURRENCY
 
     total_updated = 0
-    last_seen_id = 0
-    session = create_session(pool_size=1, scraper_config=app.config.get("SCRAPER_CONFIG"), rate_limit_profile="bulk")
+    session = _bulk_session(app, "github", pool_size=GITHUB_CONCURRENCY)
     github_config = (app.config.get("SCRAPER_CONFIG") or {}).get("github") or {}
     token = os.environ.get("GITHUB_TOKEN") or github_config.get("token") or None
+    async_http = async_http_enabled(app.config.get("SCRAPER_CONFIG"))
 
     try:
         with app.app_context():
+            candidates = Paper.query.filter(
+                Paper.arxiv_id.is_not(None),
+                Paper.github_repo.is_(None),
+                db.cast(Paper.resource_links, db.Text).like("%github.com%"),
+            )
+            tracker = BackfillTracker.start("github", candidates, emit=emit)
+            last_seen_id = tracker.cursor
             while True:
-                papers = (
-                    Paper.query.filter(
-                        Paper.id > last_seen_id,
-                        Paper.arxiv_id.is_not(None),
-                        Paper.github_repo.is_(None),
-                        db.cast(Paper.resource_links, db.Text).like("%github.com%"),
-                    )
-                    .order_by(Paper.id)
-                    .limit(batch_size)
-                    .all()
-                )
+                papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
+                    tracker.finish()
                     break
 
                 repos_by_arxiv_id: dict[str, str] = {}
@@ -365,7 +401,7 @@ def backfill_github(
                     if paper.arxiv_id and repo:
                         repos_by_arxiv_id[paper.arxiv_id] = repo
 
-                provider = GitHubProvider(token=token, max_fetches=batch_size)
+                provider = GitHubProvider(token=token, max_fetches=batch_size, async_http=async_http)
                 payloads = provider.fetch_batch(
                     list(repos_by_arxiv_id),
                     repos_by_arxiv_id=repos_by_arxiv_id,
@@ -392,9 +428,11 @@ def backfill_github(
                     break
 
                 last_seen_id = papers[-1].id
+                tracker.checkpoint(last_seen_id, processed=len(papers))
                 emit(
                     f"GitHub batch through paper {last_seen_id}: "
-                    f"updated {updated_now}/{len(papers)} papers (total {total_updated})"
+                    f"updated {updated_now}/{len(papers)} papers (total {total_updated}; {tracker.describe()}) "
+                    f"[{PROVIDER_STATS.describe('github')}]"
                 )
                 if delay_seconds > 0:
                     time.sleep(delay_seconds)
@@ -412,32 +450,28 @@ def backfill_huggingface(
     emit: Emit = print,
 ) -> int:
     """Fetch Hugging Face Papers buzz (upvotes/comments) and fill missing code/project links."""
-    from app.enrich import HuggingFaceProvider, extract_github_repo, huggingface_resource_links
+    from app.enrich import PROVIDER_STATS, HuggingFaceProvider, extract_github_repo, huggingface_resource_links
     from app.services.enrichment import merge_resource_links
+    from app.services.enrichment_providers.huggingface import HUGGINGFACE_CONCURRENCY
 
     total_updated = 0
-    last_seen_id = 0
-    session = create_session(pool_size=1, scraper_config=app.config.get("SCRAPER_CONFIG"), rate_limit_profile="bulk")
+    session = _bulk_session(app, "huggingface", pool_size=HUGGINGFACE_CONCURRENCY)
 
     try:
         with app.app_context():
             scraper_config = app.config.get("SCRAPER_CONFIG")
+            score_preferences = resolve_ranking_preferences(scraper_config)
+            candidates = Paper.query.filter(Paper.arxiv_id.is_not(None), Paper.hf_upvotes.is_(None))
+            tracker = BackfillTracker.start("huggingface", candidates, emit=emit)
+            last_seen_id = tracker.cursor
             while True:
-                papers = (
-                    Paper.query.filter(
-                        Paper.id > last_seen_id,
-                        Paper.arxiv_id.is_not(None),
-                        Paper.hf_upvotes.is_(None),
-                    )
-                    .order_by(Paper.id)
-                    .limit(batch_size)
-                    .all()
-                )
+                papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
+                    tracker.finish()
                     break
 
                 arxiv_ids = [paper.arxiv_id for paper in papers if paper.arxiv_id]
-                provider = HuggingFaceProvider(max_fetches=batch_size)
+                provider = HuggingFaceProvider(max_fetches=batch_size, async_http=async_http_enabled(scraper_config))
                 payloads = provider.fetch_batch(arxiv_ids, session=session)
                 updated_now = 0
 
@@ -456,7 +490,7 @@ def backfill_huggingface(
                         merged = merge_resource_links(paper.resource_links_list, hf_links)
                         if len(merged) != len(paper.resource_links_list):
                             paper.resource_links = merged
-                            _recompute_paper_score(paper, scraper_config)
+                            _recompute_paper_score(paper, score_preferences)
                         if not paper.github_repo:
                             paper.github_repo = extract_github_repo(hf_links)
                     updated_now += 1
@@ -472,9 +506,11 @@ def backfill_huggingface(
                     break
 
                 last_seen_id = papers[-1].id
+                tracker.checkpoint(last_seen_id, processed=len(papers))
                 emit(
                     f"Hugging Face batch through paper {last_seen_id}: "
-                    f"updated {updated_now}/{len(papers)} papers (total {total_updated})"
+                    f"updated {updated_now}/{len(papers)} papers (total {total_updated}; {tracker.describe()}) "
+                    f"[{PROVIDER_STATS.describe('huggingface')}]"
                 )
                 if delay_seconds > 0:
                     time.sleep(delay_seconds)
@@ -495,26 +531,20 @@ def backfill_thumbnails(
     from app.search_.thumbnail_generator import generate_thumbnail
 
     total_generated = 0
-    last_seen_id = 0
-    session = create_session(pool_size=1, scraper_config=app.config.get("SCRAPER_CONFIG"), rate_limit_profile="bulk")
+    session = _bulk_session(app, "thumbnails")
 
     try:
         with app.app_context():
             static_dir = Path(app.static_folder)
             thumbnails_dir = static_dir / "thumbnails"
 
+            candidates = Paper.query.filter(Paper.arxiv_id.is_not(None), Paper.pdf_link.is_not(None))
+            tracker = BackfillTracker.start("thumbnails", candidates, emit=emit)
+            last_seen_id = tracker.cursor
             while True:
-                papers = (
-                    Paper.query.filter(
-                        Paper.id > last_seen_id,
-                        Paper.arxiv_id.is_not(None),
-                        Paper.pdf_link.is_not(None),
-                    )
-                    .order_by(Paper.id)
-                    .limit(batch_size)
-                    .all()
-                )
+                papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
                 if not papers:
+                    tracker.finish()
                     break
 
                 last_seen_id = papers[-1].id
@@ -535,9 +565,11 @@ def backfill_thumbnails(
                     if delay_seconds > 0:
                         time.sleep(delay_seconds)
 
+                tracker.checkpoint(last_seen_id, processed=len(papers))
                 emit(
                     f"Thumbnail batch through paper {last_seen_id}: "
-                    f"generated {generated_now}/{len(papers)} thumbnails (total {total_generated})"
+                    f"generated {generated_now}/{len(papers)} thumbnails "
+                    f"(total {total_generated}; {tracker.describe()})"
                 )
     finally:
         session.close()
@@ -569,6 +601,7 @@ def backfill_insights(app, *, limit: int = 200, emit: Emit = print) -> int:
         )
         emit(f"Analyzing {len(papers)} papers (newest first, limit {limit})...")
         scraper_config = app.config.get("SCRAPER_CONFIG")
+        score_preferences = resolve_ranking_preferences(scraper_config)
 
         for index, paper in enumerate(papers, start=1):
             insights = llm_client.analyze_paper(
@@ -587,7 +620,7 @@ def backfill_insights(app, *, limit: int = 200, emit: Emit = print) -> int:
             paper.llm_insights = {
                 key: insights[key] for key in ("tasks", "datasets", "method_type", "backbone", "why_matched")
             }
-            _recompute_paper_score(paper, scraper_config)
+            _recompute_paper_score(paper, score_preferences)
             total_updated += 1
 
             if index % 25 == 0:
@@ -617,13 +650,16 @@ def backfill_abstracts(app, *, batch_size: int = 200, emit: Emit = print) -> int
 
     updated = 0
     with app.app_context():
-        total = Paper.query.count()
-        emit(f"Scanning {total} papers for abstract cleanup...")
-        offset = 0
+        candidates = Paper.query
+        tracker = BackfillTracker.start("abstracts", candidates, emit=emit)
+        emit(f"Scanning {tracker.total} papers for abstract cleanup...")
+        last_seen_id = tracker.cursor
         while True:
-            papers = Paper.query.order_by(Paper.id).offset(offset).limit(batch_size).all()
+            papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
             if not papers:
+                tracker.finish()
                 break
+            last_seen_id = papers[-1].id
             changed = 0
             for paper in papers:
                 original = paper.abstract_text or ""
@@ -631,34 +667,95 @@ def backfill_abstracts(app, *, batch_size: int = 200, emit: Emit = print) -> int
                 if cleaned != original:
                     paper.abstract_text = cleaned
                     changed += 1
-            if changed:
-                db.session.commit()
-                updated += changed
-            offset += batch_size
-            emit(f"  processed {min(offset, total)}/{total} (updated {updated})")
+            tracker.checkpoint(last_seen_id, processed=len(papers))
+            updated += changed
+            emit(f"  processed {tracker.describe()} (updated {updated})")
     emit(f"Abstract cleanup complete: {updated} papers updated")
     return updated
 
 
+def backfill_topic_tags(app, *, batch_size: int = 500, emit: Emit = print) -> int:
+    """Re-extract stored topic tags, e.g. after the topic hints or abstracts changed. Idempotent."""
+    from app.services.summary import extract_topic_tags
+
+    updated = 0
+    with app.app_context():
+        candidates = Paper.query
+        tracker = BackfillTracker.start("topics", candidates, emit=emit)
+        emit(f"Scanning {tracker.total} papers for topic tags...")
+        last_seen_id = tracker.cursor
+        while True:
+            papers = candidates.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
+            if not papers:
+                tracker.finish()
+                break
+            last_seen_id = papers[-1].id
+            changed = 0
+            for paper in papers:
+                tags = extract_topic_tags(paper.title or "", paper.abstract_text or "")
+                if tags != (paper.topic_tags or []):
+                    paper.topic_tags = tags
+                    changed += 1
+            tracker.checkpoint(last_seen_id, processed=len(papers))
+            updated += changed
+            emit(f"  processed {tracker.describe()} (updated {updated})")
+    emit(f"Topic tag backfill complete: {updated} papers updated")
+    return updated
+
+
 def run_all_backfills(
     app,
     *,
     batch_size: int = DEFAULT_BATCH_SIZE,
     delay_seconds: float = DEFAULT_DELAY_SECONDS,
+    workers: int = DEFAULT_WORKERS,
     emit: Emit = print,
 ) -> dict[str, int]:
-    results = {
-        "abstracts": backfill_abstracts(app, emit=emit),
-        "embeddings": run_embeddings_backfill(app, batch_size=EMBEDDINGS_BATCH_SIZE, emit=emit),
-        "citations": backfill_citations(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
-        "openalex": backfill_openalex(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
-        "comments": backfill_comments(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
-        # huggingface before github so HF-discovered repos get stars/license in the
-        # same run (mirrors the scrape pipeline's enrichment ordering).
-        "huggingface": backfill_huggingface(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
-        "github": backfill_github(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
-        "thumbnails": backfill_thumbnails(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
+    """Run every backfill, overlapping the ones that hit different hosts.
+
+    Each backfill is a stage in a :class:`StageGraph`: its pool is its host from
+    ``BACKFILL_HOSTS`` (capped at one running backfill per host) and
+    ``BACKFILL_DEPENDENCIES`` orders the few that build on each other. ``workers=1``
+    degenerates to the old back-to-back run. The first failure stops backfills that
+    haven't started; finished and interrupted ones keep their checkpoints.
+    """
+    from app.services.stage_graph import Stage, StageGraph
+
+    # Looked up at call time (not bound here) so the module-level functions stay patchable.
+    runners = {
+        "abstracts": lambda: backfill_abstracts(app, emit=emit),
+        "embeddings": lambda: run_embeddings_backfill(app, batch_size=EMBEDDINGS_BATCH_SIZE, emit=emit),
+        "citations": lambda: backfill_citations(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
+        "openalex": lambda: backfill_openalex(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
+        "comments": lambda: backfill_comments(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
+        "huggingface": lambda: backfill_huggingface(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
+        "github": lambda: backfill_github(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
+        "thumbnails": lambda: backfill_thumbnails(app, batch_size=batch_size, delay_seconds=delay_seconds, emit=emit),
     }
+
+    def stage_fn(name: str):
+        return lambda _ctx: {name: runners[name]()}
+
+    stages = [
+        Stage(
+            name, stage_fn(name), inputs=BACKFILL_DEPENDENCIES.get(name, ()), outputs=(name,), pool=BACKFILL_HOSTS[name]
+        )
+        for name in runners
+    ]
+    graph = StageGraph(
+        stages,
+        pool_limits=dict.fromkeys(BACKFILL_HOSTS.values(), 1),
+        max_workers=max(1, int(workers)),
+    )
+    artifacts, report = graph.run()
+    results = {name: cast("int | None", artifacts.get(name)) or 0 for name in runners}
+
+    if any(results[name] for name in _SCORE_WRITERS) and max(1, int(workers)) > 1:
+        from app.services.ranking import recompute_all_paper_scores
+
+        rescored = recompute_all_paper_scores(app)
+        emit(f"Rescored {rescored} papers after concurrent enrichment")
+
     emit(
         "All backfills complete: "
         f"abstracts={results['abstracts']}, "
@@ -670,6 +767,7 @@ def run_all_backfills(
         f"github={results['github']}, "
         f"thumbnails={results['thumbnails']}"
     )
+    emit(f"Backfill timings: {report.format()}")
     return results
 
 
@@ -683,6 +781,8 @@ def build_parser() -> argparse.ArgumentParser:
     index_rebuild.add_argument("--batch-size", type=_positive_int, default=EMBEDDINGS_BATCH_SIZE)
     abstracts = subparsers.add_parser("abstracts", help="Re-clean stored abstracts (strip arXiv RSS boilerplate)")
     abstracts.add_argument("--batch-size", type=_positive_int, default=200)
+    topics = subparsers.add_parser("topics", help="Re-extract stored topic tags from titles and abstracts")
+    topics.add_argument("--batch-size", type=_positive_int, default=500)
     subparsers.add_parser("interest", help="Recompute learned-interest similarities from feedback")
     insights = subparsers.add_parser("insights", help="Run structured LLM extraction for papers without insights")
     insights.add_argument("--limit", type=_positive_int, default=200, help="Max papers to analyze (one LLM call each)")
@@ -693,6 +793,13 @@ def build_parser() -> argparse.ArgumentParser:
         subparser.add_argument("--delay", type=float, default=DEFAULT_DELAY_SECONDS)
         if command == "thumbnails":
             subparser.add_argument("--teasers-only", action="store_true", help="Only generate missing teaser figures")
+        if command == "all":
+            subparser.add_argument(
+                "--workers",
+                type=_positive_int,
+                default=DEFAULT_WORKERS,
+                help="Backfills to run at once (never two against the same host)",
+            )
 
     return parser
 
@@ -709,6 +816,8 @@ def main(argv: list[str] | None = None) -> int:
             rebuild_semantic_index(app, batch_size=args.batch_size)
         elif args.command == "abstracts":
             backfill_abstracts(app, batch_size=args.batch_size)
+        elif args.command == "topics":
+            backfill_topic_tags(app, batch_size=args.batch_size)
         elif args.command == "citations":
             backfill_citations(app, batch_size=args.batch_size, delay_seconds=args.delay)
         elif args.command == "openalex":
@@ -728,7 +837,7 @@ def main(argv: list[str] | None = None) -> int:
                 app, batch_size=args.batch_size, delay_seconds=args.delay, teasers_only=args.teasers_only
             )
         else:
-            run_all_backfills(app, batch_size=args.batch_size, delay_seconds=args.delay)
+            run_all_backfills(app, batch_size=args.batch_size, delay_seconds=args.delay, workers=args.workers)
     except (RuntimeError, ValueError) as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 1
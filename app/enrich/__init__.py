@@ -2,6 +2,7 @@
 
 from app.services.citations import fetch_citations_batch
 from app.services.enrichment_providers import (
+    PROVIDER_STATS,
     EnrichmentProvider,
     GitHubProvider,
     HuggingFaceProvider,
@@ -16,6 +17,7 @@ from app.services.enrichment_providers import (
 from app.services.openalex import fetch_openalex_batch
 
 __all__ = [
+    "PROVIDER_STATS",
     "EnrichmentProvider",
     "GitHubProvider",
     "HuggingFaceProvider",
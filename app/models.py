@@ -13,6 +13,10 @@ from app.constants import INBOX_ANNOUNCEMENT_LAG_DAYS
 
 db = SQLAlchemy()
 
+# Expression behind the generated ``papers.rank_score`` column; 1.25 is
+# ranking.FEEDBACK_BOOST (tests pin the two together).
+RANK_SCORE_SQL = "ROUND(COALESCE(paper_score, 0) + COALESCE(feedback_score, 0) * 1.25, 3)"
+
 
 class JSONList(TypeDecorator):
     """Custom JSON list type since SQLite driver chokes on python lists via db.JSON directly."""
@@ -78,6 +82,8 @@ class Paper(db.Model):
         db.Index("idx_papers_scraped_at", "scraped_at"),
         db.Index("idx_papers_publication_dt", "publication_dt"),
         db.Index("idx_papers_rank", "paper_score", "feedback_score"),
+        db.Index("idx_papers_rank_score", "rank_score"),
+        db.Index("idx_papers_visible_rank", "is_hidden", "rank_score"),
         db.Index("idx_papers_hidden", "is_hidden"),
         db.Index("idx_papers_venue", "venue"),
     )
@@ -102,6 +108,11 @@ class Paper(db.Model):
     # Structured LLM extraction: tasks, datasets, method_type, backbone, why_matched.
     llm_insights = db.Column(JSONDict, nullable=False, default=dict)
     feedback_score = db.Column(db.Integer, nullable=False, default=0)
+    # Generated column (the SQL mirror of ranking.combined_rank_score): SQLite keeps it
+    # in step with every write, ORM or raw SQL, and idx_papers_rank_score /
+    # idx_papers_visible_rank let rank-ordered listings seek by (rank_score, id)
+    # instead of sorting every row.
+    rank_score = db.Column(db.Float, db.Computed(RANK_SCORE_SQL, persisted=False))
     is_hidden = db.Column(db.Boolean, nullable=False, default=False)
 
     reading_status = db.Column(db.String(16), nullable=True)
@@ -127,6 +138,10 @@ class Paper(db.Model):
     # Zotero item key of the created library item, so re-syncing skips already-synced
     # papers instead of duplicating them (mirrors mendeley_doc_id).
     zotero_item_key = db.Column(db.Text, nullable=True)
+    # Zotero's version of that item and a digest of the content last pushed, so a
+    # re-sync only sends papers whose metadata changed (as version-checked updates).
+    zotero_item_version = db.Column(db.Integer, nullable=True)
+    zotero_synced_hash = db.Column(db.Text, nullable=True)
 
     github_repo = db.Column(db.Text, nullable=True)
     github_stars = db.Column(db.Integer, nullable=True)
@@ -182,12 +197,6 @@ class Paper(db.Model):
     def resource_links_list(self) -> list[dict]:
         return self.resource_links or []
 
-    @property
-    def rank_score(self) -> float:
-        from app.services.ranking import combined_rank_score
-
-        return combined_rank_score(float(self.paper_score or 0.0), int(self.feedback_score or 0))
-
 
 def inbox_freshness_clause(cutoff_dt: datetime):
     """SQLAlchemy filter for papers that are "fresh" relative to ``cutoff_dt``.
@@ -217,6 +226,48 @@ def inbox_freshness_clause(cutoff_dt: datetime):
     )
 
 
+class Author(db.Model):
+    """A distinct name from ``papers.authors`` and how many papers carry it.
+
+    Kept in step with paper saves by :mod:`app.services.author_index`.
+    """
+
+    __tablename__ = "authors"
+    __table_args__ = (db.Index("idx_authors_name_folded", "name_folded"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.Text, nullable=False, unique=True)
+    name_folded = db.Column(db.Text, nullable=False)
+    paper_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class PaperTermVector(db.Model):
+    """A paper's bag of words as hashed token ids and counts (packed int arrays).
+
+    ``term_*`` covers title, summary, abstract and topic tags; ``title_*`` the title
+    alone (duplicate detection). Kept in step with paper saves by
+    :mod:`app.services.term_vectors`.
+    """
+
+    __tablename__ = "paper_term_vectors"
+
+    paper_id = db.Column(db.Integer, db.ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True)
+    term_hashes = db.Column(db.LargeBinary, nullable=False)
+    term_counts = db.Column(db.LargeBinary, nullable=False)
+    title_hashes = db.Column(db.LargeBinary, nullable=False)
+    title_counts = db.Column(db.LargeBinary, nullable=False)
+
+
+class TermDocumentFrequency(db.Model):
+    """How many papers' term vectors contain a hashed token (the IDF statistics)."""
+
+    __tablename__ = "term_document_frequency"
+
+    # SQLite INTEGER keys are 64-bit, so the signed token hash is the rowid.
+    term_hash = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    doc_count = db.Column(db.Integer, nullable=False, default=0)
+
+
 class Collection(db.Model):
     __tablename__ = "collections"
 
@@ -326,14 +377,38 @@ class EnrichmentCache(db.Model):
     paper = db.relationship("Paper")
 
     def is_fresh(self, *, reference_time=None) -> bool:
-        from datetime import timedelta
+        return _cache_is_fresh(self.fetched_at, self.ttl_hours, reference_time)
+
+
+class EnrichmentResourceCache(db.Model):
+    """Provider payload cached per upstream resource (e.g. a GitHub repo), not per paper.
+
+    Papers that point at the same resource share one row, and ``etag`` lets a stale
+    row be revalidated with a conditional request instead of refetched.
+    """
+
+    __tablename__ = "enrichment_resource_cache"
+    __table_args__ = (db.UniqueConstraint("source", "resource_key", name="uq_enrichment_resource_cache_key"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    source = db.Column(db.String(32), nullable=False)
+    resource_key = db.Column(db.String(255), nullable=False)
+    etag = db.Column(db.String(255), nullable=True)
+    data = db.Column(JSONDict, nullable=False, default=dict)
+    fetched_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
+    ttl_hours = db.Column(db.Integer, nullable=False, default=168)
+
+    def is_fresh(self, *, reference_time=None) -> bool:
+        return _cache_is_fresh(self.fetched_at, self.ttl_hours, reference_time)
+
 
-        from app.services.text import now_utc
+def _cache_is_fresh(fetched_at, ttl_hours: int, reference_time=None) -> bool:
+    from app.services.text import now_utc
 
-        if self.fetched_at is None or self.ttl_hours <= 0:
-            return False
-        reference = reference_time or now_utc()
-        return (reference - self.fetched_at) <= timedelta(hours=self.ttl_hours)
+    if fetched_at is None or ttl_hours <= 0:
+        return False
+    reference = reference_time or now_utc()
+    return (reference - fetched_at) <= timedelta(hours=ttl_hours)
 
 
 class PaperFeedback(db.Model):
@@ -412,4 +487,6 @@ class SyncState(db.Model):
     last_synced_paper_count = db.Column(db.Integer, nullable=False, default=0)
     last_cursor_page = db.Column(db.Integer, nullable=True)
     last_cursor_arxiv_id = db.Column(db.String(64), nullable=True)
+    # Keyset cursor (last fully processed Paper.id) for ``backfill:<name>`` rows.
+    last_cursor_paper_id = db.Column(db.Integer, nullable=True)
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now(), nullable=False)
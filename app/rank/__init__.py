@@ -37,6 +37,7 @@ from app.services.ranking import (
     compute_paper_score,
     explain_score,
     generate_ranking_explanation,
+    generate_ranking_explanations,
     recompute_all_paper_scores,
     resolve_ranking_preferences,
 )
@@ -66,6 +67,7 @@ __all__ = [
     "explain_score",
     "first_author_name",
     "generate_ranking_explanation",
+    "generate_ranking_explanations",
     "get_feedback_snapshot",
     "get_preferences",
     "recompute_all_paper_scores",
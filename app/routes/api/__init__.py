@@ -42,6 +42,8 @@ from app.routes.api import (  # noqa: E402
     backup,
     chat,
     collections,
+    dashboard,
+    enrichment,
     export,
     feed_sources,
     onboarding,
@@ -57,6 +59,8 @@ __all__ = [
     "backup",
     "chat",
     "collections",
+    "dashboard",
+    "enrichment",
     "export",
     "feed_sources",
     "onboarding",
@@ -1,22 +1,34 @@
 """Conversational RAG endpoint: chat over the reader's saved corpus."""
 
-from flask import jsonify, request
+import json
+from contextlib import closing
+
+from flask import Response, current_app, jsonify, request, stream_with_context
 
 from app.csrf import validate_csrf_token
 from app.routes.api import api_bp
 from app.services import rag
 
+_NO_SAVED_PAPERS_MESSAGE = "Save some papers first, then chat over your corpus."
+
+
+def _chat_query() -> str | None:
+    payload = request.get_json(silent=True) or {}
+    query = payload.get("query")
+    if not isinstance(query, str) or not query.strip():
+        return None
+    return query.strip()
+
 
 @api_bp.route("/corpus/chat", methods=["POST"])
 def corpus_chat():
     """Answer a question grounded in the reader's saved papers."""
     validate_csrf_token()
-    payload = request.get_json(silent=True) or {}
-    query = payload.get("query")
-    if not isinstance(query, str) or not query.strip():
+    query = _chat_query()
+    if query is None:
         return jsonify({"error": "Missing 'query'"}), 400
 
-    result = rag.answer_query(query.strip())
+    result = rag.answer_query(query)
 
     if result["no_saved_papers"]:
         # Not an error: the reader simply hasn't saved any papers yet.
@@ -27,8 +39,39 @@ def corpus_chat():
                 "llm_used": False,
                 "sources": [],
                 "no_saved_papers": True,
-                "message": "Save some papers first, then chat over your corpus.",
+                "message": _NO_SAVED_PAPERS_MESSAGE,
             }
         )
 
     return jsonify(result)
+
+
+@api_bp.route("/corpus/chat/stream", methods=["POST"])
+def corpus_chat_stream():
+    """Stream the answer as SSE: ``sources`` first, then ``token`` events, then ``done``.
+
+    POST (not EventSource) so the request carries the CSRF header and JSON body; the
+    client reads the body incrementally. When the client goes away the WSGI server
+    closes this generator, which closes the upstream LLM stream.
+    """
+    validate_csrf_token()
+    query = _chat_query()
+    if query is None:
+        return jsonify({"error": "Missing 'query'"}), 400
+    app = current_app._get_current_object()
+
+    def generate():
+        with closing(rag.stream_answer(query, app=app)) as events:
+            for event, data in events:
+                if event == "sources" and data["no_saved_papers"]:
+                    data = {**data, "message": _NO_SAVED_PAPERS_MESSAGE}
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,12 @@
+"""Dashboard page-cache statistics."""
+
+from flask import current_app, jsonify
+
+from app.routes.api import api_bp
+from app.services.dashboard_cache import DashboardCache
+
+
+@api_bp.route("/dashboard/cache-stats", methods=["GET"])
+def dashboard_cache_stats():
+    cache = current_app.extensions.setdefault("dashboard_cache", DashboardCache())
+    return jsonify(cache.stats())
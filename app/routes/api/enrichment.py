@@ -0,0 +1,11 @@
+"""Enrichment provider request/cache statistics."""
+
+from flask import jsonify
+
+from app.routes.api import api_bp
+from app.services.enrichment_providers import PROVIDER_STATS
+
+
+@api_bp.route("/enrichment/stats", methods=["GET"])
+def enrichment_stats():
+    return jsonify(PROVIDER_STATS.stats())
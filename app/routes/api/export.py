@@ -1,27 +1,27 @@
 """HTML report and BibTeX export endpoints."""
 
-from flask import Response, abort, current_app, jsonify, request
+from flask import Response, abort, current_app, jsonify, request, stream_with_context
 
 from app.enums import FeedbackAction
 from app.models import Paper, db, inbox_freshness_clause
 from app.routes.api import api_bp
-from app.services.bibtex import paper_to_bibtex, papers_to_bibtex
-from app.services.export import generate_html_report
+from app.services.bibtex import iter_bibtex, paper_to_bibtex
+from app.services.export import iter_ranked_papers, stream_html_report
 
 
 @api_bp.route("/export", methods=["GET"])
 def export_html():
     from app.routes.dashboard import TIMEFRAME_DAYS
 
-    app = current_app._get_current_object()
     # Normalize before use: an unvalidated timeframe flows into the
     # Content-Disposition header below, where a CRLF 500s the response and a quote
     # breaks out of the filename parameter.
     timeframe = request.args.get("timeframe", "daily")
     if timeframe not in TIMEFRAME_DAYS:
         timeframe = "daily"
-    html = generate_html_report(app, timeframe=timeframe)
-    response = current_app.response_class(html, mimetype="text/html")
+    # Streamed without a Content-Length, so the server sends it chunked; the
+    # context stays pushed while the generator reads batches and renders.
+    response = current_app.response_class(stream_with_context(stream_html_report(timeframe)), mimetype="text/html")
     if request.args.get("download") == "1":
         response.headers["Content-Disposition"] = f'attachment; filename="arxiv_report_{timeframe}.html"'
     return response
@@ -32,7 +32,6 @@ def export_bibtex():
     from datetime import timedelta
 
     from app.routes.dashboard import TIMEFRAME_DAYS
-    from app.services.ranking import rank_score_order_expr
     from app.services.text import now_utc
 
     view = request.args.get("view", "inbox")
@@ -59,10 +58,8 @@ def export_bibtex():
         cutoff = now_utc() - timedelta(days=days)
         query = query.filter(inbox_freshness_clause(cutoff))
 
-    papers = query.order_by(rank_score_order_expr().desc()).all()
-
-    bib = papers_to_bibtex(papers)
-    response = Response(bib, mimetype="application/x-bibtex")
+    bib = iter_bibtex(iter_ranked_papers(query))
+    response = Response(stream_with_context(bib), mimetype="application/x-bibtex")
     response.headers["Content-Disposition"] = f'attachment; filename="arxiv_papers_{timeframe}.bib"'
     return response
 
@@ -93,6 +90,9 @@ def bulk_bibtex():
         return jsonify({"error": f"Too many paper IDs (max {MAX_BULK_IDS})"}), 400
     if not paper_ids:
         return Response("", mimetype="application/x-bibtex")
-    papers = Paper.query.filter(Paper.id.in_(paper_ids)).all()
-    bib = papers_to_bibtex(papers)
-    return Response(bib, mimetype="application/x-bibtex")
+    # Loaded whole (at most MAX_BULK_IDS rows) before streaming: no cursor or SQLite
+    # read snapshot stays open while a slow client downloads, and a bad id (e.g. one
+    # overflowing SQLite's int64) still surfaces as a 400 here rather than breaking
+    # the stream mid-response.
+    papers = db.session.scalars(db.select(Paper).where(Paper.id.in_(paper_ids))).all()
+    return Response(stream_with_context(iter_bibtex(papers)), mimetype="application/x-bibtex")
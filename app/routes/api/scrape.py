@@ -50,8 +50,6 @@ def scrape_stream():
 def search_historical():
     from datetime import datetime
 
-    from app.services.scrape_engine import execute_historical_scrape
-
     validate_csrf_token()
     payload = request.get_json(silent=True) or {}
 
@@ -84,11 +82,24 @@ def search_historical():
         return jsonify({"error": "Dates must be in YYYY-MM-DD format"}), 400
 
     app = current_app._get_current_object()
-    try:
-        summary = execute_historical_scrape(app, categories, start_dt, end_dt)
-    except Exception:
-        current_app.logger.exception("Historical scrape failed")
-        return jsonify(
-            {"error": "Historical search failed. The arXiv API may be temporarily unavailable; please try again."}
-        ), 502
-    return jsonify(summary)
+    # The backfill runs on the job manager and saves each chunk as it goes; the page
+    # follows it over /api/scrape/stream?job_id=... and can cancel it part-way.
+    job, started = SCRAPE_JOB_MANAGER.start_historical(app, categories, start_dt, end_dt)
+    if not started:
+        return jsonify({"error": "A historical search is already running", "job_id": job.id}), 409
+    return jsonify(
+        {
+            "job_id": job.id,
+            "status": job.status,
+            "started_at": job.started_at.isoformat(),
+        }
+    ), 202
+
+
+@api_bp.route("/search/historical/<job_id>/cancel", methods=["POST"])
+def cancel_historical(job_id: str):
+    validate_csrf_token()
+    job = SCRAPE_JOB_MANAGER.cancel_historical(job_id)
+    if job is None:
+        return jsonify({"error": "Historical search not found"}), 404
+    return jsonify({"job_id": job.id, "status": job.status, "cancel_requested": True})
@@ -5,6 +5,7 @@ from flask import abort, current_app, jsonify, request
 from app.models import Collection, Paper, PaperCollection, db
 from app.routes.api import api_bp
 from app.routes.api._validation import parse_int_query_arg as _parse_int_query_arg
+from app.services.author_index import suggest_authors
 
 
 def _parse_bool_query_arg(name: str, *, default: bool) -> bool:
@@ -40,18 +41,23 @@ def search_papers():
         top_k = max(1, min(int(request.args.get("limit", 30)), 100))
     except (ValueError, TypeError):
         top_k = 30
+    try:
+        # Search-as-you-type: the last word is matched as a prefix.
+        prefix_kwargs = {"prefix": True} if _parse_bool_query_arg("prefix", default=False) else {}
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
 
     if not q:
         return jsonify({"query": "", "mode": mode, "results": []})
 
     if mode == "keyword":
-        raw = search_bm25(q, limit=top_k)
+        raw = search_bm25(q, limit=top_k, **prefix_kwargs)
         results = [{"paper_id": pid, "score": score} for pid, score in raw]
     elif mode == "semantic":
         raw = search_semantic(q, top_k=top_k)
         results = [{"paper_id": pid, "score": score} for pid, score in raw]
     else:
-        results = search_hybrid(q, top_k=top_k)
+        results = search_hybrid(q, top_k=top_k, **prefix_kwargs)
 
     # Enrich with paper data
     paper_ids = [r["paper_id"] for r in results]
@@ -162,50 +168,18 @@ def search_authors():
     if not q:
         return jsonify([])
 
-    # Extract unique author names matching the query.
-    escaped_q = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-    rows = db.session.query(Paper.authors).filter(Paper.authors.ilike(f"%{escaped_q}%", escape="\\")).limit(200).all()
-    seen: dict[str, int] = {}
-    for (authors_str,) in rows:
-        for author in (a.strip() for a in authors_str.split(",") if a.strip()):
-            if q.lower() in author.lower():
-                key = author.strip()
-                seen[key] = seen.get(key, 0) + 1
-
-    results = sorted(seen.items(), key=lambda x: (-x[1], x[0]))[:20]
-    return jsonify([{"name": name, "paper_count": count} for name, count in results])
+    return jsonify(suggest_authors(q))
 
 
 @api_bp.route("/papers/<int:paper_id>/graph", methods=["GET"])
 def paper_graph(paper_id: int):
-    from app.services.related import build_vector, cosine_similarity
+    from app.services.paper_graph import DEFAULT_GRAPH_NEIGHBOURS, MAX_GRAPH_HOPS, build_paper_graph
 
     paper = db.session.get(Paper, paper_id) or abort(404)
+    try:
+        k = _parse_int_query_arg("k", default=DEFAULT_GRAPH_NEIGHBOURS, minimum=1, maximum=50)
+        hops = _parse_int_query_arg("hops", default=1, minimum=1, maximum=MAX_GRAPH_HOPS)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
 
-    # Build graph from top-N similar papers.
-    pool = Paper.query.filter(Paper.id != paper_id).order_by(Paper.paper_score.desc()).limit(100).all()
-    center_text = " ".join([paper.title or "", paper.summary_text or "", paper.abstract_text or ""])
-    center_vec = build_vector(center_text)
-
-    nodes = [{"id": paper.id, "title": paper.title, "score": float(paper.paper_score or 0), "center": True}]
-    edges = []
-
-    for other in pool:
-        other_text = " ".join([other.title or "", other.summary_text or "", other.abstract_text or ""])
-        other_vec = build_vector(other_text)
-        sim = cosine_similarity(center_vec, other_vec)
-        if sim >= 0.15:
-            nodes.append(
-                {"id": other.id, "title": other.title, "score": float(other.paper_score or 0), "center": False}
-            )
-            edges.append({"source": paper.id, "target": other.id, "similarity": round(sim, 3)})
-
-    # Sort edges by similarity and keep top 20.
-    edges.sort(key=lambda e: e["similarity"], reverse=True)
-    edges = edges[:20]
-    connected_ids = {paper.id}
-    for e in edges:
-        connected_ids.add(e["target"])
-    nodes = [n for n in nodes if n["id"] in connected_ids]
-
-    return jsonify({"nodes": nodes, "edges": edges})
+    return jsonify(build_paper_graph(paper, k=k, hops=hops))
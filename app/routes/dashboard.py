@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import math
 import re
 import time
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
 
-from flask import Blueprint, current_app, render_template, request, send_file
+from flask import Blueprint, current_app, make_response, render_template, request, send_file, session
+from flask_sqlalchemy.pagination import Pagination
 from flask_sqlalchemy.query import Query
+from sqlalchemy.orm import defer, load_only
 
 from app.constants import ARXIV_CATEGORY_NAMES, DASHBOARD_PER_PAGE
 from app.csrf import get_or_create_csrf_token
@@ -21,18 +26,27 @@ from app.models import (
     db,
     inbox_freshness_clause,
 )
+from app.services.dashboard_cache import (
+    DashboardCache,
+    IdSetCache,
+    cache_key,
+    data_version,
+    preference_version,
+)
 from app.services.feedback import get_feedback_snapshot
 from app.services.preferences import first_author_name, get_preferences
 from app.services.ranking import (
     combined_rank_score,
     explain_score,
-    generate_ranking_explanation,
+    generate_ranking_explanations,
     get_active_ranking_config,
-    rank_score_order_expr,
+    resolve_ranking_preferences,
     top_score_contributors,
 )
-from app.services.related import build_vector, top_related_papers
+from app.services.related import top_related_papers
+from app.services.term_vectors import load_term_matrix
 from app.services.text import now_utc
+from app.services.thumbnail_generator import VARIANT_WIDTHS
 from app.services.thumbnail_warmer import THUMBNAIL_WARMER
 
 dashboard_bp = Blueprint("dashboard", __name__)
@@ -102,6 +116,104 @@ def _parse_page(raw_value: str | None) -> int:
         return 1
 
 
+def _parse_cursor(raw_value: str | None) -> tuple[float, int] | None:
+    """``"<rank_score>:<id>"`` as a tuple, or None for a missing or garbled cursor."""
+    score, sep, paper_id = (raw_value or "").partition(":")
+    if not sep:
+        return None
+    try:
+        cursor = (float(score), int(paper_id))
+    except ValueError:
+        return None
+    return cursor if math.isfinite(cursor[0]) else None
+
+
+def _format_cursor(paper: Paper) -> str:
+    # repr() round-trips the float exactly, so the seek resumes on the same row.
+    return f"{float(paper.rank_score or 0.0)!r}:{paper.id}"
+
+
+@dataclass
+class KeysetPagination:
+    """One page of the rank-ordered feed, fetched by seeking past a ``(rank_score, id)``
+    cursor instead of OFFSET, so a deep page costs what page 1 does. Exposes the
+    attributes ``dashboard.html`` reads from Flask-SQLAlchemy's pagination."""
+
+    items: list[Paper]
+    page: int
+    per_page: int
+    total: int
+    prev_cursor: str | None
+    next_cursor: str | None
+
+    @property
+    def pages(self) -> int:
+        return math.ceil(self.total / self.per_page)
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _keyset_paginate(
+    query: Query,
+    *,
+    page: int,
+    after: tuple[float, int] | None,
+    before: tuple[float, int] | None,
+    per_page: int,
+) -> KeysetPagination:
+    total = query.order_by(None).count()
+    key = db.tuple_(Paper.rank_score, Paper.id)
+    if before is not None:
+        # Seek backwards from the cursor, then flip the rows back into feed order.
+        rows = query.filter(key > before).order_by(Paper.rank_score, Paper.id).limit(per_page + 1).all()
+        items = rows[:per_page][::-1]
+        more_before, more_after = len(rows) > per_page, True
+    else:
+        query = query.order_by(Paper.rank_score.desc(), Paper.id.desc())
+        if after is not None:
+            query = query.filter(key < after)
+        elif page > 1:
+            # A bare ``?page=N`` (an old bookmark) has no cursor: OFFSET this once;
+            # the links it renders carry cursors again.
+            query = query.offset((page - 1) * per_page)
+        rows = query.limit(per_page + 1).all()
+        items = rows[:per_page]
+        more_before, more_after = after is not None or page > 1, len(rows) > per_page
+    # With a cursor, ``page`` only labels the position; the cursor decides the rows.
+    page = max(page, 2) if more_before and items else 1
+    return KeysetPagination(
+        items=items,
+        page=page,
+        per_page=per_page,
+        total=total,
+        prev_cursor=_format_cursor(items[0]) if more_before and items else None,
+        next_cursor=_format_cursor(items[-1]) if more_after and items else None,
+    )
+
+
+def _page_link_args(pagination) -> dict[str, dict | None]:
+    """Query-arg overrides for the Previous/Next links (None when disabled)."""
+    if isinstance(pagination, KeysetPagination):
+        return {
+            "prev": {"page": pagination.page - 1, "before": pagination.prev_cursor, "after": None}
+            if pagination.has_prev
+            else None,
+            "next": {"page": pagination.page + 1, "after": pagination.next_cursor, "before": None}
+            if pagination.has_next
+            else None,
+        }
+    return {
+        "prev": {"page": pagination.prev_num} if pagination.has_prev else None,
+        "next": {"page": pagination.next_num} if pagination.has_next else None,
+    }
+
+
 _STORAGE_KEY_RE = re.compile(r"^[A-Za-z0-9._\-]+(?:/[A-Za-z0-9._\-]+)?$")
 
 
@@ -191,6 +303,68 @@ def _apply_dataset_filter(query: Query, dataset: str | None) -> Query:
     return query.filter(db.cast(Paper.llm_insights, db.Text).ilike(escaped, escape="\\"))
 
 
+def _apply_facet_filters(query: Query, *, category: str, venue: str, dataset: str, resource_filter: str) -> Query:
+    query = _apply_category_filter(query, category or None)
+    query = _apply_venue_filter(query, venue or None)
+    query = _apply_dataset_filter(query, dataset or None)
+    return _apply_resource_filter(query, resource_filter)
+
+
+def _apply_reading_status_filter(query: Query, reading_status: str) -> Query:
+    if not reading_status:
+        return query
+    if reading_status == "unread":
+        return query.filter(Paper.reading_status.is_(None))
+    return query.filter(Paper.reading_status == reading_status)
+
+
+def _apply_author_filter(query: Query, author: str) -> Query:
+    if not author:
+        return query
+    escaped = f"%{_escape_like_term(author)}%"
+    return query.filter(Paper.authors.ilike(escaped, escape="\\"))
+
+
+# Request args that decide which papers a dashboard search may return, before and
+# after the facets (category, venue, dataset, resources). The page searches the
+# faceted set; the facet counts come from a search of the unfaceted one.
+_ELIGIBILITY_ARGS = (
+    "view",
+    "collection",
+    "include_hidden",
+    "timeframe",
+    "match_type",
+    "reading_status",
+    "author",
+)
+_FACET_ARGS = ("category", "venue", "dataset", "resource_filter")
+
+
+def _eligible_paper_ids(query: Query, config: dict, args: tuple[str, ...]) -> frozenset[int]:
+    """Ids of the papers ``query`` admits, for pushdown into search.
+
+    ``args`` names the request args that shaped ``query``. Cached per their values,
+    preferences and data version, so paging through (or re-sorting) a filtered
+    search reads the id set once.
+    """
+    cache = current_app.extensions.setdefault("dashboard_id_sets", IdSetCache())
+    key = cache_key(
+        "eligible-ids",
+        [(name, request.args.get(name, "")) for name in args],
+        preference_version(config),
+        data_version(),
+    )
+    return cache.get_or_load(key, lambda: (pid for (pid,) in query.order_by(None).with_entities(Paper.id)))
+
+
+def _search_paper_ids(q: str, search_mode: str, paper_ids: frozenset[int]) -> list[int]:
+    from app.services.search import search_hybrid, search_semantic
+
+    if search_mode == "semantic":
+        return [pid for pid, _ in search_semantic(q, top_k=100, paper_ids=paper_ids)]
+    return [r["paper_id"] for r in search_hybrid(q, top_k=100, early_termination=True, paper_ids=paper_ids)]
+
+
 def _build_filter_options(query: Query) -> dict:
     base = query.order_by(None)
 
@@ -307,24 +481,13 @@ def _enrich_cards_with_feedback_and_related(papers: list[Paper], candidate_pool:
     followed_authors = set(config.get("whitelists", {}).get("authors", []))
     muted_topics = set(preferences["muted"]["topics"])
 
-    vectors_by_id = {
-        paper.id: build_vector(
-            " ".join(
-                [
-                    paper.title or "",
-                    paper.summary_text or "",
-                    paper.abstract_text or "",
-                    " ".join(paper.topic_tags or []),
-                ]
-            )
-        )
-        for paper in candidate_pool
-    }
+    term_matrix = load_term_matrix([paper.id for paper in candidate_pool])
     candidate_by_id = {paper.id: paper for paper in candidate_pool}
 
-    # Resolve the active RankingConfig once for the whole page instead of issuing a
-    # fresh query + DEFAULT_PREFERENCES deepcopy inside explain_score for every row.
+    # Resolve the weights (incl. the active RankingConfig) once for the whole page
+    # instead of issuing a fresh RankingConfig query inside explain_score per row.
     active_ranking_config = get_active_ranking_config()
+    ranking_preferences = resolve_ranking_preferences(config, ranking_config=active_ranking_config)
 
     for paper in papers:
         feedback = feedback_snapshot.get(
@@ -344,8 +507,7 @@ def _enrich_cards_with_feedback_and_related(papers: list[Paper], candidate_pool:
             acceptance_status=paper.acceptance_status,
             interest_similarity=paper.interest_similarity,
             feedback_score=int(paper.feedback_score or 0),
-            config=config,
-            ranking_config=active_ranking_config,
+            preferences=ranking_preferences,
         )
         # Reconcile the bars to the stored paper_score the headline shows (and the
         # feed sorts by), so they agree even if ranking weights changed since the
@@ -364,17 +526,94 @@ def _enrich_cards_with_feedback_and_related(papers: list[Paper], candidate_pool:
             "available": bool(primary_topic) and primary_topic not in muted_topics,
         }
 
-        related_ids = top_related_papers(paper.id, vectors_by_id, top_k=3)
+        related_ids = top_related_papers(paper.id, term_matrix, top_k=3)
         paper.related_papers = [
             candidate_by_id[related_id] for related_id in related_ids if related_id in candidate_by_id
         ]
 
-        paper.ranking_explanations = generate_ranking_explanation(paper, config=config)
+    explanations = generate_ranking_explanations(
+        papers,
+        config=config,
+        breakdowns=[paper.score_breakdown for paper in papers],
+        ranking_config=active_ranking_config,
+    )
+    for paper, paper_explanations in zip(papers, explanations):
+        paper.ranking_explanations = paper_explanations
+
+
+# Columns no feed card or score explanation reads. Deferred so the page query neither
+# ships nor JSON-decodes them; raiseload turns an accidental read (a lazy load per
+# card) into an error instead of a silent N+1.
+_CARD_DEFERRED_COLUMNS = (
+    Paper.openalex_topics,
+    Paper.recommendation_score,
+    Paper.influential_citation_count,
+    Paper.oa_status,
+    Paper.referenced_works_count,
+    Paper.zotero_item_key,
+    Paper.zotero_item_version,
+    Paper.zotero_synced_hash,
+    Paper.source_feed_id,
+    Paper.created_at,
+)
+# The related-papers candidate pool only feeds the text vectors and renders title/link.
+# Related cards only render these; similarity reads the stored term vectors.
+_CANDIDATE_POOL_COLUMNS = (
+    Paper.title,
+    Paper.link,
+)
+
+# Stands in for the per-session CSRF token inside cached pages (see index()).
+_CSRF_PLACEHOLDER = "__dashboard_csrf_token__"
 
 
 @dashboard_bp.route("/")
 def index():
+    """Serve the dashboard from the page cache, or ``304`` when the client is current.
+
+    The ETag is derived from the cache key (request args + data/preference versions)
+    and the session's CSRF token, so revalidation needs no rendering at all.
+    """
     config = current_app.config["SCRAPER_CONFIG"]
+    csrf_token = get_or_create_csrf_token()
+    cache = current_app.extensions.setdefault("dashboard_cache", DashboardCache())
+    mendeley_connected = _mendeley_connected()
+    if "_flashes" in session:
+        # Flashed messages are per-session and consumed by this render: never cache it.
+        cache.record_bypass()
+        return _render_dashboard(config, csrf_token=csrf_token, mendeley_connected=mendeley_connected)
+
+    key = cache_key(
+        sorted(request.args.items(multi=True)),
+        preference_version(config),
+        data_version(),
+        mendeley_connected,
+    )
+    etag = hashlib.blake2b(f"{key}:{csrf_token}".encode(), digest_size=16).hexdigest()
+    if request.if_none_match.contains(etag):
+        cache.record_not_modified(key)
+        response = current_app.response_class(status=304)
+        state = "not-modified"
+    else:
+        entry = cache.get(key)
+        started = time.perf_counter()
+        if entry is None:
+            html = _render_dashboard(config, csrf_token=_CSRF_PLACEHOLDER, mendeley_connected=mendeley_connected)
+            cache.put(key, html, time.perf_counter() - started)
+            state = "miss"
+        else:
+            html = entry.html
+            state = "hit"
+        response = make_response(html.replace(_CSRF_PLACEHOLDER, csrf_token, 1))
+        response.headers["Server-Timing"] = f'dashboard;desc="{state}";dur={(time.perf_counter() - started) * 1000:.1f}'
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.headers["X-Dashboard-Cache"] = state
+    return response
+
+
+def _render_dashboard(config: dict, *, csrf_token: str, mendeley_connected: bool) -> str:
     view = request.args.get("view", "inbox")
     if view not in VIEW_OPTIONS:
         view = "inbox"
@@ -408,54 +647,11 @@ def index():
     if match_type:
         query = query.filter(Paper.match_type == match_type)
 
-    q = request.args.get("q", "").strip()
-    search_mode = request.args.get("search_mode", "hybrid").strip()
-    hybrid_search_used = False
-    if q:
-        # Try hybrid/semantic search when available
-        if search_mode in ("hybrid", "semantic"):
-            try:
-                from app.services.search import search_hybrid, search_semantic
-
-                if search_mode == "semantic":
-                    raw = search_semantic(q, top_k=100)
-                    hybrid_ids = [pid for pid, _ in raw]
-                else:
-                    hybrid_results = search_hybrid(q, top_k=100)
-                    hybrid_ids = [r["paper_id"] for r in hybrid_results]
-
-                if hybrid_ids:
-                    query = query.filter(Paper.id.in_(hybrid_ids))
-                    hybrid_search_used = True
-            except Exception:
-                pass
-
-        if not hybrid_search_used:
-            escaped_q = _escape_like_term(q)
-            search = f"%{escaped_q}%"
-            query = query.filter(
-                db.or_(
-                    Paper.title.ilike(search, escape="\\"),
-                    Paper.authors.ilike(search, escape="\\"),
-                    Paper.abstract_text.ilike(search, escape="\\"),
-                    db.cast(Paper.matched_terms, db.Text).ilike(search, escape="\\"),
-                    Paper.summary_text.ilike(search, escape="\\"),
-                    db.cast(Paper.topic_tags, db.Text).ilike(search, escape="\\"),
-                    db.cast(Paper.user_tags, db.Text).ilike(search, escape="\\"),
-                )
-            )
-
     reading_status = request.args.get("reading_status", "").strip()
-    if reading_status:
-        if reading_status == "unread":
-            query = query.filter(Paper.reading_status.is_(None))
-        else:
-            query = query.filter(Paper.reading_status == reading_status)
+    query = _apply_reading_status_filter(query, reading_status)
 
     author_filter = request.args.get("author", "").strip()
-    if author_filter:
-        escaped_author = f"%{_escape_like_term(author_filter)}%"
-        query = query.filter(Paper.authors.ilike(escaped_author, escape="\\"))
+    query = _apply_author_filter(query, author_filter)
 
     density = request.args.get("density", "list").strip()
     if density == "comfortable":  # legacy alias (saved searches may persist it)
@@ -470,11 +666,51 @@ def index():
     if resource_filter not in RESOURCE_FILTER_OPTIONS:
         resource_filter = "all"
 
-    filter_options = _build_filter_options(query)
-    query = _apply_category_filter(query, category or None)
-    query = _apply_venue_filter(query, venue or None)
-    query = _apply_dataset_filter(query, dataset or None)
-    query = _apply_resource_filter(query, resource_filter)
+    facets = {"category": category, "venue": venue, "dataset": dataset, "resource_filter": resource_filter}
+    facets_active = bool(category or venue or dataset) or resource_filter != "all"
+    # Facet counts cover the search hits before any facet is applied, so every
+    # option shows what picking it would yield.
+    unfaceted_query = query
+    query = _apply_facet_filters(query, **facets)
+
+    q = request.args.get("q", "").strip()
+    search_mode = request.args.get("search_mode", "hybrid").strip()
+    hybrid_search_used = False
+    if q:
+        # Try hybrid/semantic search when available
+        if search_mode in ("hybrid", "semantic"):
+            try:
+                unfaceted_ids = _eligible_paper_ids(unfaceted_query, config, _ELIGIBILITY_ARGS)
+                count_hits = _search_paper_ids(q, search_mode, unfaceted_ids)
+                if count_hits:
+                    page_hits = count_hits
+                    if facets_active:
+                        # A separate top-k over the faceted set, so a facet narrows the
+                        # candidates instead of filtering the unfaceted top-k.
+                        faceted_ids = _eligible_paper_ids(query, config, _ELIGIBILITY_ARGS + _FACET_ARGS)
+                        page_hits = _search_paper_ids(q, search_mode, faceted_ids)
+                    unfaceted_query = unfaceted_query.filter(Paper.id.in_(count_hits))
+                    query = query.filter(Paper.id.in_(page_hits))
+                    hybrid_search_used = True
+            except Exception:
+                pass
+
+        if not hybrid_search_used:
+            escaped_q = _escape_like_term(q)
+            search = f"%{escaped_q}%"
+            text_match = db.or_(
+                Paper.title.ilike(search, escape="\\"),
+                Paper.authors.ilike(search, escape="\\"),
+                Paper.abstract_text.ilike(search, escape="\\"),
+                db.cast(Paper.matched_terms, db.Text).ilike(search, escape="\\"),
+                Paper.summary_text.ilike(search, escape="\\"),
+                db.cast(Paper.topic_tags, db.Text).ilike(search, escape="\\"),
+                db.cast(Paper.user_tags, db.Text).ilike(search, escape="\\"),
+            )
+            unfaceted_query = unfaceted_query.filter(text_match)
+            query = query.filter(text_match)
+
+    filter_options = _build_filter_options(unfaceted_query)
 
     default_sort = "saved" if view == "saved" else "trending"
     sort = request.args.get("sort", default_sort)
@@ -490,6 +726,7 @@ def index():
     if sort == "saved" and collection_id:
         sort = "newest"
 
+    rank_ordered = False
     if sort == "saved" and view == "saved":
         query = query.order_by(
             PaperFeedback.created_at.desc(),
@@ -511,14 +748,22 @@ def index():
             Paper.scraped_at.desc(),
         )
     else:
-        query = query.order_by(
-            rank_score_order_expr().desc(),
-            Paper.publication_dt.desc(),
-            Paper.scraped_at.desc(),
-        )
+        # Rank order: paged by a (rank_score, id) cursor over idx_papers_rank_score.
+        rank_ordered = True
 
     page = _parse_page(request.args.get("page"))
-    pagination = query.paginate(page=page, per_page=DASHBOARD_PER_PAGE, error_out=False)
+    page_query = query.options(*(defer(column, raiseload=True) for column in _CARD_DEFERRED_COLUMNS))
+    pagination: Pagination | KeysetPagination
+    if rank_ordered:
+        pagination = _keyset_paginate(
+            page_query,
+            page=page,
+            after=_parse_cursor(request.args.get("after")),
+            before=_parse_cursor(request.args.get("before")),
+            per_page=DASHBOARD_PER_PAGE,
+        )
+    else:
+        pagination = page_query.paginate(page=page, per_page=DASHBOARD_PER_PAGE, error_out=False)
     papers = pagination.items
 
     type_counts_row = (
@@ -539,16 +784,17 @@ def index():
     candidate_pool = (
         query.order_by(None)
         .order_by(Paper.paper_score.desc(), Paper.publication_dt.desc(), Paper.scraped_at.desc())
+        .options(load_only(*_CANDIDATE_POOL_COLUMNS, raiseload=True))
         .limit(250)
         .all()
     )
     _enrich_cards_with_feedback_and_related(papers, candidate_pool, config)
-    mendeley_connected = _mendeley_connected()
 
     return render_template(
         "dashboard.html",
         papers=papers,
         pagination=pagination,
+        page_links=_page_link_args(pagination),
         type_counts=type_counts,
         current_filters={
             "view": view,
@@ -570,11 +816,17 @@ def index():
         filter_options=filter_options,
         dashboard_overview=_build_dashboard_overview(config),
         mendeley_connected=mendeley_connected,
-        csrf_token=get_or_create_csrf_token(),
+        csrf_token=csrf_token,
         preferences=get_preferences(config),
     )
 
 
+# Browser cache lifetimes for served previews (see _send_preview).
+_VERSIONED_PREVIEW_MAX_AGE = 31536000
+_PREVIEW_MAX_AGE = 86400
+_FALLBACK_PREVIEW_MAX_AGE = 3600
+
+
 def _missing_thumbnail_response():
     # Don't generate inline — a PDF download + subprocess render can hold a worker
     # thread for minutes and freeze the UI. The <img onerror> handler shows a
@@ -587,59 +839,131 @@ def _static_root() -> Path:
     return Path(current_app.static_folder or Path(__file__).resolve().parent.parent / "static")
 
 
-def _resolved_thumbnail_path(storage_key: str, static_root: Path, *, suffix: str = "") -> Path | None:
-    """Resolve the on-disk PNG for a thumbnail/teaser and enforce the traversal
-    guard, returning None if the resolved path escapes static/thumbnails."""
+def _resolved_thumbnail_path(storage_key: str, static_root: Path, *, suffix: str = "", ext: str = "png") -> Path | None:
+    """Resolve the on-disk file for a thumbnail/teaser (or one of their variants) and
+    enforce the traversal guard, returning None if the path escapes static/thumbnails."""
     thumbnail_root = (static_root / "thumbnails").resolve()
-    resolved = (thumbnail_root / f"{storage_key}{suffix}.png").resolve()
+    resolved = (thumbnail_root / f"{storage_key}{suffix}.{ext}").resolve()
     if not resolved.is_relative_to(thumbnail_root):
         return None
     return resolved
 
 
-@dashboard_bp.route("/papers/<int:paper_id>/thumbnail.png")
-def paper_thumbnail(paper_id: int):
-    paper = Paper.query.get_or_404(paper_id)
+def _preview_version(storage_key: str, static_root: Path, suffix: str) -> str | None:
+    """Version token for a preview: the mtime of its source PNG (``<key><suffix>.png``).
+
+    A render writes every srcset variant before swapping the PNG in (see
+    ``thumbnail_generator._write_missing_renders``), so once the PNG's mtime moves
+    the variants already hold the new render and one token covers them all.
+    """
+    path = _resolved_thumbnail_path(storage_key, static_root, suffix=suffix)
+    if path is None:
+        return None
+    try:
+        return format(path.stat().st_mtime_ns, "x")
+    except OSError:
+        return None
+
+
+def preview_version(paper: Paper, kind: str) -> str | None:
+    """``v=`` query value for a paper's preview URLs; None until the preview is cached.
+
+    Registered as a Jinja global for ``partials/_preview_picture.html``.
+    """
     storage_key = _thumbnail_storage_key(paper)
-    if not storage_key or not paper.pdf_link:
+    if storage_key is None:
+        return None
+    return _preview_version(storage_key, _static_root(), "_teaser" if kind == "teaser" else "")
+
+
+def _requested_current_version(storage_key: str, static_root: Path, suffix: str) -> bool:
+    requested = request.args.get("v")
+    return requested is not None and requested == _preview_version(storage_key, static_root, suffix)
+
+
+def _send_preview(path: Path, mimetype: str, *, final: bool, versioned: bool = False):
+    """Serve a cached preview.
+
+    A finished preview requested with its current ``v=`` token is immutable — a
+    re-render changes the token and so the URL. Without one (a page cached before
+    the preview existed) it gets a bounded ``max_age`` and revalidates against the
+    file's ETag; a stand-in (teaser → page-1 PNG, variant → PNG while the warm runs)
+    stays short-lived so the real file replaces it.
+    """
+    if not final:
+        return send_file(path, mimetype=mimetype, conditional=True, max_age=_FALLBACK_PREVIEW_MAX_AGE)
+    if not versioned:
+        return send_file(path, mimetype=mimetype, conditional=True, max_age=_PREVIEW_MAX_AGE)
+    response = send_file(path, mimetype=mimetype, conditional=True, max_age=_VERSIONED_PREVIEW_MAX_AGE)
+    response.cache_control.immutable = True
+    return response
+
+
+def _serve_png_preview(paper: Paper, storage_key: str, static_root: Path, suffix: str, *, final: bool):
+    """Serve ``<key><suffix>.png``, falling back to the page-1 PNG; warm when absent."""
+    path = _resolved_thumbnail_path(storage_key, static_root, suffix=suffix)
+    if path is None:
         return ("", 404)
+    if path.exists():
+        versioned = final and _requested_current_version(storage_key, static_root, suffix)
+        return _send_preview(path, "image/png", final=final, versioned=versioned)
 
-    static_root = _static_root()
-    thumbnail_path = _resolved_thumbnail_path(storage_key, static_root)
+    # Fall back to the page-1 thumbnail if it's already cached (instant); otherwise
+    # enqueue a background warm and return a placeholder — reusing the already-fetched
+    # paper/storage_key instead of re-fetching the paper (avoids a second get_or_404).
+    thumbnail_path = _resolved_thumbnail_path(storage_key, static_root) if suffix else path
     if thumbnail_path is None:
         return ("", 404)
-
     if not thumbnail_path.exists():
         THUMBNAIL_WARMER.warm(storage_key, paper.pdf_link, static_root)
         return _missing_thumbnail_response()
+    return _send_preview(thumbnail_path, "image/png", final=False)
+
+
+def _preview_target(paper_id: int):
+    paper = Paper.query.get_or_404(paper_id)
+    storage_key = _thumbnail_storage_key(paper)
+    if not storage_key or not paper.pdf_link:
+        return paper, None
+    return paper, storage_key
 
-    return send_file(thumbnail_path, mimetype="image/png", conditional=True, max_age=86400)
+
+@dashboard_bp.route("/papers/<int:paper_id>/thumbnail.png")
+def paper_thumbnail(paper_id: int):
+    paper, storage_key = _preview_target(paper_id)
+    if storage_key is None:
+        return ("", 404)
+    return _serve_png_preview(paper, storage_key, _static_root(), "", final=True)
 
 
 @dashboard_bp.route("/papers/<int:paper_id>/teaser.png")
 def paper_teaser(paper_id: int):
     """Teaser figure extracted from the PDF (the warmer writes it alongside the
     page-1 thumbnail from a single download)."""
-    paper = Paper.query.get_or_404(paper_id)
-    storage_key = _thumbnail_storage_key(paper)
-    if not storage_key or not paper.pdf_link:
+    paper, storage_key = _preview_target(paper_id)
+    if storage_key is None:
         return ("", 404)
+    return _serve_png_preview(paper, storage_key, _static_root(), "_teaser", final=True)
 
-    static_root = _static_root()
-    teaser_path = _resolved_thumbnail_path(storage_key, static_root, suffix="_teaser")
-    if teaser_path is None:
-        return ("", 404)
 
-    if teaser_path.exists():
-        return send_file(teaser_path, mimetype="image/png", conditional=True, max_age=86400)
+@dashboard_bp.route("/papers/<int:paper_id>/<any(thumbnail, teaser):kind>-<int:width>w.<any(avif, webp):fmt>")
+def paper_preview_variant(paper_id: int, kind: str, width: int, fmt: str):
+    """Resized WebP/AVIF preview for ``srcset``. Papers rendered before variants
+    existed get the PNG meanwhile, and the warmer re-encodes it without a download."""
+    if width not in VARIANT_WIDTHS:
+        return ("", 404)
+    paper, storage_key = _preview_target(paper_id)
+    if storage_key is None:
+        return ("", 404)
 
-    # Fall back to the page-1 thumbnail if it's already cached (instant); otherwise
-    # enqueue a background warm and return a placeholder — reusing the already-fetched
-    # paper/storage_key instead of re-invoking paper_thumbnail (avoids a second get_or_404).
-    thumbnail_path = _resolved_thumbnail_path(storage_key, static_root)
-    if thumbnail_path is None:
+    static_root = _static_root()
+    suffix = "_teaser" if kind == "teaser" else ""
+    path = _resolved_thumbnail_path(storage_key, static_root, suffix=f"{suffix}-{width}w", ext=fmt)
+    if path is None:
         return ("", 404)
-    if not thumbnail_path.exists():
-        THUMBNAIL_WARMER.warm(storage_key, paper.pdf_link, static_root)
-        return _missing_thumbnail_response()
-    return send_file(thumbnail_path, mimetype="image/png", conditional=True, max_age=86400)
+    if path.exists():
+        versioned = _requested_current_version(storage_key, static_root, suffix)
+        return _send_preview(path, f"image/{fmt}", final=True, versioned=versioned)
+
+    THUMBNAIL_WARMER.warm(storage_key, paper.pdf_link, static_root)
+    return _serve_png_preview(paper, storage_key, static_root, suffix, final=False)
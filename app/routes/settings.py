@@ -713,7 +713,7 @@ def zotero_sync():
     validate_csrf_token()
 
     from app.models import PaperFeedback
-    from app.services.zotero import ZoteroClient
+    from app.services.zotero import ZoteroClient, needs_zotero_sync, zotero_fingerprint
 
     client = ZoteroClient()
     status = client.check_connection()
@@ -731,9 +731,10 @@ def zotero_sync():
         ),
     ).all()
 
-    # Skip papers already synced (they carry a Zotero item key), so re-running the sync
-    # never duplicates the library — mirrors the Mendeley dedup on mendeley_doc_id.
-    papers_to_sync = [paper for paper in saved_papers if not paper.zotero_item_key]
+    # Delta sync: push only papers never synced or changed since their last push, so
+    # re-running the sync never duplicates the library — mirrors the Mendeley dedup on
+    # mendeley_doc_id — and leaves unchanged items alone.
+    papers_to_sync = [paper for paper in saved_papers if needs_zotero_sync(paper)]
     skipped_count = len(saved_papers) - len(papers_to_sync)
 
     if not papers_to_sync:
@@ -743,8 +744,16 @@ def zotero_sync():
     result = client.sync_saved_papers(papers_to_sync, collection_key=collection_key)
 
     item_keys = result.get("item_keys") or {}
+    item_versions = result.get("item_versions") or {}
+    # Conflicts carry Zotero's current version but the local copy wasn't pushed: keep
+    # their old synced hash so the next sync sends the local edit.
+    conflicts = set(result.get("conflicts") or ())
     for idx, key in item_keys.items():
-        papers_to_sync[idx].zotero_item_key = key
+        paper = papers_to_sync[idx]
+        paper.zotero_item_key = key
+        paper.zotero_item_version = item_versions.get(idx, paper.zotero_item_version)
+        if paper.zotero_item_version is not None and idx not in conflicts:
+            paper.zotero_synced_hash = zotero_fingerprint(paper)
     if item_keys:
         db.session.commit()
 
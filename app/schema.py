@@ -9,12 +9,17 @@ from datetime import datetime
 from sqlalchemy import inspect, text
 from sqlalchemy.exc import IntegrityError
 
-from app.models import db
+from app.models import RANK_SCORE_SQL, db
 
 LOGGER = logging.getLogger(__name__)
 
 _SAFE_COLUMN_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
 
+# Stamped into SQLite's ``PRAGMA user_version`` once ensure_schema() completes cleanly,
+# so app startup can skip the inspector round-trips, ALTER probes and FTS count check
+# on an already-upgraded DB. Bump whenever ensure_schema() gains a new upgrade step.
+SCHEMA_VERSION = 8
+
 
 def _validate_column_name(name: str) -> None:
     """Assert column names are safe for SQL interpolation."""
@@ -42,15 +47,20 @@ SAVED_SEARCH_COLUMN_DEFS = {
 SYNC_STATE_COLUMN_DEFS = {
     "last_cursor_page": "INTEGER",
     "last_cursor_arxiv_id": "TEXT",
+    "last_cursor_paper_id": "INTEGER",
 }
 
 FTS5_CREATE = """
 CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
     title, abstract_text, authors, topic_tags,
     content='papers', content_rowid='id',
-    tokenize='porter unicode61'
+    tokenize='porter unicode61',
+    prefix='2 3'
 );
 """
+# 2- and 3-character prefix indexes serve search-as-you-type ("seg"*) queries
+# without scanning every term; tables created before them are rebuilt.
+FTS5_PREFIX_OPTION = "prefix='2 3'"
 
 FTS5_TRIGGERS = [
     """CREATE TRIGGER IF NOT EXISTS papers_fts_insert AFTER INSERT ON papers BEGIN
@@ -101,6 +111,8 @@ PAPER_COLUMN_DEFS = {
     "openalex_cited_by_count": "INTEGER",
     "mendeley_doc_id": "TEXT",
     "zotero_item_key": "TEXT",
+    "zotero_item_version": "INTEGER",
+    "zotero_synced_hash": "TEXT",
     "github_repo": "TEXT",
     "github_stars": "INTEGER",
     "github_license": "TEXT",
@@ -112,12 +124,17 @@ PAPER_COLUMN_DEFS = {
     "acceptance_status": "TEXT",
     "interest_similarity": "REAL",
     "llm_insights": "TEXT NOT NULL DEFAULT '{}'",
+    # VIRTUAL: SQLite can't ADD a STORED generated column; the index stores the value.
+    "rank_score": f"REAL GENERATED ALWAYS AS ({RANK_SCORE_SQL}) VIRTUAL",
 }
 
 INDEX_STATEMENTS = [
     "CREATE INDEX IF NOT EXISTS idx_papers_scraped_at ON papers (scraped_at)",
     "CREATE INDEX IF NOT EXISTS idx_papers_publication_dt ON papers (publication_dt)",
     "CREATE INDEX IF NOT EXISTS idx_papers_rank ON papers (paper_score, feedback_score)",
+    "CREATE INDEX IF NOT EXISTS idx_papers_rank_score ON papers (rank_score)",
+    # The feed filters is_hidden; without the prefix SQLite picks idx_papers_hidden and sorts.
+    "CREATE INDEX IF NOT EXISTS idx_papers_visible_rank ON papers (is_hidden, rank_score)",
     "CREATE INDEX IF NOT EXISTS idx_papers_hidden ON papers (is_hidden)",
     "CREATE INDEX IF NOT EXISTS idx_papers_venue ON papers (venue)",
     "CREATE INDEX IF NOT EXISTS idx_feedback_paper_action ON paper_feedback (paper_id, action)",
@@ -157,12 +174,44 @@ def _try_parse_datetime(value: str | None):
         return None
 
 
-def ensure_schema() -> None:
-    """Apply additive schema upgrades and backfill normalized date columns."""
+def _is_sqlite() -> bool:
+    return db.engine.dialect.name == "sqlite"
+
+
+def read_schema_version() -> int:
+    """Return the stamped schema version (0 when unstamped or not SQLite)."""
+    if not _is_sqlite():
+        return 0
+    return int(db.session.execute(text("PRAGMA user_version")).scalar() or 0)
+
+
+def _stamp_schema_version() -> None:
+    if not _is_sqlite():
+        return
+    # PRAGMA arguments can't be bound parameters; SCHEMA_VERSION is an int constant.
+    db.session.execute(text(f"PRAGMA user_version = {int(SCHEMA_VERSION)}"))
+    db.session.commit()
+
+
+def ensure_schema(*, skip_if_current: bool = False) -> None:
+    """Apply additive schema upgrades and backfill normalized date columns.
+
+    With ``skip_if_current`` (the ``create_app`` path) the DDL is skipped when the DB
+    already carries the current :data:`SCHEMA_VERSION` stamp; only the cheap data
+    repairs in :func:`_repair_data` still run. Direct callers get the full
+    idempotent pass, which also repairs a hand-modified DB.
+    """
+    if skip_if_current and read_schema_version() >= SCHEMA_VERSION:
+        _repair_data()
+        return
+
     inspector = inspect(db.engine)
     tables = inspector.get_table_names()
     if "papers" not in tables:
         return
+    # Only a fully clean pass earns the stamp: a degraded step (FTS5 unavailable, a
+    # legacy DB blocking the unique index) must be retried on the next startup.
+    fully_applied = True
 
     existing_columns = {column["name"] for column in inspector.get_columns("papers")}
 
@@ -178,19 +227,23 @@ def ensure_schema() -> None:
 
     # Ensure all tables exist even on older DBs.
     from app.models import (  # local import to avoid circular dependency
+        Author,
         Collection,
         DigestRun,
         EnrichmentCache,
+        EnrichmentResourceCache,
         FeedSource,
         PaperCollection,
         PaperFeedback,
         PaperRelation,
         PaperSection,
+        PaperTermVector,
         RankingConfig,
         RecommendationMetric,
         SavedSearch,
         ScrapeRun,
         SyncState,
+        TermDocumentFrequency,
     )
 
     PaperFeedback.__table__.create(bind=db.engine, checkfirst=True)
@@ -198,6 +251,7 @@ def ensure_schema() -> None:
     DigestRun.__table__.create(bind=db.engine, checkfirst=True)
     FeedSource.__table__.create(bind=db.engine, checkfirst=True)
     EnrichmentCache.__table__.create(bind=db.engine, checkfirst=True)
+    EnrichmentResourceCache.__table__.create(bind=db.engine, checkfirst=True)
     Collection.__table__.create(bind=db.engine, checkfirst=True)
     PaperCollection.__table__.create(bind=db.engine, checkfirst=True)
     PaperRelation.__table__.create(bind=db.engine, checkfirst=True)
@@ -206,6 +260,9 @@ def ensure_schema() -> None:
     RankingConfig.__table__.create(bind=db.engine, checkfirst=True)
     RecommendationMetric.__table__.create(bind=db.engine, checkfirst=True)
     SyncState.__table__.create(bind=db.engine, checkfirst=True)
+    Author.__table__.create(bind=db.engine, checkfirst=True)
+    PaperTermVector.__table__.create(bind=db.engine, checkfirst=True)
+    TermDocumentFrequency.__table__.create(bind=db.engine, checkfirst=True)
 
     if "sync_state" in inspect(db.engine).get_table_names():
         sync_state_columns = {col["name"] for col in inspect(db.engine).get_columns("sync_state")}
@@ -241,21 +298,37 @@ def ensure_schema() -> None:
 
     # Set up FTS5 full-text search index.
     try:
+        fts_sql = db.session.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'papers_fts'")
+        ).scalar()
+        recreated = fts_sql is not None and FTS5_PREFIX_OPTION not in fts_sql
+        if recreated:
+            LOGGER.info("Recreating FTS5 index with prefix indexes...")
+            db.session.execute(text("DROP TABLE papers_fts"))
         db.session.execute(text(FTS5_CREATE))
         for trigger_sql in FTS5_TRIGGERS:
             db.session.execute(text(trigger_sql))
         db.session.commit()
 
-        # Rebuild FTS index if it's empty but papers exist.
-        fts_count = db.session.execute(text("SELECT COUNT(*) FROM papers_fts")).scalar()
+        # Rebuild FTS index if it's empty but papers exist. COUNT(*) on an
+        # external-content table counts the content rows, so count the index's
+        # own per-document sizes instead.
+        fts_count = db.session.execute(text("SELECT COUNT(*) FROM papers_fts_docsize")).scalar()
         paper_count = db.session.execute(text("SELECT COUNT(*) FROM papers")).scalar()
-        if fts_count == 0 and paper_count > 0:
+        if (recreated or fts_count == 0) and paper_count > 0:
             LOGGER.info("Rebuilding FTS5 index for %d papers...", paper_count)
             db.session.execute(text("INSERT INTO papers_fts(papers_fts) VALUES('rebuild');"))
             db.session.commit()
     except Exception as exc:
         LOGGER.warning("FTS5 setup failed (search will use ILIKE fallback): %s", exc)
         db.session.rollback()
+        fully_applied = False
+    from app.services.fts import reset_fts5_available  # local import (in-function convention)
+
+    reset_fts5_available()
+
+    if not _ensure_author_index():
+        fully_applied = False
 
     for statement in INDEX_STATEMENTS:
         db.session.execute(text(statement))
@@ -268,7 +341,32 @@ def ensure_schema() -> None:
     except Exception as exc:  # pragma: no cover - depends on legacy DB contents
         LOGGER.warning("Could not create unique arXiv id index: %s", exc)
         db.session.rollback()
+        fully_applied = False
+
+    _repair_data()
+
+    if fully_applied:
+        _stamp_schema_version()
+
 
+def _repair_data() -> None:
+    """Data repairs cheap enough to run on every startup, stamped DB or not.
+
+    They fix rows written around the app (an older build, a manual import) rather
+    than the schema, so the :data:`SCHEMA_VERSION` stamp says nothing about them.
+    """
+    from app.services.fts import restore_fts_merge_settings  # local import (in-function convention)
+
+    _backfill_normalized_dates()
+    _backfill_arxiv_ids()
+    _fix_pdf_links()
+    _catch_up_author_index()
+    _ensure_term_vectors()
+    restore_fts_merge_settings()
+
+
+def _backfill_normalized_dates() -> None:
+    """Fill ``publication_dt``/``scraped_at`` from the legacy string date columns."""
     rows = db.session.execute(
         text(
             """
@@ -339,8 +437,59 @@ def ensure_schema() -> None:
             )
             db.session.commit()
 
-    _backfill_arxiv_ids()
-    _fix_pdf_links()
+
+def _ensure_author_index() -> bool:
+    """Create the author trigram index.
+
+    Returns False when the trigram table couldn't be created (the author search then
+    falls back to scanning ``authors``).
+    """
+    from app.services.author_index import (  # local import (in-function convention)
+        AUTHORS_FTS_CREATE,
+        reset_authors_fts_available,
+    )
+
+    created = True
+    try:
+        db.session.execute(text(AUTHORS_FTS_CREATE))
+        db.session.commit()
+    except Exception as exc:
+        LOGGER.warning("Author trigram index unavailable (author search will scan): %s", exc)
+        db.session.rollback()
+        created = False
+    reset_authors_fts_available()
+    return created
+
+
+def _catch_up_author_index() -> None:
+    """Fill ``authors`` (and its trigram index) when they lag behind ``papers``."""
+    from app.services.author_index import (  # local import (in-function convention)
+        authors_fts_available,
+        rebuild_author_index,
+    )
+
+    author_count = db.session.execute(text("SELECT COUNT(*) FROM authors")).scalar()
+    indexed = (
+        db.session.execute(text("SELECT COUNT(*) FROM authors_fts")).scalar()
+        if authors_fts_available()
+        else author_count
+    )
+    if author_count == 0 or indexed != author_count:
+        paper_count = db.session.execute(text("SELECT COUNT(*) FROM papers")).scalar()
+        if paper_count:
+            LOGGER.info("Building author index for %d papers...", paper_count)
+            rebuild_author_index()
+
+
+def _ensure_term_vectors() -> None:
+    """Vectorize papers from a DB that predates ``paper_term_vectors`` (or was written around it)."""
+    from app.services.term_vectors import rebuild_term_vectors  # local import (in-function convention)
+
+    vector_count = db.session.execute(text("SELECT COUNT(*) FROM paper_term_vectors")).scalar()
+    paper_count = db.session.execute(text("SELECT COUNT(*) FROM papers")).scalar()
+    if vector_count != paper_count:
+        LOGGER.info("Building term vectors for %d papers...", paper_count)
+        rebuild_term_vectors()
 
 
 _ARXIV_ID_RE = re.compile(r"arxiv\.org/abs/(.+?)(?:v\d+)?$")
@@ -1,14 +1,21 @@
 """Semantic package for search, semantic indexing, and corpus analysis."""
 
+from app.services.author_index import rebuild_author_index, suggest_authors
 from app.services.corpus_analysis import analyze_topic_clusters, detect_emerging_topics, find_neighbor_papers
 from app.services.embed_backfill import backfill_embeddings
 from app.services.embeddings import EmbeddingService, get_embedding_service, reset_embedding_service
-from app.services.export import generate_html_report
+from app.services.export import generate_html_report, iter_ranked_papers, stream_html_report
+from app.services.paper_graph import build_paper_graph
 from app.services.pdf_extraction import extract_and_store_sections
 from app.services.related import build_vector, cosine_similarity, find_duplicates, top_related_papers
 from app.services.saved_search import execute_saved_search, validate_saved_search
 from app.services.search import RRF_K, search_bm25, search_hybrid, search_semantic
-from app.services.summary import extract_topic_tags, generate_llm_summary, generate_summary
+from app.services.summary import (
+    extract_topic_tags,
+    generate_llm_summary,
+    generate_summary,
+)
+from app.services.term_vectors import TermMatrix, TitleIndex, load_term_matrix, rebuild_term_vectors
 from app.services.text import STOP_WORDS, clean_whitespace, normalize, now_utc, tokenize, utc_today
 from app.services.thumbnail_generator import generate_thumbnail
 
@@ -16,8 +23,11 @@ __all__ = [
     "EmbeddingService",
     "RRF_K",
     "STOP_WORDS",
+    "TermMatrix",
+    "TitleIndex",
     "analyze_topic_clusters",
     "backfill_embeddings",
+    "build_paper_graph",
     "build_vector",
     "clean_whitespace",
     "cosine_similarity",
@@ -32,12 +42,18 @@ __all__ = [
     "generate_summary",
     "generate_thumbnail",
     "get_embedding_service",
+    "iter_ranked_papers",
+    "load_term_matrix",
     "normalize",
     "now_utc",
+    "rebuild_author_index",
+    "rebuild_term_vectors",
     "reset_embedding_service",
     "search_bm25",
     "search_hybrid",
     "search_semantic",
+    "stream_html_report",
+    "suggest_authors",
     "tokenize",
     "top_related_papers",
     "utc_today",
@@ -0,0 +1,281 @@
+"""Asyncio HTTP layer with the same contract as :func:`request_with_backoff`.
+
+The enrichment stages issue many small, independent, latency-bound requests. Run
+through ``request_with_backoff`` each one parks a worker thread for its whole
+round-trip; here they are coroutines on a single event-loop thread, so hundreds
+can be in flight for the cost of one thread and a few pooled ``httpx.AsyncClient`` instances.
+
+The contract is kept deliberately identical to the blocking helper so call sites
+can switch on ``ingest.async_http`` without changing their error handling:
+
+* bodies are streamed and capped at ``max_bytes`` (:class:`ResponseTooLargeError`);
+* retries use the same backoff, retryable-status set and clamped ``Retry-After``;
+* every attempt draws from the same shared token bucket a ``requests`` session with
+  the same settings/scope would use, so switching paths never raises the request
+  rate against a host;
+* failures raise ``httpx.HTTPStatusError``/``httpx.TransportError``, whose
+  ``.response.status_code`` / ``.response.headers`` match what callers inspect on
+  ``requests`` exceptions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from typing import Any
+
+import httpx
+
+from app.services.http_client import (
+    _DEFAULT_MAX_BYTES,
+    _SESSION_RATE_LIMIT_ATTR,
+    _SESSION_RATE_LIMIT_SCOPE_ATTR,
+    _SESSION_USER_AGENT_ATTR,
+    ResponseTooLargeError,
+    _headers_with_user_agent,
+    _is_retryable,
+    _parse_retry_after,
+    resolve_user_agent,
+)
+from app.services.rate_limiter import TokenBucketRateLimiter, get_shared_rate_limiter, resolve_rate_limit_settings
+
+LOGGER = logging.getLogger(__name__)
+
+# Upper bound on simultaneously open requests for one ``fetch_all`` call. The token
+# bucket still paces *starts*; this only bounds sockets held by slow responses.
+DEFAULT_CONCURRENCY = 64
+
+# httpcore's pool re-scans every connection (probing each idle socket) for every
+# waiting request, so one wide pool gets quadratically slower as it fills — 64
+# connections ran ~6x slower than 8 pools of 8 in scripts/bench_async_http.py.
+# ``fetch_all`` therefore spreads its calls over several narrow clients.
+_CONNECTIONS_PER_CLIENT = 8
+
+
+async def _read_capped_body(response: httpx.Response, max_bytes: int) -> None:
+    """Async twin of ``http_client._read_capped_body`` for a streamed httpx response."""
+    declared = response.headers.get("Content-Length")
+    if declared is not None:
+        try:
+            if int(declared) > max_bytes:
+                raise ResponseTooLargeError(f"Declared Content-Length {int(declared)} exceeds cap {max_bytes}")
+        except (TypeError, ValueError):
+            pass  # Malformed header — fall through to the streamed byte count guard.
+
+    chunks: list[bytes] = []
+    total = 0
+    async for chunk in response.aiter_bytes(64 * 1024):
+        total += len(chunk)
+        if total > max_bytes:
+            raise ResponseTooLargeError(f"Response body exceeds cap {max_bytes}")
+        chunks.append(chunk)
+    # Same trick as the requests path: serve .content/.text/.json() from the capped
+    # buffer after the stream context has closed the connection.
+    response._content = b"".join(chunks)
+
+
+async def async_request_with_backoff(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    limiter: TokenBucketRateLimiter,
+    attempts: int = 3,
+    base_delay: float = 1.25,
+    timeout: float = 30,
+    user_agent: str | None = None,
+    max_bytes: int | None = _DEFAULT_MAX_BYTES,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Run one request with bounded retries, backoff and a shared rate limit.
+
+    Mirrors :func:`app.services.http_client.request_with_backoff`; ``limiter`` is
+    the already-resolved shared bucket (see :func:`fetch_all`).
+    """
+    attempts = max(1, attempts)
+    kwargs["headers"] = _headers_with_user_agent(kwargs.get("headers"), user_agent=user_agent or resolve_user_agent())
+    last_exc: Exception | None = None
+
+    for attempt in range(1, attempts + 1):
+        try:
+            await limiter.acquire_async()
+            async with client.stream(method, url, timeout=timeout, **kwargs) as response:
+                response.raise_for_status()
+                if max_bytes is None:
+                    await response.aread()
+                else:
+                    await _read_capped_body(response, max_bytes)
+            return response
+        except ResponseTooLargeError:
+            # Retrying just re-downloads the same oversized body — fail fast.
+            raise
+        except Exception as exc:
+            last_exc = exc
+            if attempt == attempts or not _is_retryable(exc):
+                break
+
+            delay = base_delay * (2 ** (attempt - 1))
+            retry_after = _parse_retry_after(exc)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            LOGGER.warning("HTTP retry %s/%s for %s %s after error: %s", attempt, attempts, method, url, exc)
+            await asyncio.sleep(delay)
+
+    raise last_exc  # guaranteed non-None by loop logic
+
+
+def create_async_client(*, concurrency: int = DEFAULT_CONCURRENCY) -> httpx.AsyncClient:
+    """A pooled client sized for ``concurrency`` in-flight requests.
+
+    Redirects are followed to match ``requests``' default behaviour.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    return httpx.AsyncClient(limits=limits, follow_redirects=True)
+
+
+def _resolve_call(
+    call: Mapping[str, Any],
+    *,
+    session,
+    scraper_config: Mapping[str, Any] | None,
+) -> tuple[dict[str, Any], TokenBucketRateLimiter]:
+    """Split a ``request_with_backoff``-style call into request kwargs + its limiter.
+
+    Follows the blocking helper's per-dimension rules: an explicit
+    ``rate_limit_profile``/``scraper_config`` picks the settings, otherwise a
+    configured ``session`` lends its own; the session's rate-limit scope and
+    User-Agent carry over so both paths draw from the same bucket.
+    """
+    kwargs = dict(call)
+    kwargs.pop("session", None)
+    profile = kwargs.pop("rate_limit_profile", None)
+    session_settings = getattr(session, _SESSION_RATE_LIMIT_ATTR, None)
+    if profile is not None or scraper_config is not None or session_settings is None:
+        settings = resolve_rate_limit_settings(scraper_config, profile=profile or "interactive")
+    else:
+        settings = session_settings
+    limiter = get_shared_rate_limiter(settings, getattr(session, _SESSION_RATE_LIMIT_SCOPE_ATTR, None))
+    kwargs["user_agent"] = (
+        kwargs.get("user_agent")
+        or getattr(session, _SESSION_USER_AGENT_ATTR, None)
+        or resolve_user_agent(scraper_config)
+    )
+    return kwargs, limiter
+
+
+async def _fetch_all(
+    calls: Sequence[Mapping[str, Any]],
+    *,
+    session,
+    scraper_config: Mapping[str, Any] | None,
+    concurrency: int,
+    stop_when: Callable[[Exception], bool] | None,
+    client: httpx.AsyncClient | None,
+    on_latency: Callable[[float], None] | None,
+) -> list[Any]:
+    outcomes: list[Any] = [None] * len(calls)
+    concurrency = max(1, concurrency)
+    shard_count = 1 if client is not None else -(-concurrency // _CONNECTIONS_PER_CLIENT)
+    per_shard = -(-concurrency // shard_count)
+    gates = [asyncio.Semaphore(per_shard) for _ in range(shard_count)]
+    stopped = False
+
+    async def run(index: int, call: Mapping[str, Any], http: httpx.AsyncClient, gate: asyncio.Semaphore) -> None:
+        nonlocal stopped
+        async with gate:
+            if stopped:
+                return
+            kwargs, limiter = _resolve_call(call, session=session, scraper_config=scraper_config)
+            method = kwargs.pop("method")
+            url = kwargs.pop("url")
+            started = time.perf_counter()
+            try:
+                outcomes[index] = await async_request_with_backoff(http, method, url, limiter=limiter, **kwargs)
+            except Exception as exc:
+                outcomes[index] = exc
+                if stop_when is not None and stop_when(exc):
+                    stopped = True
+            finally:
+                if on_latency is not None:
+                    on_latency(time.perf_counter() - started)
+
+    async with contextlib.AsyncExitStack() as stack:
+        if client is not None:
+            clients = [client]
+        else:
+            clients = [
+                await stack.enter_async_context(create_async_client(concurrency=per_shard)) for _ in range(shard_count)
+            ]
+        await asyncio.gather(
+            *(
+                run(index, call, clients[index % shard_count], gates[index % shard_count])
+                for index, call in enumerate(calls)
+            )
+        )
+    return outcomes
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` to completion from synchronous code.
+
+    Uses a fresh event loop on the calling thread; if that thread already runs a
+    loop (so ``asyncio.run`` would refuse), the coroutine gets its own helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome: dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["value"] = asyncio.run(coro)
+        except BaseException as exc:  # re-raised on the caller's thread below
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=target, name="async-http", daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("value")
+
+
+def fetch_all(
+    calls: Sequence[Mapping[str, Any]],
+    *,
+    session=None,
+    scraper_config: Mapping[str, Any] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    stop_when: Callable[[Exception], bool] | None = None,
+    client: httpx.AsyncClient | None = None,
+    on_latency: Callable[[float], None] | None = None,
+) -> list[Any]:
+    """Issue ``calls`` concurrently on one event loop; return one outcome per call.
+
+    Each call is a mapping of ``request_with_backoff`` arguments including
+    ``method`` and ``url`` (``session=`` entries are ignored; pass the session once
+    here so its User-Agent and rate-limit scope apply). An outcome is the
+    ``httpx.Response``, the exception the request finally raised, or ``None`` for a
+    call that never started because an earlier failure matched ``stop_when``
+    (e.g. a 429 — don't keep hammering a host that asked us to back off).
+    ``on_latency`` receives each issued call's wall time in seconds (retries included).
+    """
+    if not calls:
+        return []
+    return run_coroutine(
+        _fetch_all(
+            calls,
+            session=session,
+            scraper_config=scraper_config,
+            concurrency=concurrency,
+            stop_when=stop_when,
+            client=client,
+            on_latency=on_latency,
+        )
+    )
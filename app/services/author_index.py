@@ -0,0 +1,223 @@
+"""Author autocomplete backed by the ``authors`` table.
+
+``papers.authors`` is a comma-joined string, so answering "which authors match
+'ann'" from it means scanning papers and splitting names in Python. Instead every
+distinct name lives once in ``authors`` with its case-folded form and the number
+of papers carrying it:
+
+* **maintenance** — SQLAlchemy session events turn each flush's inserted, deleted
+  and re-authored papers into per-name count deltas and apply them in the same
+  transaction (:func:`install_author_index_listeners`). Writes that bypass the ORM
+  unit of work (Core bulk inserts, raw SQL) are caught up by
+  :func:`rebuild_author_index`.
+* **lookup** — ``authors_fts``, an FTS5 ``trigram`` table over the folded names,
+  answers substring queries of three or more characters from its index. Shorter
+  queries (which a trigram index cannot serve) and lookups without trigram support
+  (SQLite < 3.34) scan the authors table instead, which is still exact and far
+  smaller than ``papers``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy import bindparam, event, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import History
+
+from app.models import Paper, db
+
+LOGGER = logging.getLogger(__name__)
+
+AUTHOR_SUGGESTION_LIMIT = 20
+# Trigram queries need at least one full trigram.
+TRIGRAM_MIN_CHARS = 3
+_CHUNK = 500
+
+AUTHORS_FTS_CREATE = "CREATE VIRTUAL TABLE IF NOT EXISTS authors_fts USING fts5(name_folded, tokenize='trigram')"
+
+_AVAILABLE_KEY = "authors_fts_available"
+_DELTAS_KEY = "author_index_deltas"
+
+_UPSERT = text(
+    "INSERT INTO authors (name, name_folded, paper_count) VALUES (:name, :name_folded, :delta) "
+    "ON CONFLICT(name) DO UPDATE SET paper_count = paper_count + excluded.paper_count"
+)
+_EXISTING = text("SELECT name FROM authors WHERE name IN :names").bindparams(bindparam("names", expanding=True))
+_ROWS_BY_NAME = text("SELECT id, name, name_folded, paper_count FROM authors WHERE name IN :names").bindparams(
+    bindparam("names", expanding=True)
+)
+_DELETE_AUTHORS = text("DELETE FROM authors WHERE id IN :ids").bindparams(bindparam("ids", expanding=True))
+_DELETE_FTS = text("DELETE FROM authors_fts WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True))
+_STORED_AUTHORS = text("SELECT authors FROM papers WHERE id IN :ids").bindparams(bindparam("ids", expanding=True))
+_INSERT_FTS = text("INSERT INTO authors_fts (rowid, name_folded) VALUES (:id, :name_folded)")
+
+
+def split_authors(authors: str | None) -> list[str]:
+    """Distinct, whitespace-normalized names of a comma-joined author string, in order."""
+    names = (" ".join(part.split()) for part in (authors or "").split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def fold_author_name(name: str) -> str:
+    return name.casefold()
+
+
+def authors_fts_available(connection=None) -> bool:
+    """Whether ``authors_fts`` can be queried; probed once per app."""
+    extensions = current_app.extensions
+    cached = extensions.get(_AVAILABLE_KEY)
+    if cached is not None:
+        return cached
+    try:
+        # A failed SELECT leaves an SQLite transaction intact, so this is safe
+        # inside a flush.
+        (connection or db.session.connection()).execute(text("SELECT 1 FROM authors_fts LIMIT 1"))
+        available = True
+    except Exception:
+        available = False
+    extensions[_AVAILABLE_KEY] = available
+    return available
+
+
+def reset_authors_fts_available() -> None:
+    """Forget the cached probe (after ``authors_fts`` is created or dropped)."""
+    current_app.extensions.pop(_AVAILABLE_KEY, None)
+
+
+def _chunks(items: list, size: int = _CHUNK):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def apply_author_deltas(connection, deltas: Counter[str]) -> None:
+    """Add ``{name: change in paper count}`` to ``authors`` and its trigram index.
+
+    Names left with no papers are removed from both.
+    """
+    names = [name for name, delta in deltas.items() if delta]
+    if not names:
+        return
+    use_fts = authors_fts_available(connection)
+    for chunk in _chunks(names):
+        existing = set(connection.execute(_EXISTING, {"names": chunk}).scalars())
+        connection.execute(
+            _UPSERT,
+            [{"name": name, "name_folded": fold_author_name(name), "delta": deltas[name]} for name in chunk],
+        )
+        rows = connection.execute(_ROWS_BY_NAME, {"names": chunk}).all()
+        gone = [row.id for row in rows if row.paper_count <= 0]
+        if use_fts:
+            fresh = [
+                {"id": row.id, "name_folded": row.name_folded}
+                for row in rows
+                if row.paper_count > 0 and row.name not in existing
+            ]
+            if fresh:
+                connection.execute(_INSERT_FTS, fresh)
+            if gone:
+                connection.execute(_DELETE_FTS, {"ids": gone})
+        if gone:
+            connection.execute(_DELETE_AUTHORS, {"ids": gone})
+
+
+def _before_flush(session: Session, _flush_context, _instances) -> None:
+    deltas: Counter[str] = Counter()
+    for obj in session.new:
+        if isinstance(obj, Paper):
+            deltas.update(split_authors(obj.authors))
+    for obj in session.deleted:
+        if isinstance(obj, Paper):
+            deltas.subtract(split_authors(obj.authors))
+    unloaded: list[int] = []
+    for obj in session.dirty:
+        if not isinstance(obj, Paper):
+            continue
+        history: History = inspect(obj).attrs.authors.history
+        if not history.has_changes():
+            continue
+        deltas.update(split_authors(history.added[0] if history.added else None))
+        if history.deleted:
+            deltas.subtract(split_authors(history.deleted[0]))
+        elif obj.id is not None:
+            # Set on an expired instance (e.g. after a commit): the old value was
+            # never loaded, so read the stored one. Core on the flush's connection,
+            # not session.execute, which would autoflush.
+            unloaded.append(obj.id)
+    for chunk in _chunks(unloaded):
+        for stored in session.connection().execute(_STORED_AUTHORS, {"ids": chunk}).scalars():
+            deltas.subtract(split_authors(stored))
+    if any(deltas.values()):
+        session.info[_DELTAS_KEY] = deltas
+    else:
+        session.info.pop(_DELTAS_KEY, None)
+
+
+def _after_flush(session: Session, _flush_context) -> None:
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        apply_author_deltas(session.connection(), deltas)
+
+
+def install_author_index_listeners() -> None:
+    """Hook the session events that keep ``authors`` current (idempotent)."""
+    for name, listener in (("before_flush", _before_flush), ("after_flush", _after_flush)):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def rebuild_author_index() -> int:
+    """Recount every author from ``papers`` and reload the trigram index.
+
+    Returns the number of distinct authors.
+    """
+    counts: Counter[str] = Counter()
+    for (authors,) in db.session.query(Paper.authors).yield_per(1000):
+        counts.update(split_authors(authors))
+    db.session.execute(text("DELETE FROM authors"))
+    use_fts = authors_fts_available()
+    if use_fts:
+        db.session.execute(text("DELETE FROM authors_fts"))
+    rows = [{"name": name, "name_folded": fold_author_name(name), "delta": count} for name, count in counts.items()]
+    for chunk in _chunks(rows, 5000):
+        db.session.execute(_UPSERT, chunk)
+    if use_fts:
+        db.session.execute(text("INSERT INTO authors_fts (rowid, name_folded) SELECT id, name_folded FROM authors"))
+    db.session.commit()
+    LOGGER.info("Rebuilt author index: %d authors", len(rows))
+    return len(rows)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def suggest_authors(query: str, limit: int = AUTHOR_SUGGESTION_LIMIT) -> list[dict]:
+    """Authors whose name contains ``query`` (case-insensitive), most papers first.
+
+    Queries shorter than :data:`TRIGRAM_MIN_CHARS` scan ``authors`` rather than
+    the trigram index.
+    Returns ``[{"name", "paper_count"}]`` ordered by count, then name.
+    """
+    folded = fold_author_name(" ".join(query.split()))
+    if not folded:
+        return []
+    params: dict[str, object] = {"limit": limit}
+    if len(folded) >= TRIGRAM_MIN_CHARS and authors_fts_available():
+        where = "authors_fts MATCH :match"
+        params["match"] = '"' + folded.replace('"', '""') + '"'
+        source = "authors_fts JOIN authors a ON a.id = authors_fts.rowid"
+    else:
+        where = "a.name_folded LIKE :pattern ESCAPE '\\'"
+        params["pattern"] = f"%{_escape_like(folded)}%"
+        source = "authors a"
+    rows = db.session.execute(
+        text(
+            f"SELECT a.name, a.paper_count FROM {source} WHERE {where} "  # noqa: S608 - constant fragments
+            "ORDER BY a.paper_count DESC, a.name LIMIT :limit"
+        ),
+        params,
+    ).all()
+    return [{"name": name, "paper_count": int(count)} for name, count in rows]
@@ -0,0 +1,116 @@
+"""Checkpointed keyset progress for the enrichment backfills.
+
+Every backfill walks ``Paper.id`` in ascending keyset order. A
+:class:`BackfillTracker` remembers the last fully processed id in the
+``sync_state`` row ``backfill:<name>`` (committed together with the batch's own
+writes), so an interrupted run resumes after that id instead of rescanning, and
+reports throughput and an ETA against the number of candidate rows counted at start.
+The cursor is cleared once a pass completes, so the next run starts from the top.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from app.models import Paper, SyncState, db
+from app.services.text import now_utc
+
+CHECKPOINT_PREFIX = "backfill:"
+
+
+def checkpoint_category(name: str) -> str:
+    return f"{CHECKPOINT_PREFIX}{name}"
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+class BackfillTracker:
+    """Keyset cursor + progress accounting for one backfill subcommand.
+
+    Must be used inside an app context. ``checkpoint`` commits the session, so
+    callers use it in place of their per-batch ``db.session.commit()``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        total: int,
+        start_after: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.total = max(0, int(total))
+        self.cursor = int(start_after)
+        self.resumed = start_after > 0
+        self.processed = 0
+        self._clock = clock
+        self._started = clock()
+
+    @classmethod
+    def start(cls, name: str, query, *, emit: Callable[[str], None] | None = None) -> BackfillTracker:
+        """Resume from the stored checkpoint and size the remaining ``query`` rows."""
+        state = SyncState.query.filter_by(category=checkpoint_category(name)).one_or_none()
+        start_after = int(state.last_cursor_paper_id or 0) if state is not None else 0
+        total = query.filter(Paper.id > start_after).count()
+        tracker = cls(name, total=total, start_after=start_after)
+        if emit is not None and tracker.resumed:
+            emit(f"Resuming {name} backfill after paper {start_after} ({total} candidate papers left)")
+        return tracker
+
+    def _state(self) -> SyncState:
+        category = checkpoint_category(self.name)
+        state = SyncState.query.filter_by(category=category).one_or_none()
+        if state is None:
+            state = SyncState(category=category)
+            db.session.add(state)
+        return state
+
+    def checkpoint(self, last_id: int, *, processed: int) -> None:
+        """Record that every candidate up to ``last_id`` is done and commit."""
+        self.cursor = int(last_id)
+        self.processed += int(processed)
+        state = self._state()
+        state.last_cursor_paper_id = self.cursor
+        state.last_synced_paper_count = (state.last_synced_paper_count or 0) + int(processed)
+        state.last_synced_updated_at = now_utc()
+        db.session.commit()
+
+    def finish(self) -> None:
+        """Mark the pass complete: clear the cursor so the next run starts over."""
+        state = self._state()
+        state.last_cursor_paper_id = None
+        state.last_synced_updated_at = now_utc()
+        db.session.commit()
+
+    @property
+    def elapsed(self) -> float:
+        return max(0.0, self._clock() - self._started)
+
+    @property
+    def rate(self) -> float:
+        """Items per second since this run started."""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        rate = self.rate
+        if rate <= 0:
+            return None
+        return max(0, self.total - self.processed) / rate
+
+    def describe(self) -> str:
+        eta = self.eta_seconds
+        eta_text = "?" if eta is None else _format_duration(eta)
+        return f"{self.processed}/{self.total} papers, {self.rate:.1f} papers/s, ETA {eta_text}"
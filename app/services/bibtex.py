@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -114,6 +115,17 @@ def paper_to_bibtex(paper: Paper) -> str:
     return f"@article{{{cite_key},\n{field_str}\n}}"
 
 
+def iter_bibtex(papers: Iterable[Paper]) -> Iterator[str]:
+    """Yield one BibTeX entry (with its separator) per paper, for streamed exports.
+
+    Joined, the chunks equal :func:`papers_to_bibtex` of the same papers.
+    """
+    separator = ""
+    for paper in papers:
+        yield f"{separator}{paper_to_bibtex(paper)}"
+        separator = "\n\n"
+
+
 def papers_to_bibtex(papers: list[Paper]) -> str:
     """Convert multiple Paper objects to a joined BibTeX string."""
-    return "\n\n".join(paper_to_bibtex(p) for p in papers)
+    return "".join(iter_bibtex(papers))
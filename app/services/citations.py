@@ -8,10 +8,14 @@ from app.services.enrichment_providers import SemanticScholarProvider
 from app.services.http_client import request_with_backoff
 
 
-def fetch_citations_batch(arxiv_ids: list[str], session=None) -> dict[str, dict[str, Any]]:
+def fetch_citations_batch(
+    arxiv_ids: list[str],
+    session=None,
+    async_http: bool = False,
+) -> dict[str, dict[str, Any]]:
     """
     Fetch citation data from Semantic Scholar for a batch of arXiv IDs.
     Returns a dict mapping arXiv ID to citation data dict.
     """
-    provider = SemanticScholarProvider(request_fn=request_with_backoff)
+    provider = SemanticScholarProvider(request_fn=request_with_backoff, async_http=async_http)
     return provider.fetch_batch(arxiv_ids, session=session)
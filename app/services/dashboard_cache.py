@@ -0,0 +1,229 @@
+"""Rendered-page cache for the dashboard, keyed by request and data/preference versions.
+
+A dashboard view re-runs the candidate-pool query, filter-option counts, overview,
+feedback snapshot, score explanations and related-paper vectors on every hit even
+though the underlying rows change only on a scrape or a user action. The rendered
+page is cached under ``(query args, preference version, data version, ...)`` and
+served with an ETag derived from the same key, so an unchanged page costs one dict
+lookup — or a bare ``304 Not Modified`` when the browser already holds it.
+
+Invalidation is by version, never by scanning entries:
+
+* **data version** — a process-wide monotonic counter bumped when a commit touched a
+  table the dashboard reads (:data:`WATCHED_TABLES`): scrapes, feedback, hides,
+  collections, saved searches, ranking-config edits. Writes to caches the page never
+  shows (enrichment cache, sections, sync state) leave it alone. Installed as
+  SQLAlchemy session events by :func:`install_data_version_listeners`.
+* **preference version** — a fingerprint of the active config, so a settings save
+  (or any in-place edit of ``SCRAPER_CONFIG``) changes the key.
+
+The same keys cache the eligible-paper id set of a filter combination
+(:class:`IdSetCache`), which searches push into FAISS and BM25 instead of
+filtering their top_k afterwards.
+
+Writers outside this process (CLI backfills) can't bump the counter; the key carries
+a :data:`CACHE_TTL_SECONDS` time bucket so their rows, and the sliding "daily"
+timeframe, show up within that bound.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+WATCHED_TABLES = frozenset(
+    {
+        "papers",
+        "paper_feedback",
+        "paper_collections",
+        "paper_relations",
+        "collections",
+        "saved_searches",
+        "ranking_configs",
+        "scrape_runs",
+        "digest_runs",
+    }
+)
+
+CACHE_TTL_SECONDS = 300
+MAX_ENTRIES = 64
+MAX_ID_SETS = 32
+
+# Process-local versions restart at 0; the boot nonce keeps an ETag issued by a
+# previous process from matching a different page rendered under the same number.
+_BOOT_NONCE = secrets.token_hex(4)
+_DIRTY_KEY = "dashboard_data_dirty"
+
+_version_lock = threading.Lock()
+_data_version = 0
+
+
+def data_version() -> int:
+    return _data_version
+
+
+def bump_data_version() -> int:
+    """Invalidate every cached dashboard page (for writes that bypass the ORM)."""
+    global _data_version
+    with _version_lock:
+        _data_version += 1
+        return _data_version
+
+
+def preference_version(config: dict | None) -> str:
+    """Short fingerprint of the active config (whitelists, preferences, ranking)."""
+    serialized = json.dumps(config or {}, sort_keys=True, default=str)
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def _touches_watched_table(objects) -> bool:
+    return any(getattr(obj, "__tablename__", None) in WATCHED_TABLES for obj in objects)
+
+
+def _after_flush(session: Session, _flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state here.
+    if (
+        _touches_watched_table(session.new)
+        or _touches_watched_table(session.dirty)
+        or _touches_watched_table(session.deleted)
+    ):
+        session.info[_DIRTY_KEY] = True
+
+
+def _do_orm_execute(state) -> None:
+    # Bulk ``query.update()`` / ``query.delete()`` never go through flush.
+    if not (state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is not None and mapper.local_table.name in WATCHED_TABLES:
+        state.session.info[_DIRTY_KEY] = True
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        bump_data_version()
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
+
+
+def install_data_version_listeners() -> None:
+    """Hook the session events that bump the data version (idempotent)."""
+    for name, listener in (
+        ("after_flush", _after_flush),
+        ("do_orm_execute", _do_orm_execute),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+    ):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def cache_key(*parts: object) -> str:
+    """Digest of the request/version parts that fully determine a rendered page."""
+    payload = json.dumps([_BOOT_NONCE, int(time.time() // CACHE_TTL_SECONDS), *parts], default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    html: str
+    render_seconds: float
+
+
+class DashboardCache:
+    """Bounded LRU of rendered pages plus hit/miss/savings counters. Thread-safe."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedPage] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        self._bypassed = 0
+        self._seconds_saved = 0.0
+        self._render_seconds_total = 0.0
+
+    def get(self, key: str) -> CachedPage | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self._seconds_saved += entry.render_seconds
+            return entry
+
+    def put(self, key: str, html: str, render_seconds: float) -> None:
+        with self._lock:
+            self._render_seconds_total += render_seconds
+            self._entries[key] = CachedPage(html=html, render_seconds=render_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_not_modified(self, key: str) -> None:
+        """A 304 answered from the ETag alone; credit the render it avoided."""
+        with self._lock:
+            self._not_modified += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._seconds_saved += entry.render_seconds
+            elif self._misses:
+                self._seconds_saved += self._render_seconds_total / self._misses
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self._bypassed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            served = self._hits + self._not_modified
+            lookups = served + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "not_modified": self._not_modified,
+                "misses": self._misses,
+                "bypassed": self._bypassed,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                "avg_render_ms": round(1000 * self._render_seconds_total / self._misses, 2) if self._misses else 0.0,
+                "render_seconds_saved": round(self._seconds_saved, 4),
+                "data_version": _data_version,
+            }
+
+
+class IdSetCache:
+    """Bounded LRU of filtered paper-id sets, keyed like pages. Thread-safe."""
+
+    def __init__(self, max_entries: int = MAX_ID_SETS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, frozenset[int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: str, load: Callable[[], Iterable[int]]) -> frozenset[int]:
+        """The cached set for ``key``, running ``load`` (outside the lock) on a miss."""
+        with self._lock:
+            ids = self._entries.get(key)
+            if ids is not None:
+                self._entries.move_to_end(key)
+                return ids
+        ids = frozenset(load())
+        with self._lock:
+            self._entries[key] = ids
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return ids
@@ -15,16 +15,19 @@ def backfill_embeddings(app, batch_size: int = 64) -> int:
     service = get_embedding_service(app)
     total_added = 0
 
-    # A non-positive batch_size makes SQLite treat LIMIT as unlimited (LIMIT -1) and
-    # OFFSET stays <= 0, so the cursor never advances and the loop spins forever.
+    # A non-positive batch_size makes SQLite treat LIMIT as unlimited (LIMIT -1).
     batch_size = max(1, batch_size)
 
     with app.app_context():
-        offset = 0
+        # Keyset pagination: OFFSET rescans every skipped row, so late batches of a
+        # large corpus got progressively slower. Index membership is the checkpoint
+        # here (has_paper skips what a previous run already embedded).
+        last_seen_id = 0
         while True:
-            papers = Paper.query.order_by(Paper.id).offset(offset).limit(batch_size).all()
+            papers = Paper.query.filter(Paper.id > last_seen_id).order_by(Paper.id).limit(batch_size).all()
             if not papers:
                 break
+            last_seen_id = papers[-1].id
 
             paper_ids = []
             texts = []
@@ -38,8 +41,6 @@ def backfill_embeddings(app, batch_size: int = 64) -> int:
                 total_added += added
                 LOGGER.info("Backfill batch: indexed %d papers (total so far: %d)", added, total_added)
 
-            offset += batch_size
-
     if total_added > 0:
         service.save()
         LOGGER.info("Backfill complete: %d new embeddings saved", total_added)
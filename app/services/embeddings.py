@@ -6,8 +6,10 @@ import json
 import logging
 import os
 import threading
+from array import array
 from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 try:
     import fcntl
@@ -26,6 +28,9 @@ _OMP_THREADS = max(1, int(os.environ.get("OMP_NUM_THREADS", "1") or "1"))
 import numpy as np  # noqa: E402
 from flask import current_app, has_app_context  # noqa: E402
 
+if TYPE_CHECKING:
+    import faiss
+
 LOGGER = logging.getLogger(__name__)
 
 DIMENSION = 768
@@ -49,6 +54,11 @@ _service_lock = threading.Lock()
 _FILE_LOCKS: dict[str, _ReentrantFileLock] = {}
 _FILE_LOCKS_GUARD = threading.Lock()
 
+# A filtered search over at most 1/32 of the rows hands FAISS the row ids
+# (``IDSelectorBatch``, a hash set); denser filters pass a packed row bitmap,
+# which costs ntotal/8 bytes to build but one bit test per row to check.
+_BATCH_SELECTOR_MAX_FRACTION = 32
+
 
 class _ReentrantFileLock:
     """Reentrant exclusive lock spanning threads (RLock) and processes (fcntl.flock).
@@ -110,6 +120,129 @@ def _index_file_lock(index_dir: str | Path) -> _ReentrantFileLock:
         return lock
 
 
+_SECTION_INDEX_FILE = "sections.index"
+_SECTION_META_FILE = "section_meta.npz"
+# Pre-columnar sidecar (JSON list of {"paper_id", "section_type"} dicts); read for
+# migration only and removed by the first save_sections() after the upgrade.
+_LEGACY_SECTION_MAP_FILE = "section_id_map.json"
+
+
+class _SectionMeta:
+    """Columnar row metadata for the section index.
+
+    Row ``i`` of ``sections.index`` belongs to ``paper_ids[i]`` with section type
+    ``types[type_codes[i]]``. Columns are ``array.array``s (amortized O(1) append, no
+    per-row dict), alongside a per-type row-offset array used to build FAISS bitmap
+    selectors and the set of paper ids already indexed. All three persist together in
+    one ``.npz`` sidecar, so appends and dedup checks cost O(batch), not O(index).
+    Callers serialize access through ``EmbeddingService._lock``.
+    """
+
+    def __init__(self):
+        self.paper_ids = array("q")
+        self.type_codes = array("H")
+        self.types: list[str] = []
+        self._type_to_code: dict[str, int] = {}
+        self._type_rows: dict[int, array] = {}
+        self._papers: set[int] = set()
+        # section type -> packed row bitmap; invalidated per type on append.
+        self._bitmaps: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.paper_ids)
+
+    def has_paper(self, paper_id: int) -> bool:
+        return paper_id in self._papers
+
+    def extend(self, rows: list[tuple[int, str]]) -> None:
+        for paper_id, section_type in rows:
+            code = self._type_to_code.get(section_type)
+            if code is None:
+                code = len(self.types)
+                self.types.append(section_type)
+                self._type_to_code[section_type] = code
+                self._type_rows[code] = array("q")
+            self._type_rows[code].append(len(self.paper_ids))
+            self.paper_ids.append(int(paper_id))
+            self.type_codes.append(code)
+            self._papers.add(int(paper_id))
+            self._bitmaps.pop(section_type, None)
+
+    def prefix(self, keep: int) -> _SectionMeta:
+        """Return metadata for only the first ``keep`` rows (drift reconciliation on load)."""
+        trimmed = _SectionMeta()
+        trimmed.extend([(self.paper_ids[row], self.types[self.type_codes[row]]) for row in range(keep)])
+        return trimmed
+
+    def type_count(self, section_type: str) -> int:
+        code = self._type_to_code.get(section_type)
+        return 0 if code is None else len(self._type_rows[code])
+
+    def type_bitmap(self, section_type: str) -> np.ndarray:
+        """Packed little-endian row bitmap in the layout ``faiss.IDSelectorBitmap`` reads."""
+        bitmap = self._bitmaps.get(section_type)
+        if bitmap is None:
+            mask = np.zeros(len(self.paper_ids), dtype=bool)
+            code = self._type_to_code.get(section_type)
+            if code is not None:
+                mask[np.frombuffer(self._type_rows[code], dtype=np.int64)] = True
+            bitmap = np.packbits(mask, bitorder="little")
+            self._bitmaps[section_type] = bitmap
+        return bitmap
+
+    def lookup(self, rows) -> tuple[list[int | None], list[str | None]]:
+        """Resolve FAISS row positions to (paper_id, section_type); out-of-range -> None."""
+        total = len(self.paper_ids)
+        paper_ids: list[int | None] = []
+        section_types: list[str | None] = []
+        for row in rows:
+            row = int(row)
+            if 0 <= row < total:
+                paper_ids.append(self.paper_ids[row])
+                section_types.append(self.types[self.type_codes[row]])
+            else:
+                paper_ids.append(None)
+                section_types.append(None)
+        return paper_ids, section_types
+
+    def save(self, path: str) -> None:
+        type_offsets = np.zeros(len(self.types) + 1, dtype=np.int64)
+        for code in range(len(self.types)):
+            type_offsets[code + 1] = type_offsets[code] + len(self._type_rows[code])
+        type_rows = np.concatenate(
+            [np.frombuffer(self._type_rows[code], dtype=np.int64) for code in range(len(self.types))]
+            or [np.empty(0, dtype=np.int64)]
+        )
+        # Write through a file object: np.savez would otherwise append ".npz" to the
+        # temp name and break the caller's os.replace.
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                paper_ids=np.frombuffer(self.paper_ids, dtype=np.int64),
+                type_codes=np.frombuffer(self.type_codes, dtype=np.uint16),
+                types=np.asarray(self.types, dtype=str),
+                type_offsets=type_offsets,
+                type_rows=type_rows,
+                indexed_paper_ids=np.fromiter(sorted(self._papers), dtype=np.int64, count=len(self._papers)),
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> _SectionMeta:
+        meta = cls()
+        with np.load(path, allow_pickle=False) as data:
+            meta.paper_ids = array("q", data["paper_ids"].astype(np.int64).tobytes())
+            meta.type_codes = array("H", data["type_codes"].astype(np.uint16).tobytes())
+            meta.types = [str(t) for t in data["types"]]
+            offsets = data["type_offsets"]
+            type_rows = data["type_rows"].astype(np.int64)
+            meta._papers = set(data["indexed_paper_ids"].tolist())
+        meta._type_to_code = {section_type: code for code, section_type in enumerate(meta.types)}
+        meta._type_rows = {
+            code: array("q", type_rows[offsets[code] : offsets[code + 1]].tobytes()) for code in range(len(meta.types))
+        }
+        return meta
+
+
 class EmbeddingService:
     """Manages SPECTER2 embeddings and a FAISS sidecar index."""
 
@@ -293,16 +426,53 @@ class EmbeddingService:
         with self._lock:
             return int(self._index.ntotal)
 
-    def search(self, query_text: str, top_k: int = 20) -> list[tuple[int, float]]:
-        """Search by text query. Returns [(paper_id, score)]."""
+    def _row_selector(self, paper_ids) -> tuple[faiss.IDSelector | None, np.ndarray | None, int]:
+        """``(selector, buffer, candidates)`` restricting a search to ``paper_ids``' rows.
+
+        Caller holds ``self._lock``. ``buffer`` must stay referenced until the search
+        returns (a bitmap selector only holds a raw pointer into it).
+        """
+        import faiss
+
+        rows = np.fromiter(
+            (row for row in map(self._pk_to_row.get, paper_ids) if row is not None),
+            dtype=np.int64,
+        )
+        if not len(rows):
+            return None, None, 0
+        total = int(self._index.ntotal)
+        if len(rows) * _BATCH_SELECTOR_MAX_FRACTION <= total:
+            return faiss.IDSelectorBatch(rows), rows, len(rows)
+        mask = np.zeros(total, dtype=bool)
+        mask[rows] = True
+        bitmap = np.packbits(mask, bitorder="little")
+        return faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(bitmap)), bitmap, len(rows)
+
+    def search(self, query_text: str, top_k: int = 20, *, paper_ids=None) -> list[tuple[int, float]]:
+        """Search by text query. Returns [(paper_id, score)].
+
+        ``paper_ids`` (any iterable of ids, e.g. a filtered SQL id set) restricts the
+        search to those papers inside FAISS, so a selective filter still gets its true
+        top_k instead of the few survivors of an unfiltered top_k.
+        """
+        import faiss
+
         if self._index.ntotal == 0:
             return []
 
         query_vec = self.encode([query_text])
 
         with self._lock:
+            params = None
             k = min(top_k, self._index.ntotal)
-            scores, indices = self._index.search(query_vec, k)
+            if paper_ids is not None:
+                selector, _buffer, candidates = self._row_selector(paper_ids)
+                if not candidates:
+                    return []
+                params = faiss.SearchParameters()
+                params.sel = selector
+                k = min(top_k, candidates)
+            scores, indices = self._index.search(query_vec, k, params=params)
             id_map_snapshot = list(self._id_map)
 
         results = []
@@ -334,6 +504,34 @@ class EmbeddingService:
             results.append((pid, float(score)))
         return results[:top_k]
 
+    def search_by_ids(self, paper_ids: list[int], top_k: int = 10) -> dict[int, list[tuple[int, float]]]:
+        """:meth:`search_by_id` for many papers in one multi-query FAISS search.
+
+        Returns ``{paper_id: [(neighbour_id, score)]}`` for the indexed ids only.
+        """
+        with self._lock:
+            rows = {pid: self._pk_to_row[pid] for pid in dict.fromkeys(paper_ids) if pid in self._pk_to_row}
+            if not rows or self._index.ntotal == 0:
+                return {}
+
+            queries = np.vstack([self._index.reconstruct(row) for row in rows.values()]).astype(np.float32)
+            k = min(top_k + 1, self._index.ntotal)
+            scores, indices = self._index.search(queries, k)
+            id_map_snapshot = list(self._id_map)
+
+        results: dict[int, list[tuple[int, float]]] = {}
+        for paper_id, row_scores, row_indices in zip(rows, scores, indices):
+            neighbours = []
+            for score, idx in zip(row_scores, row_indices):
+                if idx < 0 or idx >= len(id_map_snapshot):
+                    continue
+                pid = id_map_snapshot[idx]
+                if pid == paper_id:
+                    continue
+                neighbours.append((pid, float(score)))
+            results[paper_id] = neighbours[:top_k]
+        return results
+
     def get_paper_vectors(self, paper_ids: list[int]) -> tuple[list[int], np.ndarray]:
         """Return indexed paper IDs and their reconstructed embedding vectors."""
         if not paper_ids or self._index.ntotal == 0:
@@ -361,61 +559,68 @@ class EmbeddingService:
         The (possibly slow) disk read happens OUTSIDE ``self._lock`` so a one-time
         cold-start section load can't freeze concurrent paper searches/adds that share
         ``self._lock``; the lock is held only for the brief in-memory assignment. Assign
-        _section_id_map before _section_index so the unlocked fast-path check (hasattr
-        _section_index) never sees a half-initialized pair. Mirrors _load_index's
-        partial-survivor + drift handling so a torn save_sections() can't silently
-        mis-map rows or clobber a surviving index.
+        the columnar sidecar before _section_index so the unlocked fast-path check
+        (hasattr _section_index) never sees a half-initialized pair. Mirrors
+        _load_index's partial-survivor + drift handling so a torn save_sections() can't
+        silently mis-map rows or clobber a surviving index.
         """
         if hasattr(self, "_section_index"):
             return
 
         import faiss
 
-        section_index_path = self._index_dir / "sections.index"
-        section_map_path = self._index_dir / "section_id_map.json"
+        section_index_path = self._index_dir / _SECTION_INDEX_FILE
+        meta_path = self._index_dir / _SECTION_META_FILE
+        legacy_map_path = self._index_dir / _LEGACY_SECTION_MAP_FILE
         index_exists = section_index_path.exists()
-        map_exists = section_map_path.exists()
+        meta_exists = meta_path.exists() or legacy_map_path.exists()
         sections_persistable = True
+        meta = _SectionMeta()
 
-        if not index_exists and not map_exists:
+        if not index_exists and not meta_exists:
             section_index = faiss.IndexFlatIP(DIMENSION)
-            section_id_map: list[dict] = []
-        elif index_exists != map_exists:
+        elif index_exists != meta_exists:
             # One sidecar survived a crash between save_sections()'s two renames. The
             # missing half can't be reconstructed; run read-empty and DISABLE save so
             # the survivor is left intact for a rebuild instead of being overwritten.
             LOGGER.error(
-                "Section FAISS index partial (sections.index=%s, section_id_map.json=%s); "
+                "Section FAISS index partial (%s=%s, section metadata=%s); "
                 "starting empty and disabling section save to avoid clobbering the survivor.",
+                _SECTION_INDEX_FILE,
                 index_exists,
-                map_exists,
+                meta_exists,
             )
             section_index = faiss.IndexFlatIP(DIMENSION)
-            section_id_map = []
             sections_persistable = False
         else:
             section_index = faiss.read_index(str(section_index_path))
-            with open(section_map_path) as f:
-                section_id_map = json.load(f)
+            if meta_path.exists():
+                meta = _SectionMeta.load(meta_path)
+            else:
+                # Pre-columnar layout: a JSON list of {"paper_id", "section_type"} dicts.
+                # Converted once here; the next save_sections() writes the sidecar and
+                # drops the legacy file.
+                with open(legacy_map_path) as f:
+                    meta.extend([(m["paper_id"], m["section_type"]) for m in json.load(f)])
             n = section_index.ntotal
-            m = len(section_id_map)
+            m = len(meta)
             if n != m:
                 keep = min(n, m)
                 LOGGER.error(
-                    "Section index/id_map drift (index=%d, map=%d); reconciling to %d consistent rows",
+                    "Section index/metadata drift (index=%d, meta=%d); reconciling to %d consistent rows",
                     n,
                     m,
                     keep,
                 )
                 if n > keep:
                     section_index = self._prefix_index(section_index, keep)
-                section_id_map = section_id_map[:keep]
+                meta = meta.prefix(keep)
 
         with self._lock:
             if hasattr(self, "_section_index"):
                 return
             self._sections_persistable = sections_persistable
-            self._section_id_map = section_id_map
+            self._section_meta = meta
             self._section_index = section_index
 
     def add_sections(
@@ -441,19 +646,17 @@ class EmbeddingService:
         # Dedup is per *paper*, not per row: one paper legitimately contributes many
         # section rows (intro/method/…) in a single call, so we must NOT drop a
         # paper's later sections here (that is the add_papers one-vector-per-id case).
-        indexed_paper_ids = {m["paper_id"] for m in self._section_id_map}
-        fresh = [(pid, stype, text) for pid, stype, text in entries if pid not in indexed_paper_ids]
+        # The indexed-paper set is maintained incrementally, so this is O(batch).
+        with self._lock:
+            fresh = [entry for entry in entries if not self._section_meta.has_paper(entry[0])]
         if not fresh:
             return 0
 
-        texts = [text for _, _, text in fresh]
-        meta = [{"paper_id": pid, "section_type": stype} for pid, stype, _ in fresh]
-
-        embeddings = self.encode(texts)
+        embeddings = self.encode([text for _, _, text in fresh])
 
         with self._lock:
             self._section_index.add(embeddings)
-            self._section_id_map.extend(meta)
+            self._section_meta.extend([(pid, stype) for pid, stype, _ in fresh])
 
         return len(fresh)
 
@@ -465,8 +668,13 @@ class EmbeddingService:
     ) -> list[dict]:
         """Search section-level embeddings.
 
+        A ``section_type`` filter is pushed into FAISS as a row bitmap selector, so the
+        filtered search stays exact (the true top_k of that type) without over-fetching.
+
         Returns list of dicts with paper_id, section_type, score.
         """
+        import faiss
+
         self._ensure_section_index()
         if self._section_index.ntotal == 0:
             return []
@@ -474,32 +682,32 @@ class EmbeddingService:
         query_vec = self.encode([query_text])
 
         with self._lock:
-            # Search more than needed if filtering by type.
-            search_k = min(top_k * 3 if section_type else top_k, self._section_index.ntotal)
-            scores, indices = self._section_index.search(query_vec, search_k)
-            map_snapshot = list(self._section_id_map)
+            params = None
+            if section_type:
+                candidates = self._section_meta.type_count(section_type)
+                if candidates == 0:
+                    return []
+                bitmap = self._section_meta.type_bitmap(section_type)
+                # Keep ``bitmap`` referenced until search returns: the selector only
+                # holds a raw pointer into it.
+                selector = faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(bitmap))
+                params = faiss.SearchParameters()
+                params.sel = selector
+                search_k = min(top_k, candidates)
+            else:
+                search_k = min(top_k, self._section_index.ntotal)
+            scores, indices = self._section_index.search(query_vec, search_k, params=params)
+            paper_ids, section_types = self._section_meta.lookup(indices[0])
 
         results = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < 0 or idx >= len(map_snapshot):
-                continue
-            entry = map_snapshot[idx]
-            if section_type and entry["section_type"] != section_type:
+        for score, idx, pid, stype in zip(scores[0], indices[0], paper_ids, section_types):
+            if idx < 0 or pid is None:
                 continue
-            results.append(
-                {
-                    "paper_id": entry["paper_id"],
-                    "section_type": entry["section_type"],
-                    "score": float(score),
-                }
-            )
-            if len(results) >= top_k:
-                break
-
+            results.append({"paper_id": pid, "section_type": stype, "score": float(score)})
         return results
 
     def save_sections(self) -> None:
-        """Persist section FAISS index to disk."""
+        """Persist section FAISS index and its columnar sidecar to disk."""
         import faiss
 
         if not hasattr(self, "_section_index"):
@@ -512,18 +720,19 @@ class EmbeddingService:
             return
 
         with _index_file_lock(self._index_dir).acquire(), self._lock:
-            section_index_path = self._index_dir / "sections.index"
-            section_map_path = self._index_dir / "section_id_map.json"
+            section_index_path = self._index_dir / _SECTION_INDEX_FILE
+            meta_path = self._index_dir / _SECTION_META_FILE
 
             tmp_index = str(section_index_path) + ".tmp"
-            tmp_map = str(section_map_path) + ".tmp"
+            tmp_meta = str(meta_path) + ".tmp"
 
             faiss.write_index(self._section_index, tmp_index)
-            with open(tmp_map, "w") as f:
-                json.dump(self._section_id_map, f)
+            self._section_meta.save(tmp_meta)
 
             os.replace(tmp_index, str(section_index_path))
-            os.replace(tmp_map, str(section_map_path))
+            os.replace(tmp_meta, str(meta_path))
+            # The sidecar now supersedes any pre-columnar JSON map.
+            (self._index_dir / _LEGACY_SECTION_MAP_FILE).unlink(missing_ok=True)
 
     def save(self) -> None:
         """Persist FAISS index (and section index if loaded) to disk atomically."""
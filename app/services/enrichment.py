@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import io
 import logging
 import re
 import time
@@ -10,7 +9,6 @@ from datetime import date, timedelta
 from urllib.parse import urlparse
 
 import defusedxml.ElementTree as ET
-import pdfplumber
 import requests
 
 from app.constants import ARXIV_API_BATCH_SIZE as _ARXIV_API_BATCH_SIZE
@@ -18,10 +16,14 @@ from app.constants import ARXIV_API_DELAY as _ARXIV_API_DELAY
 from app.services.http_client import request_with_backoff
 from app.services.ingest import ArxivApiBackend, RssFeedBackend
 from app.services.ingest.base import clean_abstract, extract_arxiv_id, parse_publication_dt
+from app.services.lazy_imports import lazy_module
+from app.services.pdf_spool import PdfPayload, pdf_source
 from app.services.text import clean_whitespace, utc_today
 
 LOGGER = logging.getLogger(__name__)
 
+pdfplumber = lazy_module("pdfplumber")
+
 _HEADER_END_RE = re.compile(
     r"^\s*(?:Abstract|ABSTRACT|1[\.\s]+Introduction|I\.\s+Introduction)\b",
     re.MULTILINE,
@@ -222,7 +224,7 @@ def _host_matches(host: str, suffixes: tuple[str, ...]) -> bool:
     return any(host == suffix or host.endswith("." + suffix) for suffix in suffixes)
 
 
-def extract_pdf_resource_links(pdf_content: bytes | None, max_pages: int = 2) -> list[dict[str, str]]:
+def extract_pdf_resource_links(pdf_content: PdfPayload | None, max_pages: int = 2) -> list[dict[str, str]]:
     """Extract code/dataset/project links from the first pages of a paper PDF.
 
     Generic web links are dropped (front-matter references are noisy); only
@@ -232,7 +234,7 @@ def extract_pdf_resource_links(pdf_content: bytes | None, max_pages: int = 2) ->
         return []
 
     try:
-        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+        with pdfplumber.open(pdf_source(pdf_content)) as pdf:
             text = "\n".join(page.extract_text() or "" for page in pdf.pages[:max_pages])
     except Exception as exc:
         LOGGER.warning("Failed to extract resource links from PDF: %s", exc)
@@ -257,7 +259,7 @@ def extract_pdf_resource_links(pdf_content: bytes | None, max_pages: int = 2) ->
 
 
 def extract_pdf_resource_links_batch(
-    pdf_contents: list[bytes | None], max_pages: int = 2
+    pdf_contents: list[PdfPayload | None], max_pages: int = 2
 ) -> list[list[dict[str, str]]]:
     """Batch wrapper for :func:`extract_pdf_resource_links`.
 
@@ -423,7 +425,7 @@ def enrich_entries_with_api_metadata(entries: list[dict], session: requests.Sess
 
 
 def extract_affiliation_text(
-    pdf_bytes: bytes,
+    pdf_bytes: PdfPayload,
     *,
     lines_start: int = 2,
     max_header_lines: int = 50,
@@ -431,7 +433,7 @@ def extract_affiliation_text(
 ) -> str:
     """Extract first-page text region that usually includes author affiliations."""
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        with pdfplumber.open(pdf_source(pdf_bytes)) as pdf:
             if not pdf.pages:
                 return ""
             page_text = pdf.pages[0].extract_text() or ""
@@ -449,7 +451,7 @@ def extract_affiliation_text(
 
 
 def extract_affiliation_text_batch(
-    pdf_contents: list[bytes | None],
+    pdf_contents: list[PdfPayload | None],
     *,
     lines_start: int = 2,
     max_header_lines: int = 50,
@@ -1,6 +1,6 @@
 """Cache-aware enrichment provider exports."""
 
-from app.services.enrichment_providers.base import EnrichmentProvider
+from app.services.enrichment_providers.base import PROVIDER_STATS, EnrichmentProvider, ProviderStats
 from app.services.enrichment_providers.github import GitHubProvider, extract_github_repo
 from app.services.enrichment_providers.huggingface import (
     HuggingFaceProvider,
@@ -12,10 +12,12 @@ from app.services.enrichment_providers.openalex_provider import OpenAlexProvider
 from app.services.enrichment_providers.semantic_scholar import SemanticScholarProvider
 
 __all__ = [
+    "PROVIDER_STATS",
     "EnrichmentProvider",
     "GitHubProvider",
     "HuggingFaceProvider",
     "OpenAlexProvider",
+    "ProviderStats",
     "SemanticScholarProvider",
     "extract_github_repo",
     "fetch_huggingface_batch",
@@ -1,8 +1,12 @@
-"""Shared interfaces and cache helpers for enrichment providers."""
+"""Shared interfaces, request fan-out, cache helpers and counters for enrichment providers."""
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Protocol
 
 from flask import has_app_context
@@ -12,12 +16,186 @@ from app.services.text import now_utc
 DEFAULT_CACHE_TTL_HOURS = 168
 
 
+@dataclass(slots=True)
+class _ProviderCounters:
+    lookups: int = 0
+    cache_hits: int = 0
+    requests: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    latency_seconds_total: float = 0.0
+    latency_seconds_max: float = 0.0
+
+
+class ProviderStats:
+    """Per-provider lookup, cache-hit, request and latency counters. Thread-safe.
+
+    ``lookups`` counts papers asked for and ``cache_hits`` those answered without a
+    request (a fresh per-paper or shared resource cache row). ``requests`` counts
+    HTTP calls actually issued, of which ``not_modified`` were answered by a
+    conditional ``304`` and ``errors`` failed (a provider's normal "not found" miss
+    is not an error). Counters are process-wide and reset only on restart.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, _ProviderCounters] = {}
+
+    def record(self, source: str, **counts: int) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(source, _ProviderCounters())
+            for name, value in counts.items():
+                setattr(counters, name, getattr(counters, name) + value)
+
+    def record_latency(self, source: str, seconds: float) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(source, _ProviderCounters())
+            counters.requests += 1
+            counters.latency_seconds_total += seconds
+            counters.latency_seconds_max = max(counters.latency_seconds_max, seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {source: self._summarize(counters) for source, counters in sorted(self._counters.items())}
+
+    def describe(self, source: str) -> str:
+        """One-line summary for CLI output."""
+        summary = self.stats().get(source) or self._summarize(_ProviderCounters())
+        return (
+            f"{source}: {summary['lookups']} lookups, {summary['hit_ratio']:.0%} cached, "
+            f"{summary['requests']} requests ({summary['not_modified']} not modified, "
+            f"{summary['errors']} failed), avg {summary['avg_latency_ms']:.0f}ms"
+        )
+
+    @staticmethod
+    def _summarize(counters: _ProviderCounters) -> dict[str, Any]:
+        requests = counters.requests
+        return {
+            "lookups": counters.lookups,
+            "cache_hits": counters.cache_hits,
+            "hit_ratio": round(counters.cache_hits / counters.lookups, 4) if counters.lookups else 0.0,
+            "requests": requests,
+            "not_modified": counters.not_modified,
+            "errors": counters.errors,
+            "avg_latency_ms": round(1000 * counters.latency_seconds_total / requests, 2) if requests else 0.0,
+            "max_latency_ms": round(1000 * counters.latency_seconds_max, 2),
+        }
+
+
+PROVIDER_STATS = ProviderStats()
+
+
 class EnrichmentProvider(Protocol):
     source: str
 
     def fetch_batch(self, arxiv_ids: list[str], **kwargs: Any) -> dict[str, dict[str, Any]]: ...
 
 
+def run_requests(
+    calls: Sequence[Mapping[str, Any]],
+    *,
+    request_fn,
+    session=None,
+    async_http: bool = False,
+    stop_when: Callable[[Exception], bool] | None = None,
+    concurrency: int = 1,
+    source: str | None = None,
+) -> list[Any]:
+    """Issue a provider's ``request_fn`` calls; return one outcome per call.
+
+    Each call maps ``request_with_backoff`` arguments (with ``method``/``url``). An
+    outcome is the response, the exception the call raised, or ``None`` when it was
+    skipped because an earlier failure matched ``stop_when``. At most
+    ``concurrency`` calls are in flight: on worker threads sharing ``session``'s
+    connection pool, or with ``async_http`` as coroutines on one event-loop thread.
+    Both apply only to the real ``request_with_backoff``; injected test doubles keep
+    the serial path. With ``source`` each call's latency lands in
+    :data:`PROVIDER_STATS`.
+    """
+    from app.services.http_client import request_with_backoff
+
+    on_latency = (lambda seconds: PROVIDER_STATS.record_latency(source, seconds)) if source else None
+    if request_fn is request_with_backoff:
+        if async_http:
+            from app.services.async_http import fetch_all
+
+            return fetch_all(
+                calls,
+                session=session,
+                stop_when=stop_when,
+                concurrency=max(1, concurrency),
+                on_latency=on_latency,
+            )
+        if concurrency > 1 and len(calls) > 1:
+            return _run_threaded(
+                calls,
+                request_fn=request_fn,
+                session=session,
+                stop_when=stop_when,
+                concurrency=concurrency,
+                on_latency=on_latency,
+            )
+
+    outcomes: list[Any] = []
+    stopped = False
+    for call in calls:
+        if stopped:
+            outcomes.append(None)
+            continue
+        outcome = _issue(call, request_fn=request_fn, session=session, on_latency=on_latency)
+        outcomes.append(outcome)
+        stopped = isinstance(outcome, Exception) and stop_when is not None and stop_when(outcome)
+    return outcomes
+
+
+def _issue(call: Mapping[str, Any], *, request_fn, session, on_latency) -> Any:
+    kwargs = dict(call)
+    method = kwargs.pop("method")
+    url = kwargs.pop("url")
+    started = time.perf_counter()
+    try:
+        return request_fn(method, url, session=session, **kwargs)
+    except Exception as exc:
+        return exc
+    finally:
+        if on_latency is not None:
+            on_latency(time.perf_counter() - started)
+
+
+def _run_threaded(
+    calls: Sequence[Mapping[str, Any]],
+    *,
+    request_fn,
+    session,
+    stop_when: Callable[[Exception], bool] | None,
+    concurrency: int,
+    on_latency,
+) -> list[Any]:
+    """Blocking fan-out: ``concurrency`` worker threads, outcomes in call order.
+
+    Calls not yet started when one fails with ``stop_when`` are skipped (``None``);
+    the ones already in flight finish.
+    """
+    outcomes: list[Any] = [None] * len(calls)
+    stopped = threading.Event()
+
+    def run(index: int) -> None:
+        if stopped.is_set():
+            return
+        outcome = _issue(calls[index], request_fn=request_fn, session=session, on_latency=on_latency)
+        outcomes[index] = outcome
+        if isinstance(outcome, Exception) and stop_when is not None and stop_when(outcome):
+            stopped.set()
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(calls)), thread_name_prefix="enrichment") as pool:
+        list(pool.map(run, range(len(calls))))
+    return outcomes
+
+
 def _ordered_arxiv_ids(arxiv_ids: Sequence[str]) -> list[str]:
     ordered: list[str] = []
     seen: set[str] = set()
@@ -106,3 +284,53 @@ def store_cached_payloads(
         cache_row.ttl_hours = ttl_hours
 
     db.session.commit()
+
+
+def get_shared_entries(keys: Sequence[str], *, source: str) -> dict[str, Any]:
+    """Cached resource rows (fresh or stale) for ``keys``, keyed by resource key.
+
+    Staleness is the caller's call: a stale row with an ``etag`` is still worth a
+    conditional request.
+    """
+    wanted = sorted({key for key in keys if key})
+    if not wanted or not has_app_context():
+        return {}
+
+    from app.models import EnrichmentResourceCache
+
+    rows = EnrichmentResourceCache.query.filter(
+        EnrichmentResourceCache.source == source,
+        EnrichmentResourceCache.resource_key.in_(wanted),
+    ).all()
+    return {row.resource_key: row for row in rows}
+
+
+def store_shared_entries(
+    entries: Mapping[str, tuple[dict[str, Any], str | None]],
+    *,
+    source: str,
+    existing: Mapping[str, Any],
+    ttl_hours: int = DEFAULT_CACHE_TTL_HOURS,
+) -> None:
+    """Persist ``{resource_key: (payload, etag)}`` and restart their TTL.
+
+    ``existing`` is the :func:`get_shared_entries` result the batch started from;
+    rows in it are updated in place.
+    """
+    if not entries or not has_app_context():
+        return
+
+    from app.models import EnrichmentResourceCache, db
+
+    fetched_at = now_utc()
+    for key, (payload, etag) in entries.items():
+        row = existing.get(key)
+        if row is None:
+            row = EnrichmentResourceCache(source=source, resource_key=key)
+            db.session.add(row)
+        row.data = dict(payload)
+        row.etag = etag
+        row.fetched_at = fetched_at
+        row.ttl_hours = ttl_hours
+
+    db.session.commit()
@@ -1,4 +1,11 @@
-"""GitHub repository metadata enrichment provider."""
+"""GitHub repository metadata enrichment provider.
+
+Repo metadata is cached twice: per paper (what callers read back) and per repo in
+the shared resource cache, so papers that link the same repo cost one request.
+A stale repo row is revalidated with ``If-None-Match``; GitHub answers an
+unchanged repo with ``304 Not Modified``, which does not count against the
+rate-limit quota.
+"""
 
 from __future__ import annotations
 
@@ -10,18 +17,26 @@ from urllib.parse import urlparse
 import requests
 
 from app.services.enrichment_providers.base import (
+    PROVIDER_STATS,
     EnrichmentProvider,
     get_cached_payloads,
+    get_shared_entries,
+    run_requests,
     store_cached_payloads,
+    store_shared_entries,
 )
+from app.services.text import now_utc
 
 LOGGER = logging.getLogger(__name__)
 
+GITHUB_API_HOST = "api.github.com"
 GITHUB_REPO_API_URL = "https://api.github.com/repos/{repo}"
 # Repo metadata changes slowly; 14 days keeps unauthenticated quota usage low.
 GITHUB_CACHE_TTL_HOURS = 336
 # Unauthenticated GitHub API allows 60 requests/hour.
 DEFAULT_MAX_FETCHES_PER_RUN = 25
+# Requests in flight against api.github.com at once (the token bucket still paces starts).
+GITHUB_CONCURRENCY = 4
 
 # The negative lookahead rejects dot-only segments (``.``/``..``). Without it, an
 # attacker-supplied link like ``https://github.com/../user`` yields repo ``../user``,
@@ -55,6 +70,23 @@ def _is_not_found(exc: Exception) -> bool:
     return response is not None and response.status_code == 404
 
 
+def _is_not_modified(outcome: Any) -> bool:
+    # requests hands a 304 back as a response; httpx raises it as HTTPStatusError.
+    response = getattr(outcome, "response", None) if isinstance(outcome, Exception) else outcome
+    return getattr(response, "status_code", None) == 304
+
+
+def _parse_repo(data: dict, repo: str) -> dict[str, Any]:
+    license_info = data.get("license") or {}
+    return {
+        "github_repo": data.get("full_name") or repo,
+        "github_stars": data.get("stargazers_count"),
+        "github_license": license_info.get("spdx_id") or license_info.get("name"),
+        "archived": data.get("archived"),
+        "pushed_at": data.get("pushed_at"),
+    }
+
+
 class GitHubProvider(EnrichmentProvider):
     source = "github"
 
@@ -65,11 +97,15 @@ class GitHubProvider(EnrichmentProvider):
         request_fn=None,
         max_fetches: int = DEFAULT_MAX_FETCHES_PER_RUN,
         token: str | None = None,
+        async_http: bool = False,
+        concurrency: int = GITHUB_CONCURRENCY,
     ) -> None:
         self.ttl_hours = ttl_hours
         self._request_fn = request_fn
         self.max_fetches = max_fetches
         self.token = token
+        self.async_http = async_http
+        self.concurrency = concurrency
         # Set when a batch stops early due to GitHub rate limiting, so a caller
         # (e.g. the CLI backfill) can stop advancing its cursor past unfetched papers.
         self.rate_limited = False
@@ -97,53 +133,100 @@ class GitHubProvider(EnrichmentProvider):
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        fetched: dict[str, dict[str, Any]] = {}
-        fetches = 0
+        # Group the papers still missing by repo (GitHub names are case-insensitive):
+        # a fresh shared row answers every paper on that repo without a request.
+        papers_by_repo: dict[str, list[tuple[str, str]]] = {}
         for arxiv_id in missing_ids:
             repo = repos_by_arxiv_id.get(arxiv_id)
-            if not repo:
-                continue
-            if fetches >= self.max_fetches:
-                LOGGER.info("GitHub fetch cap (%d) reached; deferring remaining repos", self.max_fetches)
-                break
-            fetches += 1
-
-            try:
-                response = request_fn(
-                    "GET",
-                    GITHUB_REPO_API_URL.format(repo=repo),
-                    headers=headers,
-                    session=session,
-                    timeout=15,
-                    attempts=2,
-                    rate_limit_profile="bulk",
-                )
-            except Exception as exc:
-                if _is_rate_limited(exc):
-                    LOGGER.warning("GitHub API rate limited; skipping remaining repos: %s", exc)
+            if repo:
+                papers_by_repo.setdefault(repo.lower(), []).append((arxiv_id, repo))
+        shared = get_shared_entries(list(papers_by_repo), source=self.source)
+        reference_time = now_utc()
+        payload_by_key: dict[str, dict[str, Any]] = {}
+        wanted: list[str] = []
+        shared_hits = 0
+        for key, papers in papers_by_repo.items():
+            row = shared.get(key)
+            if row is not None and row.is_fresh(reference_time=reference_time):
+                payload_by_key[key] = dict(row.data or {})
+                shared_hits += len(papers)
+            else:
+                wanted.append(key)
+
+        to_fetch = wanted[: max(0, self.max_fetches)]
+        if len(to_fetch) < len(wanted):
+            LOGGER.info("GitHub fetch cap (%d) reached; deferring remaining repos", self.max_fetches)
+        calls = []
+        for key in to_fetch:
+            call_headers = headers
+            etag = shared[key].etag if key in shared else None
+            if etag:
+                call_headers = {**headers, "If-None-Match": etag}
+            calls.append(
+                {
+                    "method": "GET",
+                    "url": GITHUB_REPO_API_URL.format(repo=papers_by_repo[key][0][1]),
+                    "headers": call_headers,
+                    "timeout": 15,
+                    "attempts": 2,
+                    "rate_limit_profile": "bulk",
+                }
+            )
+        outcomes = run_requests(
+            calls,
+            request_fn=request_fn,
+            session=session,
+            async_http=self.async_http,
+            stop_when=_is_rate_limited,
+            concurrency=self.concurrency,
+            source=self.source,
+        )
+
+        refreshed: dict[str, tuple[dict[str, Any], str | None]] = {}
+        not_modified = errors = 0
+        for key, outcome in zip(to_fetch, outcomes):
+            repo = papers_by_repo[key][0][1]
+            if outcome is None:
+                continue  # Never issued: an earlier request was rate limited.
+            if _is_not_modified(outcome) and key in shared:
+                # Unchanged since the cached ETag: restart the row's TTL, reuse its data.
+                not_modified += 1
+                row = shared[key]
+                refreshed[key] = (dict(row.data or {}), row.etag)
+            elif _is_not_found(outcome):
+                # Cache the miss so a deleted repo is not re-queried every run.
+                refreshed[key] = ({"github_repo": repo, "github_stars": None, "github_license": None}, None)
+            elif isinstance(outcome, Exception):
+                errors += 1
+                if _is_rate_limited(outcome):
+                    if not self.rate_limited:
+                        LOGGER.warning("GitHub API rate limited; skipping remaining repos: %s", outcome)
                     self.rate_limited = True
-                    break
-                if _is_not_found(exc):
-                    # Cache the miss so a deleted repo is not re-queried every run.
-                    fetched[arxiv_id] = {"github_repo": repo, "github_stars": None, "github_license": None}
-                    continue
-                LOGGER.warning("GitHub metadata fetch failed for %s: %s", repo, exc)
+                else:
+                    LOGGER.warning("GitHub metadata fetch failed for %s: %s", repo, outcome)
                 continue
+            else:
+                try:
+                    refreshed[key] = (_parse_repo(outcome.json(), repo), outcome.headers.get("ETag"))
+                except Exception as exc:
+                    # A non-JSON 200 must skip this one repo, not abort the whole run.
+                    errors += 1
+                    LOGGER.warning("GitHub metadata parse failed for %s: %s", repo, exc)
+                    continue
+            payload_by_key[key] = refreshed[key][0]
 
-            try:
-                data = response.json()
-                license_info = data.get("license") or {}
-                fetched[arxiv_id] = {
-                    "github_repo": data.get("full_name") or repo,
-                    "github_stars": data.get("stargazers_count"),
-                    "github_license": license_info.get("spdx_id") or license_info.get("name"),
-                    "archived": data.get("archived"),
-                    "pushed_at": data.get("pushed_at"),
-                }
-            except Exception as exc:
-                # A non-JSON 200 must skip this one repo, not abort the whole run.
-                LOGGER.warning("GitHub metadata parse failed for %s: %s", repo, exc)
-                continue
+        fetched: dict[str, dict[str, Any]] = {}
+        for key, payload in payload_by_key.items():
+            for arxiv_id, _repo in papers_by_repo[key]:
+                fetched[arxiv_id] = dict(payload)
+
+        PROVIDER_STATS.record(
+            self.source,
+            lookups=len(cached) + sum(len(papers) for papers in papers_by_repo.values()),
+            cache_hits=len(cached) + shared_hits,
+            not_modified=not_modified,
+            errors=errors,
+        )
 
         if fetched:
             store_cached_payloads(
@@ -152,4 +235,5 @@ class GitHubProvider(EnrichmentProvider):
                 paper_by_arxiv_id=paper_by_arxiv_id,
                 ttl_hours=self.ttl_hours,
             )
+        store_shared_entries(refreshed, source=self.source, existing=shared, ttl_hours=self.ttl_hours)
         return {**cached, **fetched}
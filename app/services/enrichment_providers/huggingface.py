@@ -15,13 +15,16 @@ from typing import Any
 import requests
 
 from app.services.enrichment_providers.base import (
+    PROVIDER_STATS,
     EnrichmentProvider,
     get_cached_payloads,
+    run_requests,
     store_cached_payloads,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+HF_API_HOST = "huggingface.co"
 HF_PAPER_API_URL = "https://huggingface.co/api/papers/{arxiv_id}"
 # Upvotes/comments keep accruing for days after a paper hits the daily page, and
 # papers are often submitted days after publication — refresh hits (and retry
@@ -29,6 +32,8 @@ HF_PAPER_API_URL = "https://huggingface.co/api/papers/{arxiv_id}"
 HUGGINGFACE_CACHE_TTL_HOURS = 72
 # The endpoint is per-paper (no batch form); bound one run's request count.
 DEFAULT_MAX_FETCHES_PER_RUN = 200
+# Requests in flight against huggingface.co at once (the token bucket still paces starts).
+HUGGINGFACE_CONCURRENCY = 8
 
 
 def parse_hf_paper(data: dict) -> dict[str, Any]:
@@ -78,10 +83,14 @@ class HuggingFaceProvider(EnrichmentProvider):
         ttl_hours: int = HUGGINGFACE_CACHE_TTL_HOURS,
         request_fn=None,
         max_fetches: int = DEFAULT_MAX_FETCHES_PER_RUN,
+        async_http: bool = False,
+        concurrency: int = HUGGINGFACE_CONCURRENCY,
     ) -> None:
         self.ttl_hours = ttl_hours
         self._request_fn = request_fn
         self.max_fetches = max_fetches
+        self.async_http = async_http
+        self.concurrency = concurrency
         # Set when a batch stops early due to rate limiting, so a caller (e.g.
         # the CLI backfill) can stop advancing its cursor past unfetched papers.
         self.rate_limited = False
@@ -99,44 +108,65 @@ class HuggingFaceProvider(EnrichmentProvider):
         request_fn = self._request_fn or request_with_backoff
         cached, missing_ids, paper_by_arxiv_id = get_cached_payloads(arxiv_ids, source=self.source)
 
-        fetched: dict[str, dict[str, Any]] = {}
-        fetches = 0
-        for arxiv_id in missing_ids:
-            if fetches >= self.max_fetches:
-                LOGGER.info("Hugging Face fetch cap (%d) reached; deferring remaining papers", self.max_fetches)
-                break
-            fetches += 1
+        fetch_ids = missing_ids[: max(0, self.max_fetches)]
+        if len(fetch_ids) < len(missing_ids):
+            LOGGER.info("Hugging Face fetch cap (%d) reached; deferring remaining papers", self.max_fetches)
+        calls = [
+            {
+                "method": "GET",
+                "url": HF_PAPER_API_URL.format(arxiv_id=arxiv_id),
+                "params": {"field": "comments"},
+                "timeout": 15,
+                "attempts": 2,
+                "rate_limit_profile": "bulk",
+            }
+            for arxiv_id in fetch_ids
+        ]
+        outcomes = run_requests(
+            calls,
+            request_fn=request_fn,
+            session=session,
+            async_http=self.async_http,
+            stop_when=_is_rate_limited,
+            concurrency=self.concurrency,
+            source=self.source,
+        )
 
-            try:
-                response = request_fn(
-                    "GET",
-                    HF_PAPER_API_URL.format(arxiv_id=arxiv_id),
-                    params={"field": "comments"},
-                    session=session,
-                    timeout=15,
-                    attempts=2,
-                    rate_limit_profile="bulk",
-                )
-            except Exception as exc:
-                if _is_not_found(exc):
+        fetched: dict[str, dict[str, Any]] = {}
+        errors = 0
+        for arxiv_id, outcome in zip(fetch_ids, outcomes):
+            if outcome is None:
+                continue  # Never issued: an earlier request was rate limited.
+            if isinstance(outcome, Exception):
+                if _is_not_found(outcome):
                     # Normal case: the paper was never submitted to HF. Cache the
                     # miss so it is not re-queried every run until the TTL lapses.
                     fetched[arxiv_id] = {}
-                    continue
-                if _is_rate_limited(exc):
-                    LOGGER.warning("Hugging Face API rate limited; skipping remaining papers: %s", exc)
+                elif _is_rate_limited(outcome):
+                    errors += 1
+                    if not self.rate_limited:
+                        LOGGER.warning("Hugging Face API rate limited; skipping remaining papers: %s", outcome)
                     self.rate_limited = True
-                    break
-                LOGGER.warning("Hugging Face fetch failed for %s: %s", arxiv_id, exc)
+                else:
+                    errors += 1
+                    LOGGER.warning("Hugging Face fetch failed for %s: %s", arxiv_id, outcome)
                 continue
 
             try:
-                fetched[arxiv_id] = parse_hf_paper(response.json())
+                fetched[arxiv_id] = parse_hf_paper(outcome.json())
             except Exception as exc:
                 # A non-JSON 200 must skip this one paper, not abort the whole run.
+                errors += 1
                 LOGGER.warning("Hugging Face payload parse failed for %s: %s", arxiv_id, exc)
                 continue
 
+        PROVIDER_STATS.record(
+            self.source,
+            lookups=len(cached) + len(missing_ids),
+            cache_hits=len(cached),
+            errors=errors,
+        )
+
         if fetched:
             store_cached_payloads(
                 fetched,
@@ -150,11 +180,12 @@ class HuggingFaceProvider(EnrichmentProvider):
 def fetch_huggingface_batch(
     arxiv_ids: list[str],
     session: requests.Session | None = None,
+    async_http: bool = False,
 ) -> dict[str, dict[str, Any]]:
     """Fetch Hugging Face Papers data for a batch of arXiv IDs (cache-aware).
 
     Returns {arxiv_id: {hf_upvotes, hf_comments_count, github_repo_url, project_page_url}};
     a cached 404 miss maps to an empty dict.
     """
-    provider = HuggingFaceProvider()
+    provider = HuggingFaceProvider(async_http=async_http)
     return provider.fetch_batch(arxiv_ids, session=session)
@@ -1,21 +1,42 @@
-"""OpenAlex enrichment provider."""
+"""OpenAlex enrichment provider.
+
+Works are looked up by arXiv DOI, packed into as few ``doi:a|b|...`` OR-filter
+requests as the URL length allows and issued a few at a time. Only the fields
+:func:`parse_openalex_work` reads are selected. Ids a successful response didn't
+return are cached as empty misses on a shorter TTL, so papers OpenAlex hasn't
+indexed yet are retried daily rather than on every run.
+"""
 
 from __future__ import annotations
 
 import logging
 import re
 from typing import Any
+from urllib.parse import urlencode
 
 from app.services.enrichment_providers.base import (
     DEFAULT_CACHE_TTL_HOURS,
+    PROVIDER_STATS,
     EnrichmentProvider,
     get_cached_payloads,
+    run_requests,
     store_cached_payloads,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+OPENALEX_API_HOST = "api.openalex.org"
 OPENALEX_WORKS_URL = "https://api.openalex.org/works"
+OPENALEX_SELECT_FIELDS = "id,doi,open_access,cited_by_count,referenced_works_count,topics"
+# Newly announced papers reach OpenAlex within days; re-ask about a miss sooner
+# than a hit is refreshed.
+OPENALEX_MISS_TTL_HOURS = 24
+# Requests in flight at once; the polite pool allows 10 requests/second.
+OPENALEX_CONCURRENCY = 4
+# OpenAlex accepts at most 100 values in one OR filter.
+_MAX_OR_VALUES = 100
+# Keep each request URL under the 4 KiB many proxies and servers cap request lines at.
+_MAX_URL_LENGTH = 4000
 
 # OpenAlex made API keys mandatory (~Feb 2026); the free tier authenticates via an
 # ``api_key`` query parameter (per docs.openalex.org → developers.openalex.org).
@@ -60,17 +81,73 @@ def parse_openalex_work(work: dict) -> dict[str, Any]:
         "openalex_topics": topics,
         "oa_status": oa_info.get("oa_status"),
         "openalex_cited_by_count": work.get("cited_by_count"),
-        "referenced_works_count": len(work.get("referenced_works") or []),
+        # Requests select the count; a full work object carries only the list.
+        "referenced_works_count": work.get("referenced_works_count") or len(work.get("referenced_works") or []),
+    }
+
+
+def _arxiv_doi(arxiv_id: str) -> str:
+    return f"10.48550/arXiv.{arxiv_id}"
+
+
+def _works_params(dois: list[str], *, email: str | None, api_key: str | None) -> dict[str, str]:
+    params: dict[str, str] = {
+        "filter": "doi:" + "|".join(dois),
+        "select": OPENALEX_SELECT_FIELDS,
+        "per_page": str(_MAX_OR_VALUES),
     }
+    if email:
+        params["mailto"] = email
+    if api_key:
+        params["api_key"] = api_key
+    return params
+
+
+def pack_doi_batches(arxiv_ids: list[str], *, email: str | None = None, api_key: str | None = None) -> list[list[str]]:
+    """Split ``arxiv_ids`` into the fewest OR-filter batches whose URLs fit the limit.
+
+    Sizes come from the encoded query string exactly as it will be sent, so the
+    ``mailto``/``api_key`` parameters count against the budget too.
+    """
+    fixed = len(OPENALEX_WORKS_URL) + 1 + len(urlencode(_works_params([], email=email, api_key=api_key)))
+    separator = len(urlencode({"": "|"})) - 1
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    length = fixed
+    for arxiv_id in arxiv_ids:
+        cost = len(urlencode({"": _arxiv_doi(arxiv_id)})) - 1 + (separator if batch else 0)
+        if batch and (len(batch) >= _MAX_OR_VALUES or length + cost > _MAX_URL_LENGTH):
+            batches.append(batch)
+            batch, length = [], fixed
+            cost -= separator
+        batch.append(arxiv_id)
+        length += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _is_auth_failure(exc: Exception) -> bool:
+    return getattr(getattr(exc, "response", None), "status_code", None) in _AUTH_FAILURE_STATUSES
 
 
 class OpenAlexProvider(EnrichmentProvider):
     source = "openalex"
 
-    def __init__(self, *, ttl_hours: int = DEFAULT_CACHE_TTL_HOURS, request_fn=None, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        ttl_hours: int = DEFAULT_CACHE_TTL_HOURS,
+        request_fn=None,
+        api_key: str | None = None,
+        async_http: bool = False,
+        concurrency: int = OPENALEX_CONCURRENCY,
+    ) -> None:
         self.ttl_hours = ttl_hours
         self._request_fn = request_fn
         self._api_key = api_key
+        self.async_http = async_http
+        self.concurrency = concurrency
 
     def fetch_batch(  # type: ignore[override]  # provider-specific kwargs; base Protocol uses **kwargs
         self,
@@ -87,45 +164,52 @@ class OpenAlexProvider(EnrichmentProvider):
         request_fn = self._request_fn or request_with_backoff
         api_key = self._api_key or resolve_data_source_key("openalex")
         cached, missing_ids, paper_by_arxiv_id = get_cached_payloads(arxiv_ids, source=self.source)
+        PROVIDER_STATS.record(self.source, lookups=len(cached) + len(missing_ids), cache_hits=len(cached))
+        # A cached miss is an empty payload: answered, but nothing to return.
+        cached = {arxiv_id: payload for arxiv_id, payload in cached.items() if payload}
         if not missing_ids:
             return cached
 
-        fetched: dict[str, dict[str, Any]] = {}
-
-        batch_size = 50
-        for i in range(0, len(missing_ids), batch_size):
-            batch = missing_ids[i : i + batch_size]
-            dois = [f"https://doi.org/10.48550/arXiv.{aid}" for aid in batch]
-            doi_filter = "|".join(dois)
-
-            params: dict[str, str] = {
-                "filter": f"doi:{doi_filter}",
-                "select": "id,doi,open_access,cited_by_count,referenced_works,topics",
-                "per_page": str(len(batch)),
+        batches = pack_doi_batches(missing_ids, email=email, api_key=api_key)
+        calls = [
+            {
+                "method": "GET",
+                "url": OPENALEX_WORKS_URL,
+                "params": _works_params([_arxiv_doi(aid) for aid in batch], email=email, api_key=api_key),
+                "timeout": 15,
             }
-            if email:
-                params["mailto"] = email
-            if api_key:
-                params["api_key"] = api_key
+            for batch in batches
+        ]
+        # An auth/rate-limit failure will repeat for every remaining batch; stop there.
+        outcomes = run_requests(
+            calls,
+            request_fn=request_fn,
+            session=session,
+            async_http=self.async_http,
+            stop_when=_is_auth_failure,
+            concurrency=self.concurrency,
+            source=self.source,
+        )
 
+        fetched: dict[str, dict[str, Any]] = {}
+        misses: dict[str, dict[str, Any]] = {}
+        errors = 0
+        for batch, response in zip(batches, outcomes):
             try:
-                response = request_fn(
-                    "GET",
-                    OPENALEX_WORKS_URL,
-                    params=params,
-                    session=session,
-                    timeout=15,
-                )
+                if isinstance(response, Exception):
+                    raise response
                 # The real request_with_backoff raises on failure and always
                 # returns a truthy Response, so this guard is dead on that path.
                 # It is retained deliberately to tolerate an injected request_fn
                 # (test doubles / the fetch_openalex_batch shim) that returns a
-                # falsy/None response instead of raising.
+                # falsy/None response instead of raising. It also skips batches
+                # never issued after an auth failure.
                 if not response:
                     continue
 
                 data = response.json()
                 batch_by_id = {aid.lower(): aid for aid in batch}
+                found: set[str] = set()
                 for work in data.get("results", []):
                     try:
                         doi = (work.get("doi") or "").lower()
@@ -138,19 +222,28 @@ class OpenAlexProvider(EnrichmentProvider):
                         aid = batch_by_id.get(work_id)
                         if aid is not None:
                             fetched[aid] = parse_openalex_work(work)
+                            found.add(aid)
                     except Exception as exc:
                         # One malformed work must not abandon the rest of the batch.
                         LOGGER.warning("Skipping malformed OpenAlex work: %s", exc)
+                misses.update((aid, {}) for aid in batch if aid not in found)
             except Exception as exc:
-                status = getattr(getattr(exc, "response", None), "status_code", None)
-                if status in _AUTH_FAILURE_STATUSES and not api_key:
+                errors += 1
+                if _is_auth_failure(exc) and not api_key:
                     _warn_missing_key_once()
                 LOGGER.warning("Failed to fetch OpenAlex data for batch: %s", exc)
 
+        PROVIDER_STATS.record(self.source, errors=errors)
         store_cached_payloads(
             fetched,
             source=self.source,
             paper_by_arxiv_id=paper_by_arxiv_id,
             ttl_hours=self.ttl_hours,
         )
+        store_cached_payloads(
+            misses,
+            source=self.source,
+            paper_by_arxiv_id=paper_by_arxiv_id,
+            ttl_hours=min(self.ttl_hours, OPENALEX_MISS_TTL_HOURS),
+        )
         return {**cached, **fetched}
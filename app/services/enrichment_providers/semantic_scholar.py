@@ -9,6 +9,7 @@ from app.services.enrichment_providers.base import (
     DEFAULT_CACHE_TTL_HOURS,
     EnrichmentProvider,
     get_cached_payloads,
+    run_requests,
     store_cached_payloads,
 )
 
@@ -24,10 +25,18 @@ SEMANTIC_SCHOLAR_BATCH_LIMIT = 500
 class SemanticScholarProvider(EnrichmentProvider):
     source = "semantic_scholar"
 
-    def __init__(self, *, ttl_hours: int = DEFAULT_CACHE_TTL_HOURS, request_fn=None, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        ttl_hours: int = DEFAULT_CACHE_TTL_HOURS,
+        request_fn=None,
+        api_key: str | None = None,
+        async_http: bool = False,
+    ) -> None:
         self.ttl_hours = ttl_hours
         self._request_fn = request_fn
         self._api_key = api_key
+        self.async_http = async_http
 
     def fetch_batch(self, arxiv_ids: list[str], session=None) -> dict[str, dict[str, Any]]:  # type: ignore[override]  # provider-specific kwargs; base Protocol uses **kwargs
         from app.services.http_client import request_with_backoff
@@ -55,28 +64,37 @@ class SemanticScholarProvider(EnrichmentProvider):
             extra_kwargs["rate_limit_profile"] = "bulk"
         fetched: dict[str, dict[str, Any]] = {}
 
-        for i in range(0, len(missing_ids), SEMANTIC_SCHOLAR_BATCH_LIMIT):
-            batch = missing_ids[i : i + SEMANTIC_SCHOLAR_BATCH_LIMIT]
-            payload = {"ids": [f"ARXIV:{arxiv_id}" for arxiv_id in batch]}
+        batches = [
+            missing_ids[i : i + SEMANTIC_SCHOLAR_BATCH_LIMIT]
+            for i in range(0, len(missing_ids), SEMANTIC_SCHOLAR_BATCH_LIMIT)
+        ]
+        calls = [
+            {
+                "method": "POST",
+                "url": SEMANTIC_SCHOLAR_BATCH_URL,
+                "json": {"ids": [f"ARXIV:{arxiv_id}" for arxiv_id in batch]},
+                "params": params,
+                "timeout": 15,
+                **extra_kwargs,
+            }
+            for batch in batches
+        ]
+        outcomes = run_requests(calls, request_fn=request_fn, session=session, async_http=self.async_http)
+
+        for batch, response in zip(batches, outcomes):
+            if isinstance(response, Exception):
+                # One failed chunk must not abandon the rest of the batch.
+                LOGGER.warning("Failed to fetch citations from Semantic Scholar: %s", response)
+                continue
+            # The real request_with_backoff raises on failure and always
+            # returns a truthy Response, so this guard is dead on that path.
+            # It is retained deliberately to tolerate an injected request_fn
+            # (test doubles) that returns a falsy/None response instead of
+            # raising.
+            if not response:
+                continue
 
             try:
-                response = request_fn(
-                    "POST",
-                    SEMANTIC_SCHOLAR_BATCH_URL,
-                    json=payload,
-                    params=params,
-                    session=session,
-                    timeout=15,
-                    **extra_kwargs,
-                )
-                # The real request_with_backoff raises on failure and always
-                # returns a truthy Response, so this guard is dead on that path.
-                # It is retained deliberately to tolerate an injected request_fn
-                # (test doubles) that returns a falsy/None response instead of
-                # raising.
-                if not response:
-                    continue
-
                 data = response.json()
                 for idx, item in enumerate(data):
                     if item is None:
@@ -90,7 +108,6 @@ class SemanticScholarProvider(EnrichmentProvider):
                         "semantic_scholar_id": item.get("paperId"),
                     }
             except Exception as exc:
-                # One failed chunk must not abandon the rest of the batch.
                 LOGGER.warning("Failed to fetch citations from Semantic Scholar: %s", exc)
 
         store_cached_payloads(
@@ -1,44 +1,88 @@
-"""Static HTML export helpers."""
+"""Static HTML export helpers.
+
+Exports stream: papers are read in keyset batches over ``(rank_score, id)`` and
+rendered chunk by chunk, so memory and time-to-first-byte stay flat however large
+the library is.
+"""
 
 from __future__ import annotations
 
-from datetime import timedelta
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from flask import render_template
+from flask import current_app
+from flask_sqlalchemy.query import Query
 
-from app.models import Paper, inbox_freshness_clause
+from app.models import Paper, db, inbox_freshness_clause
 from app.routes.dashboard import TIMEFRAME_DAYS
-from app.services.ranking import rank_score_order_expr
 from app.services.text import now_utc
 
+EXPORT_BATCH_SIZE = 500
+# Template events buffered per yielded chunk (a few cards' worth of markup).
+_STREAM_BUFFER_EVENTS = 64
 
-def generate_html_report(app, timeframe: str = "daily", output_path: str | Path | None = None) -> str:
+
+def iter_ranked_papers(query: Query, *, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Paper]:
+    """Yield ``query``'s papers best-ranked first, one keyset batch at a time.
+
+    Each batch seeks past the previous batch's last ``(rank_score, id)`` on the rank
+    index, so late batches cost what the first does. A batch is fetched whole, so no
+    cursor (and no SQLite read snapshot) stays open while a slow client downloads;
+    a single ``yield_per`` cursor would hold one for the whole response.
+    """
+    ordered = query.order_by(Paper.rank_score.desc(), Paper.id.desc())
+    key = db.tuple_(Paper.rank_score, Paper.id)
+    last: tuple[float, int] | None = None
+    while True:
+        batch = (ordered if last is None else ordered.filter(key < last)).limit(batch_size).all()
+        if not batch:
+            return
+        last = (batch[-1].rank_score, batch[-1].id)
+        yield from batch
+        if len(batch) < batch_size:
+            return
+
+
+def _report_query(timeframe: str, generated_at: datetime) -> Query:
+    query = Paper.query.filter(Paper.is_hidden.is_(False))
+    days = TIMEFRAME_DAYS.get(timeframe)
+    if days is not None:
+        query = query.filter(inbox_freshness_clause(generated_at - timedelta(days=days)))
+    return query
+
+
+def stream_html_report(timeframe: str = "daily") -> Iterator[str]:
+    """Render the HTML report as a stream of chunks (needs an app context to iterate).
+
+    Only the paper count is queried up front; cards are rendered as their batch
+    arrives, so the page head goes out before the first paper is read.
+    """
     if timeframe not in TIMEFRAME_DAYS:
         timeframe = "daily"
-
     generated_at = now_utc()
-    days = TIMEFRAME_DAYS.get(timeframe)
+    query = _report_query(timeframe, generated_at)
+
+    app = current_app._get_current_object()
+    context = {
+        "papers": iter_ranked_papers(query),
+        "timeframe": timeframe,
+        "generated_at": generated_at,
+        "total": query.order_by(None).count(),
+    }
+    app.update_template_context(context)
+    stream = app.jinja_env.get_template("export.html").stream(context)
+    stream.enable_buffering(_STREAM_BUFFER_EVENTS)
+    return stream
+
+
+def generate_html_report(app, timeframe: str = "daily", output_path: str | Path | None = None) -> str:
+    """The whole report as one string (also written to ``output_path`` when given).
 
+    Holds the full document in memory; HTTP exports stream :func:`stream_html_report`.
+    """
     with app.app_context():
-        query = Paper.query.filter(Paper.is_hidden.is_(False))
-        if days is not None:
-            cutoff_dt = generated_at - timedelta(days=days)
-            query = query.filter(inbox_freshness_clause(cutoff_dt))
-
-        papers = query.order_by(
-            rank_score_order_expr().desc(),
-            Paper.publication_dt.desc(),
-            Paper.scraped_at.desc(),
-        ).all()
-
-        html = render_template(
-            "export.html",
-            papers=papers,
-            timeframe=timeframe,
-            generated_at=generated_at,
-            total=len(papers),
-        )
+        html = "".join(stream_html_report(timeframe))
 
     if output_path:
         output = Path(output_path)
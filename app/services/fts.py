@@ -0,0 +1,212 @@
+"""Maintenance of the ``papers_fts`` full-text index.
+
+``papers_fts`` is an external-content FTS5 table kept in sync with ``papers`` by
+the triggers in :mod:`app.schema`. Per-row triggers are right for the odd manual
+edit but wasteful for a scrape, so bulk writers use two wrappers:
+
+* :func:`batched_fts_inserts` — drops the insert trigger for the duration of one
+  write transaction and indexes every new row with a single ``INSERT ... SELECT``
+  before recreating it. The swap happens under ``BEGIN IMMEDIATE`` so no other
+  connection can insert a paper while the trigger is gone.
+* :func:`deferred_fts_merges` — turns off FTS5's incremental ``automerge`` and
+  raises ``crisismerge`` while a scrape runs, so segment merging doesn't happen
+  inside every save. On exit (and at startup, in case a scrape was killed inside
+  the block) the steady-state settings are restored, and
+  :func:`run_fts_maintenance` merges the backlog: a full ``optimize`` at most every
+  :data:`FTS_OPTIMIZE_INTERVAL_HOURS` (tracked in the ``fts:optimize`` sync-state
+  row), otherwise a bounded ``merge``.
+
+Whether the index exists at all is probed once per app and cached in
+``app.extensions``; :func:`app.schema.ensure_schema` clears the cache after (re)creating it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+
+from flask import current_app
+from sqlalchemy import text
+
+from app.models import SyncState, db
+from app.services.text import now_utc
+
+LOGGER = logging.getLogger(__name__)
+
+# FTS5's own defaults, restored after a bulk load.
+FTS_AUTOMERGE = 4
+FTS_CRISISMERGE = 16
+# While deferred: no incremental merging, and a level may hold 64 segments before
+# FTS5 forces a merge inside the writing transaction.
+FTS_BULK_CRISISMERGE = 64
+# Pages of merge work done after a bulk load when an optimize isn't due.
+FTS_MERGE_PAGES = 2000
+FTS_OPTIMIZE_INTERVAL_HOURS = 24
+OPTIMIZE_STATE_CATEGORY = "fts:optimize"
+
+_AVAILABLE_KEY = "papers_fts_available"
+_INSERT_TRIGGER = "papers_fts_insert"
+_FTS_COLUMNS = "rowid, title, abstract_text, authors, topic_tags"
+_INDEX_NEW_ROWS = text(
+    f"INSERT INTO papers_fts({_FTS_COLUMNS}) "  # noqa: S608 - constant column list
+    "SELECT id, title, abstract_text, authors, COALESCE(topic_tags, '') FROM papers WHERE id > :floor"
+)
+
+
+def fts5_available() -> bool:
+    """Whether ``papers_fts`` can be queried; probed once per app."""
+    extensions = current_app.extensions
+    cached = extensions.get(_AVAILABLE_KEY)
+    if cached is not None:
+        return cached
+    try:
+        db.session.execute(text("SELECT 1 FROM papers_fts LIMIT 1"))
+        available = True
+    except Exception:
+        db.session.rollback()
+        available = False
+    extensions[_AVAILABLE_KEY] = available
+    return available
+
+
+def reset_fts5_available() -> None:
+    """Forget the cached probe (after the index is created, dropped or found broken)."""
+    current_app.extensions.pop(_AVAILABLE_KEY, None)
+
+
+def _set_config(name: str, value: int) -> None:
+    db.session.execute(
+        text("INSERT INTO papers_fts(papers_fts, rank) VALUES (:name, :value)"),
+        {"name": name, "value": int(value)},
+    )
+
+
+def _insert_trigger_sql() -> str | None:
+    return db.session.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+        {"name": _INSERT_TRIGGER},
+    ).scalar()
+
+
+@contextmanager
+def batched_fts_inserts() -> Iterator[None]:
+    """Run the block's paper inserts as one transaction indexed in a single statement.
+
+    Commits any pending work first, then commits the block together with its FTS
+    rows on success; rolls everything back (trigger included) if the block raises.
+    A no-op wrapper when the index or its insert trigger is missing.
+    """
+    if not fts5_available():
+        yield
+        return
+    db.session.commit()
+    connection = db.session.connection()
+    if not connection.connection.driver_connection.in_transaction:
+        # DDL doesn't open a transaction under pysqlite; without this the DROP
+        # TRIGGER would autocommit and expose an unindexed window to other writers.
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    try:
+        trigger_sql = _insert_trigger_sql()
+        if trigger_sql is None:
+            yield
+            db.session.commit()
+            return
+        floor = db.session.execute(text("SELECT COALESCE(MAX(id), 0) FROM papers")).scalar()
+        db.session.execute(text(f"DROP TRIGGER {_INSERT_TRIGGER}"))
+        yield
+        db.session.flush()
+        db.session.execute(_INDEX_NEW_ROWS, {"floor": floor})
+        db.session.execute(text(trigger_sql))
+        db.session.commit()
+    except BaseException:
+        db.session.rollback()
+        raise
+
+
+def _optimize_due(state: SyncState | None, now) -> bool:
+    if state is None or state.last_synced_updated_at is None:
+        return True
+    return now - state.last_synced_updated_at >= timedelta(hours=FTS_OPTIMIZE_INTERVAL_HOURS)
+
+
+def run_fts_maintenance(*, force_optimize: bool = False) -> str | None:
+    """Merge the index's segments after a bulk load.
+
+    Runs ``optimize`` (one segment, fastest queries) when forced or when the last
+    one is older than :data:`FTS_OPTIMIZE_INTERVAL_HOURS`, else a bounded
+    ``merge``. Returns ``"optimize"``, ``"merge"`` or ``None`` without an index.
+    """
+    if not fts5_available():
+        return None
+    now = now_utc()
+    state = SyncState.query.filter_by(category=OPTIMIZE_STATE_CATEGORY).one_or_none()
+    try:
+        if force_optimize or _optimize_due(state, now):
+            db.session.execute(text("INSERT INTO papers_fts(papers_fts) VALUES ('optimize')"))
+            if state is None:
+                state = SyncState(category=OPTIMIZE_STATE_CATEGORY)
+                db.session.add(state)
+            state.last_synced_updated_at = now
+            action = "optimize"
+        else:
+            _set_config("merge", FTS_MERGE_PAGES)
+            action = "merge"
+        db.session.commit()
+    except Exception as exc:
+        LOGGER.warning("FTS5 maintenance failed: %s", exc)
+        db.session.rollback()
+        return None
+    LOGGER.info("FTS5 maintenance: %s", action)
+    return action
+
+
+@contextmanager
+def deferred_fts_merges() -> Iterator[None]:
+    """Defer segment merging for the duration of a bulk scrape, then catch up.
+
+    The merge settings persist in the index, so they are restored in ``finally``
+    even when the scrape fails.
+    """
+    if not fts5_available():
+        yield
+        return
+    try:
+        _set_config("automerge", 0)
+        _set_config("crisismerge", FTS_BULK_CRISISMERGE)
+        db.session.commit()
+    except Exception as exc:
+        LOGGER.warning("Could not defer FTS5 merges: %s", exc)
+        db.session.rollback()
+    try:
+        yield
+    finally:
+        restore_fts_merge_settings()
+        run_fts_maintenance()
+
+
+def restore_fts_merge_settings() -> None:
+    """Put ``automerge``/``crisismerge`` back to their steady-state values if they differ.
+
+    Runs on exit from :func:`deferred_fts_merges` and on every startup (via
+    :func:`app.schema.ensure_schema`), so a scrape killed inside the block — where the
+    ``finally`` never ran — doesn't leave incremental merging off for good.
+    """
+    if not fts5_available():
+        return
+    try:
+        stored: dict[str, int] = dict(
+            db.session.execute(text("SELECT k, v FROM papers_fts_config WHERE k IN ('automerge', 'crisismerge')")).all()
+        )
+        changed = False
+        for name, value in (("automerge", FTS_AUTOMERGE), ("crisismerge", FTS_CRISISMERGE)):
+            # An absent key means FTS5's default, which is the steady-state value.
+            if stored.get(name, value) != value:
+                _set_config(name, value)
+                changed = True
+        if changed:
+            db.session.commit()
+    except Exception as exc:
+        LOGGER.warning("Could not restore FTS5 merge settings: %s", exc)
+        db.session.rollback()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any
@@ -41,14 +41,8 @@ class ResponseTooLargeError(Exception):
     """Raised when a response body exceeds the configured ``max_bytes`` ceiling."""
 
 
-def _read_capped_body(response: requests.Response, max_bytes: int) -> None:
-    """Buffer ``response`` body into memory, aborting once ``max_bytes`` is exceeded.
-
-    Reads incrementally via :meth:`requests.Response.iter_content` and stashes the
-    result into ``response._content`` so ``.content``/``.text``/``.json()`` keep
-    working transparently for callers. Rejects early on a declared
-    ``Content-Length`` over the cap to avoid downloading a body we'll discard.
-    """
+def _reject_declared_oversize(response: requests.Response, max_bytes: int) -> None:
+    """Fail before downloading a body whose declared ``Content-Length`` is over the cap."""
     headers = getattr(response, "headers", None)
     declared = headers.get("Content-Length") if headers else None
     if declared is not None:
@@ -59,14 +53,8 @@ def _read_capped_body(response: requests.Response, max_bytes: int) -> None:
         except (TypeError, ValueError):
             pass  # Malformed header — fall through to the streamed byte count guard.
 
-    try:
-        chunk_iter = iter(response.iter_content(chunk_size=64 * 1024))
-    except TypeError:
-        # The response object doesn't yield a real byte stream (e.g. a test
-        # double). Nothing to cap — leave .content/.text untouched.
-        return
 
-    chunks: list[bytes] = []
+def _capped_chunks(response: requests.Response, chunk_iter: Iterator[bytes], max_bytes: int) -> Iterator[bytes]:
     total = 0
     for chunk in chunk_iter:
         if not chunk:
@@ -75,10 +63,40 @@ def _read_capped_body(response: requests.Response, max_bytes: int) -> None:
         if total > max_bytes:
             response.close()
             raise ResponseTooLargeError(f"Response body exceeds cap {max_bytes}")
-        chunks.append(chunk)
+        yield chunk
+
+
+def iter_capped_content(response: requests.Response, max_bytes: int, *, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a ``stream=True`` response's body chunk by chunk, aborting past ``max_bytes``.
+
+    The incremental counterpart of the capped buffering :func:`request_with_backoff`
+    does, for callers that parse the body as it arrives. An oversized declared
+    ``Content-Length`` is rejected before the first chunk is read.
+    """
+    _reject_declared_oversize(response, max_bytes)
+    return _capped_chunks(response, iter(response.iter_content(chunk_size=chunk_size)), max_bytes)
+
+
+def _read_capped_body(response: requests.Response, max_bytes: int) -> None:
+    """Buffer ``response`` body into memory, aborting once ``max_bytes`` is exceeded.
+
+    Reads incrementally via :meth:`requests.Response.iter_content` and stashes the
+    result into ``response._content`` so ``.content``/``.text``/``.json()`` keep
+    working transparently for callers. Rejects early on a declared
+    ``Content-Length`` over the cap to avoid downloading a body we'll discard.
+    """
+    _reject_declared_oversize(response, max_bytes)
+
+    try:
+        chunk_iter = iter(response.iter_content(chunk_size=64 * 1024))
+    except TypeError:
+        # The response object doesn't yield a real byte stream (e.g. a test
+        # double). Nothing to cap — leave .content/.text untouched.
+        return
+
     # Populate the private cache requests uses so .content/.text/.json() are served
     # from our capped buffer instead of re-reading the (already consumed) stream.
-    response._content = b"".join(chunks)
+    response._content = b"".join(_capped_chunks(response, chunk_iter, max_bytes))
     response._content_consumed = True
 
 
@@ -136,6 +154,7 @@ def _is_retryable(exc: Exception) -> bool:
 _SESSION_LIMITER_ATTR = "_cv_arxiv_rate_limiter"
 _SESSION_RATE_LIMIT_ATTR = "_cv_arxiv_rate_limit_settings"
 _SESSION_USER_AGENT_ATTR = "_cv_arxiv_user_agent"
+_SESSION_RATE_LIMIT_SCOPE_ATTR = "_cv_arxiv_rate_limit_scope"
 
 
 def resolve_user_agent(scraper_config: Mapping[str, Any] | None = None, *, fallback: str = DEFAULT_USER_AGENT) -> str:
@@ -147,6 +166,12 @@ def resolve_user_agent(scraper_config: Mapping[str, Any] | None = None, *, fallb
     return fallback
 
 
+def async_http_enabled(scraper_config: Mapping[str, Any] | None) -> bool:
+    """Whether ``ingest.async_http`` routes the fetch-heavy stages through :mod:`app.services.async_http`."""
+    ingest = scraper_config.get("ingest", {}) if isinstance(scraper_config, Mapping) else {}
+    return isinstance(ingest, Mapping) and ingest.get("async_http") is True
+
+
 def _headers_with_user_agent(headers: Mapping[str, str] | None, *, user_agent: str) -> dict[str, str]:
     merged = dict(headers or {})
     if not any(key.lower() == "user-agent" for key in merged):
@@ -155,8 +180,12 @@ def _headers_with_user_agent(headers: Mapping[str, str] | None, *, user_agent: s
 
 
 def _apply_session_config(session: requests.Session, *, settings, user_agent: str):
-    """Stamp resolved rate-limit settings + User-Agent onto a session."""
-    limiter = get_shared_rate_limiter(settings)
+    """Stamp resolved rate-limit settings + User-Agent onto a session.
+
+    A rate-limit scope stamped at creation (see :func:`create_session`) survives
+    later reconfiguration, so the session keeps drawing from its own bucket.
+    """
+    limiter = get_shared_rate_limiter(settings, getattr(session, _SESSION_RATE_LIMIT_SCOPE_ATTR, None))
     session.headers["User-Agent"] = user_agent
     setattr(session, _SESSION_LIMITER_ATTR, limiter)
     setattr(session, _SESSION_RATE_LIMIT_ATTR, settings)
@@ -188,6 +217,7 @@ def request_with_backoff(
     rate_limit_profile: str | None = None,
     user_agent: str | None = None,
     max_bytes: int | None = _DEFAULT_MAX_BYTES,
+    raise_for_status: bool = True,
     **kwargs: Any,
 ) -> requests.Response:
     """Run an HTTP request with bounded retries and exponential backoff.
@@ -197,6 +227,11 @@ def request_with_backoff(
     :class:`ResponseTooLargeError`. Pass ``max_bytes=None`` to disable the cap.
     The buffered body is cached on the response, so callers keep using
     ``.content``/``.text``/``.json()`` unchanged.
+
+    With ``raise_for_status=False`` an HTTP error status that is not retried (or
+    outlived its retries) is returned instead of raised, for API clients that
+    branch on it (a 401 that triggers a token refresh, a 403 for a bad key).
+    Network errors still raise.
     """
     # Always make at least one attempt. A misconfigured ``attempts <= 0`` (e.g.
     # ``pdf_attempts: 0``) would otherwise skip the loop entirely and ``raise
@@ -274,6 +309,9 @@ def request_with_backoff(
             )
             time.sleep(delay)
 
+    error_response = getattr(last_exc, "response", None)
+    if not raise_for_status and isinstance(last_exc, requests.HTTPError) and error_response is not None:
+        return error_response
     raise last_exc  # guaranteed non-None by loop logic
 
 
@@ -283,9 +321,16 @@ def create_session(
     scraper_config: Mapping[str, Any] | None = None,
     rate_limit_profile: str = "interactive",
     user_agent: str | None = None,
+    rate_limit_scope: str | None = None,
 ) -> requests.Session:
-    """Create a session with connection pooling for concurrent downloads."""
+    """Create a session with connection pooling for concurrent downloads.
+
+    ``rate_limit_scope`` (a host name) gives the session its own token bucket rather
+    than the process-wide one shared by every session with the same settings.
+    """
     session = requests.Session()
+    if rate_limit_scope:
+        setattr(session, _SESSION_RATE_LIMIT_SCOPE_ATTR, rate_limit_scope)
     adapter = requests.adapters.HTTPAdapter(
         pool_connections=pool_size,
         pool_maxsize=pool_size,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import logging
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import date
 from typing import Any
 
@@ -12,20 +13,26 @@ import requests
 
 from app.constants import ARXIV_API_BATCH_SIZE as _ARXIV_API_BATCH_SIZE
 from app.constants import ARXIV_API_DELAY as _ARXIV_API_DELAY
-from app.services.http_client import request_with_backoff
+from app.services.http_client import iter_capped_content, request_with_backoff
 from app.services.ingest.base import PaperCandidate, clean_abstract, extract_arxiv_id, parse_publication_dt
 from app.services.text import clean_whitespace
 
+LOGGER = logging.getLogger(__name__)
+
 ProgressCallback = Callable[[int, PaperCandidate], None]
 
 _ARXIV_API_URL = "https://export.arxiv.org/api/query"
 _ARXIV_API_TIMEOUT = 45
 _ARXIV_API_ATTEMPTS = 4
 _ARXIV_API_BASE_DELAY = 2.0
+# An Atom page of <= page_size entries is a few MB; cap well below the global
+# default so a hostile response can't stream 200 MB of XML.
+_ARXIV_API_MAX_BYTES = 25 * 1024 * 1024
 _ATOM_NS = {
     "atom": "http://www.w3.org/2005/Atom",
     "arxiv": "http://arxiv.org/schemas/atom",
 }
+_ATOM_ENTRY_TAG = f"{{{_ATOM_NS['atom']}}}entry"
 
 
 def _build_query(categories: Sequence[str], start_dt: date, end_dt: date) -> str:
@@ -74,6 +81,43 @@ def _parse_atom_candidate(entry: ET.Element) -> PaperCandidate:
     )
 
 
+class _ChunkReader:
+    """File-like ``read()`` over an iterable of byte chunks, as ``iterparse`` expects."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._pending = chunk
+        if size < 0 or size >= len(self._pending):
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def iter_atom_candidates(chunks: Iterable[bytes]) -> Iterator[PaperCandidate]:
+    """Parse an arXiv API Atom feed incrementally, yielding each entry as its tag closes.
+
+    ``chunks`` is the raw body as it arrives (see :func:`iter_capped_content`), so
+    candidates come out while the page is still downloading. Parsed entries are
+    cleared from the tree, so neither the body nor the whole document is ever held
+    in memory. Parsing goes through defusedxml, like the rest of the feed handling.
+    """
+    root = None
+    for event, element in ET.iterparse(_ChunkReader(chunks), events=("start", "end")):
+        if root is None:
+            root = element
+        elif event == "end" and element.tag == _ATOM_ENTRY_TAG:
+            yield _parse_atom_candidate(element)
+            root.clear()
+
+
 class ArxivApiBackend:
     def __init__(self, *, page_size: int = _ARXIV_API_BATCH_SIZE, delay_seconds: float = _ARXIV_API_DELAY):
         self.page_size = page_size
@@ -99,47 +143,69 @@ class ArxivApiBackend:
     ) -> list[PaperCandidate]:
         del kwargs
 
+        return [
+            candidate
+            for page in self.iter_pages(
+                categories=categories,
+                start_dt=start_dt,
+                end_dt=end_dt,
+                max_results=max_results,
+                session=session,
+                offset=offset,
+                resume_after_arxiv_id=resume_after_arxiv_id,
+                progress_callback=progress_callback,
+                user_agent=user_agent,
+            )
+            for candidate in page
+        ]
+
+    def iter_pages(
+        self,
+        *,
+        categories: Sequence[str],
+        start_dt: date,
+        end_dt: date,
+        max_results: int = 1000,
+        session: requests.Session | None = None,
+        offset: int = 0,
+        resume_after_arxiv_id: str | None = None,
+        progress_callback: ProgressCallback | None = None,
+        user_agent: str | None = None,
+    ) -> Iterator[list[PaperCandidate]]:
+        """Yield the candidates of each API page as soon as it is parsed.
+
+        The next page is only requested once the consumer asks for it, so a caller
+        that processes and drops each page holds at most one page in memory, and
+        closing the generator stops the crawl without another request.
+        """
         if not categories or max_results <= 0:
-            return []
+            return
 
         query_str = _build_query(categories, start_dt, end_dt)
-        results: list[PaperCandidate] = []
+        yielded = 0
         start = max(0, int(offset))
         resume_page = ((start // self.page_size) + 1) if resume_after_arxiv_id else None
         resume_consumed = resume_after_arxiv_id is None
 
-        while len(results) < max_results:
+        while yielded < max_results:
             if start > max(0, int(offset)) and self.delay_seconds > 0:
                 time.sleep(self.delay_seconds)
 
-            batch_limit = min(self.page_size, max_results - len(results))
-            response = request_with_backoff(
-                "GET",
-                _ARXIV_API_URL,
-                params={
+            batch_limit = min(self.page_size, max_results - yielded)
+            candidates = self._fetch_page(
+                {
                     "search_query": query_str,
                     "sortBy": "submittedDate",
                     "sortOrder": "descending",
                     "start": start,
                     "max_results": batch_limit,
                 },
-                timeout=_ARXIV_API_TIMEOUT,
-                attempts=_ARXIV_API_ATTEMPTS,
-                base_delay=_ARXIV_API_BASE_DELAY,
-                rate_limit_profile="bulk",
                 session=session,
                 user_agent=user_agent,
-                # An Atom page of <= page_size entries is a few MB; cap well below the
-                # global default so a hostile response can't buffer 200 MB of XML.
-                max_bytes=25 * 1024 * 1024,
             )
-            root = ET.fromstring(response.text)
-            entries = root.findall("atom:entry", _ATOM_NS)
-            if not entries:
+            if not candidates:
                 break
 
-            candidates = [_parse_atom_candidate(entry) for entry in entries]
-
             # If the saved cursor is no longer present on the page we resumed
             # from, it was pushed off by submissions/withdrawals that landed
             # between runs. Skipping the page (waiting to re-find the cursor)
@@ -154,6 +220,7 @@ class ArxivApiBackend:
             ):
                 resume_consumed = True
 
+            page: list[PaperCandidate] = []
             for batch_index, candidate in enumerate(candidates):
                 current_page = ((start + batch_index) // self.page_size) + 1
 
@@ -166,14 +233,72 @@ class ArxivApiBackend:
                     else:
                         continue
 
-                results.append(candidate)
+                page.append(candidate)
                 if progress_callback is not None:
                     progress_callback(current_page, candidate)
-                if len(results) >= max_results:
+                if yielded + len(page) >= max_results:
                     break
 
-            if len(entries) < batch_limit:
+            last_page = len(candidates) < batch_limit
+            del candidates
+            if page:
+                yielded += len(page)
+                yield page
+            if last_page:
                 break
             start += batch_limit
 
-        return results
+    def _fetch_page(
+        self,
+        params: dict[str, Any],
+        *,
+        session: requests.Session | None,
+        user_agent: str | None,
+    ) -> list[PaperCandidate]:
+        """Request one API page and parse it as it downloads.
+
+        :func:`request_with_backoff` retries the request itself (connection errors,
+        429/5xx) and raises anything else. Only a connection lost while the body is
+        downloading is retried here, by requesting the page again.
+        """
+        attempt = 1
+        while True:
+            response = self._request_page(params, session=session, user_agent=user_agent)
+            try:
+                return list(iter_atom_candidates(iter_capped_content(response, _ARXIV_API_MAX_BYTES)))
+            except requests.RequestException as exc:
+                if attempt >= _ARXIV_API_ATTEMPTS:
+                    raise
+                interrupted = exc
+            finally:
+                response.close()
+            delay = _ARXIV_API_BASE_DELAY * (2 ** (attempt - 1))
+            LOGGER.warning(
+                "arXiv API page download interrupted (%s/%s), retrying in %.1fs: %s",
+                attempt,
+                _ARXIV_API_ATTEMPTS,
+                delay,
+                interrupted,
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _request_page(
+        params: dict[str, Any],
+        *,
+        session: requests.Session | None,
+        user_agent: str | None,
+    ) -> requests.Response:
+        return request_with_backoff(
+            "GET",
+            _ARXIV_API_URL,
+            params=params,
+            timeout=_ARXIV_API_TIMEOUT,
+            attempts=_ARXIV_API_ATTEMPTS,
+            base_delay=_ARXIV_API_BASE_DELAY,
+            rate_limit_profile="bulk",
+            session=session,
+            user_agent=user_agent,
+            stream=True,
+        )
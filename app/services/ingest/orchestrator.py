@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime, time
 
@@ -114,6 +114,35 @@ class IngestOrchestrator:
             )
         raise ValueError(f"Unsupported ingest mode: {mode}")
 
+    def iter_pages(
+        self,
+        *,
+        mode: IngestMode,
+        categories: Sequence[str],
+        start_dt: date,
+        end_dt: date,
+        session: requests.Session | None = None,
+        max_results: int = 2000,
+        backend_names: Sequence[str] | None = None,
+        user_agent: str | None = None,
+    ) -> Iterator[list[PaperCandidate]]:
+        """Page-at-a-time form of a ``BACKFILL`` :meth:`fetch`.
+
+        Historical scrapes process and persist each page before asking for the next,
+        so their memory is bounded by the API page size rather than ``max_results``.
+        """
+        if mode != IngestMode.BACKFILL:
+            raise ValueError(f"Paged fetch is only supported for BACKFILL mode, not {mode}")
+        self._require_backend(self._resolve_backend_names(backend_names), backend_name="arxiv_api", mode=mode)
+        return self._arxiv_api_backend.iter_pages(
+            categories=categories,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            max_results=max_results,
+            session=session,
+            user_agent=user_agent,
+        )
+
     def _fetch_daily_watch(
         self,
         *,
@@ -159,11 +159,12 @@ def recompute_interest_similarities(app, *, batch_size: int = 500) -> int:
 
     updated = 0
     with app.app_context():
-        offset = 0
+        last_id = 0
         while True:
-            papers = Paper.query.order_by(Paper.id).offset(offset).limit(batch_size).all()
+            papers = Paper.query.filter(Paper.id > last_id).order_by(Paper.id).limit(batch_size).all()
             if not papers:
                 break
+            last_id = papers[-1].id
             if profile is None:
                 for paper in papers:
                     if paper.interest_similarity is not None:
@@ -180,7 +181,6 @@ def recompute_interest_similarities(app, *, batch_size: int = 500) -> int:
                         paper.interest_similarity = round(similarity, 4)
                         updated += 1
             db.session.commit()
-            offset += batch_size
 
     from app.services.ranking import recompute_all_paper_scores
 
@@ -9,9 +9,9 @@ import uuid
 from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 
-from app.services.scrape_engine import execute_scrape
+from app.services.scrape_engine import execute_historical_scrape, execute_scrape
 from app.services.text import now_utc
 
 LOGGER = logging.getLogger(__name__)
@@ -20,6 +20,8 @@ LOGGER = logging.getLogger(__name__)
 # terminate the SSE stream in stream_events. Keep both sites in sync via this set.
 TERMINAL_EVENTS = frozenset({"done", "scrape_error", "skipped"})
 
+_HISTORICAL_ERROR_MESSAGE = "Historical search failed. The arXiv API may be temporarily unavailable; please try again."
+
 
 @dataclass
 class ScrapeJob:
@@ -29,6 +31,8 @@ class ScrapeJob:
     events: list[tuple[str, dict]] = field(default_factory=list)
     finished_at: datetime | None = None
     condition: threading.Condition = field(default_factory=threading.Condition)
+    kind: str = "scrape"
+    cancel_event: threading.Event = field(default_factory=threading.Event)
 
 
 class ScrapeJobManager:
@@ -39,8 +43,13 @@ class ScrapeJobManager:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape-job")
+        # Historical searches get their own worker so a long backfill never queues
+        # the daily scrape behind it; the two only meet at the FAISS index, which
+        # scrape_engine._INDEX_WRITE_LOCK already serializes.
+        self._historical_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="historical-job")
         self._jobs: dict[str, ScrapeJob] = {}
         self._active_job_id: str | None = None
+        self._active_historical_id: str | None = None
 
     def _trim_history(self, keep: int = 4, stale_hours: int = 2) -> None:
         if len(self._jobs) <= keep:
@@ -58,7 +67,7 @@ class ScrapeJobManager:
         for job_id, job in list(self._jobs.items()):
             if (
                 job.finished_at is None
-                and job_id != self._active_job_id
+                and job_id not in {self._active_job_id, self._active_historical_id}
                 and (now - job.started_at).total_seconds() > stale_hours * 3600
             ):
                 self._jobs.pop(job_id, None)
@@ -93,13 +102,17 @@ class ScrapeJobManager:
             with self._lock:
                 if self._active_job_id == job_id:
                     self._active_job_id = None
+                if self._active_historical_id == job_id:
+                    self._active_historical_id = None
 
     def _run_job(self, app, job_id: str, force: bool = False) -> None:
+        job = self._jobs[job_id]
         try:
             execute_scrape(
                 app,
                 event_callback=lambda event, data: self._publish(job_id, event, data),
                 force=force,
+                cancel_event=job.cancel_event,
             )
         except Exception as exc:
             LOGGER.exception("Background scrape job failed")
@@ -125,6 +138,57 @@ class ScrapeJobManager:
             self._executor.submit(self._run_job, app, job_id, force)
             return job
 
+    def _run_historical_job(self, app, job_id: str, categories: list[str], start_dt: date, end_dt: date) -> None:
+        job = self._jobs[job_id]
+        try:
+            execute_historical_scrape(
+                app,
+                categories,
+                start_dt,
+                end_dt,
+                event_callback=lambda event, data: self._publish(job_id, event, data),
+                cancel_event=job.cancel_event,
+            )
+        except Exception:
+            LOGGER.exception("Historical scrape job failed")
+            self._publish(job_id, "scrape_error", {"message": _HISTORICAL_ERROR_MESSAGE})
+        finally:
+            with self._lock:
+                if self._active_historical_id == job_id:
+                    self._active_historical_id = None
+                self._trim_history()
+
+    def start_historical(self, app, categories: list[str], start_dt: date, end_dt: date) -> tuple[ScrapeJob, bool]:
+        """Queue a historical search; returns ``(job, started)``.
+
+        Only one historical search runs at a time: while one is active it is
+        returned with ``started=False`` instead of queueing a second backfill.
+        """
+        with self._lock:
+            active = self._jobs.get(self._active_historical_id or "")
+            if active is not None and active.finished_at is None:
+                return active, False
+
+            job_id = uuid.uuid4().hex
+            job = ScrapeJob(id=job_id, started_at=now_utc(), kind="historical")
+            self._jobs[job_id] = job
+            self._active_historical_id = job_id
+            self._historical_executor.submit(self._run_historical_job, app, job_id, categories, start_dt, end_dt)
+            return job, True
+
+    def cancel_historical(self, job_id: str) -> ScrapeJob | None:
+        """Ask a historical search to stop at its next chunk boundary.
+
+        Chunks already saved stay in the library; the job still finishes with a
+        ``done`` event (``cancelled: True``). Returns ``None`` for an unknown job.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.kind != "historical":
+            return None
+        job.cancel_event.set()
+        return job
+
     def get_status_snapshot(self) -> dict:
         """Thread-safe status snapshot for the polling endpoint."""
         with self._lock:
@@ -141,7 +205,7 @@ class ScrapeJobManager:
                 return {"running": True, "status": job.status}
 
             # Check the most recently finished job for terminal state.
-            completed = [j for j in self._jobs.values() if j.finished_at is not None]
+            completed = [j for j in self._jobs.values() if j.finished_at is not None and j.kind == "scrape"]
             if completed:
                 latest = max(completed, key=lambda j: j.finished_at)
                 return {
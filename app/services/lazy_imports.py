@@ -0,0 +1,57 @@
+"""Deferred imports for heavy optional dependencies.
+
+pdfplumber (pdfminer), openai (its pydantic type tree) and friends cost hundreds of
+milliseconds to import, yet most requests and CLI invocations never touch them.
+Service modules bind them through :func:`lazy_module` so the import cost is paid on
+first attribute access instead of on the ``create_app`` route-import chain.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from types import ModuleType
+
+_IMPORT_LOCK = threading.Lock()
+
+
+class LazyModule(ModuleType):
+    """Module stand-in that imports the real module on first attribute access.
+
+    Resolved attributes are copied onto the proxy, so after the first access lookups
+    are plain ``__dict__`` hits, and ``unittest.mock.patch("pkg.mod.pdfplumber.open")``
+    patches and restores the proxy's attribute without touching the real module.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _IMPORT_LOCK:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        value = getattr(self._load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self):
+        return dir(self._load())
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Return a proxy for ``name`` that defers ``import name`` until first use."""
+    return LazyModule(name)
@@ -6,17 +6,34 @@ import math
 import os
 import re
 import threading
+from collections.abc import Iterator
 from pathlib import Path
-
-try:  # pragma: no cover - exercised indirectly in integration paths
-    from openai import OpenAI
-except ImportError:  # pragma: no cover - depends on local environment
-    OpenAI = None
+from typing import Any
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _DEFAULT_KEY_PATH = _PROJECT_ROOT / ".llm_api_key"
 _NUMERIC_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
 
+# The openai SDK eagerly builds its whole pydantic type tree (~1.5s) on import, and
+# this module sits on the create_app route-import chain. Resolve the client class on
+# first LLMClient construction instead; None means the package is not installed.
+_UNRESOLVED = object()
+OpenAI: Any = _UNRESOLVED
+_OPENAI_LOCK = threading.Lock()
+
+
+def _openai_client_class():
+    global OpenAI
+    if OpenAI is _UNRESOLVED:
+        with _OPENAI_LOCK:
+            if OpenAI is _UNRESOLVED:
+                try:
+                    from openai import OpenAI as client_class
+                except ImportError:  # pragma: no cover - depends on local environment
+                    client_class = None
+                OpenAI = client_class
+    return OpenAI
+
 
 def _strip_code_fences(content: str) -> str:
     """Remove a wrapping ```json ... ``` fence that some models emit."""
@@ -68,10 +85,11 @@ class LLMClient:
     ):
         if not api_key.strip():
             raise ValueError("LLM API key is required")
-        if OpenAI is None:
+        client_class = _openai_client_class()
+        if client_class is None:
             raise RuntimeError("openai package is not installed")
 
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = client_class(api_key=api_key, base_url=base_url)
         self.model = model
         self._semaphore = threading.Semaphore(max(1, int(max_concurrent)))
         self.reasoning_effort = reasoning_effort
@@ -102,13 +120,33 @@ class LLMClient:
             **request,
         )
 
-    def complete(self, *, system_prompt: str, user_prompt: str, max_tokens: int, temperature: float, **extra):
+    def complete(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False,
+        **extra,
+    ):
         """Throttled public wrapper around ``_create_completion``.
 
         Acquires the concurrency semaphore so external callers (e.g. the corpus chat)
         respect ``max_concurrent`` instead of reaching into the private helper and
         issuing an extra in-flight request beyond the configured cap.
+
+        With ``stream=True`` this returns an iterator of content deltas instead of the
+        completion object; see :meth:`_stream_completion`.
         """
+        if stream:
+            return self._stream_completion(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **extra,
+            )
         with self._semaphore:
             return self._create_completion(
                 system_prompt=system_prompt,
@@ -118,6 +156,30 @@ class LLMClient:
                 **extra,
             )
 
+    def _stream_completion(self, **kwargs) -> Iterator[str]:
+        """Yield non-empty content deltas from a streamed completion.
+
+        The semaphore slot is held for the life of the stream (it is still one
+        in-flight request). Closing the generator early — e.g. because the browser
+        disconnected — closes the underlying HTTP response, which aborts the upstream
+        generation instead of letting it run to ``max_tokens`` unread.
+        """
+        with self._semaphore:
+            response = self._create_completion(stream=True, **kwargs)
+            try:
+                for chunk in response:
+                    choices = getattr(chunk, "choices", None)
+                    if not choices:
+                        continue
+                    delta = getattr(choices[0], "delta", None)
+                    content = getattr(delta, "content", None)
+                    if isinstance(content, str) and content:
+                        yield content
+            finally:
+                close = getattr(response, "close", None)
+                if callable(close):
+                    close()
+
     def generate_tldr(self, title: str, abstract: str) -> str | None:
         system_prompt = "Produce a specific 1-2 sentence TLDR for a research paper. Keep it under 280 characters."
         user_prompt = f"Title: {title}\n\nAbstract: {abstract}"
@@ -2,18 +2,22 @@
 
 Uses OAuth2 for authentication, mirroring the Gmail OAuth pattern.
 Credentials are stored in ``mendeley_credentials.json`` and tokens in
-``.mendeley_token``.
+``.mendeley_token``. Requests share one pooled keep-alive session that draws from
+the shared rate limiter (its own bucket for the Mendeley host).
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import requests
 
+from app.services.http_client import create_session, request_with_backoff
 from app.services.secret_files import write_secret_file
 
 if TYPE_CHECKING:
@@ -37,10 +41,43 @@ class MendeleyClient:
         self,
         credentials_path: Path | None = None,
         token_path: Path | None = None,
+        *,
+        session: requests.Session | None = None,
+        scraper_config: Mapping[str, Any] | None = None,
     ):
         self.credentials_path = credentials_path or DEFAULT_CREDENTIALS_PATH
         self.token_path = token_path or DEFAULT_TOKEN_PATH
         self._token_data: dict | None = None
+        self._scraper_config = scraper_config
+        self._session = session
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session for this client, created on first use."""
+        if self._session is None:
+            self._session = create_session(
+                pool_size=1,
+                scraper_config=self._scraper_config,
+                rate_limit_scope=urlsplit(MENDELEY_API_BASE).netloc,
+            )
+        return self._session
+
+    def _request(self, method: str, url: str, *, timeout: int, attempts: int = 1, **kwargs: Any) -> requests.Response:
+        """Rate-limited request on the pooled session; error statuses are returned, not raised.
+
+        Single attempt by default: Mendeley writes and OAuth token grants aren't
+        idempotent, so a retry after a lost response could duplicate a document or
+        replay a spent refresh token.
+        """
+        return request_with_backoff(
+            method,
+            url,
+            session=self.session,
+            timeout=timeout,
+            attempts=attempts,
+            raise_for_status=False,
+            **kwargs,
+        )
 
     def _load_credentials(self) -> dict:
         """Load client_id and client_secret from credentials file."""
@@ -95,7 +132,8 @@ class MendeleyClient:
             raise RuntimeError("Mendeley token expired and cannot be refreshed automatically.")
 
         creds = self._load_credentials()
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             MENDELEY_TOKEN_URL,
             data={
                 "grant_type": "refresh_token",
@@ -143,7 +181,8 @@ class MendeleyClient:
             }
 
         try:
-            resp = requests.get(
+            resp = self._request(
+                "GET",
                 f"{MENDELEY_API_BASE}/profiles/me",
                 headers={"Authorization": f"Bearer {token['access_token']}"},
                 timeout=3,
@@ -156,7 +195,8 @@ class MendeleyClient:
                         "status": "expired",
                         "message": "Mendeley token expired. Re-authorize to reconnect.",
                     }
-                resp = requests.get(
+                resp = self._request(
+                    "GET",
                     f"{MENDELEY_API_BASE}/profiles/me",
                     headers={"Authorization": f"Bearer {refreshed['access_token']}"},
                     timeout=3,
@@ -244,7 +284,8 @@ class MendeleyClient:
             return {"success": False, "message": "No authorization code in callback URL."}
 
         try:
-            resp = requests.post(
+            resp = self._request(
+                "POST",
                 MENDELEY_TOKEN_URL,
                 data={
                     "grant_type": "authorization_code",
@@ -295,7 +336,8 @@ class MendeleyClient:
             doc["month"] = paper.publication_dt.month
 
         try:
-            resp = requests.post(
+            resp = self._request(
+                "POST",
                 f"{MENDELEY_API_BASE}/documents",
                 headers=self._get_headers(),
                 json=doc,
@@ -303,7 +345,8 @@ class MendeleyClient:
             )
             if resp.status_code == 401:
                 self._refresh_access_token()
-                resp = requests.post(
+                resp = self._request(
+                    "POST",
                     f"{MENDELEY_API_BASE}/documents",
                     headers=self._get_headers(),
                     json=doc,
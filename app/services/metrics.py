@@ -11,6 +11,7 @@ from app.services.ranking import (
     build_ranking_config_snapshot,
     compute_paper_score,
     get_active_ranking_config,
+    resolve_ranking_preferences,
 )
 
 POSITIVE_FEEDBACK_ACTIONS = {
@@ -45,6 +46,7 @@ def _rank_papers(
     config: dict | None = None,
     ranking_config=None,
 ) -> list[tuple[Paper, float]]:
+    preferences = resolve_ranking_preferences(config, ranking_config=ranking_config)
     scored = []
     for paper in papers:
         scored.append(
@@ -59,8 +61,7 @@ def _rank_papers(
                     citation_count=paper.citation_count,
                     acceptance_status=paper.acceptance_status,
                     interest_similarity=paper.interest_similarity,
-                    config=config,
-                    ranking_config=ranking_config,
+                    preferences=preferences,
                 ),
             )
         )
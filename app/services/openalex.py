@@ -14,6 +14,7 @@ def fetch_openalex_batch(
     arxiv_ids: list[str],
     session=None,
     email: str | None = None,
+    async_http: bool = False,
 ) -> dict[str, dict[str, Any]]:
     """
     Fetch OpenAlex metadata for papers by arXiv ID.
@@ -21,5 +22,5 @@ def fetch_openalex_batch(
     Looks up papers via their arXiv DOI (10.48550/arXiv.{id}).
     Returns {arxiv_id: {openalex_id, openalex_topics, oa_status, ...}}.
     """
-    provider = OpenAlexProvider(request_fn=request_with_backoff)
+    provider = OpenAlexProvider(request_fn=request_with_backoff, async_http=async_http)
     return provider.fetch_batch(arxiv_ids, session=session, email=email)
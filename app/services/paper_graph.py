@@ -0,0 +1,191 @@
+"""Similarity graph around one paper, built from the FAISS embedding index.
+
+The centre's ``k`` nearest neighbours come from one :meth:`EmbeddingService.search_by_id`
+call; each further hop expands every node of the previous hop with one batched
+:meth:`EmbeddingService.search_by_ids`. Edges are the links that brought each node
+in plus, from a numpy cosine matrix over every node's stored vector, each node's
+:data:`GRAPH_NODE_LINKS` most similar other nodes.
+
+Graphs are cached per ``(paper, k, hops)`` under the dashboard data version and the
+index size, so a new scrape or embedding backfill yields a fresh graph. Papers
+without an embedding (or an app without an index) fall back to stored TF-IDF
+similarity against the top papers by score.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from flask import current_app
+
+from app.models import Paper
+from app.services.dashboard_cache import cache_key, data_version
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_GRAPH_NEIGHBOURS = 20
+MAX_GRAPH_HOPS = 3
+MAX_GRAPH_NODES = 100
+# Each node's strongest links to other nodes, taken from the pairwise matrix.
+GRAPH_NODE_LINKS = 3
+MIN_EDGE_SIMILARITY = 0.15
+GRAPH_CACHE_ENTRIES = 256
+
+# Token-vector fallback: candidate pool and edge cap of the former endpoint.
+_FALLBACK_POOL = 100
+_FALLBACK_EDGES = 20
+
+
+class GraphCache:
+    """Bounded LRU of built graphs. Thread-safe."""
+
+    def __init__(self, max_entries: int = GRAPH_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            graph = self._entries.get(key)
+            if graph is not None:
+                self._entries.move_to_end(key)
+            return graph
+
+    def put(self, key: str, graph: dict) -> None:
+        with self._lock:
+            self._entries[key] = graph
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _node(paper: Paper, *, hop: int) -> dict:
+    return {
+        "id": paper.id,
+        "title": paper.title,
+        "score": float(paper.paper_score or 0),
+        "center": hop == 0,
+        "hop": hop,
+    }
+
+
+def _expand(service, paper_id: int, *, k: int, hops: int) -> tuple[dict[int, int], dict[tuple[int, int], float]]:
+    """Node hops and the edges that discovered them, hop by hop."""
+    hop_of = {paper_id: 0}
+    tree_edges: dict[tuple[int, int], float] = {}
+    fanout = max(1, k // 4)
+    frontier = [paper_id]
+    for hop in range(1, hops + 1):
+        if hop == 1:
+            neighbours = {paper_id: service.search_by_id(paper_id, top_k=k)}
+        else:
+            neighbours = service.search_by_ids(frontier, top_k=fanout + len(hop_of))
+        next_frontier = []
+        for source in frontier:
+            taken = 0
+            for target, score in neighbours.get(source, []):
+                if len(hop_of) >= MAX_GRAPH_NODES or (hop > 1 and taken >= fanout):
+                    break
+                if target in hop_of:
+                    continue
+                hop_of[target] = hop
+                tree_edges[(source, target)] = float(score)
+                next_frontier.append(target)
+                taken += 1
+        frontier = next_frontier
+        if not frontier:
+            break
+    return hop_of, tree_edges
+
+
+def _matrix_edges(service, node_ids: list[int]) -> dict[tuple[int, int], float]:
+    """Each node's :data:`GRAPH_NODE_LINKS` most similar other nodes (cosine)."""
+    found_ids, vectors = service.get_paper_vectors(node_ids)
+    if len(found_ids) < 2:
+        return {}
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, -np.inf)
+    links = min(GRAPH_NODE_LINKS, len(found_ids) - 1)
+    nearest = np.argpartition(-similarity, links - 1, axis=1)[:, :links]
+    edges: dict[tuple[int, int], float] = {}
+    for row, columns in enumerate(nearest):
+        for column in columns:
+            score = float(similarity[row, column])
+            if score < MIN_EDGE_SIMILARITY:
+                continue
+            a, b = found_ids[row], found_ids[int(column)]
+            edges[(min(a, b), max(a, b))] = score
+    return edges
+
+
+def _embedding_graph(paper: Paper, *, k: int, hops: int) -> dict | None:
+    try:
+        from app.services.embeddings import get_embedding_service
+
+        service = get_embedding_service()
+        if service.index_count() == 0 or not service.has_paper(paper.id):
+            return None
+        hop_of, tree_edges = _expand(service, paper.id, k=k, hops=hops)
+        cross_edges = _matrix_edges(service, list(hop_of))
+    except Exception:
+        LOGGER.debug("Embedding graph unavailable for paper %s", paper.id, exc_info=True)
+        return None
+
+    papers = {row.id: row for row in Paper.query.filter(Paper.id.in_(list(hop_of))).all()}
+    nodes = [_node(papers[pid], hop=hop) for pid, hop in hop_of.items() if pid in papers]
+    kept = {node["id"] for node in nodes}
+    edges = [
+        {"source": source, "target": target, "similarity": round(score, 3)}
+        for (source, target), score in tree_edges.items()
+        if target in kept and source in kept
+    ]
+    linked = {frozenset(pair) for pair in tree_edges}
+    edges.extend(
+        {"source": a, "target": b, "similarity": round(score, 3)}
+        for (a, b), score in sorted(cross_edges.items(), key=lambda item: -item[1])
+        if a in kept and b in kept and frozenset((a, b)) not in linked
+    )
+    return {"nodes": nodes, "edges": edges, "method": "embedding"}
+
+
+def _token_graph(paper: Paper) -> dict:
+    """TF-IDF cosine against the top papers by score (no embedding to search with)."""
+    from app.services.term_vectors import load_term_matrix
+
+    pool = Paper.query.filter(Paper.id != paper.id).order_by(Paper.paper_score.desc()).limit(_FALLBACK_POOL).all()
+    matrix = load_term_matrix([paper.id] + [other.id for other in pool])
+    pool_by_id = {other.id: other for other in pool}
+    scored = [
+        (sim, pool_by_id[other_id])
+        for other_id, sim in matrix.most_similar(paper.id, top_k=_FALLBACK_EDGES, min_similarity=MIN_EDGE_SIMILARITY)
+    ]
+
+    nodes = [_node(paper, hop=0)] + [_node(other, hop=1) for _sim, other in scored]
+    edges = [{"source": paper.id, "target": other.id, "similarity": round(sim, 3)} for sim, other in scored]
+    return {"nodes": nodes, "edges": edges, "method": "tokens"}
+
+
+def build_paper_graph(paper: Paper, *, k: int = DEFAULT_GRAPH_NEIGHBOURS, hops: int = 1) -> dict:
+    """``{"nodes", "edges", "method"}`` for ``paper``'s neighbourhood, cached.
+
+    Nodes carry ``hop`` (0 for the centre); ``method`` is ``"embedding"`` or
+    ``"tokens"`` (the fallback).
+    """
+    index_size = 0
+    try:
+        from app.services.embeddings import get_embedding_service
+
+        index_size = get_embedding_service().index_count()
+    except Exception:
+        LOGGER.debug("Embedding index unavailable for the paper graph", exc_info=True)
+    cache = current_app.extensions.setdefault("paper_graph_cache", GraphCache())
+    key = cache_key("paper-graph", paper.id, k, hops, data_version(), index_size)
+    graph = cache.get(key)
+    if graph is None:
+        graph = (_embedding_graph(paper, k=k, hops=hops) if index_size else None) or _token_graph(paper)
+        cache.put(key, graph)
+    return graph
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import io
 import logging
 import re
 from dataclasses import dataclass
 
-import pdfplumber
+from app.services.lazy_imports import lazy_module
+from app.services.pdf_spool import PdfPayload, pdf_source
 
 LOGGER = logging.getLogger(__name__)
 
+pdfplumber = lazy_module("pdfplumber")
+
 SECTION_TYPES = [
     "abstract",
     "introduction",
@@ -68,10 +70,10 @@ def _normalize_section_type(raw: str) -> str:
     return lower
 
 
-def _extract_full_text(pdf_content: bytes) -> str:
+def _extract_full_text(pdf_content: PdfPayload) -> str:
     """Extract all text from a PDF using pdfplumber."""
     text_parts = []
-    with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+    with pdfplumber.open(pdf_source(pdf_content)) as pdf:
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text:
@@ -79,7 +81,7 @@ def _extract_full_text(pdf_content: bytes) -> str:
     return "\n".join(text_parts)
 
 
-def extract_sections(pdf_content: bytes) -> list[ExtractedSection]:
+def extract_sections(pdf_content: PdfPayload) -> list[ExtractedSection]:
     """Extract structured sections from a PDF.
 
     Uses regex heuristics to detect section headings in arXiv-style papers.
@@ -137,7 +139,7 @@ def extract_sections(pdf_content: bytes) -> list[ExtractedSection]:
 
 
 def extract_sections_batch(
-    pdf_contents: list[bytes | None],
+    pdf_contents: list[PdfPayload | None],
 ) -> list[list[tuple[str, str, int]]]:
     """Batch-parse many PDFs into plain ``(section_type, text, order_index)`` tuples.
 
@@ -162,7 +164,7 @@ def extract_sections_batch(
 
 def extract_and_store_sections(
     paper_id: int,
-    pdf_content: bytes,
+    pdf_content: PdfPayload,
     app=None,
 ) -> int:
     """Extract sections from PDF and store as PaperSection rows.
@@ -0,0 +1,118 @@
+"""Temp-file spool for the PDF bodies a scrape carries between stages.
+
+A PDF is downloaded once (affiliation pre-pass) and reused by the PDF-link,
+thumbnail and section stages. Holding those bodies as ``bytes`` on every surviving
+entry made a large scrape's memory grow with its candidate count; instead each body
+is written to a per-scrape spool directory as soon as it arrives and the entry
+carries a :class:`SpooledPdf` handle (path + size). pdfplumber opens the path and
+reads pages lazily, and the handle pickles as a short path, so the isolated
+children that parse PDFs no longer receive whole batches of bytes either.
+
+Consumers accept either form (``bytes`` or :class:`SpooledPdf`) via
+:func:`pdf_source` / :func:`pdf_head`, so callers that already hold bytes (a
+one-off thumbnail download, tests) need no spool.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SpooledPdf:
+    """Handle to one spooled PDF body; ``os.fspath()``-able and cheap to pickle."""
+
+    path: str
+    size: int
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def read_bytes(self) -> bytes:
+        with open(self.path, "rb") as handle:
+            return handle.read()
+
+
+PdfPayload = bytes | SpooledPdf
+
+
+def pdf_source(payload: PdfPayload) -> str | io.BytesIO:
+    """What ``pdfplumber.open`` should be given for ``payload``."""
+    if isinstance(payload, SpooledPdf):
+        return payload.path
+    return io.BytesIO(payload)
+
+
+def pdf_head(payload: PdfPayload | None, size: int = 1024) -> bytes:
+    """The first ``size`` bytes of ``payload`` (``b""`` when missing or unreadable)."""
+    if not payload:
+        return b""
+    if isinstance(payload, SpooledPdf):
+        try:
+            with open(payload.path, "rb") as handle:
+                return handle.read(size)
+        except OSError:
+            return b""
+    return payload[:size]
+
+
+class PdfSpool:
+    """A private temp directory of PDF bodies, removed on :meth:`close`.
+
+    Thread-safe: the affiliation pre-pass spools from its download workers.
+    """
+
+    def __init__(self, root: str | os.PathLike | None = None):
+        self.directory = tempfile.mkdtemp(prefix="cv-arxiv-pdf-", dir=root)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._count = 0
+        self._closed = False
+
+    @property
+    def spooled_bytes(self) -> int:
+        """Bytes currently on disk in this spool."""
+        return self._bytes
+
+    def put(self, content: bytes) -> SpooledPdf:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PDF spool is closed")
+            self._count += 1
+            path = os.path.join(self.directory, f"{self._count:06d}.pdf")
+        with open(path, "wb") as handle:
+            handle.write(content)
+        with self._lock:
+            self._bytes += len(content)
+        return SpooledPdf(path=path, size=len(content))
+
+    def discard(self, pdf: SpooledPdf | None) -> None:
+        """Delete a body nothing downstream will read (e.g. a non-matching entry)."""
+        if pdf is None:
+            return
+        try:
+            os.unlink(pdf.path)
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._bytes -= pdf.size
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._bytes = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self) -> PdfSpool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -13,6 +13,7 @@ from app.services.matching import (
     check_whitelist_match,
     dedupe_preserve_order,
 )
+from app.services.pdf_spool import PdfPayload
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ class ScoredCandidate:
     entry_data: dict[str, Any]
     match_types: list[str]
     matched_terms: list[str]
-    pdf_content: bytes | None = None
+    pdf_content: PdfPayload | None = None
     raw_features: dict[str, Any] = field(default_factory=dict)
 
 
@@ -87,16 +88,26 @@ class WhitelistCandidateGenerator:
 
         return affiliation_matches, entry_data.get("pdf_content")
 
+    @staticmethod
+    def _topic_tags(entry_data: dict) -> list[str]:
+        """The entry's topic tags, extracted on first use and kept on ``entry_data``.
+
+        Enrichment stores the same list on the paper, so it is computed once per scrape.
+        """
+        tags = entry_data.get("topic_tags")
+        if tags is None:
+            from app.services.summary import extract_topic_tags
+
+            tags = entry_data["topic_tags"] = extract_topic_tags(entry_data["title"], entry_data.get("abstract", ""))
+        return tags
+
     def _is_muted(self, entry_data: dict) -> bool:
         """Check if a paper should be suppressed by mute filters."""
-        from app.services.summary import extract_topic_tags
-
         if check_author_match(entry_data["authors_list"], self.muted["authors"]):
             return True
         if check_whitelist_match([entry_data.get("api_affiliations", "")], self.muted["affiliations"]):
             return True
-        topic_tags = extract_topic_tags(entry_data["title"], entry_data.get("abstract", ""))
-        if check_whitelist_match(topic_tags, self.muted["topics"]):
+        if self.muted["topics"] and check_whitelist_match(self._topic_tags(entry_data), self.muted["topics"]):
             return True
         return False
 
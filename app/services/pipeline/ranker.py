@@ -7,13 +7,14 @@ from datetime import date
 from typing import Any, Protocol
 
 from app.services.matching import MATCH_PRIORITY
+from app.services.pdf_spool import PdfPayload
 from app.services.pipeline.candidate_generation import ScoredCandidate
 from app.services.pipeline.features import (
     DefaultFeatureExtractor,
     FeatureExtractor,
     FeatureVector,
 )
-from app.services.ranking import compute_paper_score
+from app.services.ranking import compute_paper_score, resolve_ranking_preferences
 
 
 @dataclass(slots=True)
@@ -25,7 +26,7 @@ class RankedPaper:
     matched_terms: list[str]
     score: float
     features: FeatureVector
-    pdf_content: bytes | None = None
+    pdf_content: PdfPayload | None = None
 
     @property
     def match_type(self) -> str:
@@ -68,8 +69,9 @@ class RankedPaper:
             "embedding": entry.get("_embedding"),
             "publication_dt": entry.get("publication_dt"),
             "publication_date": entry.get("publication_date", "Date Unknown"),
-            # INVARIANT: pdf_content (PDF bytes, fetched once during candidate
-            # generation) rides along in the result dict and is consumed by the
+            # INVARIANT: pdf_content (the PDF fetched once during candidate
+            # generation — a SpooledPdf file handle in a scrape, never a batch of
+            # in-memory bodies) rides along in the result dict and is consumed by the
             # LAST pipeline steps — _generate_thumbnails AND _extract_sections.
             # Don't .pop() it early (use .get()), or section extraction silently
             # gets nothing. It is not persisted: _save_results maps explicit cols.
@@ -98,6 +100,8 @@ class WeightedSumRanker:
     ) -> None:
         self.config = config
         self.extractor = feature_extractor or DefaultFeatureExtractor(config, interest_profile=interest_profile)
+        # Resolved once per ranker (one scrape), not per candidate.
+        self.preferences = resolve_ranking_preferences(config)
 
     def rank(self, candidates: list[ScoredCandidate]) -> list[RankedPaper]:
         ranked = []
@@ -112,7 +116,7 @@ class WeightedSumRanker:
                 citation_count=features.citation_count,
                 acceptance_status=features.acceptance_status,
                 interest_similarity=features.interest_similarity,
-                config=self.config,
+                preferences=self.preferences,
             )
             ranked.append(
                 RankedPaper(
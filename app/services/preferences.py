@@ -5,8 +5,11 @@ from __future__ import annotations
 import os
 import tempfile
 import threading
+from collections.abc import Mapping
 from copy import deepcopy
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 
@@ -56,7 +59,7 @@ def _as_str_list(value: object) -> list[str]:
     return []
 
 
-def get_preferences(config: dict | None) -> dict:
+def _normalize_preferences(config: dict | None) -> dict:
     merged = deepcopy(DEFAULT_PREFERENCES)
     if not isinstance(config, dict):
         return merged
@@ -102,6 +105,79 @@ def get_preferences(config: dict | None) -> dict:
     return merged
 
 
+@dataclass(frozen=True, slots=True)
+class PreferenceSnapshot:
+    """Read-only, normalized view of the config's preferences.
+
+    ``version`` identifies the snapshot: a new one is built (with a higher version)
+    only when the underlying ``preferences`` section changes, so callers can key
+    their own caches on it.
+    """
+
+    version: int
+    ranking: Mapping[str, float]
+    display: Mapping[str, object]
+    muted: Mapping[str, tuple[str, ...]]
+
+    @classmethod
+    def freeze(cls, preferences: dict, version: int) -> PreferenceSnapshot:
+        return cls(
+            version=version,
+            ranking=MappingProxyType(dict(preferences["ranking"])),
+            display=MappingProxyType(dict(preferences["display"])),
+            muted=MappingProxyType({key: tuple(values) for key, values in preferences["muted"].items()}),
+        )
+
+    def to_dict(self) -> dict:
+        """A fresh mutable copy shaped like :func:`get_preferences`' result."""
+        return {
+            "ranking": dict(self.ranking),
+            "display": dict(self.display),
+            "muted": {key: list(values) for key, values in self.muted.items()},
+        }
+
+
+# Snapshots are cached per config dict. An entry is reused only while the dict's raw
+# ``preferences`` section still equals the copy it was built from (so in-place edits
+# are seen) and no save_config() has run since (bumped under _CONFIG_LOCK).
+_SNAPSHOT_CACHE_SIZE = 16
+_snapshot_lock = threading.Lock()
+_snapshot_cache: dict[int, tuple[dict, object, int, PreferenceSnapshot]] = {}
+_snapshot_version = 0
+_config_generation = 0
+
+
+def _invalidate_preference_snapshots() -> None:
+    global _config_generation
+    with _snapshot_lock:
+        _config_generation += 1
+        _snapshot_cache.clear()
+
+
+def preference_snapshot(config: dict | None) -> PreferenceSnapshot:
+    """The cached :class:`PreferenceSnapshot` for ``config`` (built on first use)."""
+    global _snapshot_version
+    raw = config.get("preferences") if isinstance(config, dict) else None
+    key = id(config)
+    cached = _snapshot_cache.get(key)
+    if cached is not None and cached[0] is config and cached[2] == _config_generation and cached[1] == raw:
+        return cached[3]
+
+    normalized = _normalize_preferences(config)
+    with _snapshot_lock:
+        _snapshot_version += 1
+        snapshot = PreferenceSnapshot.freeze(normalized, _snapshot_version)
+        while len(_snapshot_cache) >= _SNAPSHOT_CACHE_SIZE:
+            _snapshot_cache.pop(next(iter(_snapshot_cache)))
+        _snapshot_cache[key] = (config, deepcopy(raw), _config_generation, snapshot)
+    return snapshot
+
+
+def get_preferences(config: dict | None) -> dict:
+    """Normalized preferences as a fresh mutable dict (see :func:`preference_snapshot`)."""
+    return preference_snapshot(config).to_dict()
+
+
 def update_preferences_from_form(config: dict, form) -> dict:
     updated = deepcopy(config)
     preferences = get_preferences(config)
@@ -143,6 +219,7 @@ def save_config(config_path: Path, full_config: dict) -> dict:
     point fails with EBUSY/EINVAL. Atomicity is preserved on the common path.
     """
     with _CONFIG_LOCK:
+        _invalidate_preference_snapshots()
         config_path.parent.mkdir(parents=True, exist_ok=True)
         serialized = yaml.safe_dump(full_config, default_flow_style=False, sort_keys=False)
         fd, tmp_path = tempfile.mkstemp(dir=config_path.parent, suffix=".yaml")
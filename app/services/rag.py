@@ -8,11 +8,16 @@ Synthesis is optional: when the LLM is disabled or no API key is available we
 return the retrieved sources plus an extractive context block with
 ``synthesis=None`` and ``llm_used=False``. The network is only touched when a
 client is successfully built, and any failure degrades back to ``synthesis=None``.
+
+:func:`stream_answer` is the incremental variant behind ``/corpus/chat/stream``: it
+emits the retrieved sources as soon as retrieval finishes, then the synthesis token by
+token, so the reader sees grounding before the LLM has produced anything.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 
 from flask import current_app
 
@@ -143,9 +148,13 @@ def _build_client(app=None):
     return client
 
 
+def _user_prompt(query: str, context: str) -> str:
+    return f"Context from saved papers:\n\n{context}\n\nQuestion: {query}"
+
+
 def _synthesize(client, query: str, context: str) -> str | None:
     """Call the low-level completion helper; return text or None on any failure."""
-    user_prompt = f"Context from saved papers:\n\n{context}\n\nQuestion: {query}"
+    user_prompt = _user_prompt(query, context)
     try:
         # Use the throttled public wrapper so chat respects the LLM concurrency cap
         # instead of bypassing the semaphore via the private _create_completion.
@@ -188,3 +197,54 @@ def answer_query(query: str, *, top_k: int = 6, app=None) -> dict:
         "sources": sources,
         "no_saved_papers": no_saved_papers,
     }
+
+
+def stream_answer(query: str, *, top_k: int = 6, app=None) -> Iterator[tuple[str, dict]]:
+    """Yield ``(event, data)`` pairs answering ``query`` incrementally.
+
+    Order: one ``sources`` event (same fields as :func:`answer_query` minus the
+    synthesis), zero or more ``token`` events ``{"text"}``, then a final ``done``
+    event ``{"llm_used", "error"}``. ``llm_used`` is False when the LLM is
+    unavailable or failed before producing any text; a failure after some tokens
+    were sent keeps ``llm_used`` True and reports ``error`` so the client can mark the
+    answer as truncated.
+
+    Closing the generator (client disconnect) closes the upstream completion stream.
+    """
+    retrieval = retrieve_saved_context(query, top_k=top_k)
+    no_saved_papers = retrieval["no_saved_papers"]
+    context = retrieval["context"]
+    yield (
+        "sources",
+        {"query": query, "sources": retrieval["sources"], "no_saved_papers": no_saved_papers},
+    )
+    # Retrieval is done; don't pin a pooled connection for the life of the LLM stream.
+    db.session.remove()
+
+    if no_saved_papers or not context:
+        yield "done", {"llm_used": False, "error": None}
+        return
+    client = _build_client(app=app)
+    if client is None:
+        yield "done", {"llm_used": False, "error": None}
+        return
+
+    produced = False
+    error: str | None = None
+    tokens = client.complete(
+        system_prompt=_SYSTEM_PROMPT,
+        user_prompt=_user_prompt(query, context),
+        max_tokens=600,
+        temperature=0.2,
+        stream=True,
+    )
+    try:
+        for text in tokens:
+            produced = True
+            yield "token", {"text": text}
+    except Exception as exc:  # noqa: BLE001 — degrade like _synthesize, but say so
+        LOGGER.warning("Streaming chat completion failed: %s", exc)
+        error = "Synthesis was interrupted." if produced else "Synthesis is unavailable right now."
+    finally:
+        tokens.close()
+    yield "done", {"llm_used": produced, "error": error}
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Mapping
 from datetime import date
 from math import exp
+from types import MappingProxyType
 
-from app.services.preferences import DEFAULT_PREFERENCES, get_preferences
+from app.services.preferences import DEFAULT_PREFERENCES, preference_snapshot
 from app.services.text import utc_today
 
 MATCH_TYPE_WEIGHTS = {
@@ -78,20 +81,20 @@ def get_active_ranking_config():
         return None
 
 
-def resolve_ranking_weight_snapshot(config: dict | None = None, *, ranking_config=None) -> dict[str, float]:
-    preferences = get_preferences(config)
-    weights = dict(preferences["ranking"])
-
-    active_config = ranking_config if ranking_config is not None else get_active_ranking_config()
+def _ranking_config_overrides(active_config) -> dict[str, float]:
     if active_config is None:
-        return weights
-
+        return {}
     if isinstance(active_config, dict):
         raw_weights = active_config.get("weights") if isinstance(active_config.get("weights"), dict) else active_config
     else:
         raw_weights = getattr(active_config, "weights", {})
+    return _normalize_ranking_weights(raw_weights)
+
 
-    weights.update(_normalize_ranking_weights(raw_weights))
+def resolve_ranking_weight_snapshot(config: dict | None = None, *, ranking_config=None) -> dict[str, float]:
+    weights = dict(preference_snapshot(config).ranking)
+    active_config = ranking_config if ranking_config is not None else get_active_ranking_config()
+    weights.update(_ranking_config_overrides(active_config))
     return weights
 
 
@@ -115,18 +118,48 @@ def build_ranking_config_snapshot(config: dict | None = None, *, ranking_config=
     return snapshot
 
 
-def resolve_ranking_preferences(config: dict | None = None, *, ranking_config=None) -> dict[str, float]:
-    weights = resolve_ranking_weight_snapshot(config, ranking_config=ranking_config)
-    return {
-        "Author": float(weights["author_weight"]),
-        "Affiliation": float(weights["affiliation_weight"]),
-        "Title": float(weights["title_weight"]),
-        "ai_weight": float(weights["ai_weight"]),
-        "citation_weight": float(weights["citation_weight"]),
-        "venue_weight": float(weights["venue_weight"]),
-        "interest_weight": float(weights["interest_weight"]),
-        "half_life_days": float(weights["freshness_half_life_days"]),
-    }
+# Resolved weight sets keyed by (preference snapshot version, DB overrides). Both
+# parts are immutable, so an entry never goes stale; it is just no longer looked up.
+# Shared by request threads and scrape workers, hence the lock.
+_RESOLVED_CACHE_SIZE = 32
+_resolved_cache: dict[tuple, Mapping[str, float]] = {}
+_resolved_cache_lock = threading.Lock()
+
+
+def resolve_ranking_preferences(config: dict | None = None, *, ranking_config=None) -> Mapping[str, float]:
+    """Scoring weights (config preferences + active RankingConfig) as a frozen mapping.
+
+    Resolution is cached, but the active RankingConfig lookup is a DB query when
+    ``ranking_config`` is not given: hot loops should resolve once and pass the
+    result to :func:`compute_paper_score` / :func:`explain_score` as ``preferences``.
+    """
+    snapshot = preference_snapshot(config)
+    active_config = ranking_config if ranking_config is not None else get_active_ranking_config()
+    overrides = _ranking_config_overrides(active_config)
+    key = (snapshot.version, tuple(sorted(overrides.items())))
+    with _resolved_cache_lock:
+        resolved = _resolved_cache.get(key)
+    if resolved is not None:
+        return resolved
+
+    weights = {**snapshot.ranking, **overrides}
+    resolved = MappingProxyType(
+        {
+            "Author": float(weights["author_weight"]),
+            "Affiliation": float(weights["affiliation_weight"]),
+            "Title": float(weights["title_weight"]),
+            "ai_weight": float(weights["ai_weight"]),
+            "citation_weight": float(weights["citation_weight"]),
+            "venue_weight": float(weights["venue_weight"]),
+            "interest_weight": float(weights["interest_weight"]),
+            "half_life_days": float(weights["freshness_half_life_days"]),
+        }
+    )
+    with _resolved_cache_lock:
+        while len(_resolved_cache) >= _RESOLVED_CACHE_SIZE:
+            _resolved_cache.pop(next(iter(_resolved_cache)))
+        _resolved_cache[key] = resolved
+    return resolved
 
 
 def recency_multiplier(
@@ -157,10 +190,14 @@ def compute_paper_score(
     interest_similarity: float | None = None,
     config: dict | None = None,
     ranking_config=None,
+    preferences: Mapping[str, float] | None = None,
 ) -> float:
+    """Headline score. Pass ``preferences`` (from :func:`resolve_ranking_preferences`)
+    when scoring many papers; otherwise the weights are resolved per call."""
     from app.services.venues import venue_bonus
 
-    preferences = resolve_ranking_preferences(config, ranking_config=ranking_config)
+    if preferences is None:
+        preferences = resolve_ranking_preferences(config, ranking_config=ranking_config)
     match_score = sum(
         preferences.get(match_type, MATCH_TYPE_WEIGHTS.get(match_type, 0.0)) for match_type in match_types
     )
@@ -197,10 +234,12 @@ def explain_score(
     feedback_score: int = 0,
     config: dict | None = None,
     ranking_config=None,
+    preferences: Mapping[str, float] | None = None,
 ) -> dict[str, float]:
     from app.services.venues import venue_bonus
 
-    preferences = resolve_ranking_preferences(config, ranking_config=ranking_config)
+    if preferences is None:
+        preferences = resolve_ranking_preferences(config, ranking_config=ranking_config)
     match_score = sum(
         preferences.get(match_type, MATCH_TYPE_WEIGHTS.get(match_type, 0.0)) for match_type in match_types
     )
@@ -227,8 +266,7 @@ def explain_score(
         citation_count=citation_count,
         acceptance_status=acceptance_status,
         interest_similarity=interest_similarity,
-        config=config,
-        ranking_config=ranking_config,
+        preferences=preferences,
     )
     feedback_bonus = round(feedback_score * FEEDBACK_BOOST, 3)
     return {
@@ -324,16 +362,18 @@ def recompute_all_paper_scores(app, *, batch_size: int = 500) -> int:
     updated = 0
     with app.app_context():
         config = app.config["SCRAPER_CONFIG"]
-        # Resolve the active RankingConfig ONCE. Passing it through avoids a fresh
-        # `RankingConfig.query...first()` + DEFAULT_PREFERENCES deepcopy per paper (N
+        # Resolve the weights (incl. the active RankingConfig) ONCE. Passing them
+        # through avoids a fresh `RankingConfig.query...first()` per paper (N
         # identical queries for a whole recompute), and guarantees every paper in the
         # run is scored against the same weight set even if is_active flips mid-run.
-        active_ranking_config = get_active_ranking_config()
-        offset = 0
+        preferences = resolve_ranking_preferences(config, ranking_config=get_active_ranking_config())
+        # Keyset by id rather than OFFSET, so late batches don't rescan earlier rows.
+        last_id = 0
         while True:
-            papers = Paper.query.order_by(Paper.id).offset(offset).limit(batch_size).all()
+            papers = Paper.query.filter(Paper.id > last_id).order_by(Paper.id).limit(batch_size).all()
             if not papers:
                 break
+            last_id = papers[-1].id
             for paper in papers:
                 paper.paper_score = compute_paper_score(
                     match_types=[part.strip() for part in (paper.match_type or "").split("+") if part.strip()],
@@ -344,12 +384,10 @@ def recompute_all_paper_scores(app, *, batch_size: int = 500) -> int:
                     citation_count=paper.citation_count,
                     acceptance_status=paper.acceptance_status,
                     interest_similarity=paper.interest_similarity,
-                    config=config,
-                    ranking_config=active_ranking_config,
+                    preferences=preferences,
                 )
                 updated += 1
             db.session.commit()
-            offset += batch_size
     return updated
 
 
@@ -363,14 +401,60 @@ def combined_rank_score(paper_score: float, feedback_score: int) -> float:
 
 def rank_score_order_expr():
     """SQL expression for the combined rank score (the query-side mirror of
-    :func:`combined_rank_score`), shared by every rank-ordered listing."""
-    from app.models import Paper, db
+    :func:`combined_rank_score`), shared by every rank-ordered listing.
+
+    This is the indexed generated ``papers.rank_score`` column, so ordering by it
+    walks ``idx_papers_rank_score`` rather than computing and sorting every row.
+    """
+    from app.models import Paper
 
-    return db.func.coalesce(Paper.paper_score, 0.0) + db.func.coalesce(Paper.feedback_score, 0) * FEEDBACK_BOOST
+    return Paper.rank_score
 
 
 def generate_ranking_explanation(paper, config: dict | None = None) -> list[str]:
     """Generate human-readable explanation strings for why a paper was ranked."""
+    return generate_ranking_explanations([paper], config=config)[0]
+
+
+def generate_ranking_explanations(
+    papers: list,
+    config: dict | None = None,
+    *,
+    breakdowns: list[dict[str, float] | None] | None = None,
+    ranking_config=None,
+) -> list[list[str]]:
+    """:func:`generate_ranking_explanation` for a whole page of cards in one pass.
+
+    Returns one list per paper, in order. ``breakdowns`` are the cards' already
+    computed :func:`explain_score` dicts (their ``recency_multiplier`` is reused);
+    without them recency is derived from weights resolved once for the batch. The
+    "similar to saved" line costs one saved-ids query, one multi-query FAISS search
+    and one title lookup for the page instead of one of each per card.
+    """
+    preferences = None
+    explanations: list[list[str]] = []
+    for position, paper in enumerate(papers):
+        breakdown = breakdowns[position] if breakdowns is not None else None
+        if breakdown is not None:
+            recency = breakdown["recency_multiplier"]
+        else:
+            if preferences is None:
+                preferences = resolve_ranking_preferences(config, ranking_config=ranking_config)
+            recency = round(recency_multiplier(paper.publication_dt, half_life_days=preferences["half_life_days"]), 3)
+        explanations.append(_paper_explanations(paper, recency=recency))
+
+    try:
+        similar = _similar_to_saved_titles([paper.id for paper in papers])
+    except Exception:
+        similar = {}
+    for paper, lines in zip(papers, explanations):
+        title = similar.get(paper.id)
+        if title is not None:
+            lines.append(f'Similar to saved: "{title}"')
+    return explanations
+
+
+def _paper_explanations(paper, *, recency: float) -> list[str]:
     explanations = []
 
     # Match type explanations. Parse the raw column here (rather than the
@@ -410,18 +494,7 @@ def generate_ranking_explanation(paper, config: dict | None = None) -> list[str]
         explanations.append(f"Highly cited ({paper.citation_count} citations)")
 
     # Recency explanation
-    breakdown = explain_score(
-        match_types=match_types,
-        matched_terms_count=len(paper.matched_terms_list),
-        publication_dt=paper.publication_dt,
-        resource_count=len(paper.resource_links_list),
-        llm_relevance_score=paper.llm_relevance_score,
-        citation_count=paper.citation_count,
-        acceptance_status=paper.acceptance_status,
-        interest_similarity=paper.interest_similarity,
-        config=config,
-    )
-    if breakdown["recency_multiplier"] > 0.9:
+    if recency > 0.9:
         explanations.append("Published very recently")
 
     # Learned interest profile (embedding similarity to saved/skipped papers)
@@ -436,31 +509,41 @@ def generate_ranking_explanation(paper, config: dict | None = None) -> list[str]
     if paper.resource_links_list:
         explanations.append("Code or dataset available")
 
-    # Similar to saved paper (embedding-based)
-    try:
-        from app.models import Paper, PaperFeedback, db
-        from app.services.embeddings import get_embedding_service
-
-        service = get_embedding_service()
-        if service.has_paper(paper.id) and service.index_count() > 0:
-            saved_ids = {
-                row[0]
-                for row in db.session.query(PaperFeedback.paper_id)
-                .filter(PaperFeedback.action.in_(["save", "priority"]))
-                .all()
-            }
-            if saved_ids:
-                similar = service.search_by_id(paper.id, top_k=5)
-                for pid, score in similar:
-                    if pid in saved_ids and score > 0.5:
-                        saved_paper = db.session.get(Paper, pid)
-                        if saved_paper:
-                            title = saved_paper.title[:50]
-                            if len(saved_paper.title) > 50:
-                                title += "..."
-                            explanations.append(f'Similar to saved: "{title}"')
-                            break
-    except Exception:
-        pass
-
     return explanations
+
+
+def _similar_to_saved_titles(paper_ids: list[int]) -> dict[int, str]:
+    """Map each paper to the (truncated) title of its nearest saved neighbour, if any.
+
+    A neighbour counts when it is among the paper's 5 nearest in the FAISS index,
+    is saved or prioritised, and scores above 0.5.
+    """
+    from app.models import Paper, PaperFeedback, db
+    from app.services.embeddings import get_embedding_service
+
+    service = get_embedding_service()
+    if service.index_count() == 0:
+        return {}
+    saved_ids = {
+        row[0]
+        for row in db.session.query(PaperFeedback.paper_id).filter(PaperFeedback.action.in_(["save", "priority"])).all()
+    }
+    if not saved_ids:
+        return {}
+
+    candidates: dict[int, list[int]] = {}
+    for paper_id, neighbours in service.search_by_ids(paper_ids, top_k=5).items():
+        matches = [pid for pid, score in neighbours if pid in saved_ids and score > 0.5]
+        if matches:
+            candidates[paper_id] = matches
+    if not candidates:
+        return {}
+
+    wanted = {pid for matches in candidates.values() for pid in matches}
+    titles = dict(db.session.query(Paper.id, Paper.title).filter(Paper.id.in_(wanted)).all())
+    similar: dict[int, str] = {}
+    for paper_id, matches in candidates.items():
+        title = next((titles[pid] for pid in matches if pid in titles), None)
+        if title is not None:
+            similar[paper_id] = title[:50] + "..." if len(title) > 50 else title
+    return similar
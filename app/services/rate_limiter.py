@@ -73,8 +73,34 @@ class TokenBucketRateLimiter:
             self._sleep_fn(delay)
             waited += delay
 
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` now, going into debt if needed; return the delay to honour.
 
-_SHARED_LIMITERS: dict[RateLimitSettings, TokenBucketRateLimiter] = {}
+        The non-blocking counterpart of :meth:`acquire` for callers that wait on
+        their own clock (coroutines). Debt is repaid by later refills, so threads
+        blocked in :meth:`acquire` on the same bucket still see the combined rate.
+        """
+        if tokens <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill(self._time_fn())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.requests_per_second
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Await a reservation without blocking the event loop. Returns the wait time."""
+        import asyncio
+
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_SHARED_LIMITERS: dict[tuple[RateLimitSettings, str | None], TokenBucketRateLimiter] = {}
 _SHARED_LIMITERS_LOCK = threading.Lock()
 
 
@@ -133,14 +159,20 @@ def resolve_rate_limit_settings(
     )
 
 
-def get_shared_rate_limiter(settings: RateLimitSettings) -> TokenBucketRateLimiter:
-    """Return a shared limiter for the given settings."""
+def get_shared_rate_limiter(settings: RateLimitSettings, scope: str | None = None) -> TokenBucketRateLimiter:
+    """Return a shared limiter for the given settings.
+
+    ``scope`` (typically the remote host) gives callers that only ever talk to one
+    service their own bucket, so e.g. concurrent backfills against Semantic Scholar
+    and OpenAlex each get the full per-host budget instead of splitting one.
+    """
+    key = (settings, scope)
     with _SHARED_LIMITERS_LOCK:
-        limiter = _SHARED_LIMITERS.get(settings)
+        limiter = _SHARED_LIMITERS.get(key)
         if limiter is None:
             limiter = TokenBucketRateLimiter(
                 requests_per_second=settings.requests_per_second,
                 burst=settings.burst,
             )
-            _SHARED_LIMITERS[settings] = limiter
+            _SHARED_LIMITERS[key] = limiter
         return limiter
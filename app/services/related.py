@@ -7,6 +7,7 @@ from collections import Counter
 from functools import lru_cache
 from math import sqrt
 
+from app.services.term_vectors import TermMatrix, TitleIndex
 from app.services.text import STOP_WORDS, tokenize
 
 LOGGER = logging.getLogger(__name__)
@@ -38,24 +39,17 @@ def cosine_similarity(vec_a: Counter[str], vec_b: Counter[str]) -> float:
 
 def find_duplicates(
     title: str,
-    existing_titles: dict[int, str],
+    existing_titles: dict[int, str] | TitleIndex,
     *,
     threshold: float = 0.92,
 ) -> list[tuple[int, float]]:
-    """Return (paper_id, similarity) pairs where title similarity >= threshold."""
-    target_vec = build_vector(title.lower())
-    if not target_vec:
-        return []
-
-    results: list[tuple[int, float]] = []
-    for paper_id, existing_title in existing_titles.items():
-        other_vec = build_vector(existing_title.lower())
-        sim = cosine_similarity(target_vec, other_vec)
-        if sim >= threshold:
-            results.append((paper_id, sim))
+    """Return (paper_id, similarity) pairs where title similarity >= threshold.
 
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results
+    Pass a :class:`TitleIndex` when checking many titles against the same set.
+    """
+    if not isinstance(existing_titles, TitleIndex):
+        existing_titles = TitleIndex.from_titles(existing_titles)
+    return existing_titles.find(title, threshold=threshold)
 
 
 def top_related_papers_embedding(paper_id: int, top_k: int = 3) -> list[int]:
@@ -75,7 +69,7 @@ def top_related_papers_embedding(paper_id: int, top_k: int = 3) -> list[int]:
 
 def top_related_papers(
     paper_id: int,
-    vectors_by_id: dict[int, Counter[str]],
+    vectors_by_id: dict[int, Counter[str]] | TermMatrix,
     *,
     top_k: int = 3,
     min_similarity: float = 0.18,
@@ -91,6 +85,13 @@ def top_related_papers(
         return in_pool
 
     # Fall back to TF-IDF
+    if isinstance(vectors_by_id, TermMatrix):
+        return [
+            other_id
+            for other_id, _similarity in vectors_by_id.most_similar(
+                paper_id, top_k=top_k, min_similarity=min_similarity
+            )
+        ]
     target = vectors_by_id.get(paper_id)
     if not target:
         return []
@@ -5,10 +5,12 @@ from __future__ import annotations
 import logging
 import os
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
 from datetime import date, timedelta
 from pathlib import Path
+from typing import cast
 
 import requests
 from sqlalchemy.exc import IntegrityError
@@ -22,14 +24,17 @@ from app.services.enrichment import (
     merge_resource_links,
     parse_feed_entries,
 )
-from app.services.http_client import create_session, request_with_backoff, resolve_user_agent
+from app.services.fts import batched_fts_inserts, deferred_fts_merges
+from app.services.http_client import async_http_enabled, create_session, request_with_backoff, resolve_user_agent
 from app.services.ingest import IngestMode, IngestOrchestrator, PaperCandidate
 from app.services.interest_model import build_interest_profile
 from app.services.llm_client import LLMClient, resolve_api_key
 from app.services.matching import check_author_match, check_whitelist_match
+from app.services.pdf_spool import PdfPayload, PdfSpool, SpooledPdf
 from app.services.pipeline import WeightedSumRanker, WhitelistCandidateGenerator
 from app.services.preferences import get_preferences
-from app.services.ranking import compute_paper_score
+from app.services.ranking import compute_paper_score, resolve_ranking_preferences
+from app.services.stage_graph import STATUS_CANCELLED, STATUS_OK, Stage, StageGraph
 from app.services.summary import extract_topic_tags, generate_llm_summary, generate_summary
 from app.services.text import now_utc
 
@@ -43,15 +48,30 @@ _NATIVE_STAGE_TIMEOUT = float(os.environ.get("CV_ARXIV_NATIVE_STAGE_TIMEOUT", "9
 _THUMBNAIL_TIMEOUT_SECONDS = 120.0
 
 # Serializes the FAISS index read-append-rename performed by run_isolated inside
-# _generate_embeddings / _extract_sections. The historical search
-# (POST /api/search/historical) runs the pipeline synchronously in the request
-# thread, outside the job-manager single-flight gate, so a daily/scheduled scrape
+# _generate_embeddings / _extract_sections. Historical searches
+# (POST /api/search/historical) run on the job manager's separate historical worker,
+# outside the daily-scrape single-flight gate, so a daily/scheduled scrape
 # and a concurrent historical run can both load the same index snapshot and the
 # later os.replace would silently drop the other run's vectors/sections. A single
 # non-reentrant lock acquired once per stage serializes every path that writes the
 # index (all paths funnel through these two functions) with no duplication.
 _INDEX_WRITE_LOCK = threading.Lock()
 
+# Post-match stage concurrency (see _build_finalize_graph). "network" stages talk to
+# distinct hosts (Semantic Scholar, OpenAlex, HF, GitHub), each still paced by the
+# session's per-host limiter; "native" stages spawn isolated pdfplumber/torch/faiss
+# children, so cap them to bound peak memory. Thumbnails fan out over their own
+# 4-thread download/render pool, so they get a separate class.
+_FINALIZE_POOL_LIMITS = {"network": 3, "native": 2, "render": 1}
+_FINALIZE_MAX_WORKERS = 4
+
+# Historical backfills stop after this many candidates (sync_cli's INGEST_CHUNK_CAP
+# mirrors it) and are processed in chunks of _HISTORICAL_CHUNK_SIZE: a few API pages,
+# so memory stays bounded while each chunk's isolated embedding/section children
+# still amortize their model load over a useful batch.
+_HISTORICAL_MAX_RESULTS = 2000
+_HISTORICAL_CHUNK_SIZE = 200
+
 
 EventCallback = Callable[[str, dict], None] | None
 
@@ -132,7 +152,9 @@ def _enrich_candidate_with_llm(
             llm_client.rate_relevance(title, abstract, interests_text) if llm_client is not None else None
         )
         entry["llm_insights"] = {}
-    entry["topic_tags"] = extract_topic_tags(title, abstract)
+    if entry.get("topic_tags") is None:
+        # Usually already extracted for the mute check during candidate generation.
+        entry["topic_tags"] = extract_topic_tags(title, abstract)
 
 
 def _process_entries_with_pipeline(
@@ -239,6 +261,7 @@ def _filter_existing_entries(app, entries: list[dict]) -> tuple[list[dict], int]
 def _save_results(app, results: list[dict]) -> tuple[int, int]:
     from app.models import Paper, db
     from app.services.related import find_duplicates
+    from app.services.term_vectors import load_title_index
 
     now = now_utc()
     today_str = now.date().isoformat()
@@ -248,10 +271,8 @@ def _save_results(app, results: list[dict]) -> tuple[int, int]:
     with app.app_context():
         existing_keys = _get_existing_ids(app, results)
 
-        # Build title map for duplicate detection.
-        existing_titles: dict[int, str] = {}
-        for pid, ptitle in db.session.query(Paper.id, Paper.title).yield_per(500):
-            existing_titles[pid] = ptitle
+        # Stored title vectors for duplicate detection, stacked once for the batch.
+        existing_titles = load_title_index()
 
         seen_keys: set[str] = set()
         papers_to_insert = []
@@ -310,8 +331,8 @@ def _save_results(app, results: list[dict]) -> tuple[int, int]:
 
         if papers_to_insert:
             try:
-                db.session.add_all(papers_to_insert)
-                db.session.commit()
+                with batched_fts_inserts():
+                    db.session.add_all(papers_to_insert)
                 new_count += len(papers_to_insert)
             except IntegrityError:
                 db.session.rollback()
@@ -342,48 +363,60 @@ def _save_results(app, results: list[dict]) -> tuple[int, int]:
 def _link_intra_batch_duplicates(papers: list) -> None:
     """Link near-duplicate titles that landed in the SAME batch.
 
-    ``existing_titles`` is built once from pre-existing rows, so two near-duplicate NEW
+    ``existing_titles`` is loaded once from pre-existing rows, so two near-duplicate NEW
     papers in one scrape both get ``duplicate_of_id=None`` (find_duplicates never sees
     the sibling). After commit assigns ids, walk the inserted rows and point each later
     near-duplicate at the first occurrence, so intra-batch dupes are grouped too.
     """
     from app.models import db
     from app.services.related import find_duplicates
+    from app.services.term_vectors import TitleIndex
 
-    seen_titles: dict[int, str] = {}
+    seen_titles = TitleIndex()
     changed = False
     for paper in papers:
         if paper.id is None:
             continue  # skipped on a unique conflict during row-by-row fallback
-        if paper.duplicate_of_id is None and seen_titles:
+        if paper.duplicate_of_id is None and len(seen_titles):
             dups = find_duplicates(paper.title, seen_titles)
             if dups:
                 paper.duplicate_of_id = dups[0][0]
                 changed = True
-        seen_titles[paper.id] = paper.title
+        seen_titles.add(paper.id, paper.title)
     if changed:
         db.session.commit()
 
 
-def _generate_thumbnails(app, results: list[dict], session: requests.Session) -> None:
+def _generate_thumbnails(app, results: list[dict], session: requests.Session) -> dict:
+    """Render previews for ``results``; returns render time / byte totals for the run."""
     import time
     from concurrent.futures import ThreadPoolExecutor
     from concurrent.futures import TimeoutError as FuturesTimeout
 
-    from app.services.thumbnail_generator import DEFAULT_THUMBNAIL_DPI, generate_thumbnail
+    from app.services.thumbnail_generator import DEFAULT_THUMBNAIL_DPI, generate_previews
 
     static_folder = app.static_folder if app.static_folder else Path(__file__).parent.parent / "static"
     scraper_config = app.config["SCRAPER_CONFIG"].get("scraper", {}) or {}
     resolution = int(scraper_config.get("thumbnail_dpi", DEFAULT_THUMBNAIL_DPI))
 
+    totals = {"rendered": 0, "render_seconds": 0.0, "png_bytes": 0, "variant_bytes": 0, "bytes_saved": 0}
+    totals_lock = threading.Lock()
+
     def worker(res):
         arxiv_id = res.get("arxiv_id") or (res.get("link") or "").split("/")[-1]
         pdf_link = res.get("pdf_link")
         pdf_content = res.get("pdf_content")
         if arxiv_id and pdf_link:
-            generate_thumbnail(
+            stats = generate_previews(
                 arxiv_id, pdf_link, static_folder, session=session, pdf_content=pdf_content, resolution=resolution
             )
+            if stats.rendered:
+                with totals_lock:
+                    totals["rendered"] += 1
+                    totals["render_seconds"] += stats.render_seconds
+                    totals["png_bytes"] += stats.png_bytes
+                    totals["variant_bytes"] += stats.variant_bytes
+                    totals["bytes_saved"] += stats.bytes_saved
 
     # Bound the *wall-clock* time this holds the scrape worker. Note: exiting a
     # ``with ThreadPoolExecutor`` block calls ``shutdown(wait=True)``, which waits for
@@ -391,7 +424,8 @@ def _generate_thumbnails(app, results: list[dict], session: requests.Session) ->
     # slow/unreachable PDF hosts could block for hours. Instead we submit explicitly,
     # walk the futures under a deadline, and on timeout drop the rest with
     # ``cancel_futures=True`` (queued tasks are cancelled; the ≤4 in-flight ones finish
-    # in the background without blocking us).
+    # in the background without blocking us). Those may outlive the scrape's PdfSpool:
+    # generate_previews skips a paper whose spooled PDF is gone rather than failing.
     executor = ThreadPoolExecutor(max_workers=4)
     try:
         futures = [executor.submit(worker, res) for res in results]
@@ -410,6 +444,9 @@ def _generate_thumbnails(app, results: list[dict], session: requests.Session) ->
                 LOGGER.warning("Thumbnail generation failed for one paper", exc_info=True)
     finally:
         executor.shutdown(wait=False, cancel_futures=True)
+    with totals_lock:
+        totals["render_seconds"] = round(totals["render_seconds"], 3)
+        return dict(totals)
 
 
 def _generate_embeddings(app, results: list[dict]) -> None:
@@ -668,8 +705,11 @@ def _create_llm_client(app) -> tuple[LLMClient | None, str]:
     return client, interests_text
 
 
-def _rescore_result(res: dict, config: dict | None) -> None:
-    """Recompute the paper score after enrichment added new signals (in-place)."""
+def _rescore_result(res: dict, preferences: Mapping[str, float]) -> None:
+    """Recompute the paper score after enrichment added new signals (in-place).
+
+    ``preferences`` is resolved once per stage (:func:`resolve_ranking_preferences`).
+    """
     res["paper_score"] = compute_paper_score(
         match_types=res.get("match_types", []),
         matched_terms_count=len(res.get("matches", [])),
@@ -679,7 +719,7 @@ def _rescore_result(res: dict, config: dict | None) -> None:
         citation_count=res.get("citation_count"),
         acceptance_status=res.get("acceptance_status"),
         interest_similarity=res.get("interest_similarity"),
-        config=config,
+        preferences=preferences,
     )
 
 
@@ -711,7 +751,8 @@ def _enrich_results_with_citations(
     if now is None:
         now = now_utc()
 
-    citation_data = fetch_citations_batch(arxiv_ids, session=session)
+    citation_data = fetch_citations_batch(arxiv_ids, session=session, async_http=async_http_enabled(config))
+    preferences = resolve_ranking_preferences(config)
     for res in results:
         arxiv_id = res.get("arxiv_id")
         if arxiv_id and arxiv_id in citation_data:
@@ -721,21 +762,21 @@ def _enrich_results_with_citations(
             res["semantic_scholar_id"] = data.get("semantic_scholar_id")
             if res["citation_count"] is not None:
                 _mark_citation_source(res, "semantic_scholar", now)
-            _rescore_result(res, config)
+            _rescore_result(res, preferences)
 
 
-def _enrich_results_with_openalex(
-    results: list[dict],
-    session,
-    config: dict,
-) -> None:
-    """Enrich matched results with OpenAlex metadata (in-place)."""
+def _enrich_results_with_openalex(results: list[dict], config: dict) -> None:
+    """Enrich matched results with OpenAlex metadata (in-place).
+
+    Batches are pipelined over an api.openalex.org session of their own.
+    """
     openalex_config = config.get("openalex", {})
     if not openalex_config.get("enabled", True):
         return
     if not results:
         return
 
+    from app.services.enrichment_providers.openalex_provider import OPENALEX_API_HOST, OPENALEX_CONCURRENCY
     from app.services.openalex import fetch_openalex_batch
 
     arxiv_ids = [res["arxiv_id"] for res in results if res.get("arxiv_id")]
@@ -743,8 +784,14 @@ def _enrich_results_with_openalex(
         return
 
     email = openalex_config.get("email") or None
-    openalex_data = fetch_openalex_batch(arxiv_ids, session=session, email=email)
+    with _provider_session(
+        config, OPENALEX_API_HOST, OPENALEX_CONCURRENCY, rate_limit_profile="interactive"
+    ) as session:
+        openalex_data = fetch_openalex_batch(
+            arxiv_ids, session=session, email=email, async_http=async_http_enabled(config)
+        )
     now = now_utc()
+    preferences = resolve_ranking_preferences(config)
     for res in results:
         arxiv_id = res.get("arxiv_id")
         if arxiv_id and arxiv_id in openalex_data:
@@ -757,16 +804,21 @@ def _enrich_results_with_openalex(
             if res.get("citation_count") is None and res["openalex_cited_by_count"] is not None:
                 res["citation_count"] = res["openalex_cited_by_count"]
                 _mark_citation_source(res, "openalex", now)
-                _rescore_result(res, config)
+                _rescore_result(res, preferences)
 
 
-def _enrich_results_with_github(app, results: list[dict], session: requests.Session, config: dict) -> None:
-    """Fetch GitHub repo metadata (stars, license) for saved papers with code links."""
+def _enrich_results_with_github(app, results: list[dict], config: dict) -> None:
+    """Fetch GitHub repo metadata (stars, license) for saved papers with code links.
+
+    Uses its own api.github.com session: a pool sized for the provider's concurrent
+    fetches and a token bucket that isn't shared with the arXiv downloads.
+    """
     github_config = config.get("github", {})
     if not github_config.get("enabled", True):
         return
 
     from app.services.enrichment_providers import GitHubProvider, extract_github_repo
+    from app.services.enrichment_providers.github import GITHUB_API_HOST, GITHUB_CONCURRENCY
 
     repos_by_arxiv_id: dict[str, str] = {}
     for res in results:
@@ -778,9 +830,9 @@ def _enrich_results_with_github(app, results: list[dict], session: requests.Sess
         return
 
     token = os.environ.get("GITHUB_TOKEN") or github_config.get("token") or None
-    provider = GitHubProvider(token=token)
+    provider = GitHubProvider(token=token, async_http=async_http_enabled(config))
     try:
-        with app.app_context():
+        with app.app_context(), _provider_session(config, GITHUB_API_HOST, GITHUB_CONCURRENCY) as session:
             payloads = provider.fetch_batch(
                 list(repos_by_arxiv_id),
                 repos_by_arxiv_id=repos_by_arxiv_id,
@@ -802,7 +854,16 @@ def _enrich_results_with_github(app, results: list[dict], session: requests.Sess
         LOGGER.warning("GitHub enrichment failed (non-fatal)", exc_info=True)
 
 
-def _enrich_results_with_huggingface(app, results: list[dict], session: requests.Session, config: dict) -> None:
+def _provider_session(
+    config: dict, host: str, concurrency: int, *, rate_limit_profile: str = "bulk"
+) -> requests.Session:
+    """A session scoped to one enrichment host, pooled for ``concurrency``."""
+    return create_session(
+        pool_size=concurrency, scraper_config=config, rate_limit_profile=rate_limit_profile, rate_limit_scope=host
+    )
+
+
+def _enrich_results_with_huggingface(app, results: list[dict], config: dict) -> None:
     """Fill Hugging Face Papers community buzz (upvotes/comments) and missing code/project links.
 
     Keyless, always-on best-effort (a config ``huggingface.enabled: false`` opts out).
@@ -810,6 +871,7 @@ def _enrich_results_with_huggingface(app, results: list[dict], session: requests
     ``_enrich_results_with_github``, so an HF-discovered repo link is picked up by the
     stars/license pass in the same run. Fill-only: ``merge_resource_links`` dedups with
     existing links winning, and ``github_repo`` is only set when currently empty.
+    Like the GitHub pass it fetches over its own huggingface.co session.
     """
     hf_config = config.get("huggingface", {}) or {}
     if not hf_config.get("enabled", True):
@@ -822,14 +884,15 @@ def _enrich_results_with_huggingface(app, results: list[dict], session: requests
         extract_github_repo,
         huggingface_resource_links,
     )
+    from app.services.enrichment_providers.huggingface import HF_API_HOST, HUGGINGFACE_CONCURRENCY
 
     arxiv_ids = [res["arxiv_id"] for res in results if res.get("arxiv_id")]
     if not arxiv_ids:
         return
 
-    provider = HuggingFaceProvider()
+    provider = HuggingFaceProvider(async_http=async_http_enabled(config))
     try:
-        with app.app_context():
+        with app.app_context(), _provider_session(config, HF_API_HOST, HUGGINGFACE_CONCURRENCY) as session:
             payloads = {aid: data for aid, data in provider.fetch_batch(arxiv_ids, session=session).items() if data}
             if not payloads:
                 return
@@ -861,51 +924,88 @@ def _enrich_results_with_huggingface(app, results: list[dict], session: requests
         LOGGER.warning("Hugging Face Papers enrichment failed (non-fatal)", exc_info=True)
 
 
-def _enrich_results_with_pdf_links(results: list[dict], config: dict | None) -> None:
-    """Merge code/project links found in PDF front matter into resource_links (in-place)."""
+def _extract_pdf_links(results: list[dict]) -> list[list[dict]] | None:
+    """Parse code/project links from each result's PDF front matter (no mutation).
+
+    Returns one link list per result, or None when there is nothing to parse or the
+    isolated parse failed (non-fatal).
+    """
     if not results:
-        return
+        return None
     # .get(), not .pop(): pdf_content is still needed by thumbnails/sections.
     pdf_contents = [res.get("pdf_content") for res in results]
     if not any(pdf_contents):
-        return
+        return None
     try:
         from app.services.subprocess_runner import run_isolated
 
         # pdfplumber is a native-crash site; parse all PDFs in one child process so a
         # SIGSEGV/abort (or timeout) can't take down the scrape — degrade non-fatally.
-        links_per_result = run_isolated(extract_pdf_resource_links_batch, pdf_contents, timeout=_NATIVE_STAGE_TIMEOUT)
+        return run_isolated(extract_pdf_resource_links_batch, pdf_contents, timeout=_NATIVE_STAGE_TIMEOUT)
     except Exception:
         LOGGER.warning("PDF resource-link extraction failed (non-fatal)", exc_info=True)
+        return None
+
+
+def _apply_pdf_links(results: list[dict], links_per_result: list[list[dict]] | None, config: dict | None) -> None:
+    """Merge extracted PDF links into resource_links and rescore changed results (in-place)."""
+    if not links_per_result:
         return
+    preferences = resolve_ranking_preferences(config)
     for res, pdf_links in zip(results, links_per_result):
         if not pdf_links:
             continue
         merged = merge_resource_links(res.get("resource_links"), pdf_links)
         if len(merged) != len(res.get("resource_links") or []):
             res["resource_links"] = merged
-            _rescore_result(res, config)
+            _rescore_result(res, preferences)
+
+
+def _enrich_results_with_pdf_links(results: list[dict], config: dict | None) -> None:
+    """Merge code/project links found in PDF front matter into resource_links (in-place)."""
+    _apply_pdf_links(results, _extract_pdf_links(results), config)
 
 
-# Bound how many PDFs are downloaded + held in memory at once during the affiliation
-# pre-pass; each chunk is parsed in one isolated subprocess.
+# Bound how many PDFs are downloaded at once during the affiliation pre-pass; each
+# chunk is parsed in one isolated subprocess.
 _AFFILIATION_PREFETCH_CHUNK = 64
-# Bound resident PDF bytes during the prefetch: a per-download cap (a real arXiv
-# PDF over 50 MB is pathological) plus an aggregate per-chunk budget sized so
-# legitimate figure-heavy CV papers (~5-20 MB) rarely trip it — live QA showed a
+# Bound PDF bytes during the prefetch: a per-download cap (a real arXiv PDF over
+# 50 MB is pathological) plus an aggregate per-chunk budget on what is spooled, sized
+# so legitimate figure-heavy CV papers (~5-20 MB) rarely trip it — live QA showed a
 # tighter budget dropping real PDFs and silently degrading affiliation matching.
 # Once the aggregate budget is hit, remaining bodies in the chunk are dropped
 # (affiliation enrichment is best-effort).
 _AFFILIATION_MAX_PDF_BYTES = 50 * 1024 * 1024
 _AFFILIATION_MAX_TOTAL_PDF_BYTES = 768 * 1024 * 1024
 
+# Global budget (``scraper.memory_budget_mb``) for PDF bodies resident in the scrape
+# process. Past download every body lives in the scrape's PdfSpool on disk, so what
+# is left in memory is the downloads in flight — up to _AFFILIATION_MAX_PDF_BYTES
+# each. The prefetch narrows its download pool to fit.
+_DEFAULT_MEMORY_BUDGET_MB = 512
+
+
+def _memory_budget_bytes(scraper_config: dict) -> int:
+    return max(1, int(scraper_config.get("memory_budget_mb", _DEFAULT_MEMORY_BUDGET_MB))) * 1024 * 1024
+
+
+def _pdf_download_workers(scraper_config: dict) -> int:
+    """Download threads for the prefetch: ``max_workers`` capped by the memory budget."""
+    max_workers = max(1, int(scraper_config.get("max_workers", DEFAULT_MAX_WORKERS)))
+    return max(1, min(max_workers, _memory_budget_bytes(scraper_config) // _AFFILIATION_MAX_PDF_BYTES))
+
+
+def _discard_pdf(spool: PdfSpool | None, pdf_content: PdfPayload | None) -> None:
+    if spool is not None and isinstance(pdf_content, SpooledPdf):
+        spool.discard(pdf_content)
+
 
 def _entry_has_match_signal(entry: dict, whitelists: dict, affiliation_text: str) -> bool:
     """Cheap, network-free check of whether an entry could still become a candidate.
 
     Used by the affiliation pre-pass to decide whether to retain an entry's (large)
-    ``pdf_content`` bytes: an entry that matches no whitelist can never be a candidate, so
-    its PDF is never needed downstream and can be dropped to bound peak memory.
+    ``pdf_content``: an entry that matches no whitelist can never be a candidate, so
+    its PDF is never needed downstream and can be dropped to bound the spool.
     """
     affiliations = whitelists.get("affiliations", [])
     return bool(
@@ -925,6 +1025,7 @@ def _prefetch_affiliation_text(
     config: dict | None = None,
     rate_limit_profile: str = "interactive",
     event_callback: EventCallback = None,
+    spool: PdfSpool | None = None,
 ) -> None:
     """Download PDFs and extract affiliation-header text for entries whose API
     affiliations didn't already match — once per scrape, isolated.
@@ -932,8 +1033,11 @@ def _prefetch_affiliation_text(
     This moves the native pdfplumber parse out of the per-paper ranking worker (where a
     SIGSEGV would kill the whole scrape) into a single isolated subprocess. Network stays
     in the parent (threaded). Results are stashed on each entry as ``pdf_affiliation_text``
-    and ``pdf_content``; PDF bytes are kept only for entries that can still match (see
-    :func:`_entry_has_match_signal`), so peak memory ≈ candidate count.
+    and ``pdf_content``; PDFs are kept only for entries that can still match (see
+    :func:`_entry_has_match_signal`). With a ``spool`` each body goes to disk straight
+    from its download thread and ``pdf_content`` is a :class:`SpooledPdf` handle, so
+    resident PDF bytes are bounded by the downloads in flight (see
+    :func:`_pdf_download_workers`) instead of growing with the candidate count.
 
     This PDF-download pass is usually the longest stage of a fresh daily scrape, so it
     streams a ``downloading`` status event per completed PDF (``done``/``total``) to keep
@@ -948,7 +1052,7 @@ def _prefetch_affiliation_text(
     if not targets:
         return
 
-    max_workers = max(1, int(scraper_config.get("max_workers", DEFAULT_MAX_WORKERS)))
+    max_workers = _pdf_download_workers(scraper_config)
     attempts = int(scraper_config.get("pdf_attempts", 2))
     extract_kwargs = {
         "lines_start": scraper_config.get("pdf_lines_start", 2),
@@ -956,7 +1060,7 @@ def _prefetch_affiliation_text(
         "smart_header": scraper_config.get("pdf_smart_header", True),
     }
 
-    def _download(entry: dict) -> bytes | None:
+    def _download(entry: dict) -> PdfPayload | None:
         pdf_url = entry["link"].replace("/abs/", "/pdf/")
         try:
             # Pass the same config + profile the session was configured with, so
@@ -973,7 +1077,9 @@ def _prefetch_affiliation_text(
                 rate_limit_profile=rate_limit_profile,
                 max_bytes=_AFFILIATION_MAX_PDF_BYTES,
             )
-            return response.content
+            # Spool from the worker thread: the future then holds a small handle,
+            # not the body, for the rest of the chunk.
+            return spool.put(response.content) if spool is not None else response.content
         except Exception as exc:
             LOGGER.warning("Error fetching PDF for %s: %s", entry.get("link"), exc)
             return None
@@ -999,18 +1105,20 @@ def _prefetch_affiliation_text(
         # Submit + as_completed (instead of executor.map) so each finished download can
         # tick the progress counter; results are written back by index to preserve the
         # chunk order the downstream zip() relies on.
-        pdf_contents: list[bytes | None] = [None] * len(chunk)
+        pdf_contents: list[PdfPayload | None] = [None] * len(chunk)
         chunk_bytes = 0
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_index = {executor.submit(_download, entry): i for i, entry in enumerate(chunk)}
             for future in as_completed(future_to_index):
                 content = future.result()
                 if content is not None:
-                    if chunk_bytes + len(content) > _AFFILIATION_MAX_TOTAL_PDF_BYTES:
+                    size = content.size if isinstance(content, SpooledPdf) else len(content)
+                    if chunk_bytes + size > _AFFILIATION_MAX_TOTAL_PDF_BYTES:
                         LOGGER.warning("Affiliation prefetch byte budget reached; dropping remaining PDFs in chunk")
+                        _discard_pdf(spool, content)
                         content = None
                     else:
-                        chunk_bytes += len(content)
+                        chunk_bytes += size
                 pdf_contents[future_to_index[future]] = content
                 downloaded += 1
                 _emit_download_progress(downloaded)
@@ -1030,7 +1138,11 @@ def _prefetch_affiliation_text(
 
         for entry, pdf_content, text in zip(chunk, pdf_contents, texts):
             entry["pdf_affiliation_text"] = text
-            entry["pdf_content"] = pdf_content if _entry_has_match_signal(entry, whitelists, text) else None
+            if _entry_has_match_signal(entry, whitelists, text):
+                entry["pdf_content"] = pdf_content
+            else:
+                entry["pdf_content"] = None
+                _discard_pdf(spool, pdf_content)
 
 
 def _collect_matched_results(
@@ -1084,6 +1196,98 @@ def _collect_matched_results(
     return results
 
 
+def _build_finalize_graph(
+    app,
+    results: list[dict],
+    session: requests.Session,
+    config: dict,
+    *,
+    event_callback: EventCallback = None,
+    now=None,
+) -> StageGraph:
+    """Model the post-match stages as a dependency graph over the shared ``results``.
+
+    Pre-save enrichment that rescores results (citations -> OpenAlex) runs alongside
+    the isolated PDF-link parse; the parsed links are merged only after OpenAlex so two
+    stages never rescore the same result concurrently. Everything after the save needs
+    only persisted rows, so HF (-> GitHub, which reads HF-discovered repo links),
+    thumbnails, embeddings and sections overlap.
+    """
+
+    def status(phase: str, message: str) -> None:
+        _emit(event_callback, "status", {"phase": phase, "message": message})
+
+    def save(_ctx):
+        status("saving", "Saving to database...")
+        _sort_results(results)
+        return {"saved": _save_results(app, results)}
+
+    def thumbnails(_ctx):
+        status("thumbnails", "Generating PDF thumbnails...")
+        return {"thumbnail_stats": _generate_thumbnails(app, results, session)}
+
+    def embeddings(_ctx):
+        status("embeddings", "Generating embeddings...")
+        _generate_embeddings(app, results)
+
+    def sections(_ctx):
+        status("sections", "Extracting PDF sections...")
+        _extract_sections(app, results)
+
+    stages = [
+        Stage(
+            "citations",
+            lambda _ctx: _enrich_results_with_citations(results, session, config, now=now),
+            outputs=("citations",),
+            pool="network",
+        ),
+        Stage(
+            "openalex",
+            lambda _ctx: _enrich_results_with_openalex(results, config),
+            inputs=("citations",),
+            outputs=("openalex",),
+            pool="network",
+        ),
+        Stage(
+            "pdf_links",
+            lambda _ctx: {"pdf_links": _extract_pdf_links(results)},
+            outputs=("pdf_links",),
+            pool="native",
+        ),
+        Stage(
+            "merge_pdf_links",
+            lambda ctx: _apply_pdf_links(results, cast("list[list[dict]] | None", ctx.inputs["pdf_links"]), config),
+            inputs=("openalex", "pdf_links"),
+            outputs=("ranked",),
+        ),
+        Stage("save", save, inputs=("ranked",), outputs=("saved",)),
+        Stage(
+            "huggingface",
+            lambda _ctx: _enrich_results_with_huggingface(app, results, config),
+            inputs=("saved",),
+            outputs=("huggingface",),
+            pool="network",
+        ),
+        Stage(
+            "github",
+            lambda _ctx: _enrich_results_with_github(app, results, config),
+            inputs=("huggingface",),
+            pool="network",
+        ),
+        Stage("thumbnails", thumbnails, inputs=("saved",), outputs=("thumbnail_stats",), pool="render"),
+        Stage("embeddings", embeddings, inputs=("saved",), pool="native"),
+        Stage("sections", sections, inputs=("saved",), pool="native"),
+    ]
+    return StageGraph(stages, pool_limits=_FINALIZE_POOL_LIMITS, max_workers=_FINALIZE_MAX_WORKERS)
+
+
+@contextmanager
+def _deferred_fts_merges(app):
+    """Hold off FTS5 segment merges while a scrape saves, then merge/optimize once."""
+    with app.app_context(), deferred_fts_merges():
+        yield
+
+
 def _finalize_results(
     app,
     results: list[dict],
@@ -1094,31 +1298,29 @@ def _finalize_results(
     total_entries: int,
     event_callback: EventCallback = None,
     now=None,
+    cancel_event: threading.Event | None = None,
 ) -> dict:
     """Enrich, persist, and post-process matched results; returns the run summary."""
-    _emit(event_callback, "status", {"phase": "saving", "message": "Saving to database..."})
-    _enrich_results_with_citations(results, session, config, now=now)
-    _enrich_results_with_openalex(results, session, config)
-    _enrich_results_with_pdf_links(results, config)
-
-    _sort_results(results)
-    new_count, skipped = _save_results(app, results)
-    _enrich_results_with_huggingface(app, results, session, config)
-    _enrich_results_with_github(app, results, session, config)
-
-    _emit(event_callback, "status", {"phase": "thumbnails", "message": "Generating PDF thumbnails..."})
-    _generate_thumbnails(app, results, session)
-
-    _emit(event_callback, "status", {"phase": "embeddings", "message": "Generating embeddings..."})
-    _generate_embeddings(app, results)
+    graph = _build_finalize_graph(app, results, session, config, event_callback=event_callback, now=now)
+    artifacts, report = graph.run(cancel_event=cancel_event)
+    LOGGER.info("Scrape post-match stages: %s", report.format())
 
-    _emit(event_callback, "status", {"phase": "sections", "message": "Extracting PDF sections..."})
-    _extract_sections(app, results)
+    new_count, skipped = cast("tuple[int, int] | None", artifacts.get("saved")) or (0, 0)
+    summary = _build_summary(new_count, skipped + pre_filtered, len(results), total_entries)
+    summary["stage_report"] = report.as_dict()
+    if artifacts.get("thumbnail_stats"):
+        summary["thumbnail_stats"] = artifacts["thumbnail_stats"]
+    return summary
 
-    return _build_summary(new_count, skipped + pre_filtered, len(results), total_entries)
 
-
-def execute_scrape(app, event_callback: EventCallback = None, force: bool = False) -> dict:
+def execute_scrape(
+    app,
+    event_callback: EventCallback = None,
+    force: bool = False,
+    *,
+    cancel_event: threading.Event | None = None,
+) -> dict:
+    """Run the daily scrape; a set ``cancel_event`` skips post-match stages not yet started."""
     config = app.config["SCRAPER_CONFIG"]
     whitelists = config["whitelists"]
     scraper_config = config["scraper"]
@@ -1140,6 +1342,9 @@ def execute_scrape(app, event_callback: EventCallback = None, force: bool = Fals
     scrape_run_id = _create_scrape_run(app, now, force=force)
 
     session = None
+    # PDF bodies fetched by the affiliation pre-pass live here until the post-match
+    # stages are done with them.
+    spool = PdfSpool()
     try:
         max_workers = max(1, int(scraper_config.get("max_workers", DEFAULT_MAX_WORKERS)))
         user_agent = resolve_user_agent(config)
@@ -1209,6 +1414,7 @@ def execute_scrape(app, event_callback: EventCallback = None, force: bool = Fals
             config=config,
             rate_limit_profile="interactive",
             event_callback=event_callback,
+            spool=spool,
         )
 
         _emit(
@@ -1230,16 +1436,18 @@ def execute_scrape(app, event_callback: EventCallback = None, force: bool = Fals
             interest_profile=interest_profile,
         )
 
-        summary = _finalize_results(
-            app,
-            results,
-            session,
-            config,
-            pre_filtered=pre_filtered,
-            total_entries=total_entries,
-            event_callback=event_callback,
-            now=now,
-        )
+        with _deferred_fts_merges(app):
+            summary = _finalize_results(
+                app,
+                results,
+                session,
+                config,
+                pre_filtered=pre_filtered,
+                total_entries=total_entries,
+                event_callback=event_callback,
+                now=now,
+                cancel_event=cancel_event,
+            )
         _emit(event_callback, "done", summary)
         _finish_scrape_run(app, scrape_run_id, status="success")
 
@@ -1257,6 +1465,7 @@ def execute_scrape(app, event_callback: EventCallback = None, force: bool = Fals
     finally:
         if session is not None:
             session.close()
+        spool.close()
 
 
 def run_scrape(app) -> dict:
@@ -1270,7 +1479,39 @@ def stream_or_start_scrape(app, force: bool = False):
     return SCRAPE_JOB_MANAGER.stream_for_request(app, force=force)
 
 
-def execute_historical_scrape(app, categories: list[str], start_dt: date, end_dt: date) -> dict:
+def _iter_historical_chunks(pages, chunk_size: int):
+    """Regroup backend pages into chunks of at least ``chunk_size`` candidates."""
+    chunk: list[PaperCandidate] = []
+    for page in pages:
+        chunk.extend(page)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def execute_historical_scrape(
+    app,
+    categories: list[str],
+    start_dt: date,
+    end_dt: date,
+    *,
+    event_callback: EventCallback = None,
+    cancel_event: threading.Event | None = None,
+    chunk_size: int = _HISTORICAL_CHUNK_SIZE,
+) -> dict:
+    """Backfill ``categories`` over ``[start_dt, end_dt]`` one chunk at a time.
+
+    Each chunk of API pages is filtered, enriched, matched and saved before the
+    next page is requested, so peak memory tracks ``chunk_size`` rather than the
+    ``_HISTORICAL_MAX_RESULTS`` cap, and every finished chunk is already in the
+    library. A set ``cancel_event`` also skips the current chunk's post-match stages
+    that haven't started, then stops the run; the summary covers the chunks saved so
+    far and carries ``cancelled: True``. A chunk cut short is described under
+    ``partial_chunk`` (``saved`` and the ``skipped_stages``); one cancelled before its
+    save is left out of the counts so a re-run of the range picks it up again.
+    """
     config = app.config["SCRAPER_CONFIG"]
     whitelists = config["whitelists"]
     scraper_config = config["scraper"]
@@ -1282,53 +1523,130 @@ def execute_historical_scrape(app, categories: list[str], start_dt: date, end_dt
         scraper_config=config,
         rate_limit_profile="bulk",
     )
+    summary = {**_build_summary(0, 0, 0, 0), "chunks": 0, "cancelled": False}
+    ranking_context = None
     try:
         orchestrator = _build_ingest_orchestrator()
-
-        entries = _candidate_entries(
-            orchestrator.fetch(
-                mode=IngestMode.BACKFILL,
-                session=session,
-                categories=categories,
-                start_dt=start_dt,
-                end_dt=end_dt,
-                max_results=2000,
-                backend_names=ingest_config.get("backends"),
-                user_agent=user_agent,
-            )
-        )
-        total_entries = len(entries)
-        if not entries:
-            return _build_summary(0, 0, 0, 0)
-
-        entries, pre_filtered = _filter_existing_entries(app, entries)
-
-        llm_client, interests_text = _create_llm_client(app)
-        interest_profile = build_interest_profile(app)
-        enrich_entries_with_api_metadata(entries, session=session)
-        _prefetch_affiliation_text(
-            entries, whitelists, scraper_config, session, config=config, rate_limit_profile="bulk"
-        )
-
-        results = _collect_matched_results(
-            entries,
-            whitelists,
-            scraper_config,
-            session,
-            llm_client,
-            interests_text,
-            config,
-            progress_total=len(entries),
-            interest_profile=interest_profile,
-        )
-
-        return _finalize_results(
-            app,
-            results,
-            session,
-            config,
-            pre_filtered=pre_filtered,
-            total_entries=total_entries,
+        pages = orchestrator.iter_pages(
+            mode=IngestMode.BACKFILL,
+            session=session,
+            categories=categories,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            max_results=_HISTORICAL_MAX_RESULTS,
+            backend_names=ingest_config.get("backends"),
+            user_agent=user_agent,
         )
+        _emit(event_callback, "status", {"phase": "feed", "message": "Querying the arXiv API..."})
+        with closing(_iter_historical_chunks(pages, max(1, chunk_size))) as chunks, _deferred_fts_merges(app):
+            for chunk_number, candidates in enumerate(chunks, 1):
+                # Checked on both sides of a chunk: after fetching (so a cancel during
+                # the page requests skips the ranking work) and after saving (so the
+                # next pages are never requested).
+                if cancel_event is not None and cancel_event.is_set():
+                    summary["cancelled"] = True
+                    break
+                entries = _candidate_entries(candidates)
+                del candidates
+                in_feed = len(entries)
+                summary["total_in_feed"] += in_feed
+                summary["chunks"] = chunk_number
+                entries, pre_filtered = _filter_existing_entries(app, entries)
+                summary["duplicates_skipped"] += pre_filtered
+
+                if entries:
+                    if ranking_context is None:
+                        ranking_context = (*_create_llm_client(app), build_interest_profile(app))
+                    llm_client, interests_text, interest_profile = ranking_context
+                    _emit(
+                        event_callback,
+                        "status",
+                        {
+                            "phase": "processing",
+                            "chunk": chunk_number,
+                            "message": f"Ranking {len(entries)} new papers (batch {chunk_number})...",
+                        },
+                    )
+                    enrich_entries_with_api_metadata(entries, session=session)
+                    with PdfSpool() as spool:
+                        _prefetch_affiliation_text(
+                            entries,
+                            whitelists,
+                            scraper_config,
+                            session,
+                            config=config,
+                            rate_limit_profile="bulk",
+                            spool=spool,
+                        )
+                        results = _collect_matched_results(
+                            entries,
+                            whitelists,
+                            scraper_config,
+                            session,
+                            llm_client,
+                            interests_text,
+                            config,
+                            progress_total=len(entries),
+                            interest_profile=interest_profile,
+                        )
+                        chunk_summary = _finalize_results(
+                            app,
+                            results,
+                            session,
+                            config,
+                            pre_filtered=0,
+                            total_entries=len(entries),
+                            cancel_event=cancel_event,
+                        )
+                    del entries, results
+                    stage_report = chunk_summary.get("stage_report") or {}
+                    if stage_report.get("cancelled"):
+                        stages = stage_report.get("stages", {})
+                        saved = stages.get("save", {}).get("status") == STATUS_OK
+                        summary["partial_chunk"] = {
+                            "chunk": chunk_number,
+                            "saved": saved,
+                            "skipped_stages": sorted(
+                                name for name, stage in stages.items() if stage["status"] == STATUS_CANCELLED
+                            ),
+                        }
+                        if not saved:
+                            # Cancelled before the save: nothing from this chunk is in the
+                            # library, so leave it out of the summary and let a re-run of the
+                            # range fetch it again.
+                            summary["total_in_feed"] -= in_feed
+                            summary["duplicates_skipped"] -= pre_filtered
+                            summary["chunks"] = chunk_number - 1
+                            summary["cancelled"] = True
+                            break
+                        # Saved but cut short: a re-run skips these papers as already in
+                        # the library, so point at the backfills that fill what was skipped.
+                        LOGGER.warning(
+                            "Historical chunk %s saved %s paper(s) before the cancel; skipped stages: %s "
+                            "(fill them with cv-arxiv-backfill thumbnails / embeddings)",
+                            chunk_number,
+                            chunk_summary["new_papers"],
+                            ", ".join(summary["partial_chunk"]["skipped_stages"]) or "-",
+                        )
+                    summary["new_papers"] += chunk_summary["new_papers"]
+                    summary["duplicates_skipped"] += chunk_summary["duplicates_skipped"]
+                    summary["total_matched"] += chunk_summary["total_matched"]
+
+                _emit(event_callback, "status", {"phase": "chunk", **summary})
+                if cancel_event is not None and cancel_event.is_set():
+                    summary["cancelled"] = True
+                    break
     finally:
         session.close()
+
+    LOGGER.info(
+        "Historical scrape %s: %s new, %s duplicates, %s matched out of %s entries in %s chunk(s)",
+        "cancelled" if summary["cancelled"] else "complete",
+        summary["new_papers"],
+        summary["duplicates_skipped"],
+        summary["total_matched"],
+        summary["total_in_feed"],
+        summary["chunks"],
+    )
+    _emit(event_callback, "done", summary)
+    return summary
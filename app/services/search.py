@@ -3,47 +3,68 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Iterator
+from collections.abc import Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
 
+from flask import current_app, has_app_context
 from sqlalchemy import text
 
 from app.models import db
+from app.services.fts import fts5_available, reset_fts5_available
 
 LOGGER = logging.getLogger(__name__)
 
 RRF_K = 60  # Reciprocal Rank Fusion constant
+# Most FTS rows a filtered BM25 search reads while looking for enough eligible hits.
+BM25_FILTERED_SCAN_LIMIT = 5000
 
+# Runs the semantic leg of hybrid searches next to the BM25 leg on the request
+# thread. Query encoding is the slow part and releases the GIL (torch / FAISS).
+_SEMANTIC_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="semantic-search")
 
-def _sanitize_fts5_query(query: str) -> str:
-    """Escape user input for safe use in FTS5 MATCH by wrapping tokens in double quotes."""
+
+def _sanitize_fts5_query(query: str, *, prefix: bool = False) -> str:
+    """Escape user input for safe use in FTS5 MATCH by wrapping tokens in double quotes.
+
+    With ``prefix`` the last token also matches as a prefix (``"seg"*``), served by
+    the index's 2/3-character prefix indexes. A one-character token stays exact:
+    its prefix query would walk most of the vocabulary.
+    """
     # Remove existing double quotes and wrap each token as a quoted phrase
     # to prevent FTS5 operator injection (NEAR, OR, NOT, *, etc.)
     cleaned = query.replace('"', "")
     tokens = cleaned.split()
     if not tokens:
         return '""'
-    return " ".join(f'"{token}"' for token in tokens)
+    phrases = [f'"{token}"' for token in tokens]
+    if prefix and len(tokens[-1]) >= 2:
+        phrases[-1] += "*"
+    return " ".join(phrases)
 
 
-def _fts5_available() -> bool:
-    """Check if the papers_fts table exists."""
-    try:
-        db.session.execute(text("SELECT COUNT(*) FROM papers_fts LIMIT 1"))
-        return True
-    except Exception:
-        db.session.rollback()
-        return False
+def search_bm25(
+    query: str, limit: int = 50, *, prefix: bool = False, paper_ids: AbstractSet[int] | None = None
+) -> list[tuple[int, float]]:
+    """Full-text search using SQLite FTS5. Returns [(paper_id, bm25_score)].
 
+    ``prefix`` treats the last word as still being typed (search-as-you-type).
+    ``paper_ids`` keeps only those papers, reading further down the ranking (up to
+    :data:`BM25_FILTERED_SCAN_LIMIT` rows) until ``limit`` of them are found.
+    """
+    if paper_ids is not None:
+        return [
+            row for page in _iter_bm25_pages(query, limit, limit, prefix=prefix, paper_ids=paper_ids) for row in page
+        ]
 
-def search_bm25(query: str, limit: int = 50) -> list[tuple[int, float]]:
-    """Full-text search using SQLite FTS5. Returns [(paper_id, bm25_score)]."""
     if not query.strip():
         return []
 
-    if not _fts5_available():
+    if not fts5_available():
         return []
 
     try:
-        safe_query = _sanitize_fts5_query(query)
+        safe_query = _sanitize_fts5_query(query, prefix=prefix)
         rows = db.session.execute(
             text("SELECT rowid, rank FROM papers_fts WHERE papers_fts MATCH :query ORDER BY rank LIMIT :limit"),
             {"query": safe_query, "limit": limit},
@@ -53,13 +74,23 @@ def search_bm25(query: str, limit: int = 50) -> list[tuple[int, float]]:
     except Exception as exc:
         LOGGER.warning("FTS5 search failed: %s", exc)
         db.session.rollback()
+        # The index may have been dropped under us; re-probe on the next search.
+        reset_fts5_available()
         return []
 
 
-def search_semantic(query: str, top_k: int = 50) -> list[tuple[int, float]]:
-    """Semantic search using FAISS embeddings. Returns [(paper_id, cosine_score)]."""
+def search_semantic(
+    query: str, top_k: int = 50, *, paper_ids: AbstractSet[int] | None = None
+) -> list[tuple[int, float]]:
+    """Semantic search using FAISS embeddings. Returns [(paper_id, cosine_score)].
+
+    ``paper_ids`` restricts the search to those papers inside FAISS (see
+    :meth:`EmbeddingService.search`).
+    """
     if not query.strip():
         return []
+    if paper_ids is not None and not paper_ids:
+        return []
 
     try:
         from app.services.embeddings import get_embedding_service
@@ -67,68 +98,196 @@ def search_semantic(query: str, top_k: int = 50) -> list[tuple[int, float]]:
         service = get_embedding_service()
         if service.index_count() == 0:
             return []
-        return service.search(query, top_k=top_k)
+        if paper_ids is None:
+            return service.search(query, top_k=top_k)
+        return service.search(query, top_k=top_k, paper_ids=paper_ids)
     except Exception as exc:
         LOGGER.warning("Semantic search failed: %s", exc)
         return []
 
 
+def _iter_bm25_pages(
+    query: str,
+    limit: int,
+    page_size: int,
+    *,
+    prefix: bool = False,
+    paper_ids: AbstractSet[int] | None = None,
+) -> Iterator[list[tuple[int, float]]]:
+    """Yield :func:`search_bm25`'s results ``page_size`` rows at a time from one cursor.
+
+    FTS5 ranks the whole match set when the statement starts, so pages come off a
+    single cursor rather than re-running the query with an OFFSET. With
+    ``paper_ids`` other papers are skipped and the cursor is read past ``limit``
+    (up to :data:`BM25_FILTERED_SCAN_LIMIT` rows) until ``limit`` eligible rows are
+    found; every page but the last still holds ``page_size`` rows.
+    """
+    if not query.strip() or not fts5_available():
+        return
+    if paper_ids is not None and not paper_ids:
+        return
+    scan_limit = limit if paper_ids is None else max(limit, BM25_FILTERED_SCAN_LIMIT)
+    try:
+        result = db.session.execute(
+            text("SELECT rowid, rank FROM papers_fts WHERE papers_fts MATCH :query ORDER BY rank LIMIT :limit"),
+            {"query": _sanitize_fts5_query(query, prefix=prefix), "limit": scan_limit},
+        )
+        try:
+            kept = 0
+            page: list[tuple[int, float]] = []
+            while kept < limit and (rows := result.fetchmany(page_size)):
+                for row in rows:
+                    paper_id = int(row[0])
+                    if paper_ids is not None and paper_id not in paper_ids:
+                        continue
+                    page.append((paper_id, -float(row[1])))
+                    kept += 1
+                    if len(page) == page_size or kept == limit:
+                        yield page
+                        page = []
+                    if kept == limit:
+                        break
+            if page:
+                yield page
+        finally:
+            result.close()
+    except Exception as exc:
+        LOGGER.warning("FTS5 search failed: %s", exc)
+        db.session.rollback()
+        reset_fts5_available()
+
+
+def _rank_map(results: list[tuple[int, float]]) -> dict[int, int]:
+    """1-indexed ranks; a repeated id keeps its last rank, as the fusion always has."""
+    return {pid: rank for rank, (pid, _score) in enumerate(results, 1)}
+
+
+def _known_scores(
+    bm25_ranks: dict[int, int], semantic_ranks: dict[int, int], bm25_weight: float, semantic_weight: float
+) -> dict[int, float]:
+    scores: dict[int, float] = {}
+    for pid in bm25_ranks.keys() | semantic_ranks.keys():
+        score = 0.0
+        if pid in bm25_ranks:
+            score += bm25_weight / (RRF_K + bm25_ranks[pid])
+        if pid in semantic_ranks:
+            score += semantic_weight / (RRF_K + semantic_ranks[pid])
+        scores[pid] = score
+    return scores
+
+
+def _top_k_settled(
+    bm25_ranks: dict[int, int],
+    semantic_ranks: dict[int, int],
+    *,
+    depth: int,
+    top_k: int,
+    bm25_weight: float,
+    semantic_weight: float,
+) -> bool:
+    """Whether no BM25 row below ``depth`` can change the fused top_k or its order.
+
+    Any paper without a BM25 rank yet can gain at most ``bm25_weight / (K + depth + 1)``
+    from a deeper row; a paper unseen by both legs can score at most that. The top_k
+    is settled once each of its members' current score beats every score that could
+    still rise above it.
+    """
+    gain = bm25_weight / (RRF_K + depth + 1)
+    known = _known_scores(bm25_ranks, semantic_ranks, bm25_weight, semantic_weight)
+    if len(known) < top_k:
+        return False
+    ordered = sorted(known.items(), key=lambda item: (-item[1], item[0]))
+    ceilings = [score + (gain if pid not in bm25_ranks else 0.0) for pid, score in ordered]
+    # The best score any paper ranked after position i could reach: itself, a later
+    # candidate, or an unseen paper.
+    best_after = gain
+    for i in range(len(ordered) - 1, -1, -1):
+        if i < top_k and ordered[i][1] <= best_after:
+            return False
+        best_after = max(best_after, ceilings[i])
+    return True
+
+
+def _in_app_context(fn: Callable) -> Callable:
+    """Wrap ``fn`` to run inside the caller's app context on a worker thread."""
+    if not has_app_context():
+        return fn
+    app = current_app._get_current_object()
+
+    def run(*args, **kwargs):
+        with app.app_context():
+            return fn(*args, **kwargs)
+
+    return run
+
+
 def search_hybrid(
     query: str,
     *,
     top_k: int = 30,
     bm25_weight: float = 0.4,
     semantic_weight: float = 0.6,
+    prefix: bool = False,
+    early_termination: bool = False,
+    paper_ids: AbstractSet[int] | None = None,
 ) -> list[dict]:
     """
     Combine BM25 and semantic search via Reciprocal Rank Fusion.
 
+    The semantic leg (query embedding + FAISS search) runs on a worker thread while
+    BM25 runs here; both release the GIL for most of their time. With
+    ``early_termination`` BM25 rows are read a page at a time and reading stops as
+    soon as deeper rows can no longer change which papers make the top_k or their
+    order; a returned paper whose BM25 rank lies below that depth reports
+    ``bm25_rank`` None.
+
+    ``paper_ids`` (a filtered id set) is pushed into both legs, so the top_k comes
+    from the eligible papers alone rather than being filtered afterwards.
+
     Returns [{paper_id, rrf_score, bm25_rank, semantic_rank}] sorted by rrf_score desc.
     """
     if not query.strip():
         return []
 
-    bm25_results = search_bm25(query, limit=top_k * 2)
-    semantic_results = search_semantic(query, top_k=top_k * 2)
+    depth = top_k * 2
+    filter_kwargs = {} if paper_ids is None else {"paper_ids": paper_ids}
+    semantic_future = _SEMANTIC_EXECUTOR.submit(_in_app_context(search_semantic), query, top_k=depth, **filter_kwargs)
+    if not early_termination:
+        bm25_results = search_bm25(query, limit=depth, prefix=prefix, **filter_kwargs)
+    else:
+        page_size = max(1, top_k // 2)
+        bm25_results = []
+        for page in _iter_bm25_pages(query, depth, page_size, prefix=prefix, **filter_kwargs):
+            bm25_results.extend(page)
+            if len(page) < page_size or _top_k_settled(
+                _rank_map(bm25_results),
+                _rank_map(semantic_future.result()),
+                depth=len(bm25_results),
+                top_k=top_k,
+                bm25_weight=bm25_weight,
+                semantic_weight=semantic_weight,
+            ):
+                break
+    semantic_results = semantic_future.result()
 
     # If only one system has results, use that
     if not bm25_results and not semantic_results:
         return []
 
-    # Build rank maps (1-indexed)
-    bm25_ranks: dict[int, int] = {}
-    for rank, (pid, _score) in enumerate(bm25_results, 1):
-        bm25_ranks[pid] = rank
-
-    semantic_ranks: dict[int, int] = {}
-    for rank, (pid, _score) in enumerate(semantic_results, 1):
-        semantic_ranks[pid] = rank
-
-    # Collect all candidate paper IDs
-    all_pids = set(bm25_ranks.keys()) | set(semantic_ranks.keys())
-
-    # Compute RRF scores
-    scored = []
-    for pid in all_pids:
-        rrf_score = 0.0
-        bm25_rank = bm25_ranks.get(pid)
-        semantic_rank = semantic_ranks.get(pid)
-
-        if bm25_rank is not None:
-            rrf_score += bm25_weight / (RRF_K + bm25_rank)
-        if semantic_rank is not None:
-            rrf_score += semantic_weight / (RRF_K + semantic_rank)
-
-        scored.append(
-            {
-                "paper_id": pid,
-                "rrf_score": round(rrf_score, 6),
-                "bm25_rank": bm25_rank,
-                "semantic_rank": semantic_rank,
-            }
-        )
+    bm25_ranks = _rank_map(bm25_results)
+    semantic_ranks = _rank_map(semantic_results)
+    known = _known_scores(bm25_ranks, semantic_ranks, bm25_weight, semantic_weight)
+    scored = [
+        {
+            "paper_id": pid,
+            "rrf_score": round(score, 6),
+            "bm25_rank": bm25_ranks.get(pid),
+            "semantic_rank": semantic_ranks.get(pid),
+        }
+        for pid, score in known.items()
+    ]
 
-    # Tie-break on paper_id so the top_k cut is reproducible: all_pids is a set, so
-    # equal-rrf_score papers would otherwise order non-deterministically across runs.
+    # Tie-break on paper_id so the top_k cut is reproducible: the candidate ids come
+    # from a set, so equal-rrf_score papers would otherwise order non-deterministically.
     scored.sort(key=lambda x: (-x["rrf_score"], x["paper_id"]))
     return scored[:top_k]
@@ -0,0 +1,260 @@
+"""Small dependency-graph executor (post-match scrape stages, the ``all`` backfill).
+
+Each :class:`Stage` declares the artifacts it consumes (``inputs``) and produces
+(``outputs``); a stage becomes runnable once every input has been produced, so
+independent stages (e.g. thumbnails vs. embeddings after the save) overlap on a
+shared thread pool. ``pool`` names a concurrency class capped by ``pool_limits``
+(network fan-out, native subprocess work), and a single cancellation event is shared
+by every stage: a stage failure, or the caller setting the event, stops anything not
+yet started. The :class:`StageReport` records per-stage timings and the critical path.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+LOGGER = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+
+@dataclass
+class StageContext:
+    """What a stage function sees: its resolved inputs and the shared cancel flag."""
+
+    inputs: dict[str, object]
+    cancel_event: threading.Event
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node of the graph.
+
+    ``fn`` receives a :class:`StageContext` and returns ``None`` (every output is an
+    ordering-only marker, e.g. the stage mutated shared results in place) or a mapping
+    holding a value for some/all of ``outputs``.
+    """
+
+    name: str
+    fn: Callable[[StageContext], Mapping[str, object] | None]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    pool: str | None = None
+
+
+@dataclass
+class StageTiming:
+    name: str
+    status: str
+    started_at: float | None = None  # seconds since the run started
+    duration: float = 0.0
+
+
+@dataclass
+class StageReport:
+    timings: dict[str, StageTiming] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+    cancelled: bool = False
+
+    def as_dict(self) -> dict:
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "critical_path": list(self.critical_path),
+            "critical_path_seconds": round(self.critical_path_seconds, 3),
+            "cancelled": self.cancelled,
+            "stages": {
+                name: {"status": timing.status, "seconds": round(timing.duration, 3)}
+                for name, timing in self.timings.items()
+            },
+        }
+
+    def format(self) -> str:
+        stages = ", ".join(
+            f"{name}={timing.duration:.2f}s" + ("" if timing.status == STATUS_OK else f" ({timing.status})")
+            for name, timing in self.timings.items()
+        )
+        return (
+            f"wall {self.wall_seconds:.2f}s; critical path {' -> '.join(self.critical_path) or '-'} "
+            f"({self.critical_path_seconds:.2f}s); {stages}"
+        )
+
+
+class StageGraph:
+    """Validated set of stages that can be executed concurrently in dependency order."""
+
+    def __init__(
+        self,
+        stages: Iterable[Stage],
+        *,
+        pool_limits: Mapping[str, int] | None = None,
+        max_workers: int = 4,
+    ):
+        self._stages: dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self._stages:
+                raise ValueError(f"Duplicate stage name: {stage.name!r}")
+            self._stages[stage.name] = stage
+        self._pool_limits = {name: max(1, int(limit)) for name, limit in (pool_limits or {}).items()}
+        self._max_workers = max(1, int(max_workers))
+
+        self._producer: dict[str, str] = {}
+        for stage in self._stages.values():
+            for artifact in stage.outputs:
+                if artifact in self._producer:
+                    raise ValueError(
+                        f"Artifact {artifact!r} produced by both {self._producer[artifact]!r} and {stage.name!r}"
+                    )
+                self._producer[artifact] = stage.name
+
+        self._deps: dict[str, set[str]] = {
+            stage.name: {self._producer[a] for a in stage.inputs if a in self._producer}
+            for stage in self._stages.values()
+        }
+        self._order = self._topological_order()
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        remaining = {name: set(deps) for name, deps in self._deps.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Stage graph has a cycle among: {', '.join(sorted(remaining))}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def run(
+        self,
+        initial: Mapping[str, object] | None = None,
+        *,
+        cancel_event: threading.Event | None = None,
+    ) -> tuple[dict[str, object], StageReport]:
+        """Execute every stage; returns (artifacts, report).
+
+        Inputs not produced by any stage must be supplied via ``initial``. The first
+        stage exception is re-raised once running stages have drained; dependents of a
+        failed or cancelled stage never start.
+        """
+        artifacts: dict[str, object] = dict(initial or {})
+        for stage in self._stages.values():
+            missing = [a for a in stage.inputs if a not in self._producer and a not in artifacts]
+            if missing:
+                raise ValueError(f"Stage {stage.name!r} needs unprovided inputs: {', '.join(missing)}")
+
+        cancel = cancel_event if cancel_event is not None else threading.Event()
+        report = StageReport()
+        pending = list(self._order)
+        done: set[str] = set()
+        in_pool: dict[str, int] = {}
+        running: dict[Future, str] = {}
+        first_error: BaseException | None = None
+        run_start = time.monotonic()
+
+        def runnable(name: str) -> bool:
+            if not self._deps[name] <= done:
+                return False
+            pool = self._stages[name].pool
+            return pool is None or in_pool.get(pool, 0) < self._pool_limits.get(pool, self._max_workers)
+
+        def execute(stage: Stage, timing: StageTiming) -> Mapping[str, object] | None:
+            started = time.monotonic()
+            timing.started_at = started - run_start
+            try:
+                return stage.fn(StageContext({a: artifacts.get(a) for a in stage.inputs}, cancel))
+            finally:
+                timing.duration = time.monotonic() - started
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="stage") as executor:
+            while pending or running:
+                if not cancel.is_set():
+                    for name in list(pending):
+                        if not runnable(name):
+                            continue
+                        stage = self._stages[name]
+                        pending.remove(name)
+                        if stage.pool is not None:
+                            in_pool[stage.pool] = in_pool.get(stage.pool, 0) + 1
+                        timing = StageTiming(name, STATUS_OK)
+                        report.timings[name] = timing
+                        running[executor.submit(execute, stage, timing)] = name
+                if not running:
+                    # Cancelled (or nothing left can start): everything pending is skipped.
+                    for name in pending:
+                        report.timings[name] = StageTiming(name, STATUS_CANCELLED)
+                    pending.clear()
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    stage = self._stages[name]
+                    if stage.pool is not None:
+                        in_pool[stage.pool] -= 1
+                    exc = future.exception()
+                    produced: Mapping[str, object] = {}
+                    if exc is None:
+                        produced = future.result() or {}
+                        unknown = set(produced) - set(stage.outputs)
+                        if unknown:
+                            # A contract error, but still a stage failure: stop scheduling
+                            # and drain the running stages like any other exception.
+                            exc = ValueError(
+                                f"Stage {name!r} returned undeclared outputs: {', '.join(sorted(unknown))}"
+                            )
+                    if exc is not None:
+                        report.timings[name].status = STATUS_FAILED
+                        LOGGER.warning("Stage %s failed; cancelling stages not yet started", name)
+                        if first_error is None:
+                            first_error = exc
+                        cancel.set()
+                        continue
+                    for artifact in stage.outputs:
+                        artifacts[artifact] = produced.get(artifact)
+                    done.add(name)
+
+        report.wall_seconds = time.monotonic() - run_start
+        report.cancelled = cancel.is_set()
+        report.critical_path, report.critical_path_seconds = self._critical_path(report)
+        if first_error is not None:
+            raise first_error
+        return artifacts, report
+
+    def _critical_path(self, report: StageReport) -> tuple[list[str], float]:
+        """Longest duration-weighted dependency chain among the stages that ran."""
+        cost: dict[str, float] = {}
+        via: dict[str, str | None] = {}
+        for name in self._order:
+            timing = report.timings.get(name)
+            if timing is None or timing.started_at is None:
+                continue
+            best_dep, best_cost = None, 0.0
+            for dep in self._deps[name]:
+                if dep in cost and cost[dep] > best_cost:
+                    best_dep, best_cost = dep, cost[dep]
+            cost[name] = best_cost + timing.duration
+            via[name] = best_dep
+        if not cost:
+            return [], 0.0
+        tail = max(cost, key=cost.__getitem__)
+        path: list[str] = []
+        node: str | None = tail
+        while node is not None:
+            path.append(node)
+            node = via[node]
+        return path[::-1], cost[tail]
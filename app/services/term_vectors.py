@@ -0,0 +1,383 @@
+"""Persisted sparse TF-IDF vectors for lexical paper similarity.
+
+:func:`app.services.related.build_vector` re-tokenizes a paper's text on every
+call and :func:`~app.services.related.cosine_similarity` walks two dicts in Python,
+so scoring one paper against a few hundred others repeats all of that work per
+render. Instead each paper's tokens are hashed once, on save:
+
+* **storage** — ``paper_term_vectors`` holds a paper's sorted 64-bit token hashes
+  and their counts, for the whole text (title, summary, abstract, topic tags) and
+  for the title alone; ``term_document_frequency`` counts how many papers carry
+  each hash, which gives the IDF weights.
+* **maintenance** — SQLAlchemy session events re-vectorize inserted papers and
+  papers whose text changed, and move the document frequencies by the difference,
+  in the same transaction (:func:`install_term_vector_listeners`). Writes that
+  bypass the ORM unit of work are caught up by :func:`rebuild_term_vectors`.
+* **similarity** — :class:`TermMatrix` stacks a set of papers into one CSR-style
+  array of L2-normalized weights, so scoring one paper against all of them is a
+  single sparse matrix-vector product in numpy. :class:`TitleIndex` does the same
+  over raw title counts for near-duplicate detection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+from sqlalchemy import bindparam, event, inspect, select, text
+from sqlalchemy.orm import InstanceState, Session
+
+from app.models import Paper, db
+from app.services.text import STOP_WORDS, tokenize
+
+LOGGER = logging.getLogger(__name__)
+
+_HASH_DTYPE = np.dtype("<i8")
+_COUNT_DTYPE = np.dtype("<i4")
+_EMPTY_HASHES = np.empty(0, dtype=_HASH_DTYPE)
+_EMPTY_COUNTS = np.empty(0, dtype=_COUNT_DTYPE)
+_CHUNK = 500
+# Paper columns a term vector is built from; changing any of them re-vectorizes.
+_TEXT_ATTRS = ("title", "summary_text", "abstract_text", "topic_tags")
+_PENDING_KEY = "term_vector_pending"
+
+_PAPERS = Paper.__table__
+_TEXT_BY_ID = select(_PAPERS.c.id, *(_PAPERS.c[name] for name in _TEXT_ATTRS)).where(
+    _PAPERS.c.id.in_(bindparam("ids", expanding=True))
+)
+_UNVECTORIZED_TITLES = text(
+    "SELECT id, title FROM papers WHERE NOT EXISTS (SELECT 1 FROM paper_term_vectors WHERE paper_id = papers.id)"
+)
+_STORED_HASHES = text("SELECT paper_id, term_hashes FROM paper_term_vectors WHERE paper_id IN :ids").bindparams(
+    bindparam("ids", expanding=True)
+)
+_STORED_VECTORS = text(
+    "SELECT paper_id, term_hashes, term_counts FROM paper_term_vectors WHERE paper_id IN :ids"
+).bindparams(bindparam("ids", expanding=True))
+_UPSERT_VECTOR = text(
+    "INSERT INTO paper_term_vectors (paper_id, term_hashes, term_counts, title_hashes, title_counts) "
+    "VALUES (:paper_id, :term_hashes, :term_counts, :title_hashes, :title_counts) "
+    "ON CONFLICT(paper_id) DO UPDATE SET term_hashes = excluded.term_hashes, term_counts = excluded.term_counts, "
+    "title_hashes = excluded.title_hashes, title_counts = excluded.title_counts"
+)
+_DELETE_VECTORS = text("DELETE FROM paper_term_vectors WHERE paper_id IN :ids").bindparams(
+    bindparam("ids", expanding=True)
+)
+_UPSERT_FREQUENCY = text(
+    "INSERT INTO term_document_frequency (term_hash, doc_count) VALUES (:term_hash, :delta) "
+    "ON CONFLICT(term_hash) DO UPDATE SET doc_count = doc_count + excluded.doc_count"
+)
+_DELETE_UNUSED = text("DELETE FROM term_document_frequency WHERE doc_count <= 0 AND term_hash IN :hashes").bindparams(
+    bindparam("hashes", expanding=True)
+)
+_FREQUENCIES = text("SELECT term_hash, doc_count FROM term_document_frequency WHERE term_hash IN :hashes").bindparams(
+    bindparam("hashes", expanding=True)
+)
+
+
+@lru_cache(maxsize=65536)
+def term_hash(token: str) -> int:
+    """Stable signed 64-bit id of a token (fits an SQLite INTEGER)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+
+
+def term_counts(value: str | None) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted token hashes of ``value`` (stop words dropped) and their counts."""
+    counts = Counter(term_hash(token) for token in tokenize(value) if token not in STOP_WORDS)
+    if not counts:
+        return _EMPTY_HASHES, _EMPTY_COUNTS
+    hashes = np.fromiter(counts.keys(), dtype=_HASH_DTYPE, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=_COUNT_DTYPE, count=len(counts))
+    order = np.argsort(hashes)
+    return hashes[order], values[order]
+
+
+def paper_document_text(title, summary_text, abstract_text, topic_tags) -> str:
+    """The text a paper's term vector covers."""
+    return " ".join([title or "", summary_text or "", abstract_text or "", " ".join(topic_tags or [])])
+
+
+def _chunks(items: list, size: int = _CHUNK):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _vector_row(paper_id: int, title, summary_text, abstract_text, topic_tags) -> dict:
+    hashes, counts = term_counts(paper_document_text(title, summary_text, abstract_text, topic_tags))
+    title_hashes, title_counts = term_counts(title)
+    return {
+        "paper_id": paper_id,
+        "term_hashes": hashes.tobytes(),
+        "term_counts": counts.tobytes(),
+        "title_hashes": title_hashes.tobytes(),
+        "title_counts": title_counts.tobytes(),
+    }
+
+
+def _hashes(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype=_HASH_DTYPE)
+
+
+def _counts(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype=_COUNT_DTYPE)
+
+
+def apply_frequency_deltas(connection, deltas: Counter[int]) -> None:
+    """Add ``{term_hash: change in paper count}`` to ``term_document_frequency``.
+
+    Hashes left in no paper are removed.
+    """
+    changed = [term for term, delta in deltas.items() if delta]
+    for chunk in _chunks(changed, 5000):
+        connection.execute(_UPSERT_FREQUENCY, [{"term_hash": term, "delta": deltas[term]} for term in chunk])
+    dropped = [term for term in changed if deltas[term] < 0]
+    for chunk in _chunks(dropped):
+        connection.execute(_DELETE_UNUSED, {"hashes": chunk})
+
+
+def _text_changed(paper: Paper) -> bool:
+    state: InstanceState[Paper] = inspect(paper)
+    return any(state.attrs[name].history.has_changes() for name in _TEXT_ATTRS)
+
+
+def _before_flush(session: Session, _flush_context, _instances) -> None:
+    fresh = [obj for obj in session.new if isinstance(obj, Paper)]
+    edited = [obj for obj in session.dirty if isinstance(obj, Paper) and obj.id is not None and _text_changed(obj)]
+    removed = [obj.id for obj in session.deleted if isinstance(obj, Paper) and obj.id is not None]
+    if not (fresh or edited or removed):
+        session.info.pop(_PENDING_KEY, None)
+        return
+    # Read the vectors being replaced now, before a cascading delete can drop them.
+    # Core on the flush's connection, not session.execute, which would autoflush.
+    stale: list[np.ndarray] = []
+    for chunk in _chunks([obj.id for obj in edited] + removed):
+        stale.extend(_hashes(blob) for _paper_id, blob in session.connection().execute(_STORED_HASHES, {"ids": chunk}))
+    session.info[_PENDING_KEY] = (fresh + edited, removed, stale)
+
+
+def _after_flush(session: Session, _flush_context) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    changed, removed, stale = pending
+    connection = session.connection()
+    deltas: Counter[int] = Counter()
+    for hashes in stale:
+        deltas.subtract(hashes.tolist())
+    # Vectorize from the rows just written, so unloaded or defaulted attributes
+    # read the same values the DB now holds.
+    ids = [obj.id for obj in changed if obj.id is not None]
+    for chunk in _chunks(ids):
+        rows = [_vector_row(*row) for row in connection.execute(_TEXT_BY_ID, {"ids": chunk})]
+        for row in rows:
+            deltas.update(_hashes(row["term_hashes"]).tolist())
+        if rows:
+            connection.execute(_UPSERT_VECTOR, rows)
+    for chunk in _chunks(removed):
+        connection.execute(_DELETE_VECTORS, {"ids": chunk})
+    apply_frequency_deltas(connection, deltas)
+
+
+def install_term_vector_listeners() -> None:
+    """Hook the session events that keep the term vectors current (idempotent)."""
+    for name, listener in (("before_flush", _before_flush), ("after_flush", _after_flush)):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def rebuild_term_vectors() -> int:
+    """Re-vectorize every paper and recount the document frequencies.
+
+    Returns the number of papers vectorized.
+    """
+    db.session.execute(text("DELETE FROM paper_term_vectors"))
+    db.session.execute(text("DELETE FROM term_document_frequency"))
+    frequencies: Counter[int] = Counter()
+    batch: list[dict] = []
+    total = 0
+    query = db.session.query(Paper.id, *(getattr(Paper, name) for name in _TEXT_ATTRS)).order_by(Paper.id)
+    for row in query.yield_per(1000):
+        vector = _vector_row(*row)
+        frequencies.update(_hashes(vector["term_hashes"]).tolist())
+        batch.append(vector)
+        if len(batch) >= 1000:
+            db.session.execute(_UPSERT_VECTOR, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        db.session.execute(_UPSERT_VECTOR, batch)
+        total += len(batch)
+    apply_frequency_deltas(db.session.connection(), frequencies)
+    db.session.commit()
+    LOGGER.info("Rebuilt term vectors: %d papers, %d terms", total, len(frequencies))
+    return total
+
+
+@dataclass
+class TermMatrix:
+    """Papers as rows of L2-normalized sparse weights over a shared vocabulary.
+
+    CSR layout: row ``i`` holds ``weights[indptr[i]:indptr[i + 1]]`` at vocabulary
+    positions ``columns[indptr[i]:indptr[i + 1]]``. Rows without terms score 0
+    against everything.
+    """
+
+    paper_ids: list[int]
+    vocabulary: np.ndarray
+    indptr: np.ndarray
+    columns: np.ndarray
+    weights: np.ndarray
+    _row_of: dict[int, int] = field(init=False, repr=False)
+    _entry_rows: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._row_of = {paper_id: row for row, paper_id in enumerate(self.paper_ids)}
+        self._entry_rows = np.repeat(np.arange(len(self.paper_ids)), np.diff(self.indptr))
+
+    @classmethod
+    def from_counts(cls, rows: Sequence[tuple[int, np.ndarray, np.ndarray]], *, idf=None) -> TermMatrix:
+        """Stack ``(paper_id, hashes, counts)`` rows; ``idf(vocabulary)`` scales each term."""
+        lengths = np.fromiter((len(hashes) for _pid, hashes, _counts in rows), dtype=np.int64, count=len(rows))
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        if indptr[-1]:
+            hashes = np.concatenate([hashes for _pid, hashes, _counts in rows])
+            weights = np.concatenate([counts for _pid, _hashes, counts in rows]).astype(np.float64)
+        else:
+            hashes, weights = _EMPTY_HASHES, np.empty(0, dtype=np.float64)
+        vocabulary, columns = np.unique(hashes, return_inverse=True)
+        if idf is not None and len(vocabulary):
+            weights *= idf(vocabulary)[columns]
+        entry_rows = np.repeat(np.arange(len(rows)), lengths)
+        norms = np.sqrt(np.bincount(entry_rows, weights=weights * weights, minlength=len(rows)))
+        if len(weights):
+            weights /= norms[entry_rows]
+        return cls(
+            paper_ids=[int(paper_id) for paper_id, _hashes, _counts in rows],
+            vocabulary=vocabulary,
+            indptr=indptr,
+            columns=columns.astype(np.int64, copy=False),
+            weights=weights,
+        )
+
+    def __len__(self) -> int:
+        return len(self.paper_ids)
+
+    def __contains__(self, paper_id: object) -> bool:
+        return paper_id in self._row_of
+
+    def _scores(self, dense: np.ndarray) -> np.ndarray:
+        scores = np.bincount(self._entry_rows, weights=dense[self.columns] * self.weights, minlength=len(self))
+        # bincount returns ints when there are no entries at all.
+        return scores.astype(np.float64, copy=False)
+
+    def similarities(self, paper_id: int) -> np.ndarray:
+        """Cosine of ``paper_id``'s row against every row, in ``paper_ids`` order."""
+        row = self._row_of[paper_id]
+        start, end = self.indptr[row], self.indptr[row + 1]
+        dense = np.zeros(len(self.vocabulary))
+        dense[self.columns[start:end]] = self.weights[start:end]
+        return self._scores(dense)
+
+    def similarities_to(self, hashes: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Cosine of an outside vector (token hashes and weights) against every row."""
+        norm = float(np.sqrt(np.dot(weights, weights))) if len(weights) else 0.0
+        if not len(self.vocabulary) or norm == 0:
+            return np.zeros(len(self))
+        positions = np.minimum(np.searchsorted(self.vocabulary, hashes), len(self.vocabulary) - 1)
+        known = self.vocabulary[positions] == hashes
+        dense = np.zeros(len(self.vocabulary))
+        dense[positions[known]] = np.asarray(weights, dtype=np.float64)[known] / norm
+        return self._scores(dense)
+
+    def most_similar(self, paper_id: int, *, top_k: int, min_similarity: float = 0.0) -> list[tuple[int, float]]:
+        """The ``top_k`` other rows most similar to ``paper_id`` at or above ``min_similarity``."""
+        if paper_id not in self._row_of:
+            return []
+        scores = self.similarities(paper_id)
+        scores[self._row_of[paper_id]] = -np.inf
+        hits = [(float(scores[row]), self.paper_ids[row]) for row in np.flatnonzero(scores >= min_similarity)]
+        hits.sort(reverse=True)
+        return [(paper_id, score) for score, paper_id in hits[:top_k]]
+
+
+def _idf(connection, vocabulary: np.ndarray) -> np.ndarray:
+    """Smoothed IDF of each hash: ``ln((1 + N) / (1 + df)) + 1``."""
+    documents = connection.execute(text("SELECT COUNT(*) FROM paper_term_vectors")).scalar() or 0
+    frequency = dict.fromkeys(vocabulary.tolist(), 0)
+    for chunk in _chunks(list(frequency)):
+        frequency.update(connection.execute(_FREQUENCIES, {"hashes": chunk}).all())
+    df = np.fromiter(frequency.values(), dtype=np.float64, count=len(frequency))
+    return np.log((1.0 + documents) / (1.0 + df)) + 1.0
+
+
+def load_term_matrix(paper_ids: Iterable[int]) -> TermMatrix:
+    """TF-IDF :class:`TermMatrix` over ``paper_ids`` from the stored vectors.
+
+    Papers without a stored vector (written outside the ORM) are vectorized on the
+    fly; ids that aren't papers are left out.
+    """
+    wanted = list(dict.fromkeys(paper_ids))
+    connection = db.session.connection()
+    found: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    for chunk in _chunks(wanted):
+        for paper_id, hashes, counts in connection.execute(_STORED_VECTORS, {"ids": chunk}):
+            found[paper_id] = (_hashes(hashes), _counts(counts))
+    missing = [paper_id for paper_id in wanted if paper_id not in found]
+    for chunk in _chunks(missing):
+        for paper_id, *fields in connection.execute(_TEXT_BY_ID, {"ids": chunk}):
+            found[paper_id] = term_counts(paper_document_text(*fields))
+    rows = [(paper_id, *found[paper_id]) for paper_id in wanted if paper_id in found]
+    return TermMatrix.from_counts(rows, idf=lambda vocabulary: _idf(connection, vocabulary))
+
+
+class TitleIndex:
+    """Near-duplicate title lookup: cosine over raw title token counts.
+
+    Same scores as :func:`app.services.related.cosine_similarity` over
+    :func:`~app.services.related.build_vector`, computed as one sparse product.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, np.ndarray, np.ndarray]] = ()):
+        self._rows = list(rows)
+        self._matrix: TermMatrix | None = None
+
+    @classmethod
+    def from_titles(cls, titles: dict[int, str]) -> TitleIndex:
+        return cls((paper_id, *term_counts(title)) for paper_id, title in titles.items())
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, paper_id: int, title: str | None) -> None:
+        self._rows.append((paper_id, *term_counts(title)))
+        self._matrix = None
+
+    def find(self, title: str | None, *, threshold: float) -> list[tuple[int, float]]:
+        """``(paper_id, similarity)`` pairs at or above ``threshold``, most similar first."""
+        hashes, counts = term_counts(title)
+        if not len(hashes) or not self._rows:
+            return []
+        if self._matrix is None:
+            self._matrix = TermMatrix.from_counts(self._rows)
+        scores = self._matrix.similarities_to(hashes, counts.astype(np.float64))
+        hits = np.flatnonzero(scores >= threshold)
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        return [(self._matrix.paper_ids[row], float(scores[row])) for row in hits]
+
+
+def load_title_index() -> TitleIndex:
+    """:class:`TitleIndex` over every stored paper title."""
+    rows = [
+        (paper_id, _hashes(hashes), _counts(counts))
+        for paper_id, hashes, counts in db.session.execute(
+            text("SELECT paper_id, title_hashes, title_counts FROM paper_term_vectors ORDER BY paper_id")
+        )
+    ]
+    rows.extend((paper_id, *term_counts(title)) for paper_id, title in db.session.execute(_UNVECTORIZED_TITLES))
+    return TitleIndex(rows)
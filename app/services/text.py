@@ -89,7 +89,10 @@ STOP_WORDS = {
 
 def normalize(text: str | None) -> str:
     """Strip accents for robust text matching."""
-    nfkd = unicodedata.normalize("NFKD", text or "")
+    if not text or text.isascii():
+        # NFKD leaves ASCII untouched, so skip the per-character pass.
+        return text or ""
+    nfkd = unicodedata.normalize("NFKD", text)
     return "".join(char for char in nfkd if not unicodedata.combining(char))
 
 
@@ -1,21 +1,31 @@
-"""Generate PDF thumbnails natively using pdfplumber."""
+"""Generate PDF thumbnails natively using pdfplumber.
+
+Each paper gets a page-1 thumbnail and a teaser figure as full-size PNGs (the
+universal fallback), plus WebP/AVIF encodes of both at ``VARIANT_WIDTHS`` that the
+dashboard serves through ``srcset``.
+"""
 
 from __future__ import annotations
 
-import io
 import logging
 import os
+import time
 import uuid
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-import pdfplumber
 import requests
 
 from app.services.http_client import request_with_backoff
+from app.services.lazy_imports import lazy_module
+from app.services.pdf_spool import PdfPayload, SpooledPdf, pdf_head, pdf_source
 from app.services.subprocess_runner import run_isolated
 
 LOGGER = logging.getLogger(__name__)
 
+pdfplumber = lazy_module("pdfplumber")
+
 DEFAULT_THUMBNAIL_DPI = 150
 
 # Wall-clock budget for rendering one PDF in an isolated process before giving up.
@@ -27,11 +37,23 @@ _TEASER_MIN_PAGE_AREA_RATIO = 0.15
 _TEASER_MIN_WIDTH_PT = 200.0
 _TEASER_ASPECT_RANGE = (0.2, 5.0)
 
+# Responsive variant widths in px: the list-row thumbnail (56 CSS px, up to ~4x DPR)
+# and the visual-grid teaser card (~360 CSS px at 2x). Variants are never upscaled.
+VARIANT_WIDTHS = (240, 720)
+_MODERN_FORMATS = ("avif", "webp")
+_ENCODE_OPTIONS = {
+    "avif": {"quality": 55, "speed": 8},
+    "webp": {"quality": 80, "method": 4},
+}
+
+
+def _looks_like_pdf(content: PdfPayload | None) -> bool:
+    return pdf_head(content).lstrip().startswith(b"%PDF-")
+
 
-def _looks_like_pdf(content: bytes | None) -> bool:
-    if not content:
-        return False
-    return content.lstrip().startswith(b"%PDF-")
+def _spool_removed(content: PdfPayload | None) -> bool:
+    """Whether ``content`` is a spooled body whose scrape already removed its spool."""
+    return isinstance(content, SpooledPdf) and not os.path.exists(content.path)
 
 
 def _download_pdf(pdf_link: str, session: requests.Session | None = None) -> bytes:
@@ -54,32 +76,30 @@ def _download_pdf(pdf_link: str, session: requests.Session | None = None) -> byt
     return content
 
 
-def _save_image_atomic(im, out_path: Path) -> None:
-    """Save a pdfplumber PageImage to ``out_path`` atomically.
+def _atomic_write(out_path: Path, write) -> None:
+    """Run ``write(tmp_path)`` then swap the temp file onto ``out_path``.
 
-    Render to a unique temp file in the SAME directory (so ``os.replace`` stays
-    intra-filesystem and atomic on POSIX), then swap it onto the final path only
-    after a successful save. A timeout (``proc.terminate``) or native Pillow crash
-    mid-save then leaves the temp file (cleaned up here) rather than a truncated
-    PNG at the served cache path.
+    The temp file lives in the SAME directory (so ``os.replace`` stays
+    intra-filesystem and atomic on POSIX) and is swapped in only after a successful
+    write. A timeout (``proc.terminate``) or native Pillow crash mid-save then leaves
+    the temp file (cleaned up here) rather than a truncated image at the served path.
     """
     tmp_path = out_path.with_name(f"{out_path.name}.{uuid.uuid4().hex}.tmp")
     try:
-        im.save(str(tmp_path), format="PNG")
-        if hasattr(im.original, "close"):
-            im.original.close()
+        write(tmp_path)
         os.replace(tmp_path, out_path)
     finally:
         tmp_path.unlink(missing_ok=True)
 
 
-def _render_thumbnail(pdf_content: bytes, out_path: Path, resolution: int = DEFAULT_THUMBNAIL_DPI) -> None:
-    with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-        if not pdf.pages:
-            raise ValueError("PDF had no pages")
-        first_page = pdf.pages[0]
-        im = first_page.to_image(resolution=resolution)
-        _save_image_atomic(im, out_path)
+def _save_image_atomic(im, out_path: Path) -> None:
+    """Save a pdfplumber PageImage to ``out_path`` as PNG atomically."""
+    _atomic_write(out_path, lambda tmp_path: im.save(str(tmp_path), format="PNG"))
+
+
+def _close_page_image(im) -> None:
+    if hasattr(im.original, "close"):
+        im.original.close()
 
 
 def _best_teaser_bbox(page) -> tuple[float, float, float, float] | None:
@@ -114,50 +134,173 @@ def _best_teaser_bbox(page) -> tuple[float, float, float, float] | None:
     return best_bbox
 
 
-def extract_teaser_image(pdf_content: bytes, out_path: Path, resolution: int = DEFAULT_THUMBNAIL_DPI) -> bool:
-    """Crop the teaser figure (largest qualifying image on pages 1-2) to a PNG.
+def _find_teaser(pdf, resolution: int):
+    """Render the teaser crop (largest qualifying image on pages 1-2), or None."""
+    for page in pdf.pages[:2]:
+        bbox = _best_teaser_bbox(page)
+        if bbox is not None:
+            return page.crop(bbox).to_image(resolution=resolution)
+    return None
+
 
-    Returns False when no embedded image passes the filters (e.g. a text-only
-    first page) — callers fall back to a full-page render.
+@lru_cache(maxsize=1)
+def preview_formats() -> tuple[str, ...]:
+    """Modern encodings this Pillow build can write, best compression first."""
+    from PIL import features
+
+    return tuple(fmt for fmt in _MODERN_FORMATS if features.check(fmt))
+
+
+def variant_path(image_path: Path, width: int, fmt: str) -> Path:
+    """``<key>[_teaser].png`` → ``<key>[_teaser]-<width>w.<fmt>`` in the same dir."""
+    return image_path.with_name(f"{image_path.stem}-{width}w.{fmt}")
+
+
+def _variants_complete(image_path: Path) -> bool:
+    return all(variant_path(image_path, width, fmt).exists() for width in VARIANT_WIDTHS for fmt in preview_formats())
+
+
+def _write_variants(image, image_path: Path, *, replace: bool = False) -> tuple[int, int | None]:
+    """Encode the responsive WebP/AVIF variants of ``image`` next to ``image_path``.
+
+    Variants are downscaled to each of ``VARIANT_WIDTHS`` (never upscaled). Existing
+    variants are kept unless ``replace`` is set (``image`` is a fresh render). Returns
+    ``(bytes written, smallest encode at the largest width)``; the latter is what the
+    browser now fetches at most for a full-size card image (None if none was written).
     """
+    from PIL import Image
+
+    if image.mode not in ("RGB", "RGBA", "L"):
+        image = image.convert("RGB")
+    written = 0
+    largest: list[int] = []
+    for width in VARIANT_WIDTHS:
+        target_width = min(width, image.width)
+        if target_width == image.width:
+            resized = image
+        else:
+            target_height = max(1, round(image.height * target_width / image.width))
+            resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        for fmt in preview_formats():
+            path = variant_path(image_path, width, fmt)
+            if not replace and path.exists():
+                continue
+            options = _ENCODE_OPTIONS[fmt]
+            _atomic_write(
+                path, lambda tmp_path, img=resized, fmt=fmt, opts=options: img.save(tmp_path, format=fmt, **opts)
+            )
+            size = path.stat().st_size
+            written += size
+            if width == VARIANT_WIDTHS[-1]:
+                largest.append(size)
+    return written, min(largest) if largest else None
+
+
+def _write_missing_renders(
+    pdf_content: PdfPayload | None, out_path: Path, teaser_path: Path, resolution: int
+) -> dict[str, float]:
+    """Write whatever is missing of the page-1 PNG, teaser PNG and their variants.
+
+    The PDF is opened at most once: page 1 is rendered a single time and reused as
+    the teaser when no figure qualifies, and the variants are encoded from the
+    in-memory renders. PNGs already on disk (older papers) are only re-encoded, so
+    ``pdf_content`` may be None when both PNGs exist. Returns per-paper render stats.
+
+    A rendered PNG always gets a full new set of variants, written before the PNG is
+    swapped in: the PNG's mtime is the preview URL version (see
+    ``routes/dashboard._preview_version``), so no new version can point at a variant
+    left over from an earlier render.
+    """
+    started = time.perf_counter()
+    renders: dict[Path, object] = {}
+    page_images = []
+    png_bytes = variant_bytes = bytes_saved = 0
     try:
-        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-            for page in pdf.pages[:2]:
-                bbox = _best_teaser_bbox(page)
-                if bbox is None:
-                    continue
-                im = page.crop(bbox).to_image(resolution=resolution)
-                _save_image_atomic(im, out_path)
-                return True
-    except Exception as exc:
-        LOGGER.debug("Teaser extraction failed: %s", exc)
-    return False
-
+        if not (out_path.exists() and teaser_path.exists()):
+            if pdf_content is None:
+                raise ValueError("PDF content is required to render missing previews")
+            with pdfplumber.open(pdf_source(pdf_content)) as pdf:
+                if not pdf.pages:
+                    raise ValueError("PDF had no pages")
+                page_image = teaser_image = None
+                if not teaser_path.exists():
+                    try:
+                        teaser_image = _find_teaser(pdf, resolution)
+                    except Exception as exc:
+                        LOGGER.debug("Teaser extraction failed: %s", exc)
+                if not out_path.exists() or (teaser_image is None and not teaser_path.exists()):
+                    page_image = pdf.pages[0].to_image(resolution=resolution)
+                    page_images.append(page_image)
+                if teaser_image is not None:
+                    page_images.append(teaser_image)
+
+                if not out_path.exists():
+                    renders[out_path] = page_image
+                if not teaser_path.exists():
+                    renders[teaser_path] = teaser_image or page_image
+
+        for image_path in (out_path, teaser_path):
+            render = renders.get(image_path)
+            if render is None and _variants_complete(image_path):
+                png_bytes += image_path.stat().st_size
+                continue
+            # Variants are an optimization over the PNG fallback: a failed encode
+            # must not fail the paper.
+            largest: int | None = None
+            try:
+                if render is None:
+                    from PIL import Image
+
+                    with Image.open(image_path) as on_disk:
+                        on_disk.load()
+                        written, largest = _write_variants(on_disk, image_path)
+                else:
+                    written, largest = _write_variants(render.original, image_path, replace=True)
+                variant_bytes += written
+            except Exception as exc:
+                LOGGER.debug("Preview variant encode failed for %s: %s", image_path.name, exc)
+            if render is not None:
+                _save_image_atomic(render, image_path)
+            png_size = image_path.stat().st_size
+            png_bytes += png_size
+            if largest is not None:
+                bytes_saved += max(0, png_size - largest)
+    finally:
+        for im in page_images:
+            _close_page_image(im)
+    return {
+        "render_seconds": time.perf_counter() - started,
+        "png_bytes": png_bytes,
+        "variant_bytes": variant_bytes,
+        "bytes_saved": bytes_saved,
+    }
 
-def _render_teaser(pdf_content: bytes, out_path: Path, resolution: int = DEFAULT_THUMBNAIL_DPI) -> None:
-    """Write the teaser figure, falling back to a page-1 render so the file
-    always exists afterwards (keeps generation idempotent)."""
-    if extract_teaser_image(pdf_content, out_path, resolution=resolution):
-        return
-    _render_thumbnail(pdf_content, out_path, resolution=resolution)
 
+@dataclass
+class ThumbnailStats:
+    """Outcome of :func:`generate_previews` for one paper."""
 
-def _write_missing_renders(pdf_content: bytes, out_path: Path, teaser_path: Path, resolution: int) -> None:
-    if not out_path.exists():
-        _render_thumbnail(pdf_content, out_path, resolution=resolution)
-    if not teaser_path.exists():
-        _render_teaser(pdf_content, teaser_path, resolution=resolution)
+    ok: bool
+    rendered: bool = False
+    render_seconds: float = 0.0
+    png_bytes: int = 0
+    variant_bytes: int = 0
+    bytes_saved: int = 0
 
 
-def generate_thumbnail(
+def generate_previews(
     arxiv_id: str,
     pdf_link: str,
     static_dir: str | Path,
     session: requests.Session | None = None,
-    pdf_content: bytes | None = None,
+    pdf_content: PdfPayload | None = None,
     resolution: int = DEFAULT_THUMBNAIL_DPI,
-) -> bool:
-    """Download the PDF, then write the page-1 thumbnail and the teaser figure."""
+) -> ThumbnailStats:
+    """Write the page-1 thumbnail, the teaser figure and their size/format variants.
+
+    The PDF is only fetched when a PNG is missing; papers rendered before variants
+    existed just get their PNGs re-encoded.
+    """
     thumbnails_dir = (Path(static_dir) / "thumbnails").resolve()
 
     out_path = (thumbnails_dir / f"{arxiv_id}.png").resolve()
@@ -168,32 +311,69 @@ def generate_thumbnail(
     # mirrors the serving-side guard in routes/dashboard.py.
     if not (out_path.is_relative_to(thumbnails_dir) and teaser_path.is_relative_to(thumbnails_dir)):
         LOGGER.warning("Refusing thumbnail for unsafe arxiv_id %r (path escapes thumbnails dir)", arxiv_id)
-        return False
+        return ThumbnailStats(ok=False)
     # Legacy slash-form ids (e.g. 'cs/9901001') nest under a subdir; parents=True
     # creates the thumbnails dir and any nested subdir. The teaser shares the parent.
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    if out_path.exists() and teaser_path.exists():
-        return True
+    pngs_exist = out_path.exists() and teaser_path.exists()
+    if pngs_exist and _variants_complete(out_path) and _variants_complete(teaser_path):
+        return ThumbnailStats(ok=True)
+
+    def render(content: PdfPayload | None) -> ThumbnailStats:
+        # Render in a child process: a native crash in pdfplumber/Pillow then fails
+        # this paper instead of taking down the whole server.
+        stats = run_isolated(
+            _write_missing_renders, content, out_path, teaser_path, resolution, timeout=_RENDER_TIMEOUT
+        )
+        LOGGER.info(
+            "Generated previews for %s in %.2fs (png %d B, variants %d B, saved %d B)",
+            arxiv_id,
+            stats["render_seconds"],
+            stats["png_bytes"],
+            stats["variant_bytes"],
+            stats["bytes_saved"],
+        )
+        return ThumbnailStats(
+            ok=True,
+            rendered=True,
+            render_seconds=float(stats["render_seconds"]),
+            png_bytes=int(stats["png_bytes"]),
+            variant_bytes=int(stats["variant_bytes"]),
+            bytes_saved=int(stats["bytes_saved"]),
+        )
 
     try:
+        if pngs_exist:
+            return render(None)
         if pdf_content is not None:
             try:
                 if not _looks_like_pdf(pdf_content):
                     raise ValueError("Provided PDF bytes were not a valid PDF")
-                # Render in a child process: a native crash in pdfplumber/Pillow then
-                # fails this paper instead of taking down the whole server.
-                run_isolated(
-                    _write_missing_renders, pdf_content, out_path, teaser_path, resolution, timeout=_RENDER_TIMEOUT
-                )
-                LOGGER.info("Successfully generated thumbnail for %s", arxiv_id)
-                return True
+                return render(pdf_content)
             except Exception as exc:
+                if _spool_removed(pdf_content):
+                    # A render still running past the scrape's thumbnail deadline: the
+                    # scrape has finished and removed its PDF spool. Leave the paper to
+                    # the on-demand warmer instead of downloading from a detached thread.
+                    LOGGER.info("Skipping previews for %s: its scrape's PDF spool was removed", arxiv_id)
+                    return ThumbnailStats(ok=out_path.exists())
                 LOGGER.debug("Retrying thumbnail generation for %s with a fresh PDF download: %s", arxiv_id, exc)
 
-        content_to_use = _download_pdf(pdf_link, session=session)
-        run_isolated(_write_missing_renders, content_to_use, out_path, teaser_path, resolution, timeout=_RENDER_TIMEOUT)
-        LOGGER.info("Successfully generated thumbnail for %s", arxiv_id)
-        return True
+        return render(_download_pdf(pdf_link, session=session))
     except Exception as exc:
         LOGGER.warning("Thumbnail generation failed for %s: %s", arxiv_id, exc)
-        return out_path.exists()
+        return ThumbnailStats(ok=out_path.exists())
+
+
+def generate_thumbnail(
+    arxiv_id: str,
+    pdf_link: str,
+    static_dir: str | Path,
+    session: requests.Session | None = None,
+    pdf_content: PdfPayload | None = None,
+    resolution: int = DEFAULT_THUMBNAIL_DPI,
+) -> bool:
+    """Download the PDF, then write the page-1 thumbnail and the teaser figure."""
+    return generate_previews(
+        arxiv_id, pdf_link, static_dir, session=session, pdf_content=pdf_content, resolution=resolution
+    ).ok
@@ -3,17 +3,29 @@
 Uses API key authentication (simpler than OAuth2).
 Credentials are stored in ``.zotero_credentials`` (JSON with ``api_key``
 and ``user_id``).
+
+Requests go through one pooled keep-alive session drawing from the shared rate
+limiter (its own bucket for the Zotero host). Syncs are deltas: a paper is pushed
+when it has no Zotero item yet, or as a version-checked update when its content
+digest differs from the one recorded at its last push.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import secrets
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import requests
 
+from app.services.http_client import create_session, request_with_backoff
 from app.services.secret_files import write_secret_file
 
 if TYPE_CHECKING:
@@ -26,15 +38,143 @@ DEFAULT_CREDENTIALS_PATH = _PROJECT_ROOT / ".zotero_credentials"
 
 ZOTERO_API_BASE = "https://api.zotero.org"
 ZOTERO_BATCH_LIMIT = 50
+# Write batches in flight at once during a sync (also the session's pool size).
+ZOTERO_SYNC_CONCURRENCY = 4
+
+
+def paper_to_zotero_item(paper: Paper, collection_key: str | None = None) -> dict:
+    """Map Paper fields to Zotero journalArticle item type."""
+    creators = []
+    for name in paper.authors.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        parts = name.rsplit(None, 1)
+        if len(parts) == 2:
+            creators.append(
+                {
+                    "creatorType": "author",
+                    "firstName": parts[0],
+                    "lastName": parts[1],
+                }
+            )
+        else:
+            creators.append(
+                {
+                    "creatorType": "author",
+                    "name": name,
+                }
+            )
+
+    item: dict = {
+        "itemType": "journalArticle",
+        "title": paper.title,
+        "creators": creators,
+        "abstractNote": paper.abstract_text or "",
+        "url": paper.link,
+    }
+
+    if paper.publication_dt:
+        item["date"] = paper.publication_dt.isoformat()
+
+    if paper.arxiv_id:
+        item["extra"] = f"arXiv:{paper.arxiv_id}"
+
+    if collection_key:
+        item["collections"] = [collection_key]
+
+    return item
+
+
+def zotero_fingerprint(paper: Paper) -> str:
+    """Digest of the item content pushed for ``paper`` (collection membership excluded)."""
+    payload = json.dumps(paper_to_zotero_item(paper), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def needs_zotero_sync(paper: Paper) -> bool:
+    """Whether ``paper`` was never pushed to Zotero, or has changed since its last push.
+
+    Papers linked before item versions were tracked (a key but no version) are left
+    alone, as before: without the version Zotero can't apply a safe update.
+    """
+    if not paper.zotero_item_key:
+        return True
+    if paper.zotero_item_version is None:
+        return False
+    return paper.zotero_synced_hash != zotero_fingerprint(paper)
 
 
 class ZoteroClient:
     """Client for interacting with the Zotero API."""
 
-    def __init__(self, credentials_path: Path | None = None):
+    def __init__(
+        self,
+        credentials_path: Path | None = None,
+        *,
+        api_base: str | None = None,
+        session: requests.Session | None = None,
+        scraper_config: Mapping[str, Any] | None = None,
+        concurrency: int = ZOTERO_SYNC_CONCURRENCY,
+    ):
         self.credentials_path = credentials_path or DEFAULT_CREDENTIALS_PATH
+        self.api_base = (api_base or ZOTERO_API_BASE).rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self._scraper_config = scraper_config
+        self._session = session
         self._creds: dict | None = None
 
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session for this client, created on first use."""
+        if self._session is None:
+            self._session = create_session(
+                pool_size=self.concurrency,
+                scraper_config=self._scraper_config,
+                rate_limit_scope=urlsplit(self.api_base).netloc,
+            )
+        return self._session
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: int,
+        attempts: int = 3,
+        headers: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Rate-limited request on the pooled session.
+
+        429/5xx are retried (honouring ``Retry-After``); the final error status is
+        returned rather than raised so callers keep branching on it.
+        """
+        return request_with_backoff(
+            method,
+            url,
+            session=self.session,
+            timeout=timeout,
+            attempts=attempts,
+            headers={**self._get_headers(), **(headers or {})},
+            raise_for_status=False,
+            **kwargs,
+        )
+
+    def _write(self, items: list[dict], *, timeout: int) -> requests.Response:
+        """POST ``items`` to the library under a fresh write token.
+
+        Zotero refuses a second write with the same token, so a retry after a lost
+        response can't create the items twice.
+        """
+        return self._request(
+            "POST",
+            f"{self._user_url()}/items",
+            json=items,
+            timeout=timeout,
+            headers={"Zotero-Write-Token": secrets.token_hex(16)},
+        )
+
     def _load_credentials(self) -> dict:
         """Load api_key and user_id from credentials file."""
         if self._creds:
@@ -63,7 +203,7 @@ class ZoteroClient:
     def _user_url(self) -> str:
         """Get the base URL for the user's library."""
         creds = self._load_credentials()
-        return f"{ZOTERO_API_BASE}/users/{creds['user_id']}"
+        return f"{self.api_base}/users/{creds['user_id']}"
 
     def check_connection(self) -> dict:
         """Verify API key validity and return status dict.
@@ -85,12 +225,7 @@ class ZoteroClient:
             }
 
         try:
-            resp = requests.get(
-                f"{self._user_url()}/items/top",
-                headers=self._get_headers(),
-                params={"limit": 1},
-                timeout=10,
-            )
+            resp = self._request("GET", f"{self._user_url()}/items/top", params={"limit": 1}, timeout=10, attempts=1)
             if resp.status_code == 200:
                 return {
                     "status": "connected",
@@ -118,62 +253,16 @@ class ZoteroClient:
         Returns list of dicts with ``key`` and ``name``.
         """
         try:
-            resp = requests.get(
-                f"{self._user_url()}/collections",
-                headers=self._get_headers(),
-                timeout=10,
-            )
+            resp = self._request("GET", f"{self._user_url()}/collections", timeout=10)
             resp.raise_for_status()
             return [{"key": c["key"], "name": c["data"]["name"]} for c in resp.json()]
         except requests.RequestException:
             return []
 
-    def _paper_to_zotero_item(self, paper: Paper, collection_key: str | None = None) -> dict:
-        """Map Paper fields to Zotero journalArticle item type."""
-        creators = []
-        for name in paper.authors.split(","):
-            name = name.strip()
-            if not name:
-                continue
-            parts = name.rsplit(None, 1)
-            if len(parts) == 2:
-                creators.append(
-                    {
-                        "creatorType": "author",
-                        "firstName": parts[0],
-                        "lastName": parts[1],
-                    }
-                )
-            else:
-                creators.append(
-                    {
-                        "creatorType": "author",
-                        "name": name,
-                    }
-                )
-
-        item: dict = {
-            "itemType": "journalArticle",
-            "title": paper.title,
-            "creators": creators,
-            "abstractNote": paper.abstract_text or "",
-            "url": paper.link,
-        }
-
-        if paper.publication_dt:
-            item["date"] = paper.publication_dt.isoformat()
-
-        if paper.arxiv_id:
-            item["extra"] = f"arXiv:{paper.arxiv_id}"
-
-        if collection_key:
-            item["collections"] = [collection_key]
-
-        return item
-
     @staticmethod
-    def _batch_result_map(resp: requests.Response, key: str) -> dict:
-        """Extract a per-item map (``failed`` / ``successful``) from a 200 response.
+    def _batch_result_map(resp: requests.Response, key: str) -> dict[int, object]:
+        """Extract a per-item map (``failed`` / ``successful``) from a 200 response,
+        keyed by the item's index in the batch.
 
         Defensive against non-JSON / non-dict bodies (older/mocked responses).
         """
@@ -181,12 +270,18 @@ class ZoteroClient:
             body = resp.json()
         except (ValueError, TypeError):
             return {}
-        if isinstance(body, dict) and isinstance(body.get(key), dict):
-            return body[key]
-        return {}
+        if not isinstance(body, dict) or not isinstance(body.get(key), dict):
+            return {}
+        results: dict[int, object] = {}
+        for local_idx, result in body[key].items():
+            try:
+                results[int(local_idx)] = result
+            except (TypeError, ValueError):
+                continue
+        return results
 
     @staticmethod
-    def _failed_items(resp: requests.Response) -> dict:
+    def _failed_items(resp: requests.Response) -> dict[int, object]:
         """Extract Zotero's per-item ``failed`` map from a 200 response.
 
         The Zotero Web API returns HTTP 200 even when individual items are
@@ -197,7 +292,7 @@ class ZoteroClient:
         return ZoteroClient._batch_result_map(resp, "failed")
 
     @staticmethod
-    def _successful_items(resp: requests.Response) -> dict:
+    def _successful_items(resp: requests.Response) -> dict[int, object]:
         """Extract Zotero's per-item ``successful`` map (batch-index -> created item).
 
         Each created item carries a ``key`` we persist on the Paper so a re-sync skips
@@ -210,15 +305,10 @@ class ZoteroClient:
 
         Returns dict with ``success``, ``message``.
         """
-        item = self._paper_to_zotero_item(paper, collection_key)
+        item = paper_to_zotero_item(paper, collection_key)
 
         try:
-            resp = requests.post(
-                f"{self._user_url()}/items",
-                headers=self._get_headers(),
-                json=[item],
-                timeout=30,
-            )
+            resp = self._write([item], timeout=30)
             resp.raise_for_status()
         except requests.RequestException as exc:
             return {"success": False, "message": f"Failed to add item: {exc}"}
@@ -230,64 +320,183 @@ class ZoteroClient:
             return {"success": False, "message": f"Zotero rejected the item: {message or 'unknown error'}"}
         return {"success": True, "message": "Item added to Zotero."}
 
+    @staticmethod
+    def _sync_item(paper: Paper, collection_key: str | None) -> dict:
+        """The write payload for ``paper``: a create, or an update of its linked item.
+
+        Updates carry the item ``key`` and last-seen ``version`` (Zotero answers 412 if
+        the item changed there since) and no ``collections``: batch writes patch the
+        fields given, so collection membership arranged in Zotero is left intact.
+        """
+        if paper.zotero_item_key and paper.zotero_item_version is not None:
+            item = paper_to_zotero_item(paper)
+            item["key"] = paper.zotero_item_key
+            item["version"] = paper.zotero_item_version
+            return item
+        return paper_to_zotero_item(paper, collection_key)
+
+    def _post_batch(self, batch: list[dict]) -> requests.Response:
+        resp = self._write(batch, timeout=60)
+        resp.raise_for_status()
+        return resp
+
     def sync_saved_papers(
         self,
         papers: list[Paper],
         collection_key: str | None = None,
     ) -> dict:
-        """Batch sync papers to Zotero (max 50 per request).
-
-        Returns dict with ``success``, ``message``, ``synced_count``, and ``item_keys``
-        (a map of the input-``papers`` index -> created Zotero item key). Callers persist
-        those keys so a re-sync skips already-synced papers instead of duplicating them.
+        """Batch sync papers to Zotero (max 50 per request, ``concurrency`` batches in flight).
+
+        Papers already linked to a Zotero item are sent as updates of that item; pick
+        the papers to send with :func:`needs_zotero_sync`.
+
+        Returns dict with ``success``, ``message``, ``synced_count``, ``item_keys`` (a
+        map of the input-``papers`` index -> Zotero item key) and ``item_versions``
+        (index -> the item's new version, where Zotero reported one). Callers persist
+        both so a re-sync skips unchanged papers instead of pushing them again. An update
+        refused because the item was edited in Zotero is reported with Zotero's current
+        version (see :meth:`_resolve_conflicts`) and its index listed in ``conflicts``:
+        the local copy was not pushed, so callers must not mark it as synced.
         """
-        items = [self._paper_to_zotero_item(p, collection_key) for p in papers]
+        items = [self._sync_item(p, collection_key) for p in papers]
         synced = 0
         rejected = 0
         item_keys: dict[int, str] = {}
+        item_versions: dict[int, int] = {}
+        conflicts: dict[int, str] = {}
+        error: Exception | None = None
 
-        for i in range(0, len(items), ZOTERO_BATCH_LIMIT):
-            batch = items[i : i + ZOTERO_BATCH_LIMIT]
-            try:
-                resp = requests.post(
-                    f"{self._user_url()}/items",
-                    headers=self._get_headers(),
-                    json=batch,
-                    timeout=60,
-                )
-                resp.raise_for_status()
-            except requests.RequestException as exc:
-                return {
-                    "success": False,
-                    "message": f"Sync failed after {synced} items: {exc}",
-                    "synced_count": synced,
-                    "item_keys": item_keys,
-                }
-            # A 200 can still reject individual items; only count the accepted ones.
-            failed = len(self._failed_items(resp))
-            synced += len(batch) - failed
-            rejected += failed
-            # Record the created item keys against their global paper index so the caller
-            # can persist them (batch-local index + batch offset = position in `papers`).
-            for local_idx, created in self._successful_items(resp).items():
+        batches = {
+            start: items[start : start + ZOTERO_BATCH_LIMIT] for start in range(0, len(items), ZOTERO_BATCH_LIMIT)
+        }
+        if batches:
+            # Stop sending batches on the first failure (bad key, quota, outage): batches
+            # not yet started skip their POST; the ones already in flight still finish
+            # and are recorded.
+            stopped = threading.Event()
+
+            def post(batch: list[dict]) -> requests.Response | None:
+                if stopped.is_set():
+                    return None
                 try:
-                    global_idx = i + int(local_idx)
-                except (TypeError, ValueError):
-                    continue
-                key = created.get("key") if isinstance(created, dict) else None
-                if key:
-                    item_keys[global_idx] = key
-
+                    return self._post_batch(batch)
+                except requests.RequestException:
+                    stopped.set()
+                    raise
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.concurrency, len(batches)), thread_name_prefix="zotero-sync"
+            ) as executor:
+                futures = {executor.submit(post, batch): start for start, batch in batches.items()}
+                for future in as_completed(futures):
+                    start = futures[future]
+                    try:
+                        resp = future.result()
+                    except requests.RequestException as exc:
+                        if error is None:
+                            error = exc
+                        continue
+                    if resp is None:
+                        continue
+                    # A 200 can still reject individual items; only count the accepted ones.
+                    failed = self._failed_items(resp)
+                    synced += len(batches[start]) - len(failed)
+                    rejected += len(failed)
+                    for local_idx, reason in failed.items():
+                        key = batches[start][local_idx].get("key") if local_idx < len(batches[start]) else None
+                        if key and isinstance(reason, dict) and reason.get("code") == 412:
+                            conflicts[start + local_idx] = key
+                    # Record the item keys against their global paper index so the caller
+                    # can persist them (batch-local index + batch offset = position in
+                    # `papers`). Updates with nothing to change come back as "unchanged".
+                    for local_idx, key in self._batch_result_map(resp, "unchanged").items():
+                        self._record_result(item_keys, item_versions, start, local_idx, {"key": key})
+                    for local_idx, created in self._successful_items(resp).items():
+                        self._record_result(item_keys, item_versions, start, local_idx, created)
+
+        resolved = self._resolve_conflicts(conflicts, item_keys, item_versions)
+
+        if error is not None:
+            return {
+                "success": False,
+                "message": f"Sync failed after {synced} items: {error}",
+                "synced_count": synced,
+                "item_keys": item_keys,
+                "item_versions": item_versions,
+                "conflicts": resolved,
+            }
         if rejected:
+            message = f"Synced {synced} of {len(items)} papers; Zotero rejected {rejected}."
+            if resolved:
+                message += (
+                    f" {len(resolved)} were edited in Zotero since the last sync; "
+                    "sync again to overwrite them with the local copy."
+                )
             return {
                 "success": False,
-                "message": f"Synced {synced} of {len(items)} papers; Zotero rejected {rejected}.",
+                "message": message,
                 "synced_count": synced,
                 "item_keys": item_keys,
+                "item_versions": item_versions,
+                "conflicts": resolved,
             }
         return {
             "success": True,
             "message": f"Synced {synced} papers to Zotero.",
             "synced_count": synced,
             "item_keys": item_keys,
+            "item_versions": item_versions,
+            "conflicts": resolved,
         }
+
+    def _resolve_conflicts(
+        self, conflicts: dict[int, str], item_keys: dict[int, str], item_versions: dict[int, int]
+    ) -> list[int]:
+        """Adopt Zotero's current version for updates it refused with 412.
+
+        The item was edited in Zotero since our last push. Re-sending the same stale
+        version would be refused on every sync, so the paper is reported with the
+        server's version; the local edit is still unsynced, and the next sync sends it
+        as an update of that version. Returns the ``papers`` indexes resolved this way;
+        unresolved ones are retried against the old version on the next sync.
+        """
+        if not conflicts:
+            return []
+        versions: dict[str, int] = {}
+        keys = sorted(set(conflicts.values()))
+        for start in range(0, len(keys), ZOTERO_BATCH_LIMIT):
+            try:
+                resp = self._request(
+                    "GET",
+                    f"{self._user_url()}/items",
+                    params={"itemKey": ",".join(keys[start : start + ZOTERO_BATCH_LIMIT]), "format": "versions"},
+                    timeout=30,
+                )
+                resp.raise_for_status()
+                body = resp.json()
+            except (requests.RequestException, ValueError) as exc:
+                LOGGER.warning("Could not refresh versions of Zotero items edited remotely: %s", exc)
+                break
+            if isinstance(body, dict):
+                versions.update((key, version) for key, version in body.items() if isinstance(version, int))
+
+        resolved: list[int] = []
+        for global_idx, key in sorted(conflicts.items()):
+            if key in versions:
+                item_keys[global_idx] = key
+                item_versions[global_idx] = versions[key]
+                resolved.append(global_idx)
+        if resolved:
+            LOGGER.warning("%d items were edited in Zotero since the last sync; local copies not pushed", len(resolved))
+        return resolved
+
+    @staticmethod
+    def _record_result(
+        item_keys: dict[int, str], item_versions: dict[int, int], offset: int, local_idx: int, result: object
+    ) -> None:
+        global_idx = offset + local_idx
+        if not isinstance(result, dict) or not result.get("key"):
+            return
+        item_keys[global_idx] = result["key"]
+        if isinstance(result.get("version"), int):
+            item_versions[global_idx] = result["version"]
@@ -1,6 +1,6 @@
 """Semantic package for web-facing integrations and schedulers."""
 
-from app.services.bibtex import paper_to_bibtex, papers_to_bibtex
+from app.services.bibtex import iter_bibtex, paper_to_bibtex, papers_to_bibtex
 from app.services.cron import get_cron_status, install_cron_job, remove_cron_job
 from app.services.email_digest import (
     DEFAULT_CREDENTIALS_PATH,
@@ -34,6 +34,7 @@ __all__ = [
     "get_cron_status",
     "has_api_key",
     "install_cron_job",
+    "iter_bibtex",
     "paper_to_bibtex",
     "papers_to_bibtex",
     "remove_cron_job",
@@ -0,0 +1,57 @@
+"""Shared scaffolding for the ``scripts/bench_*.py`` benchmarks.
+
+Importing this module puts the repository root on ``sys.path``, so a benchmark
+run as ``python scripts/bench_<name>.py`` can import ``app``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+BENCH_CONFIG = {
+    "whitelists": {"authors": [], "affiliations": [], "titles": ["Vision"]},
+    "scraper": {"feed_url": "https://rss.arxiv.org/rss/cs.CV", "max_workers": 1},
+}
+
+
+def bench_parser(doc: str, *, repeat: int) -> argparse.ArgumentParser:
+    """Argument parser titled by the first line of ``doc``, with a ``--repeat`` option."""
+    parser = argparse.ArgumentParser(description=doc.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=repeat, help="runs per scenario (median reported)")
+    return parser
+
+
+def create_bench_app(tmp: str | Path, *, db_name: str = "bench.db", config: dict | None = None, **overrides):
+    """Testing app whose instance dir, SQLite DB and config file all live under ``tmp``."""
+    os.environ.setdefault("CV_ARXIV_INSTANCE_PATH", str(tmp))
+    from app import create_app
+
+    return create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{Path(tmp) / db_name}",
+            "CONFIG_PATH": str(Path(tmp) / "config.yaml"),
+            "SCRAPER_CONFIG": config or BENCH_CONFIG,
+            **overrides,
+        }
+    )
+
+
+def median_seconds(run: Callable[[], object], repeat: int) -> float:
+    """Median wall time of ``repeat`` calls to ``run``."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
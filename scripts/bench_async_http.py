@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""Benchmark blocking vs asyncio HTTP fetching against a local latency-injecting server.
+
+The fixture is a minimal keep-alive HTTP/1.1 server in a child process (stdlib
+``asyncio``, so it needs no extra dependency) that sleeps ``--latency`` seconds
+before answering every request with a small JSON body — the shape of an
+enrichment API call. Scenarios, each issuing ``--requests`` GETs:
+
+* ``threads-N`` — ``request_with_backoff`` on a ``ThreadPoolExecutor`` of N workers
+                  (the scrape default is ``max_workers: 8``), one pooled session.
+* ``async-N``   — :func:`app.services.async_http.fetch_all` with N in flight.
+
+The shared token bucket is configured far above the request rate so the numbers
+show transport cost, not pacing. Reports the median wall time, throughput and
+the peak number of client-side threads.
+
+Usage:
+    python scripts/bench_async_http.py [--requests 400] [--latency 0.1] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _bench import bench_parser
+
+from app.services.async_http import fetch_all
+from app.services.http_client import create_session, request_with_backoff
+
+_BENCH_CONFIG = {"ingest": {"rate_limit": {"requests_per_second": 100000, "burst": 100000}}}
+_BODY = b'{"upvotes": 3, "numComments": 1}'
+
+
+async def _serve(latency: float, port_sink) -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(_BODY)}\r\n\r\n".encode()
+                    + _BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+    port_sink.send(server.sockets[0].getsockname()[1])
+    port_sink.close()
+    async with server:
+        await server.serve_forever()
+
+
+def _server_main(latency: float, port_sink) -> None:
+    asyncio.run(_serve(latency, port_sink))
+
+
+class LatencyServer:
+    """Keep-alive HTTP/1.1 server answering every request after ``latency`` seconds.
+
+    Runs in a child process so its event loop doesn't compete with the client
+    under test for the GIL (an in-process server skews whichever side is busier).
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.port = 0
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> LatencyServer:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(target=_server_main, args=(self.latency, sender), daemon=True)
+        self._process.start()
+        self.port = receiver.recv()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=5)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/api/papers/bench"
+
+
+class ThreadPeak:
+    """Samples ``threading.active_count()`` while a scenario runs."""
+
+    def __init__(self):
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            time.sleep(0.005)
+
+    def __enter__(self) -> ThreadPeak:
+        self._baseline = threading.active_count()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        # Exclude the sampler itself and the threads that existed beforehand.
+        self.peak = max(0, self.peak - self._baseline - 1)
+
+
+def _run_threads(url: str, requests: int, workers: int) -> tuple[float, int]:
+    session = create_session(pool_size=workers, scraper_config=_BENCH_CONFIG)
+
+    def one(_index: int) -> int:
+        return request_with_backoff("GET", url, session=session, timeout=30).status_code
+
+    with ThreadPeak() as peak:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            statuses = list(executor.map(one, range(requests)))
+        elapsed = time.perf_counter() - started
+    session.close()
+    assert all(status == 200 for status in statuses)
+    return elapsed, peak.peak
+
+
+def _run_async(url: str, requests: int, concurrency: int) -> tuple[float, int]:
+    calls = [{"method": "GET", "url": url, "timeout": 30} for _ in range(requests)]
+    with ThreadPeak() as peak:
+        started = time.perf_counter()
+        outcomes = fetch_all(calls, scraper_config=_BENCH_CONFIG, concurrency=concurrency)
+        elapsed = time.perf_counter() - started
+    failures = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    assert not failures, failures[:3]
+    return elapsed, peak.peak
+
+
+def _summarize(name: str, requests: int, samples: list[tuple[float, int]]) -> None:
+    wall = statistics.median(sample[0] for sample in samples)
+    threads = max(sample[1] for sample in samples)
+    print(f"{name:<12} wall={wall * 1000:8.1f}ms  {requests / wall:8.1f} req/s  client threads={threads}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=3)
+    parser.add_argument("--requests", type=int, default=400, help="GETs per scenario")
+    parser.add_argument("--latency", type=float, default=0.1, help="injected server latency (seconds)")
+    parser.add_argument("--threads", type=int, nargs="+", default=[8, 64], help="thread-pool sizes to compare")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[64, 200], help="async in-flight limits")
+    args = parser.parse_args(argv)
+
+    with LatencyServer(args.latency) as server:
+        print(f"{args.requests} requests, {args.latency * 1000:.0f}ms injected latency, median of {args.repeat}")
+        for workers in args.threads:
+            samples = [_run_threads(server.url, args.requests, workers) for _ in range(args.repeat)]
+            _summarize(f"threads-{workers}", args.requests, samples)
+        for concurrency in args.concurrency:
+            samples = [_run_async(server.url, args.requests, concurrency) for _ in range(args.repeat)]
+            _summarize(f"async-{concurrency}", args.requests, samples)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
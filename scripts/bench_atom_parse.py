@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""Benchmark parsing an arXiv API Atom page into ``PaperCandidate``s.
+
+Builds a synthetic ``--entries``-entry Atom page (arXiv-shaped: several authors,
+categories, a ~1 KB abstract, comment and DOI) and delivers it in 64 KiB chunks,
+as ``iter_content`` would. Scenarios:
+
+* ``buffered`` — the former path: join the body, decode it, ``fromstring`` the
+                 whole document, then walk ``findall("atom:entry")``.
+* ``streamed`` — ``iter_atom_candidates``: ``iterparse`` fed chunk by chunk,
+                 each entry converted and cleared as its tag closes.
+
+Reports the median wall time, entries/second and time to the first candidate per
+scenario, plus the ``tracemalloc`` peak (body + tree + candidates) from one extra,
+untimed run.
+
+Usage:
+    python scripts/bench_atom_parse.py [--entries 2000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import tracemalloc
+
+import defusedxml.ElementTree as ET
+from _bench import bench_parser
+
+from app.services.ingest.arxiv_api_backend import _ATOM_NS, _parse_atom_candidate, iter_atom_candidates
+
+_CHUNK_BYTES = 64 * 1024
+
+
+def _fixture(entries: int) -> bytes:
+    abstract = "We propose a transformer for dense prediction that segments images at scale. " * 13
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom"'
+        ' xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">\n'
+        f"  <opensearch:totalResults>{entries}</opensearch:totalResults>\n"
+    ]
+    for idx in range(entries):
+        authors = "".join(f"    <author><name>Author {idx}-{n} Example</name></author>\n" for n in range(6))
+        parts.append(
+            "  <entry>\n"
+            f"    <id>http://arxiv.org/abs/2604.{idx:05d}v1</id>\n"
+            "    <updated>2026-04-02T17:59:59Z</updated>\n"
+            "    <published>2026-04-01T17:59:59Z</published>\n"
+            f"    <title>Paper {idx}: Scalable Vision Transformers\n  for Dense Prediction</title>\n"
+            f"    <summary>  {abstract}\n</summary>\n"
+            f"{authors}"
+            f"    <arxiv:doi>10.48550/arXiv.2604.{idx:05d}</arxiv:doi>\n"
+            f'    <link href="http://arxiv.org/abs/2604.{idx:05d}v1" rel="alternate" type="text/html"/>\n'
+            f'    <link title="pdf" href="http://arxiv.org/pdf/2604.{idx:05d}v1" rel="related"/>\n'
+            "    <arxiv:comment>12 pages, 5 figures. Code: https://github.com/example/repo</arxiv:comment>\n"
+            '    <arxiv:primary_category term="cs.CV" scheme="http://arxiv.org/schemas/atom"/>\n'
+            '    <category term="cs.CV" scheme="http://arxiv.org/schemas/atom"/>\n'
+            '    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>\n'
+            "  </entry>\n"
+        )
+    parts.append("</feed>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _chunks(body: bytes):
+    for start in range(0, len(body), _CHUNK_BYTES):
+        yield body[start : start + _CHUNK_BYTES]
+
+
+def _buffered(chunks):
+    text = b"".join(chunks).decode("utf-8")
+    root = ET.fromstring(text)
+    for entry in root.findall("atom:entry", _ATOM_NS):
+        yield _parse_atom_candidate(entry)
+
+
+def _time(parse, body: bytes) -> tuple[float, float, int]:
+    """(wall s, first-candidate s, candidates) for one parse of ``body``."""
+    started = time.perf_counter()
+    first = None
+    count = 0
+    for _candidate in parse(_chunks(body)):
+        if first is None:
+            first = time.perf_counter() - started
+        count += 1
+    wall = time.perf_counter() - started
+    return wall, first or wall, count
+
+
+def _peak_mib(parse, body: bytes) -> float:
+    """``tracemalloc`` high-water mark while parsing ``body`` and keeping the candidates.
+
+    Measured in a separate run: tracing slows allocation-heavy code unevenly, so
+    it would skew the timings.
+    """
+    tracemalloc.start()
+    candidates = list(parse(_chunks(body)))
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del candidates
+    return peak / (1024 * 1024)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=5)
+    parser.add_argument("--entries", type=int, default=2000, help="entries in the Atom fixture")
+    args = parser.parse_args(argv)
+
+    body = _fixture(args.entries)
+    print(f"{args.entries} entries, {len(body) / (1024 * 1024):.1f} MiB, median of {args.repeat}")
+    for name, parse in (("buffered", _buffered), ("streamed", iter_atom_candidates)):
+        runs = [_time(parse, body) for _ in range(args.repeat)]
+        wall, first, count = (statistics.median(values) for values in zip(*runs))
+        peak = _peak_mib(parse, body)
+        print(
+            f"{name:<9} wall={wall * 1000:8.1f}ms  {count / wall:9,.0f} entries/s  "
+            f"first={first * 1000:7.1f}ms  peak={peak:6.1f}MiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""Benchmark ``papers_fts`` upkeep: bulk-insert throughput and query latency.
+
+Loads ``--papers`` synthetic papers (Zipf-distributed vocabulary, ~10-word
+titles, ~150-word abstracts) into a fresh app DB in scrape-sized ``--batch``
+inserts, then times BM25 queries against the resulting index. Scenarios:
+
+* ``per-row``  — the former path: every batch committed with the per-row FTS
+                 triggers and FTS5's default incremental merging.
+* ``batched``  — every batch in ``batched_fts_inserts`` and the whole load in
+                 ``deferred_fts_merges``; the closing merge/optimize is included
+                 in the load time.
+
+Each scenario reports rows/s for the load and the median latency of exact
+queries (``search_bm25``) and search-as-you-type queries (``prefix=True``,
+served by the ``prefix='2 3'`` indexes). ``plain-prefix`` times the same
+prefix queries against a copy of the index built without prefix indexes.
+
+Usage:
+    python scripts/bench_fts.py [--papers 100000] [--batch 500] [--repeat 1]
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from contextlib import nullcontext
+from datetime import date
+from pathlib import Path
+
+from _bench import bench_parser, create_bench_app
+
+_VOCABULARY = 30000
+_QUERY_ROUNDS = 20
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    syllables = ["ka", "to", "ri", "sen", "vi", "mo", "tra", "lex", "qu", "an", "dor", "pe", "zi", "ul", "net"]
+    words: set[str] = set()
+    while len(words) < _VOCABULARY:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words, key=lambda word: rng.random())
+
+
+def _rows(count: int) -> list[dict]:
+    rng = random.Random(44)
+    words = _vocabulary(rng)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    today = date.today()
+
+    def phrase(length: int) -> str:
+        return " ".join(rng.choices(words, cum_weights=cum_weights, k=length))
+
+    return [
+        {
+            "arxiv_id": f"2601.{idx:05d}",
+            "title": phrase(10),
+            "authors": "Jane Doe, John Smith, Alex Lee",
+            "link": f"https://arxiv.org/abs/2601.{idx:05d}",
+            "pdf_link": f"https://arxiv.org/pdf/2601.{idx:05d}",
+            "abstract_text": phrase(150),
+            "topic_tags": ["Segmentation", "Vision"],
+            "match_type": "Title",
+            "matched_terms": ["vision"],
+            "paper_score": 1.0,
+            "publication_dt": today,
+            "scraped_date": today.isoformat(),
+        }
+        for idx in range(count)
+    ]
+
+
+def _queries(rows: list[dict]) -> tuple[list[str], list[str]]:
+    """Exact two-word queries and their half-typed last words, drawn from titles."""
+    rng = random.Random(45)
+    exact, typed = [], []
+    for row in rng.sample(rows, 25):
+        first, second = rng.sample(row["title"].split(), 2)
+        exact.append(f"{first} {second}")
+        typed.append(f"{first} {second[: max(2, len(second) // 2)]}")
+    return exact, typed
+
+
+def _latency_ms(run, queries: list[str]) -> float:
+    samples = []
+    for _ in range(_QUERY_ROUNDS):
+        for query in queries:
+            started = time.perf_counter()
+            run(query)
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def _scenario(tmp: str, name: str, rows: list[dict], batch: int) -> tuple[float, float, float, float | None]:
+    """(rows/s, exact ms, prefix ms, plain-prefix ms) for one load into a fresh DB."""
+    from sqlalchemy import text
+
+    from app.models import Paper, db
+    from app.services.fts import batched_fts_inserts, deferred_fts_merges
+    from app.services.search import _sanitize_fts5_query, search_bm25
+
+    (Path(tmp) / f"{name}.db").unlink(missing_ok=True)
+    app = create_bench_app(tmp, db_name=f"{name}.db")
+    batched = name == "batched"
+    exact, typed = _queries(rows)
+    with app.app_context():
+        started = time.perf_counter()
+        with deferred_fts_merges() if batched else nullcontext():
+            for start in range(0, len(rows), batch):
+                with batched_fts_inserts() if batched else nullcontext():
+                    db.session.execute(db.insert(Paper), rows[start : start + batch])
+                if not batched:
+                    db.session.commit()
+        throughput = len(rows) / (time.perf_counter() - started)
+
+        exact_ms = _latency_ms(lambda q: search_bm25(q, limit=50), exact)
+        prefix_ms = _latency_ms(lambda q: search_bm25(q, limit=50, prefix=True), typed)
+
+        plain_ms = None
+        if batched:
+            db.session.execute(
+                text(
+                    "CREATE VIRTUAL TABLE plain_fts USING fts5(title, abstract_text, authors, topic_tags, "
+                    "content='papers', content_rowid='id', tokenize='porter unicode61')"
+                )
+            )
+            db.session.execute(text("INSERT INTO plain_fts(plain_fts) VALUES ('rebuild')"))
+            db.session.execute(text("INSERT INTO plain_fts(plain_fts) VALUES ('optimize')"))
+            db.session.commit()
+            plain = text("SELECT rowid, rank FROM plain_fts WHERE plain_fts MATCH :q ORDER BY rank LIMIT 50")
+            plain_ms = _latency_ms(
+                lambda q: db.session.execute(plain, {"q": _sanitize_fts5_query(q, prefix=True)}).fetchall(), typed
+            )
+        db.session.remove()
+        db.engine.dispose()
+    return throughput, exact_ms, prefix_ms, plain_ms
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=1)
+    parser.add_argument("--papers", type=int, default=100000, help="papers loaded per scenario")
+    parser.add_argument("--batch", type=int, default=500, help="papers per insert transaction")
+    args = parser.parse_args(argv)
+
+    rows = _rows(args.papers)
+    with tempfile.TemporaryDirectory(prefix="bench-fts-") as tmp:
+        print(f"{args.papers} papers in {args.batch}-row batches, median of {args.repeat}")
+        for name in ("per-row", "batched"):
+            runs = [_scenario(tmp, name, rows, args.batch) for _ in range(args.repeat)]
+            throughput, exact_ms, prefix_ms = (statistics.median(values) for values in list(zip(*runs))[:3])
+            print(f"{name:<8} load={throughput:8,.0f} rows/s  exact={exact_ms:7.2f}ms  prefix={prefix_ms:7.2f}ms")
+            if runs[0][3] is not None:
+                print(f"{'plain-prefix':<8} prefix={statistics.median(run[3] for run in runs):7.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
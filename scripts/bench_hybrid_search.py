@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""Benchmark hybrid search latency (p50/p95) with sequential vs concurrent legs.
+
+Seeds ``--papers`` synthetic papers into a temp app DB (FTS5 index included) and a
+flat FAISS index of random unit vectors, then runs ``--queries`` two-word title
+queries at ``top_k=30``. Query encoding uses a stand-in model that sleeps
+``--encode-ms`` and returns a hash-seeded unit vector (SPECTER2 on a CPU takes tens
+of ms per query; torch releases the GIL the same way). Scenarios:
+
+* ``sequential`` — the former path: ``search_bm25`` then ``search_semantic``,
+                   then the RRF fusion.
+* ``concurrent`` — ``search_hybrid``: the semantic leg on a worker thread while
+                   BM25 runs.
+* ``early``      — ``search_hybrid(early_termination=True)``: also stops reading
+                   BM25 rows once the fused top_k is settled.
+
+Usage:
+    python scripts/bench_hybrid_search.py [--papers 50000] [--queries 200] [--encode-ms 25] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import statistics
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from _bench import bench_parser, create_bench_app
+
+_TOP_K = 30
+_VOCABULARY_TEXT = (
+    "vision transformer segmentation diffusion dense prediction robust contrastive depth estimation "
+    "point cloud detection tracking video generation medical imaging graph neural network self "
+    "supervised attention efficient sparse multimodal language grounding pose reconstruction "
+    "radiance field occupancy lidar fusion distillation quantization pruning retrieval captioning"
+)
+_WORDS = _VOCABULARY_TEXT.split()
+
+
+class _StandInModel:
+    """Sleeps like a real encoder; the same text always maps to the same unit vector."""
+
+    def __init__(self, encode_ms: float):
+        self._delay = encode_ms / 1000
+
+    def encode(self, texts, **_kwargs):
+        time.sleep(self._delay)
+        seeds = [int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big") for text in texts]
+        vectors = np.stack([np.random.default_rng(seed).standard_normal(768) for seed in seeds]).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _seed(db, paper_model, count: int) -> list[str]:
+    from app.services.fts import batched_fts_inserts
+
+    rng = random.Random(45)
+    today = date.today()
+    rows = []
+    for idx in range(count):
+        title = " ".join(rng.sample(_WORDS, 8))
+        rows.append(
+            {
+                "arxiv_id": f"2601.{idx:05d}",
+                "title": title,
+                "authors": "Jane Doe, John Smith",
+                "link": f"https://arxiv.org/abs/2601.{idx:05d}",
+                "pdf_link": f"https://arxiv.org/pdf/2601.{idx:05d}",
+                "abstract_text": " ".join(rng.choices(_WORDS, k=120)),
+                "match_type": "Title",
+                "matched_terms": ["vision"],
+                "paper_score": 1.0,
+                "publication_dt": today,
+                "scraped_date": today.isoformat(),
+            }
+        )
+    for start in range(0, count, 5000):
+        with batched_fts_inserts():
+            db.session.execute(db.insert(paper_model), rows[start : start + 5000])
+    return [row["title"] for row in rows]
+
+
+def _sequential(query: str) -> list[dict]:
+    from app.services.search import _known_scores, _rank_map, search_bm25, search_semantic
+
+    bm25_ranks = _rank_map(search_bm25(query, limit=_TOP_K * 2))
+    semantic_ranks = _rank_map(search_semantic(query, top_k=_TOP_K * 2))
+    known = _known_scores(bm25_ranks, semantic_ranks, 0.4, 0.6)
+    ranked = sorted(known.items(), key=lambda item: (-round(item[1], 6), item[0]))
+    return [{"paper_id": pid, "rrf_score": round(score, 6)} for pid, score in ranked[:_TOP_K]]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=3)
+    parser.add_argument("--papers", type=int, default=50000, help="papers seeded into the DB and FAISS index")
+    parser.add_argument("--queries", type=int, default=200, help="queries per run")
+    parser.add_argument("--encode-ms", type=float, default=25, help="stand-in query encoding time")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench-hybrid-") as tmp:
+        app = create_bench_app(tmp, FAISS_INDEX_DIR=str(Path(tmp) / "faiss_index"))
+
+        from app.models import Paper, db
+        from app.services.embeddings import get_embedding_service
+        from app.services.search import search_hybrid
+
+        with app.app_context():
+            titles = _seed(db, Paper, args.papers)
+            ids = [row[0] for row in db.session.query(Paper.id).order_by(Paper.id)]
+            service = get_embedding_service(app)
+            service._model = _StandInModel(args.encode_ms)
+            vectors = np.random.default_rng(1).standard_normal((len(ids), 768)).astype(np.float32)
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+            service.add_papers(ids, [""] * len(ids), vectors=list(vectors))
+
+            rng = random.Random(46)
+            queries = [" ".join(rng.sample(rng.choice(titles).split(), 2)) for _ in range(args.queries)]
+            scenarios = {
+                "sequential": _sequential,
+                "concurrent": lambda q: search_hybrid(q, top_k=_TOP_K),
+                "early": lambda q: search_hybrid(q, top_k=_TOP_K, early_termination=True),
+            }
+            print(
+                f"{args.papers} papers, {args.queries} queries, encode={args.encode_ms:.0f}ms, "
+                f"top_k={_TOP_K}, median of {args.repeat}"
+            )
+            baseline = [[r["paper_id"] for r in _sequential(q)] for q in queries]
+            for name, run in scenarios.items():
+                if [[r["paper_id"] for r in run(q)] for q in queries] != baseline:
+                    raise SystemExit(f"{name} disagrees with the sequential ranking")
+                runs = []
+                for _ in range(args.repeat):
+                    samples = []
+                    for query in queries:
+                        started = time.perf_counter()
+                        run(query)
+                        samples.append((time.perf_counter() - started) * 1000)
+                    cuts = statistics.quantiles(samples, n=20)
+                    runs.append((statistics.median(samples), cuts[18]))
+                p50, p95 = (statistics.median(values) for values in zip(*runs))
+                print(f"{name:<10} p50={p50:7.2f}ms  p95={p95:7.2f}ms")
+            db.session.remove()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
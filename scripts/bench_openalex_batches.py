@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""Benchmark OpenAlex DOI lookups: requests, bytes transferred and wall time.
+
+Serves a fixture of ``--papers`` works from a local ``/works`` endpoint that
+honours ``filter=doi:a|b|...`` and ``select=`` like the real API and adds
+``--latency`` ms per request. The works mirror the shape of recorded OpenAlex
+responses: three topics with their subfield/field/domain, an open-access block
+and ~45 referenced works. About 15% of the ids are unknown to the fixture, like
+freshly announced papers. Scenarios:
+
+* ``sequential`` — the former request shape: fixed 50-id batches of full
+                   ``https://doi.org/`` DOIs selecting ``referenced_works``,
+                   issued one after another.
+* ``pipelined``  — ``OpenAlexProvider.fetch_batch``: batches packed up to the
+                   URL/OR-filter limits, ``referenced_works_count`` selected,
+                   ``OPENALEX_CONCURRENCY`` requests in flight.
+
+Both use a session whose token bucket never throttles, so the numbers isolate
+request count, payload size and overlap. Bytes are the response bodies the
+server wrote. Runs without an app context, so neither scenario touches the
+enrichment cache.
+
+Usage:
+    python scripts/bench_openalex_batches.py [--papers 1000] [--latency 150] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from _bench import bench_parser
+
+from app.services.enrichment_providers.openalex_provider import OpenAlexProvider, parse_openalex_work
+from app.services.http_client import create_session, request_with_backoff
+
+_FAST_CONFIG = {"ingest": {"rate_limit": {"requests_per_second": 10000, "burst": 10000}}}
+_TOPIC_NAMES = ("Computer Vision", "Image Segmentation", "Representation Learning", "Robotics", "Medical Imaging")
+
+
+def _fixture(arxiv_ids: list[str]) -> dict[str, dict]:
+    """Works keyed by lower-cased bare DOI; ~15% of ids are left out."""
+    rng = random.Random(43)
+    works: dict[str, dict] = {}
+    for idx, arxiv_id in enumerate(arxiv_ids):
+        if rng.random() < 0.15:
+            continue
+        doi = f"10.48550/arxiv.{arxiv_id}"
+        topics = [
+            {
+                "id": f"https://openalex.org/T{10000 + rng.randint(0, 999)}",
+                "display_name": name,
+                "score": round(rng.uniform(0.5, 1.0), 4),
+                "subfield": {
+                    "id": "https://openalex.org/subfields/1707",
+                    "display_name": "Computer Vision and Pattern Recognition",
+                },
+                "field": {"id": "https://openalex.org/fields/17", "display_name": "Computer Science"},
+                "domain": {"id": "https://openalex.org/domains/3", "display_name": "Physical Sciences"},
+            }
+            for name in rng.sample(_TOPIC_NAMES, 3)
+        ]
+        referenced = [f"https://openalex.org/W{rng.randint(1_000_000_000, 4_999_999_999)}" for _ in range(45)]
+        works[doi] = {
+            "id": f"https://openalex.org/W{4_400_000_000 + idx}",
+            "doi": f"https://doi.org/{doi}",
+            "open_access": {
+                "is_oa": True,
+                "oa_status": "green",
+                "oa_url": f"https://arxiv.org/pdf/{arxiv_id}",
+                "any_repository_has_fulltext": True,
+            },
+            "cited_by_count": rng.randint(0, 400),
+            "referenced_works": referenced,
+            "referenced_works_count": len(referenced),
+            "topics": topics,
+        }
+    return works
+
+
+class _WorksServer:
+    def __init__(self, works: dict[str, dict], latency: float):
+        self.requests = 0
+        self.bytes_sent = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                dois = query.get("filter", ["doi:"])[0].removeprefix("doi:").split("|")
+                fields = query.get("select", [""])[0].split(",")
+                results = []
+                for doi in dois:
+                    work = works.get(doi.lower().removeprefix("https://doi.org/"))
+                    if work is not None:
+                        results.append({field: work[field] for field in fields if field in work})
+                body = json.dumps({"meta": {"count": len(results)}, "results": results}).encode()
+                time.sleep(latency)
+                with lock:
+                    server.requests += 1
+                    server.bytes_sent += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/works"
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.bytes_sent = 0
+
+
+def _sequential(arxiv_ids: list[str], url: str, session) -> dict[str, dict]:
+    found: dict[str, dict] = {}
+    for start in range(0, len(arxiv_ids), 50):
+        batch = arxiv_ids[start : start + 50]
+        params = {
+            "filter": "doi:" + "|".join(f"https://doi.org/10.48550/arXiv.{aid}" for aid in batch),
+            "select": "id,doi,open_access,cited_by_count,referenced_works,topics",
+            "per_page": str(len(batch)),
+        }
+        response = request_with_backoff("GET", url, params=params, timeout=15, session=session)
+        by_id = {aid.lower(): aid for aid in batch}
+        for work in response.json()["results"]:
+            aid = by_id.get(work["doi"].lower().rsplit("arxiv.", 1)[-1])
+            if aid is not None:
+                found[aid] = parse_openalex_work(work)
+    return found
+
+
+def _pipelined(arxiv_ids: list[str], url: str, session) -> dict[str, dict]:
+    with patch("app.services.enrichment_providers.openalex_provider.OPENALEX_WORKS_URL", url):
+        return OpenAlexProvider(request_fn=request_with_backoff, api_key="bench").fetch_batch(
+            arxiv_ids, session=session
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=3)
+    parser.add_argument("--papers", type=int, default=1000, help="arXiv ids looked up per run")
+    parser.add_argument("--latency", type=float, default=150, help="server time per request, ms")
+    args = parser.parse_args(argv)
+
+    arxiv_ids = [f"2604.{idx:05d}" for idx in range(args.papers)]
+    server = _WorksServer(_fixture(arxiv_ids), args.latency / 1000)
+    print(f"{args.papers} ids, {args.latency:.0f}ms per request, median of {args.repeat}")
+    baseline = None
+    for name, run in (("sequential", _sequential), ("pipelined", _pipelined)):
+        samples = []
+        for _ in range(args.repeat):
+            server.reset()
+            with create_session(pool_size=8, scraper_config=_FAST_CONFIG, rate_limit_scope="bench") as session:
+                started = time.perf_counter()
+                found = run(arxiv_ids, server.url, session)
+                samples.append((time.perf_counter() - started, server.requests, server.bytes_sent))
+        if baseline is None:
+            baseline = found
+        elif found != baseline:
+            raise SystemExit(f"{name} disagrees with sequential results")
+        wall, requests_made, sent = (statistics.median(values) for values in zip(*samples))
+        print(
+            f"{name:<10} wall={wall * 1000:8.1f}ms  requests={requests_made:4.0f}  "
+            f"bytes={sent / 1024:9.1f}KiB  found={len(found)}"
+        )
+    server.httpd.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""Micro-benchmark ``compute_paper_score`` throughput.
+
+Scores ``--papers`` synthetic papers (varied match types, citations, venues and
+publication dates) against a config with custom preferences. Scenarios:
+
+* ``per-call``    — ``compute_paper_score(config=...)`` with no app context: the
+                    weights are resolved from the config on every call.
+* ``per-call-db`` — the same inside an app context with an active ``RankingConfig``,
+                    so every call also looks the active config up in SQLite (the
+                    path the enrichment stages and backfills used to take).
+* ``snapshot``    — weights resolved once with ``resolve_ranking_preferences`` and
+                    passed as ``preferences=`` (the hot-loop path). Skipped on trees
+                    whose ``compute_paper_score`` has no ``preferences`` parameter, so
+                    the script can also be run against an older checkout for a
+                    before/after comparison.
+
+Reports the median wall time and papers/second.
+
+Usage:
+    python scripts/bench_paper_score.py [--papers 20000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import inspect
+import random
+import tempfile
+from datetime import date, timedelta
+
+from _bench import bench_parser, create_bench_app, median_seconds
+
+from app.services.ranking import compute_paper_score
+
+_CONFIG = {
+    "whitelists": {"authors": ["Jane Doe"], "affiliations": ["MIT"], "titles": ["Vision"]},
+    "scraper": {"feed_url": "https://rss.arxiv.org/rss/cs.CV", "max_workers": 1},
+    "preferences": {
+        "ranking": {"author_weight": 40.0, "ai_weight": 6.0, "freshness_half_life_days": 10.0},
+        "muted": {"authors": ["Spam Author"], "topics": ["Crypto"]},
+    },
+}
+_MATCH_TYPES = [["Author"], ["Affiliation"], ["Title"], ["Author", "Title"], []]
+_VENUES = [None, None, "accepted", "oral", "workshop", "mentioned"]
+
+
+def _papers(count: int) -> list[dict]:
+    rng = random.Random(7)
+    today = date.today()
+    return [
+        {
+            "match_types": rng.choice(_MATCH_TYPES),
+            "matched_terms_count": rng.randint(0, 3),
+            "publication_dt": today - timedelta(days=rng.randint(0, 60)),
+            "resource_count": rng.randint(0, 5),
+            "llm_relevance_score": rng.choice([None, rng.uniform(0, 10)]),
+            "citation_count": rng.choice([None, 0, rng.randint(1, 500)]),
+            "acceptance_status": rng.choice(_VENUES),
+            "interest_similarity": rng.choice([None, rng.random()]),
+        }
+        for _ in range(count)
+    ]
+
+
+def _score(papers: list[dict], **score_kwargs) -> None:
+    for paper in papers:
+        compute_paper_score(**paper, **score_kwargs)
+
+
+def _summarize(name: str, papers: int, wall: float) -> None:
+    print(f"{name:<12} wall={wall * 1000:9.1f}ms  {papers / wall:12,.0f} papers/s  {wall / papers * 1e6:7.2f}us/paper")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=5)
+    parser.add_argument("--papers", type=int, default=20000, help="papers scored per sample")
+    args = parser.parse_args(argv)
+
+    papers = _papers(args.papers)
+    print(f"{args.papers} papers, median of {args.repeat}")
+    _summarize("per-call", args.papers, median_seconds(lambda: _score(papers, config=_CONFIG), args.repeat))
+
+    with tempfile.TemporaryDirectory(prefix="bench-score-") as tmp:
+        from app.models import RankingConfig, db
+
+        app = create_bench_app(tmp, config=_CONFIG)
+        with app.app_context():
+            db.session.add(RankingConfig(name="bench", weights={"title_weight": 20.0}, is_active=True))
+            db.session.commit()
+            # The DB scenario is ~100x slower; a slice keeps the run short.
+            db_papers = papers[: max(1, args.papers // 20)]
+            _summarize(
+                "per-call-db", len(db_papers), median_seconds(lambda: _score(db_papers, config=_CONFIG), args.repeat)
+            )
+
+            if "preferences" in inspect.signature(compute_paper_score).parameters:
+                from app.services.ranking import resolve_ranking_preferences
+
+                def snapshot():
+                    _score(papers, preferences=resolve_ranking_preferences(_CONFIG))
+
+                _summarize("snapshot", args.papers, median_seconds(snapshot, args.repeat))
+            else:
+                print("snapshot     (not supported by this tree)")
+            db.session.remove()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
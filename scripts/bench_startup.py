@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Benchmark cold-process startup: time-to-first-request and CLI ``--help``.
+
+Each sample runs in a fresh interpreter (so import caches are cold) against a
+throwaway instance directory (so the developer's DB is untouched):
+
+* ``wsgi``        — ``import wsgi`` (``create_app()``) then one ``GET /`` via the
+                    Flask test client; reports import, first-request and total time.
+* ``wsgi-stamped``— the same against an instance whose schema is already stamped, i.e.
+                    the normal restart path where ``ensure_schema`` skips the DDL.
+* ``cli``         — ``python -m app.cli.backfill --help`` end-to-end wall time.
+
+Usage:
+    python scripts/bench_startup.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _bench import REPO_ROOT, bench_parser
+
+_WSGI_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import wsgi
+t1 = time.perf_counter()
+response = wsgi.app.test_client().get("/")
+t2 = time.perf_counter()
+heavy = [m for m in ("openai", "pdfplumber", "faiss", "sentence_transformers", "torch") if m in __import__("sys").modules]
+print(json.dumps({"import_s": t1 - t0, "first_request_s": t2 - t1, "status": response.status_code, "heavy": heavy}))
+"""
+
+
+def _env(instance_dir: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env["CV_ARXIV_INSTANCE_PATH"] = str(instance_dir)
+    env.setdefault("CV_ARXIV_CONFIG", str(REPO_ROOT / "config.example.yaml"))
+    return env
+
+
+def _run_wsgi(instance_dir: Path) -> dict:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _WSGI_PROBE],
+        cwd=REPO_ROOT,
+        env=_env(instance_dir),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    sample = json.loads(proc.stdout.strip().splitlines()[-1])
+    sample["total_s"] = time.perf_counter() - started
+    return sample
+
+
+def _run_cli(instance_dir: Path) -> dict:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "app.cli.backfill", "--help"],
+        cwd=REPO_ROOT,
+        env=_env(instance_dir),
+        capture_output=True,
+        check=True,
+    )
+    return {"total_s": time.perf_counter() - started}
+
+
+def _summarize(name: str, samples: list[dict]) -> None:
+    keys = [key for key in ("import_s", "first_request_s", "total_s") if key in samples[0]]
+    cells = []
+    for key in keys:
+        values = [sample[key] for sample in samples]
+        cells.append(f"{key}={statistics.median(values) * 1000:7.1f}ms (min {min(values) * 1000:.1f})")
+    print(f"{name:<13} " + "  ".join(cells))
+    heavy = sorted({module for sample in samples for module in sample.get("heavy", [])})
+    if "heavy" in samples[0]:
+        print(f"{'':<13} heavy modules loaded: {', '.join(heavy) or 'none'}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = bench_parser(__doc__, repeat=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench-startup-") as tmp:
+        tmp_path = Path(tmp)
+        fresh = []
+        for i in range(args.repeat):
+            fresh.append(_run_wsgi(tmp_path / f"fresh-{i}"))
+        _summarize("wsgi", fresh)
+
+        stamped_dir = tmp_path / "stamped"
+        _run_wsgi(stamped_dir)  # first boot creates + stamps the schema
+        _summarize("wsgi-stamped", [_run_wsgi(stamped_dir) for _ in range(args.repeat)])
+
+        _summarize("cli --help", [_run_cli(stamped_dir) for _ in range(args.repeat)])
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,7 +5,9 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import Mock, patch
 
+import requests
 import yaml
 
 from app import create_app
@@ -51,6 +53,25 @@ TEST_SCRAPER_CONFIG = {
 }
 
 
+def route_session_requests_to_verb_mocks(test: unittest.TestCase) -> None:
+    """Hand ``requests.Session.request`` calls to the module-level ``requests.<verb>``.
+
+    API clients send through a pooled session; this lets a test keep mocking
+    ``requests.get`` / ``requests.post`` per verb. A request for a verb the test
+    didn't mock fails instead of reaching the network. Undone at test cleanup.
+    """
+
+    def _dispatch(method: str, url: str, **kwargs):
+        handler = getattr(requests, method.lower())
+        if not isinstance(handler, Mock):
+            raise AssertionError(f"unexpected HTTP request: {method} {url}")
+        return handler(url, **kwargs)
+
+    patcher = patch("requests.Session.request", side_effect=_dispatch)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
+
 class FlaskDBTestCase(unittest.TestCase):
     def setUp(self):
         self._tmpdir = tempfile.TemporaryDirectory()
@@ -4,6 +4,7 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 from sqlalchemy import inspect, text
@@ -156,6 +157,135 @@ class CreateAppInitializationTests(unittest.TestCase):
             self.assertEqual(response.headers.get("X-Frame-Options"), "DENY")
             self.assertEqual(response.headers.get("Referrer-Policy"), "same-origin")
 
+    def test_restart_skips_schema_upgrade_once_stamped(self):
+        from app.schema import SCHEMA_VERSION, read_schema_version
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            app = self._create_app(root)
+            with app.app_context():
+                self.assertEqual(read_schema_version(), SCHEMA_VERSION)
+                db.session.remove()
+                db.engine.dispose()
+
+            with patch("app.schema.inspect") as inspect_mock:
+                restarted_app = self._create_app(root)
+            inspect_mock.assert_not_called()
+            with restarted_app.app_context():
+                self.assertEqual(read_schema_version(), SCHEMA_VERSION)
+
+    def test_stamped_restart_still_runs_data_repairs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            app = self._create_app(root)
+            with app.app_context():
+                db.session.add(
+                    Paper(
+                        title="Imported",
+                        authors="Ada Lovelace",
+                        link="https://arxiv.org/abs/2604.00003v2",
+                        pdf_link="https://arxiv.org/pdf/2604.00003.pdf",
+                        match_type="Title",
+                        publication_date="2026-04-06",
+                        scraped_date="2026-04-07",
+                    )
+                )
+                db.session.commit()
+                # Rows written around the app (older build, manual import) skip the
+                # ORM listeners and leave the derived columns and side tables unset.
+                db.session.execute(text("UPDATE papers SET arxiv_id = NULL, publication_dt = NULL"))
+                db.session.execute(text("DELETE FROM authors"))
+                db.session.execute(text("DELETE FROM paper_term_vectors"))
+                db.session.commit()
+                db.session.remove()
+                db.engine.dispose()
+
+            with patch("app.schema.inspect") as inspect_mock:
+                restarted_app = self._create_app(root)
+            inspect_mock.assert_not_called()
+            with restarted_app.app_context():
+                row = db.session.execute(
+                    text("SELECT arxiv_id, pdf_link, publication_dt FROM papers WHERE title = 'Imported'")
+                ).one()
+                self.assertEqual(row.arxiv_id, "2604.00003")
+                self.assertEqual(row.pdf_link, "https://arxiv.org/pdf/2604.00003")
+                self.assertIsNotNone(row.publication_dt)
+                authors = db.session.execute(text("SELECT COUNT(*) FROM authors")).scalar()
+                vectors = db.session.execute(text("SELECT COUNT(*) FROM paper_term_vectors")).scalar()
+                self.assertEqual(authors, 1)
+                self.assertEqual(vectors, 1)
+
+    def test_unstamped_database_is_upgraded_and_stamped_on_startup(self):
+        from app.schema import SCHEMA_VERSION, read_schema_version
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            app = self._create_app(root)
+            with app.app_context():
+                # Simulate a DB from before the stamp existed that also predates a column.
+                db.session.execute(text("PRAGMA user_version = 0"))
+                db.session.execute(text("ALTER TABLE papers DROP COLUMN hf_upvotes"))
+                db.session.commit()
+                db.session.remove()
+                db.engine.dispose()
+
+            restarted_app = self._create_app(root)
+            with restarted_app.app_context():
+                columns = {col["name"] for col in inspect(db.engine).get_columns("papers")}
+                self.assertIn("hf_upvotes", columns)
+                self.assertEqual(read_schema_version(), SCHEMA_VERSION)
+
+    def test_upgrade_adds_indexed_rank_score_column(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            app = self._create_app(root)
+            with app.app_context():
+                db.session.add(
+                    Paper(
+                        title="Legacy",
+                        authors="Author A",
+                        link="https://arxiv.org/abs/2604.00002",
+                        pdf_link="https://arxiv.org/pdf/2604.00002",
+                        match_type="Title",
+                        paper_score=4.0,
+                        feedback_score=2,
+                        scraped_date="2026-04-07",
+                    )
+                )
+                db.session.commit()
+                # Turn it into a DB from before the generated rank_score column.
+                db.session.execute(text("PRAGMA user_version = 0"))
+                db.session.execute(text("DROP INDEX idx_papers_rank_score"))
+                db.session.execute(text("DROP INDEX idx_papers_visible_rank"))
+                db.session.execute(text("ALTER TABLE papers DROP COLUMN rank_score"))
+                db.session.commit()
+                db.session.remove()
+                db.engine.dispose()
+
+            restarted_app = self._create_app(root)
+            with restarted_app.app_context():
+                self.assertEqual(Paper.query.one().rank_score, 6.5)
+                for where, index in (("1", "idx_papers_rank_score"), ("is_hidden IS 0", "idx_papers_visible_rank")):
+                    plan = db.session.execute(
+                        text(
+                            f"EXPLAIN QUERY PLAN SELECT id FROM papers WHERE {where}"  # noqa: S608
+                            " ORDER BY rank_score DESC, id DESC LIMIT 24"
+                        )
+                    ).all()
+                    self.assertIn(index, " ".join(str(row[-1]) for row in plan))
+                    self.assertNotIn("TEMP B-TREE", " ".join(str(row[-1]) for row in plan))
+
+    def test_app_import_does_not_load_heavy_optional_dependencies(self):
+        import subprocess
+        import sys
+
+        probe = (
+            "import sys, app, app.routes.api, app.services.scrape_engine; "
+            "print(sorted(m for m in ('openai', 'pdfplumber', 'faiss', 'sentence_transformers') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,195 @@
+"""Tests for the asyncio HTTP layer (app.services.async_http) against a local server."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import httpx
+
+from app.services.async_http import fetch_all
+from app.services.http_client import ResponseTooLargeError, async_http_enabled
+from app.services.rate_limiter import TokenBucketRateLimiter
+from tests.helpers import FlaskDBTestCase
+
+# Generous enough that the shared bucket never paces these tests.
+FAST_CONFIG = {"ingest": {"rate_limit": {"requests_per_second": 1000, "burst": 1000}}}
+
+
+class _LocalServer:
+    """Threaded HTTP server whose routes are ``path -> [(status, headers, body, delay)]``.
+
+    Each hit pops the next response for its path (the last one repeats), so a
+    route can fail first and succeed on retry. ``hits`` counts requests per path.
+    """
+
+    def __init__(self, routes):
+        self.routes = {path: list(responses) for path, responses in routes.items()}
+        self.hits: dict[str, int] = {}
+        self.user_agents: list[str] = []
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                with lock:
+                    server.hits[path] = server.hits.get(path, 0) + 1
+                    server.user_agents.append(self.headers.get("User-Agent", ""))
+                    responses = server.routes.get(path) or [(404, {}, b"missing", 0.0)]
+                    status, headers, body, delay = responses.pop(0) if len(responses) > 1 else responses[0]
+                if delay:
+                    time.sleep(delay)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _ok(body: bytes = b'{"ok": true}', delay: float = 0.0):
+    return (200, {"Content-Type": "application/json"}, body, delay)
+
+
+class FetchAllTests(unittest.TestCase):
+    def test_returns_outcomes_in_call_order_with_default_user_agent(self):
+        with _LocalServer({"/a": [_ok(b'{"n": 1}')], "/b": [_ok(b'{"n": 2}')]}) as server:
+            outcomes = fetch_all(
+                [{"method": "GET", "url": server.url(path)} for path in ("/b", "/a", "/missing")],
+                scraper_config=FAST_CONFIG,
+            )
+
+        self.assertEqual(outcomes[0].json(), {"n": 2})
+        self.assertEqual(outcomes[1].json(), {"n": 1})
+        self.assertIsInstance(outcomes[2], httpx.HTTPStatusError)
+        self.assertEqual(outcomes[2].response.status_code, 404)
+        # A 404 is a permanent client error: no retry.
+        self.assertEqual(server.hits["/missing"], 1)
+        self.assertTrue(all(agent == "cv-arxiv-scraper/1.0" for agent in server.user_agents))
+
+    def test_slow_requests_overlap_on_one_thread(self):
+        calls = [{"method": "GET", "url": None} for _ in range(20)]
+        with _LocalServer({"/slow": [_ok(delay=0.25)]}) as server:
+            for call in calls:
+                call["url"] = server.url("/slow")
+            threads_before = threading.active_count()
+            started = time.monotonic()
+            outcomes = fetch_all(calls, scraper_config=FAST_CONFIG, concurrency=20)
+            elapsed = time.monotonic() - started
+
+        self.assertTrue(all(o.status_code == 200 for o in outcomes))
+        # Serially this is 5s; overlapped it is roughly one round-trip.
+        self.assertLess(elapsed, 2.0)
+        # The server spawns a thread per connection, but the client side adds none
+        # that outlive the call.
+        self.assertLessEqual(threading.active_count(), threads_before + 1)
+
+    def test_body_over_cap_raises_without_retry(self):
+        with _LocalServer({"/big": [(200, {}, b"x" * 4096, 0.0)]}) as server:
+            (outcome,) = fetch_all(
+                [{"method": "GET", "url": server.url("/big"), "max_bytes": 1024}],
+                scraper_config=FAST_CONFIG,
+            )
+
+        self.assertIsInstance(outcome, ResponseTooLargeError)
+        self.assertEqual(server.hits["/big"], 1)
+
+    def test_retry_after_is_honoured_before_retrying(self):
+        routes = {"/busy": [(503, {"Retry-After": "1"}, b"", 0.0), _ok()]}
+        with _LocalServer(routes) as server:
+            started = time.monotonic()
+            (outcome,) = fetch_all(
+                [{"method": "GET", "url": server.url("/busy"), "base_delay": 0.01}],
+                scraper_config=FAST_CONFIG,
+            )
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(outcome.json(), {"ok": True})
+        self.assertEqual(server.hits["/busy"], 2)
+        self.assertGreaterEqual(elapsed, 0.9)
+
+    def test_stop_when_skips_requests_not_yet_started(self):
+        routes = {"/limited": [(429, {}, b"", 0.0)], "/later": [_ok()]}
+        with _LocalServer(routes) as server:
+            outcomes = fetch_all(
+                [
+                    {"method": "GET", "url": server.url("/limited"), "attempts": 1},
+                    {"method": "GET", "url": server.url("/later")},
+                ],
+                scraper_config=FAST_CONFIG,
+                concurrency=1,
+                stop_when=lambda exc: getattr(getattr(exc, "response", None), "status_code", None) == 429,
+            )
+
+        self.assertEqual(outcomes[0].response.status_code, 429)
+        self.assertIsNone(outcomes[1])
+        self.assertNotIn("/later", server.hits)
+
+    def test_reservations_share_the_blocking_bucket(self):
+        now = [0.0]
+        limiter = TokenBucketRateLimiter(requests_per_second=2.0, burst=1, time_fn=lambda: now[0])
+
+        self.assertEqual(limiter.reserve(), 0.0)
+        # The bucket is empty: each further reservation queues behind the last.
+        self.assertAlmostEqual(limiter.reserve(), 0.5)
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+        now[0] = 1.0
+        self.assertAlmostEqual(limiter.reserve(), 0.5)
+
+    def test_setting_must_be_an_explicit_true(self):
+        self.assertTrue(async_http_enabled({"ingest": {"async_http": True}}))
+        self.assertFalse(async_http_enabled({"ingest": {"async_http": "yes"}}))
+        self.assertFalse(async_http_enabled({}))
+        self.assertFalse(async_http_enabled(None))
+
+
+class AsyncProviderTests(FlaskDBTestCase):
+    def test_huggingface_provider_fetches_concurrently_when_enabled(self):
+        from app.services.enrichment_providers import HuggingFaceProvider
+
+        routes = {
+            "/api/papers/2607.00001": [_ok(b'{"upvotes": 9, "numComments": 2}', delay=0.2)],
+            "/api/papers/2607.00002": [_ok(b'{"upvotes": 4, "githubRepo": "https://github.com/a/b"}', delay=0.2)],
+        }
+        fast = TokenBucketRateLimiter(requests_per_second=1000, burst=1000)
+        with (
+            _LocalServer(routes) as server,
+            patch(
+                "app.services.enrichment_providers.huggingface.HF_PAPER_API_URL",
+                server.url("/api/papers/{arxiv_id}"),
+            ),
+            patch("app.services.async_http.get_shared_rate_limiter", return_value=fast),
+        ):
+            payloads = HuggingFaceProvider(async_http=True).fetch_batch(["2607.00001", "2607.00002", "2607.00003"])
+
+        self.assertEqual(payloads["2607.00001"]["hf_upvotes"], 9)
+        self.assertEqual(payloads["2607.00001"]["hf_comments_count"], 2)
+        self.assertEqual(payloads["2607.00002"]["github_repo_url"], "https://github.com/a/b")
+        # Unknown paper -> 404 -> durable empty miss, same as the blocking path.
+        self.assertEqual(payloads["2607.00003"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for the authors table: counts maintained on save, trigram/substring lookup, rebuild."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import text
+
+from app.models import Author, Paper, db
+from app.schema import ensure_schema
+from app.services.author_index import (
+    rebuild_author_index,
+    reset_authors_fts_available,
+    split_authors,
+    suggest_authors,
+)
+from tests.helpers import FlaskDBTestCase
+
+
+def _paper(idx: int, authors: str) -> Paper:
+    today = date.today()
+    return Paper(
+        arxiv_id=f"2609.{idx:05d}",
+        title=f"Paper {idx}",
+        authors=authors,
+        link=f"https://arxiv.org/abs/2609.{idx:05d}",
+        pdf_link=f"https://arxiv.org/pdf/2609.{idx:05d}",
+        match_type="Author",
+        matched_terms=[],
+        paper_score=1.0,
+        publication_date=today.isoformat(),
+        publication_dt=today,
+        scraped_date=today.isoformat(),
+    )
+
+
+def _counts() -> dict[str, int]:
+    return {author.name: author.paper_count for author in Author.query.all()}
+
+
+class AuthorIndexTests(FlaskDBTestCase):
+    def test_split_authors_normalizes_and_dedupes(self):
+        self.assertEqual(split_authors(" Jane  Doe, ,John Smith,Jane Doe "), ["Jane Doe", "John Smith"])
+        self.assertEqual(split_authors(None), [])
+
+    def test_counts_follow_inserts_edits_and_deletes(self):
+        first = _paper(1, "Jane Doe, John Smith")
+        second = _paper(2, "Jane Doe")
+        db.session.add_all([first, second])
+        db.session.commit()
+        self.assertEqual(_counts(), {"Jane Doe": 2, "John Smith": 1})
+
+        first.authors = "John Smith, Ann Lee"
+        db.session.commit()
+        self.assertEqual(_counts(), {"Jane Doe": 1, "John Smith": 1, "Ann Lee": 1})
+
+        db.session.delete(second)
+        db.session.commit()
+        self.assertEqual(_counts(), {"John Smith": 1, "Ann Lee": 1})
+        self.assertEqual(suggest_authors("jane"), [])
+
+    def test_rolled_back_save_leaves_counts_untouched(self):
+        db.session.add(_paper(1, "Jane Doe"))
+        db.session.flush()
+        db.session.rollback()
+
+        self.assertEqual(_counts(), {})
+
+    def test_substring_lookup_is_case_insensitive_and_ordered(self):
+        db.session.add_all(
+            [
+                _paper(1, "Alice Smith, Bob Smithers"),
+                _paper(2, "Bob Smithers"),
+                _paper(3, "Carol Goldsmith"),
+            ]
+        )
+        db.session.commit()
+
+        self.assertEqual(
+            suggest_authors("SMITH"),
+            [
+                {"name": "Bob Smithers", "paper_count": 2},
+                {"name": "Alice Smith", "paper_count": 1},
+                {"name": "Carol Goldsmith", "paper_count": 1},
+            ],
+        )
+        # Too short for the trigram index; still a substring match on any name part.
+        self.assertEqual([row["name"] for row in suggest_authors("bo")], ["Bob Smithers"])
+        self.assertEqual(
+            [row["name"] for row in suggest_authors("th")], ["Bob Smithers", "Alice Smith", "Carol Goldsmith"]
+        )
+
+    def test_prolific_author_is_counted_exactly(self):
+        # The former LIKE scan stopped at 200 matching papers.
+        db.session.add_all([_paper(idx, f"Jane Doe, Coauthor {idx}") for idx in range(250)])
+        db.session.commit()
+
+        self.assertEqual(suggest_authors("jane doe"), [{"name": "Jane Doe", "paper_count": 250}])
+
+    def test_scan_fallback_without_trigram_table(self):
+        db.session.add(_paper(1, "Alice Smith"))
+        db.session.commit()
+        db.session.execute(text("DROP TABLE authors_fts"))
+        db.session.commit()
+        reset_authors_fts_available()
+
+        self.assertEqual(suggest_authors("lice"), [{"name": "Alice Smith", "paper_count": 1}])
+        db.session.add(_paper(2, "Alice Smith"))
+        db.session.commit()
+        self.assertEqual(suggest_authors("lice"), [{"name": "Alice Smith", "paper_count": 2}])
+
+    def test_rebuild_picks_up_core_inserts_and_schema_backfills(self):
+        db.session.add(_paper(1, "Jane Doe"))
+        db.session.commit()
+        row = {column.name: getattr(_paper(2, "Jane Doe, Ann Lee"), column.name) for column in Paper.__table__.columns}
+        row.pop("id")
+        row.pop("rank_score")
+        db.session.execute(db.insert(Paper), [row])
+        db.session.commit()
+        self.assertEqual(_counts(), {"Jane Doe": 1})
+
+        self.assertEqual(rebuild_author_index(), 2)
+        self.assertEqual(_counts(), {"Jane Doe": 2, "Ann Lee": 1})
+        self.assertEqual(suggest_authors("ann"), [{"name": "Ann Lee", "paper_count": 1}])
+
+        db.session.execute(text("DELETE FROM authors"))
+        db.session.execute(text("DELETE FROM authors_fts"))
+        db.session.commit()
+        ensure_schema()
+        self.assertEqual(_counts(), {"Jane Doe": 2, "Ann Lee": 1})
+        self.assertEqual(suggest_authors("lee"), [{"name": "Ann Lee", "paper_count": 1}])
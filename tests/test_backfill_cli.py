@@ -7,7 +7,8 @@ from unittest.mock import patch
 
 import numpy as np
 
-from app.models import Paper, db
+from app.models import Paper, SyncState, db
+from app.services.backfill_progress import BackfillTracker, checkpoint_category
 from app.services.embeddings import EmbeddingService, reset_embedding_service
 from app.services.ranking import compute_paper_score
 from backfill_cli import (
@@ -16,6 +17,7 @@ from backfill_cli import (
     backfill_github,
     backfill_openalex,
     backfill_thumbnails,
+    backfill_topic_tags,
     main,
     rebuild_semantic_index,
     run_all_backfills,
@@ -44,6 +46,20 @@ class BackfillCliTests(FlaskDBTestCase):
         reset_embedding_service()
         super().tearDown()
 
+    def test_backfill_topic_tags_refreshes_stale_tags_and_is_idempotent(self):
+        stale = _paper("2601.00020")
+        stale.abstract_text = "Satellite imagery segmentation."
+        stale.topic_tags = ["Old Tag"]
+        db.session.add(stale)
+        db.session.commit()
+
+        updated = backfill_topic_tags(self.app, batch_size=10, emit=lambda _msg: None)
+
+        self.assertEqual(updated, 1)
+        tags = Paper.query.filter_by(arxiv_id="2601.00020").one().topic_tags
+        self.assertEqual(tags[:2], ["Segmentation", "Remote Sensing"])
+        self.assertEqual(backfill_topic_tags(self.app, batch_size=10, emit=lambda _msg: None), 0)
+
     def test_backfill_abstracts_strips_rss_boilerplate_and_is_idempotent(self):
         dirty = _paper("2601.00010")
         dirty.abstract_text = "arXiv:2601.00010v1 Announce Type: new Abstract: The real body."
@@ -357,6 +373,119 @@ class BackfillCliTests(FlaskDBTestCase):
         mock_thumbnails.assert_called_once()
         mock_abstracts.assert_called_once()
 
+    @patch("app.services.citations.fetch_citations_batch")
+    def test_backfill_citations_resumes_after_checkpoint_and_clears_it(self, mock_fetch):
+        papers = [_paper(f"2601.0010{i}") for i in range(3)]
+        db.session.add_all(papers)
+        db.session.commit()
+        db.session.add(SyncState(category=checkpoint_category("citations"), last_cursor_paper_id=papers[0].id))
+        db.session.commit()
+        mock_fetch.return_value = {}
+
+        backfill_citations(self.app, batch_size=10, delay_seconds=0, emit=lambda _: None)
+
+        self.assertEqual(mock_fetch.call_args.args[0], ["2601.00101", "2601.00102"])
+        state = SyncState.query.filter_by(category=checkpoint_category("citations")).one()
+        self.assertIsNone(state.last_cursor_paper_id)
+        self.assertEqual(state.last_synced_paper_count, 2)
+
+    @patch("app.services.citations.fetch_citations_batch")
+    def test_backfill_citations_checkpoints_each_batch_when_interrupted(self, mock_fetch):
+        papers = [_paper(f"2601.0020{i}") for i in range(3)]
+        db.session.add_all(papers)
+        db.session.commit()
+        mock_fetch.side_effect = [{}, RuntimeError("connection reset")]
+
+        with self.assertRaises(RuntimeError):
+            backfill_citations(self.app, batch_size=1, delay_seconds=0, emit=lambda _: None)
+
+        state = SyncState.query.filter_by(category=checkpoint_category("citations")).one()
+        self.assertEqual(state.last_cursor_paper_id, papers[0].id)
+
+    def test_tracker_reports_throughput_and_eta(self):
+        clock = iter([0.0, 10.0, 10.0, 10.0])
+        tracker = BackfillTracker("citations", total=100, clock=lambda: next(clock))
+        tracker.processed = 20
+
+        self.assertAlmostEqual(tracker.rate, 2.0)
+        self.assertEqual(tracker.describe(), "20/100 papers, 2.0 papers/s, ETA 40s")
+
+    def test_run_all_backfills_overlaps_hosts_and_respects_dependencies(self):
+        import threading
+
+        events: list[str] = []
+        lock = threading.Lock()
+        overlap = threading.Barrier(3, timeout=5)
+
+        def fake(name, *, barrier=False):
+            def run(*_args, **_kwargs):
+                if barrier:
+                    overlap.wait()  # citations, comments and thumbnails must all be in flight
+                with lock:
+                    events.append(name)
+                return 1
+
+            return run
+
+        with (
+            patch("backfill_cli.backfill_abstracts", side_effect=fake("abstracts")),
+            patch("backfill_cli.run_embeddings_backfill", side_effect=fake("embeddings")),
+            patch("backfill_cli.backfill_citations", side_effect=fake("citations", barrier=True)),
+            patch("backfill_cli.backfill_openalex", side_effect=fake("openalex")),
+            patch("backfill_cli.backfill_comments", side_effect=fake("comments", barrier=True)),
+            patch("backfill_cli.backfill_huggingface", side_effect=fake("huggingface")),
+            patch("backfill_cli.backfill_github", side_effect=fake("github")),
+            patch("backfill_cli.backfill_thumbnails", side_effect=fake("thumbnails", barrier=True)),
+            patch("app.services.ranking.recompute_all_paper_scores", return_value=0) as rescore,
+        ):
+            result = run_all_backfills(self.app, delay_seconds=0, workers=4, emit=lambda _: None)
+
+        self.assertEqual(set(result.values()), {1})
+        self.assertLess(events.index("citations"), events.index("openalex"))
+        self.assertLess(events.index("huggingface"), events.index("github"))
+        self.assertLess(events.index("comments"), events.index("github"))
+        rescore.assert_called_once_with(self.app)
+
+    @patch("backfill_cli.create_app")
+    @patch("app.enrich.HuggingFaceProvider")
+    @patch("app.services.enrichment._fetch_api_metadata")
+    def test_backfill_all_keeps_links_from_comments_and_huggingface(self, mock_fetch, mock_hf_cls, mock_create_app):
+        # Both rewrite resource_links from their own batch snapshot; run side by side,
+        # the later commit dropped the links the other had just added.
+        import time
+
+        paper = _paper("2601.00011")
+        db.session.add(paper)
+        db.session.commit()
+        mock_create_app.return_value = self.app
+
+        def slow_fetch(*_args, **_kwargs):
+            time.sleep(0.2)  # hold the comments snapshot open across a concurrent HF commit
+            return {"2601.00011": {"comment": "Code: https://github.com/lab/model", "doi": ""}}
+
+        mock_fetch.side_effect = slow_fetch
+        mock_hf_cls.return_value.rate_limited = False
+        mock_hf_cls.return_value.fetch_batch.return_value = {
+            "2601.00011": {"hf_upvotes": 5, "project_page_url": "https://lab.example/model"}
+        }
+
+        with (
+            patch("backfill_cli.backfill_abstracts", return_value=0),
+            patch("backfill_cli.run_embeddings_backfill", return_value=0),
+            patch("backfill_cli.backfill_citations", return_value=0),
+            patch("backfill_cli.backfill_openalex", return_value=0),
+            patch("backfill_cli.backfill_github", return_value=0),
+            patch("backfill_cli.backfill_thumbnails", return_value=0),
+        ):
+            exit_code = main(["all", "--workers", "2", "--delay", "0"])
+
+        self.assertEqual(exit_code, 0)
+        db.session.expire_all()
+        stored = Paper.query.filter_by(arxiv_id="2601.00011").one()
+        urls = {link["url"] for link in stored.resource_links_list}
+        self.assertEqual(urls, {"https://github.com/lab/model", "https://lab.example/model"})
+        self.assertEqual(stored.hf_upvotes, 5)
+
     @patch("backfill_cli.rebuild_semantic_index", return_value=2)
     @patch("backfill_cli.create_app")
     def test_main_routes_index_rebuild_command(self, mock_create_app, mock_rebuild):
@@ -9,6 +9,7 @@ from app.models import Paper, PaperFeedback, db
 from app.services.bibtex import (
     _escape_latex,
     _format_bibtex_authors,
+    iter_bibtex,
     paper_to_bibtex,
     papers_to_bibtex,
 )
@@ -107,6 +108,15 @@ class PaperToBibtexTests(unittest.TestCase):
         self.assertIn("2603_00001", bib)
         self.assertIn("2603_00002", bib)
 
+    def test_iter_bibtex_chunks_join_to_the_full_export(self):
+        papers = [
+            _make_paper(arxiv_id=f"2603.0000{idx}", link=f"https://arxiv.org/abs/2603.0000{idx}") for idx in range(3)
+        ]
+        chunks = list(iter_bibtex(iter(papers)))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("".join(chunks), papers_to_bibtex(papers))
+        self.assertEqual(list(iter_bibtex([])), [])
+
 
 class BibtexExportEndpointTests(FlaskDBTestCase):
     def setUp(self):
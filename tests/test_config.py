@@ -94,6 +94,23 @@ class ConfigValidationTests(unittest.TestCase):
         with self.assertRaises(ValueError, msg="user_agent"):
             _validate_config(cfg)
 
+    def test_ingest_async_http_must_be_boolean(self):
+        cfg = self._valid_config()
+        cfg["ingest"] = {"async_http": "yes"}
+        with self.assertRaises(ValueError, msg="async_http"):
+            _validate_config(cfg)
+        cfg["ingest"] = {"async_http": True}
+        _validate_config(cfg)
+
+    def test_scraper_memory_budget_must_be_positive_integer(self):
+        cfg = self._valid_config()
+        for bad in (0, -1, "512", True, 1.5):
+            cfg["scraper"]["memory_budget_mb"] = bad
+            with self.assertRaises(ValueError, msg="memory_budget_mb"):
+                _validate_config(cfg)
+        cfg["scraper"]["memory_budget_mb"] = 256
+        _validate_config(cfg)
+
     def test_scraper_not_dict(self):
         cfg = self._valid_config()
         cfg["scraper"] = "bad"
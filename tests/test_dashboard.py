@@ -11,6 +11,9 @@ from tests.helpers import FlaskDBTestCase
 class DashboardRouteTests(FlaskDBTestCase):
     def setUp(self):
         super().setUp()
+        self._seed_papers()
+
+    def _seed_papers(self):
         now = datetime.now(timezone.utc).replace(tzinfo=None)
         today = date.today()
 
@@ -128,6 +131,46 @@ class DashboardRouteTests(FlaskDBTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn("Page 2", text)
 
+    def _page_ids_and_links(self, url: str) -> tuple[list[int], dict[str, str]]:
+        import html
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        text = response.get_data(as_text=True)
+        ids = [int(value) for value in re.findall(r'<article class="paper-card[^"]*" data-paper-id="(\d+)"', text)]
+        links = {}
+        for href, label in re.findall(
+            r'<a href="([^"]+)"\s+class="btn-ghost py-1.5 text-sm">(Previous|Next)</a>', text
+        ):
+            links[label] = html.unescape(href)
+        return ids, links
+
+    def test_rank_feed_pages_by_cursor(self):
+        first_ids, first_links = self._page_ids_and_links("/?timeframe=all")
+        expected = [paper.id for paper in Paper.query.order_by(Paper.paper_score.desc()).all()]
+        self.assertEqual(first_ids, expected[:24])
+        self.assertNotIn("Previous", first_links)
+        self.assertIn("after=", first_links["Next"])
+
+        second_ids, second_links = self._page_ids_and_links(first_links["Next"])
+        self.assertEqual(second_ids, expected[24:])
+        self.assertNotIn("Next", second_links)
+        self.assertIn("before=", second_links["Previous"])
+
+        back_ids, back_links = self._page_ids_and_links(second_links["Previous"])
+        self.assertEqual(back_ids, expected[:24])
+        self.assertNotIn("Previous", back_links)
+
+    def test_rank_feed_cursor_skips_rows_ranked_above_it(self):
+        top = Paper.query.order_by(Paper.paper_score.desc()).first()
+        ids, _links = self._page_ids_and_links(f"/?timeframe=all&page=2&after={top.rank_score!r}:{top.id}")
+        self.assertNotIn(top.id, ids)
+        self.assertEqual(len(ids), 24)
+
+    def test_garbled_cursor_falls_back_to_first_page(self):
+        ids, _links = self._page_ids_and_links("/?timeframe=all&after=nan:x")
+        self.assertEqual(len(ids), 24)
+
     def test_feedback_endpoint_toggles_action(self):
         paper = Paper.query.first()
         token = self._csrf_token()
@@ -248,6 +291,35 @@ class DashboardRouteTests(FlaskDBTestCase):
         self.assertNotIn("https://arxiv.org/abs/2602.1000", text)
         self.assertIn("cs.RO", text)
 
+    def test_search_pushes_filtered_ids_into_hybrid_search(self):
+        todays_ids = {paper.id for paper in Paper.query.all() if paper.publication_dt == date.today()}
+
+        def hybrid(query, *, top_k, early_termination, paper_ids):
+            return [{"paper_id": pid} for pid in sorted(paper_ids)[:top_k]]
+
+        with patch("app.services.search.search_hybrid", side_effect=hybrid) as search:
+            first = self.client.get("/?q=vision&category=cs.RO")
+            self.client.get("/?q=vision&category=cs.RO&sort=newest")
+
+        text = first.get_data(as_text=True)
+        robotics_ids = {
+            paper.id for paper in Paper.query.all() if paper.id in todays_ids and "cs.RO" in paper.categories
+        }
+        calls = [call.kwargs["paper_ids"] for call in search.call_args_list]
+        self.assertEqual(first.status_code, 200)
+        # The unfaceted search feeds the facet counts; the page searches only the
+        # papers the category facet admits.
+        self.assertEqual(calls[0], todays_ids)
+        self.assertEqual(calls[1], robotics_ids)
+        self.assertIn("https://arxiv.org/abs/2602.1001", text)
+        self.assertNotIn("https://arxiv.org/abs/2602.1000", text)
+        # Facet counts cover the hits before the facet, so other categories stay selectable.
+        self.assertIn("Computer Vision · cs.CV (10)", text)
+        self.assertIn("Robotics · cs.RO (10)", text)
+        # Re-sorting the same filters reuses the cached id sets.
+        self.assertIs(calls[2], calls[0])
+        self.assertIs(calls[3], calls[1])
+
     def test_venue_filter_and_badge(self):
         accepted = Paper.query.filter_by(title="Paper 0").one()
         accepted.arxiv_comment = "Accepted to CVPR 2026 (oral)"
@@ -429,6 +501,84 @@ class DashboardRouteTests(FlaskDBTestCase):
         self.assertEqual(response.mimetype, "image/png")
         self.assertEqual(response.get_data(), b"png-bytes")
 
+    def test_paper_thumbnail_route_revalidates_a_rerendered_file(self):
+        paper = Paper.query.filter_by(title="Paper 0").one()
+        thumbnails_dir = Path(self.app.static_folder) / "thumbnails"
+        thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        thumbnail_path = thumbnails_dir / f"{paper.arxiv_id}.png"
+        thumbnail_path.write_bytes(b"png-bytes")
+
+        response = self.client.get(f"/papers/{paper.id}/thumbnail.png")
+        thumbnail_path.write_bytes(b"re-rendered")
+        revalidated = self.client.get(
+            f"/papers/{paper.id}/thumbnail.png", headers={"If-None-Match": response.headers["ETag"]}
+        )
+
+        self.assertNotIn("immutable", response.headers["Cache-Control"])
+        self.assertIn("max-age=86400", response.headers["Cache-Control"])
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(revalidated.get_data(), b"re-rendered")
+
+    def test_versioned_preview_urls_are_immutable(self):
+        paper = Paper.query.order_by(Paper.id.desc()).first()
+        thumbnails_dir = Path(self.app.static_folder) / "thumbnails"
+        thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        thumbnail_path = thumbnails_dir / f"{paper.arxiv_id}.png"
+        thumbnail_path.write_bytes(b"png-bytes")
+        (thumbnails_dir / f"{paper.arxiv_id}-240w.webp").write_bytes(b"RIFFwebp")
+        version = format(thumbnail_path.stat().st_mtime_ns, "x")
+
+        text = self.client.get("/?timeframe=all").get_data(as_text=True)
+        png = self.client.get(f"/papers/{paper.id}/thumbnail.png?v={version}")
+        variant = self.client.get(f"/papers/{paper.id}/thumbnail-240w.webp?v={version}")
+        stale = self.client.get(f"/papers/{paper.id}/thumbnail.png?v=0")
+
+        self.assertIn(f"/papers/{paper.id}/thumbnail-240w.webp?v={version} 240w", text)
+        self.assertIn(f"/papers/{paper.id}/thumbnail.png?v={version}", text)
+        for response in (png, variant):
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("max-age=31536000", response.headers["Cache-Control"])
+            self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertNotIn("immutable", stale.headers["Cache-Control"])
+        self.assertIn("max-age=86400", stale.headers["Cache-Control"])
+
+    def test_preview_variant_route_serves_variant(self):
+        paper = Paper.query.filter_by(title="Paper 0").one()
+        thumbnails_dir = Path(self.app.static_folder) / "thumbnails"
+        thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        (thumbnails_dir / f"{paper.arxiv_id}_teaser-240w.webp").write_bytes(b"RIFFwebp")
+
+        response = self.client.get(f"/papers/{paper.id}/teaser-240w.webp")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "image/webp")
+        self.assertEqual(response.get_data(), b"RIFFwebp")
+        self.assertIn("max-age=86400", response.headers["Cache-Control"])
+
+    def test_preview_variant_route_falls_back_to_png_and_warms(self):
+        paper = Paper.query.filter_by(title="Paper 0").one()
+        thumbnails_dir = Path(self.app.static_folder) / "thumbnails"
+        thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        (thumbnails_dir / f"{paper.arxiv_id}.png").write_bytes(b"page-one")
+
+        with patch("app.routes.dashboard.THUMBNAIL_WARMER.warm") as mock_warm:
+            response = self.client.get(f"/papers/{paper.id}/thumbnail-720w.avif")
+            unknown_width = self.client.get(f"/papers/{paper.id}/thumbnail-333w.avif")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(), b"page-one")
+        self.assertIn("max-age=3600", response.headers["Cache-Control"])
+        mock_warm.assert_called_once_with(paper.arxiv_id, paper.pdf_link, Path(self.app.static_folder))
+        self.assertEqual(unknown_width.status_code, 404)
+
+    def test_dashboard_rows_offer_preview_srcset(self):
+        paper = Paper.query.order_by(Paper.id.desc()).first()
+
+        text = self.client.get("/?timeframe=all").get_data(as_text=True)
+
+        self.assertIn(f"/papers/{paper.id}/thumbnail-240w.webp 240w", text)
+        self.assertIn('type="image/webp"', text)
+
     def test_paper_thumbnail_route_warms_in_background_when_missing(self):
         paper = Paper.query.filter_by(title="Paper 0").one()
 
@@ -588,3 +738,92 @@ class DashboardRouteTests(FlaskDBTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.get_data(), b"legacy-png")
+
+
+class DashboardCacheTests(FlaskDBTestCase):
+    """Page cache, data/preference versions and ETag revalidation for ``/``."""
+
+    def setUp(self):
+        super().setUp()
+        DashboardRouteTests._seed_papers(self)
+
+    _csrf_token = DashboardRouteTests._csrf_token
+
+    def test_repeat_view_is_served_from_cache(self):
+        first = self.client.get("/?timeframe=all")
+        with patch("app.routes.dashboard._enrich_cards_with_feedback_and_related") as enrich:
+            second = self.client.get("/?timeframe=all")
+
+        self.assertEqual(first.headers["X-Dashboard-Cache"], "miss")
+        self.assertEqual(second.headers["X-Dashboard-Cache"], "hit")
+        enrich.assert_not_called()
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertEqual(first.headers["ETag"], second.headers["ETag"])
+        self.assertIn("no-cache", second.headers["Cache-Control"])
+        self.assertIn("private", second.headers["Cache-Control"])
+
+    def test_matching_etag_answers_304_without_rendering(self):
+        etag = self.client.get("/").headers["ETag"]
+        with patch("app.routes.dashboard._render_dashboard") as render:
+            response = self.client.get("/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_data(), b"")
+        render.assert_not_called()
+
+    def test_hide_bumps_data_version_and_drops_the_paper(self):
+        first = self.client.get("/?timeframe=all")
+        self.assertIn("Paper 29", first.get_data(as_text=True))
+        paper = Paper.query.filter_by(title="Paper 29").one()
+
+        response = self.client.post(
+            f"/api/papers/{paper.id}/feedback",
+            json={"action": "skip"},
+            headers={"X-CSRF-Token": self._csrf_token()},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        second = self.client.get("/?timeframe=all", headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.headers["X-Dashboard-Cache"], "miss")
+        self.assertNotIn("Paper 29", second.get_data(as_text=True))
+
+    def test_unwatched_writes_keep_the_cached_page(self):
+        from app.models import EnrichmentCache
+
+        self.client.get("/")
+        db.session.add(EnrichmentCache(paper_id=Paper.query.first().id, source="github", data={}))
+        db.session.commit()
+
+        self.assertEqual(self.client.get("/").headers["X-Dashboard-Cache"], "hit")
+
+    def test_preference_change_invalidates(self):
+        self.client.get("/")
+        self.app.config["SCRAPER_CONFIG"].setdefault("preferences", {})["display"] = {"summary_lines": 5}
+
+        response = self.client.get("/")
+
+        self.assertEqual(response.headers["X-Dashboard-Cache"], "miss")
+        self.assertIn('data-clamp="5"', response.get_data(as_text=True))
+
+    def test_cached_page_carries_each_sessions_csrf_token(self):
+        self.client.get("/")
+        other = self.app.test_client()
+        response = other.get("/")
+        with other.session_transaction() as session:
+            token = session["settings_csrf_token"]
+
+        self.assertEqual(response.headers["X-Dashboard-Cache"], "hit")
+        self.assertIn(f'<meta name="csrf-token" content="{token}">', response.get_data(as_text=True))
+        self.assertNotIn("__dashboard_csrf_token__", response.get_data(as_text=True))
+
+    def test_stats_report_hit_ratio_and_savings(self):
+        etag = self.client.get("/").headers["ETag"]
+        self.client.get("/")
+        self.client.get("/", headers={"If-None-Match": etag})
+
+        stats = self.client.get("/api/dashboard/cache-stats").get_json()
+
+        self.assertEqual((stats["misses"], stats["hits"], stats["not_modified"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_ratio"], 2 / 3, places=3)
+        self.assertGreater(stats["render_seconds_saved"], 0)
@@ -211,7 +211,7 @@ class SemanticScholarKeyTests(FlaskDBTestCase):
 class GitHubTokenTests(FlaskDBTestCase):
     @staticmethod
     def _repo_response() -> MagicMock:
-        response = MagicMock()
+        response = MagicMock(status_code=200, headers={})
         response.json.return_value = {"full_name": "lab/model", "stargazers_count": 1, "license": None}
         return response
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 import threading
 import time
@@ -185,6 +186,21 @@ class TestEmbeddingService:
         service.add_papers([1], ["test"])
         assert service.search_by_id(999) == []
 
+    def test_search_by_ids_matches_per_id_search(self, index_dir):
+        service = _make_service(index_dir)
+        rng = np.random.default_rng(3)
+        vectors = rng.random((6, 768)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        service.add_papers([1, 2, 3, 4, 5, 6], list("abcdef"), vectors=list(vectors))
+
+        batched = service.search_by_ids([3, 999, 1, 3], top_k=2)
+
+        assert list(batched) == [3, 1]
+        for paper_id, neighbours in batched.items():
+            expected = service.search_by_id(paper_id, top_k=2)
+            assert [pid for pid, _ in neighbours] == [pid for pid, _ in expected]
+            assert [score for _, score in neighbours] == pytest.approx([score for _, score in expected])
+
     def test_get_paper_vectors_returns_indexed_ids_in_requested_order(self, index_dir):
         service = _make_service(index_dir)
         service.add_papers([1, 2, 3], ["alpha", "beta", "gamma"])
@@ -270,3 +286,79 @@ class TestEmbeddingService:
 
         assert construct_count == 1
         assert service._model is not None
+
+
+def _section_vec(axis: int) -> np.ndarray:
+    v = np.zeros((768,), dtype=np.float32)
+    v[axis] = 1.0
+    return v
+
+
+def test_search_sections_type_filter_is_exact_without_overfetch(tmp_path):
+    # A selective type filter must still return the true top_k of that type even when
+    # every closer neighbour is another type (the old 3x over-fetch missed these).
+    svc = EmbeddingService(str(tmp_path / "faiss_index"))
+    entries = [(pid, "intro", f"intro {pid}") for pid in range(1, 21)] + [(99, "method", "method 99")]
+    vectors = {f"intro {pid}": _section_vec(0) for pid in range(1, 21)}
+    vectors["method 99"] = _section_vec(1) * 0.5 + _section_vec(0) * 0.1
+    vectors["query"] = _section_vec(0)
+
+    def encode(texts, **kwargs):
+        out = np.asarray([vectors[t] for t in texts], dtype=np.float32)
+        return out / np.linalg.norm(out, axis=1, keepdims=True)
+
+    with patch.object(EmbeddingService, "encode", side_effect=encode):
+        assert svc.add_sections(entries) == 21
+        hits = svc.search_sections("query", top_k=1, section_type="method")
+        assert [h["paper_id"] for h in hits] == [99]
+        assert hits[0]["section_type"] == "method"
+        assert svc.search_sections("query", top_k=5, section_type="missing") == []
+        assert len(svc.search_sections("query", top_k=5)) == 5
+
+
+@pytest.mark.parametrize("eligible", [[7, 42, 95], list(range(1, 201, 2))], ids=["batch", "bitmap"])
+def test_search_with_paper_ids_returns_exact_filtered_top_k(index_dir, eligible):
+    # 3 of 200 rows take the IDSelectorBatch path, 100 of 200 the row bitmap; either
+    # way the result is the true top_k of the eligible papers, not a filtered top_k.
+    rng = np.random.default_rng(11)
+    vectors = rng.standard_normal((200, 768)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    service = EmbeddingService(index_dir)
+    service.add_papers(list(range(1, 201)), [""] * 200, vectors=list(vectors))
+    query = vectors[0]
+
+    with patch.object(EmbeddingService, "encode", return_value=query.reshape(1, -1)):
+        hits = service.search("query", top_k=5, paper_ids=set(eligible) | {999})
+        assert service.search("query", top_k=5, paper_ids={999}) == []
+
+    expected = sorted(eligible, key=lambda pid: -float(vectors[pid - 1] @ query))[:5]
+    assert [pid for pid, _score in hits] == expected
+
+
+def test_section_sidecar_round_trip_and_legacy_json_migration(tmp_path):
+    index_dir = tmp_path / "faiss_index"
+    entries = [(1, "intro", "a"), (1, "method", "b"), (2, "method", "c")]
+    with patch.object(EmbeddingService, "encode", side_effect=_fake_encode):
+        svc = EmbeddingService(str(index_dir))
+        svc.add_sections(entries)
+        svc.save_sections()
+
+        reloaded = EmbeddingService(str(index_dir))
+        reloaded._ensure_section_index()
+        meta = reloaded._section_meta
+        assert list(meta.paper_ids) == [1, 1, 2]
+        assert meta.has_paper(2) and not meta.has_paper(3)
+        assert meta.type_count("method") == 2
+        assert reloaded.add_sections([(2, "results", "d")]) == 0
+
+    # An index written before the columnar sidecar existed still loads, and the next
+    # save replaces the legacy JSON map.
+    (index_dir / "section_meta.npz").unlink()
+    legacy = [{"paper_id": 1, "section_type": "intro"}, {"paper_id": 1, "section_type": "method"}]
+    (index_dir / "section_id_map.json").write_text(json.dumps(legacy + [{"paper_id": 2, "section_type": "method"}]))
+    migrated = EmbeddingService(str(index_dir))
+    migrated._ensure_section_index()
+    assert migrated._section_meta.type_count("method") == 2
+    migrated.save_sections()
+    assert (index_dir / "section_meta.npz").exists()
+    assert not (index_dir / "section_id_map.json").exists()
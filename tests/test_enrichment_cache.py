@@ -83,6 +83,54 @@ class EnrichmentCacheTests(FlaskDBTestCase):
         cache_row = EnrichmentCache.query.filter_by(paper_id=paper.id, source="openalex").one()
         self.assertEqual(cache_row.data["openalex_id"], "W12345")
 
+    @patch("app.services.openalex.request_with_backoff")
+    def test_openalex_caches_unindexed_ids_as_short_lived_misses(self, mock_request):
+        hit, miss = _paper("2601.10004"), _paper("2601.10005")
+        db.session.add_all([hit, miss])
+        db.session.commit()
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "results": [
+                {
+                    "id": "https://openalex.org/W4",
+                    "doi": "https://doi.org/10.48550/arxiv.2601.10004",
+                    "cited_by_count": 2,
+                    "referenced_works_count": 31,
+                    "topics": [],
+                }
+            ]
+        }
+        mock_request.return_value = mock_response
+
+        first = fetch_openalex_batch(["2601.10004", "2601.10005"])
+        second = fetch_openalex_batch(["2601.10004", "2601.10005"])
+
+        # Callers only ever see found works; the miss is remembered, not returned.
+        self.assertEqual(set(first), {"2601.10004"})
+        self.assertEqual(second, first)
+        self.assertEqual(first["2601.10004"]["referenced_works_count"], 31)
+        self.assertEqual(mock_request.call_count, 1)
+        miss_row = EnrichmentCache.query.filter_by(paper_id=miss.id, source="openalex").one()
+        self.assertEqual((miss_row.data, miss_row.ttl_hours), ({}, 24))
+
+        miss_row.fetched_at = now_utc() - timedelta(hours=25)
+        db.session.commit()
+        fetch_openalex_batch(["2601.10004", "2601.10005"])
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertIn("2601.10005", mock_request.call_args.kwargs["params"]["filter"])
+        self.assertNotIn("2601.10004", mock_request.call_args.kwargs["params"]["filter"])
+
+    @patch("app.services.openalex.request_with_backoff")
+    def test_openalex_failed_batch_is_not_cached_as_miss(self, mock_request):
+        db.session.add(_paper("2601.10006"))
+        db.session.commit()
+        mock_request.side_effect = RuntimeError("connection reset")
+
+        self.assertEqual(fetch_openalex_batch(["2601.10006"]), {})
+        self.assertEqual(EnrichmentCache.query.filter_by(source="openalex").count(), 0)
+
     @patch("app.services.citations.request_with_backoff")
     def test_stale_citation_cache_is_refreshed(self, mock_request):
         paper = _paper("2601.10003")
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, timedelta
 
 from app.models import Paper, db
-from app.services.export import generate_html_report
+from app.services.export import generate_html_report, iter_ranked_papers
 from app.services.text import now_utc
 from tests.helpers import FlaskDBTestCase
 
@@ -127,3 +127,31 @@ class ExportTests(FlaskDBTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertIn("Announcement Lagged Bibtex Paper", response.get_data(as_text=True))
+
+    def test_iter_ranked_papers_walks_keyset_batches_in_rank_order(self):
+        self._add_lagged_paper(arxiv_id="2601.0006", title="Tied Score Paper")
+        self._add_lagged_paper(arxiv_id="2601.0007", title="Other Tied Score Paper")
+        expected = [paper.id for paper in Paper.query.order_by(Paper.rank_score.desc(), Paper.id.desc()).all()]
+
+        self.assertEqual([paper.id for paper in iter_ranked_papers(Paper.query, batch_size=2)], expected)
+        visible = Paper.query.filter(Paper.is_hidden.is_(False))
+        self.assertEqual(len(list(iter_ranked_papers(visible, batch_size=1))), len(expected) - 1)
+
+    def test_exports_are_streamed(self):
+        client = self.app.test_client()
+        for url in ("/api/export?timeframe=all", "/api/export/bibtex?timeframe=all"):
+            with client.get(url) as response:
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.is_streamed)
+                self.assertNotIn("Content-Length", response.headers)
+
+        html = client.get("/api/export?timeframe=all").get_data(as_text=True)
+        self.assertIn("2 papers included", html)
+        self.assertLess(html.index("Visible Recent Paper"), html.index("Older Paper"))
+        self.assertNotIn("Hidden Paper", html)
+
+    def test_empty_export_renders_the_empty_state(self):
+        Paper.query.delete()
+        db.session.commit()
+        html = generate_html_report(self.app, timeframe="all")
+        self.assertIn("No papers available for this timeframe", html)
@@ -77,6 +77,25 @@ class FeedbackTests(FlaskDBTestCase):
         self.assertEqual(result["counts"]["skip"], 1)
         self.assertTrue(updated.is_hidden)
 
+    def test_stored_rank_score_follows_score_and_feedback(self):
+        from sqlalchemy import text
+
+        from app.models import RANK_SCORE_SQL
+        from app.services.ranking import FEEDBACK_BOOST, combined_rank_score
+
+        self.assertIn(f"* {FEEDBACK_BOOST}", RANK_SCORE_SQL)
+        paper = self._create_paper()
+        self.assertEqual(paper.rank_score, 12.5)
+
+        result = apply_feedback_action(paper.id, "save")
+        self.assertEqual(result["rank_score"], combined_rank_score(12.5, result["feedback_score"]))
+
+        # Writes that bypass the ORM keep it in step too.
+        db.session.execute(text("UPDATE papers SET paper_score = 3.25 WHERE id = :id"), {"id": paper.id})
+        db.session.commit()
+        refreshed = db.session.get(Paper, paper.id)
+        self.assertEqual(refreshed.rank_score, combined_rank_score(3.25, refreshed.feedback_score))
+
 
 if __name__ == "__main__":
     import unittest
@@ -0,0 +1,179 @@
+"""Tests for papers_fts maintenance: availability cache, batched inserts, merges, prefixes."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from app.models import Paper, SyncState, db
+from app.schema import ensure_schema
+from app.services.fts import (
+    FTS_AUTOMERGE,
+    FTS_CRISISMERGE,
+    OPTIMIZE_STATE_CATEGORY,
+    batched_fts_inserts,
+    deferred_fts_merges,
+    fts5_available,
+    reset_fts5_available,
+    run_fts_maintenance,
+)
+from app.services.search import _iter_bm25_pages, _sanitize_fts5_query, search_bm25
+from app.services.text import now_utc
+from tests.helpers import FlaskDBTestCase
+
+
+def _paper(idx: int, title: str) -> Paper:
+    today = date.today()
+    return Paper(
+        arxiv_id=f"2608.{idx:05d}",
+        title=title,
+        authors="Jane Doe",
+        link=f"https://arxiv.org/abs/2608.{idx:05d}",
+        pdf_link=f"https://arxiv.org/pdf/2608.{idx:05d}",
+        abstract_text="An abstract.",
+        topic_tags=["Robotics"],
+        match_type="Title",
+        matched_terms=["Vision"],
+        paper_score=1.0,
+        publication_date=today.isoformat(),
+        publication_dt=today,
+        scraped_date=today.isoformat(),
+    )
+
+
+def _trigger_exists() -> bool:
+    return (
+        db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'papers_fts_insert'")
+        ).scalar()
+        is not None
+    )
+
+
+def _fts_config(key: str) -> int | None:
+    return db.session.execute(text("SELECT v FROM papers_fts_config WHERE k = :k"), {"k": key}).scalar()
+
+
+class FtsMaintenanceTests(FlaskDBTestCase):
+    def setUp(self):
+        super().setUp()
+        # create_all() recreated ``papers`` without the FTS triggers; restore them.
+        ensure_schema()
+
+    def test_availability_is_probed_once_until_reset(self):
+        self.assertTrue(fts5_available())
+        db.session.execute(text("DROP TABLE papers_fts"))
+        db.session.commit()
+
+        self.assertTrue(fts5_available())
+        reset_fts5_available()
+        self.assertFalse(fts5_available())
+        self.assertEqual(search_bm25("vision"), [])
+
+    def test_batched_inserts_index_new_rows_and_restore_trigger(self):
+        db.session.add(_paper(1, "Existing diffusion paper"))
+        db.session.commit()
+
+        with batched_fts_inserts():
+            db.session.add_all([_paper(2, "Vision transformers"), _paper(3, "Vision mamba")])
+
+        self.assertTrue(_trigger_exists())
+        self.assertEqual(len(search_bm25("vision")), 2)
+        self.assertEqual(len(search_bm25("diffusion")), 1)
+
+        db.session.add(_paper(4, "Vision after the batch"))
+        db.session.commit()
+        self.assertEqual(len(search_bm25("vision")), 3)
+
+    def test_failed_batch_rolls_back_rows_and_keeps_trigger(self):
+        with self.assertRaises(RuntimeError):
+            with batched_fts_inserts():
+                db.session.add(_paper(1, "Vision transformers"))
+                db.session.flush()
+                raise RuntimeError("boom")
+
+        self.assertTrue(_trigger_exists())
+        self.assertEqual(Paper.query.count(), 0)
+        self.assertEqual(search_bm25("vision"), [])
+
+    def test_ensure_schema_restores_merge_settings_left_by_a_killed_scrape(self):
+        # The process died inside deferred_fts_merges(), so its finally never ran.
+        db.session.execute(text("INSERT INTO papers_fts(papers_fts, rank) VALUES ('automerge', 0)"))
+        db.session.execute(text("INSERT INTO papers_fts(papers_fts, rank) VALUES ('crisismerge', 64)"))
+        db.session.commit()
+
+        ensure_schema(skip_if_current=True)
+
+        self.assertEqual(_fts_config("automerge"), FTS_AUTOMERGE)
+        self.assertEqual(_fts_config("crisismerge"), FTS_CRISISMERGE)
+
+    def test_deferred_merges_restore_settings_and_optimize_once_per_interval(self):
+        with deferred_fts_merges():
+            self.assertEqual(_fts_config("automerge"), 0)
+            db.session.add(_paper(1, "Vision transformers"))
+            db.session.commit()
+
+        self.assertEqual(_fts_config("automerge"), FTS_AUTOMERGE)
+        state = SyncState.query.filter_by(category=OPTIMIZE_STATE_CATEGORY).one()
+        self.assertIsNotNone(state.last_synced_updated_at)
+        self.assertEqual(run_fts_maintenance(), "merge")
+
+        state.last_synced_updated_at = now_utc() - timedelta(hours=25)
+        db.session.commit()
+        self.assertEqual(run_fts_maintenance(), "optimize")
+        self.assertEqual(len(search_bm25("vision")), 1)
+
+    def test_prefix_search_matches_partial_last_word(self):
+        db.session.add_all([_paper(1, "Segmentation with transformers"), _paper(2, "Depth estimation")])
+        db.session.commit()
+
+        self.assertEqual(search_bm25("segm"), [])
+        self.assertEqual([pid for pid, _score in search_bm25("segm", prefix=True)], [1])
+        self.assertEqual(len(search_bm25("with transf", prefix=True)), 1)
+
+    def test_prefix_applies_to_last_token_of_two_or_more_characters(self):
+        self.assertEqual(_sanitize_fts5_query("vision tr", prefix=True), '"vision" "tr"*')
+        self.assertEqual(_sanitize_fts5_query("vision t", prefix=True), '"vision" "t"')
+        self.assertEqual(_sanitize_fts5_query("vision tr"), '"vision" "tr"')
+
+    def test_legacy_index_without_prefixes_is_rebuilt(self):
+        db.session.add(_paper(1, "Segmentation with transformers"))
+        db.session.commit()
+        db.session.execute(text("DROP TABLE papers_fts"))
+        db.session.execute(
+            text(
+                "CREATE VIRTUAL TABLE papers_fts USING fts5(title, abstract_text, authors, topic_tags, "
+                "content='papers', content_rowid='id', tokenize='porter unicode61')"
+            )
+        )
+        db.session.commit()
+
+        ensure_schema()
+
+        fts_sql = db.session.execute(text("SELECT sql FROM sqlite_master WHERE name = 'papers_fts'")).scalar()
+        self.assertIn("prefix='2 3'", fts_sql)
+        self.assertEqual(len(search_bm25("segm", prefix=True)), 1)
+
+    def test_search_api_prefix_flag(self):
+        db.session.add(_paper(1, "Segmentation with transformers"))
+        db.session.commit()
+        client = self.app.test_client()
+
+        response = client.get("/api/search?q=segm&mode=keyword&prefix=1")
+        self.assertEqual([row["paper_id"] for row in response.get_json()["results"]], [1])
+        self.assertEqual(client.get("/api/search?q=segm&mode=keyword").get_json()["results"], [])
+        self.assertEqual(client.get("/api/search?q=segm&prefix=maybe").status_code, 400)
+
+    def test_filtered_search_reads_past_limit_for_eligible_rows(self):
+        db.session.add_all([_paper(idx, f"Vision paper {idx}") for idx in range(1, 31)])
+        db.session.commit()
+        unfiltered = [pid for pid, _score in search_bm25("vision", limit=30)]
+        eligible = set(unfiltered[-3:])
+
+        filtered = search_bm25("vision", limit=2, paper_ids=eligible)
+
+        self.assertEqual([pid for pid, _score in filtered], unfiltered[-3:-1])
+        self.assertEqual(search_bm25("vision", limit=2, paper_ids=frozenset()), [])
+        pages = list(_iter_bm25_pages("vision", 3, 2, paper_ids=eligible))
+        self.assertEqual([len(page) for page in pages], [2, 1])
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock, Mock
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import requests
 
-from app.models import EnrichmentCache, Paper, db
-from app.services.enrichment_providers import GitHubProvider, extract_github_repo
+from app.models import EnrichmentCache, EnrichmentResourceCache, Paper, db
+from app.services.enrichment_providers import PROVIDER_STATS, GitHubProvider, extract_github_repo
+from app.services.rate_limiter import TokenBucketRateLimiter
+from app.services.text import now_utc
 from tests.helpers import FlaskDBTestCase
 
 
@@ -27,8 +34,8 @@ def _paper(arxiv_id: str) -> Paper:
     )
 
 
-def _repo_response(full_name: str, stars: int = 100) -> MagicMock:
-    response = MagicMock()
+def _repo_response(full_name: str, stars: int = 100, etag: str | None = None) -> MagicMock:
+    response = MagicMock(status_code=200, headers={"ETag": etag} if etag else {})
     response.json.return_value = {
         "full_name": full_name,
         "stargazers_count": stars,
@@ -43,6 +50,76 @@ def _http_error(status_code: int) -> requests.HTTPError:
     return requests.HTTPError(response=Mock(status_code=status_code))
 
 
+def _expire_caches() -> None:
+    """Age every per-paper and per-repo cache row past its TTL."""
+    stale = now_utc() - timedelta(days=30)
+    for model in (EnrichmentCache, EnrichmentResourceCache):
+        model.query.update({model.fetched_at: stale})
+    db.session.commit()
+
+
+class _FakeGitHubApi:
+    """Threaded ``/repos/<owner>/<repo>`` server with ETags and a configurable delay.
+
+    Answers ``If-None-Match`` with the current ETag by ``304``; records the peak
+    number of requests in flight at once.
+    """
+
+    def __init__(self, *, delay: float = 0.0):
+        self.delay = delay
+        self.hits = 0
+        self.not_modified = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                repo = self.path.removeprefix("/repos/")
+                etag = f'W/"{repo}-v1"'
+                with lock:
+                    server.hits += 1
+                    server.in_flight += 1
+                    server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+                time.sleep(server.delay)
+                with lock:
+                    server.in_flight -= 1
+                if self.headers.get("If-None-Match") == etag:
+                    with lock:
+                        server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                body = f'{{"full_name": "{repo}", "stargazers_count": 7, "license": null}}'.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url_template(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/repos/{{repo}}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
 class ExtractGithubRepoTests(unittest.TestCase):
     def test_parses_owner_repo_from_code_link(self):
         links = [{"type": "code", "label": "Code", "url": "https://github.com/lab/model/tree/main"}]
@@ -175,6 +252,120 @@ class GitHubProviderTests(FlaskDBTestCase):
         headers = request_fn.call_args.kwargs["headers"]
         self.assertEqual(headers["Authorization"], "Bearer tok-123")
 
+    def test_papers_sharing_a_repo_cost_one_request(self):
+        db.session.add_all([_paper("2606.00010"), _paper("2606.00011"), _paper("2606.00012")])
+        db.session.commit()
+
+        request_fn = MagicMock(side_effect=[_repo_response("Lab/Model", stars=5), _repo_response("lab/other")])
+        provider = GitHubProvider(request_fn=request_fn)
+        # GitHub repo names are case-insensitive, so both spellings share one fetch.
+        repos = {"2606.00010": "lab/model", "2606.00011": "Lab/Model", "2606.00012": "lab/other"}
+
+        payloads = provider.fetch_batch(list(repos), repos_by_arxiv_id=repos)
+
+        self.assertEqual(request_fn.call_count, 2)
+        self.assertEqual(payloads["2606.00010"]["github_stars"], 5)
+        self.assertEqual(payloads["2606.00011"]["github_stars"], 5)
+        self.assertEqual(EnrichmentResourceCache.query.filter_by(source="github").count(), 2)
+
+    def test_fresh_repo_row_answers_new_papers_without_a_request(self):
+        db.session.add_all([_paper("2606.00013"), _paper("2606.00014")])
+        db.session.commit()
+
+        request_fn = MagicMock(return_value=_repo_response("lab/model", stars=9))
+        provider = GitHubProvider(request_fn=request_fn)
+        provider.fetch_batch(["2606.00013"], repos_by_arxiv_id={"2606.00013": "lab/model"})
+
+        PROVIDER_STATS.reset()
+        later = provider.fetch_batch(["2606.00014"], repos_by_arxiv_id={"2606.00014": "lab/model"})
+
+        self.assertEqual(request_fn.call_count, 1)
+        self.assertEqual(later["2606.00014"]["github_stars"], 9)
+        stats = PROVIDER_STATS.stats()["github"]
+        self.assertEqual((stats["lookups"], stats["cache_hits"], stats["requests"]), (1, 1, 0))
+
+    def test_stale_repo_is_revalidated_and_304_reuses_cached_data(self):
+        db.session.add(_paper("2606.00015"))
+        db.session.commit()
+        repos = {"2606.00015": "lab/model"}
+
+        first = GitHubProvider(request_fn=MagicMock(return_value=_repo_response("lab/model", 42, etag='W/"v1"')))
+        first.fetch_batch(["2606.00015"], repos_by_arxiv_id=repos)
+        _expire_caches()
+
+        request_fn = MagicMock(return_value=MagicMock(status_code=304, headers={"ETag": 'W/"v1"'}))
+        payloads = GitHubProvider(request_fn=request_fn).fetch_batch(["2606.00015"], repos_by_arxiv_id=repos)
+
+        self.assertEqual(request_fn.call_args.kwargs["headers"]["If-None-Match"], 'W/"v1"')
+        self.assertEqual(payloads["2606.00015"]["github_stars"], 42)
+        row = EnrichmentResourceCache.query.filter_by(source="github", resource_key="lab/model").one()
+        self.assertTrue(row.is_fresh())
+        self.assertEqual(row.etag, 'W/"v1"')
+
+    def test_not_modified_raised_as_status_error_counts_as_revalidated(self):
+        # The async path raises a 304 as httpx.HTTPStatusError instead of returning it.
+        db.session.add(_paper("2606.00016"))
+        db.session.commit()
+        repos = {"2606.00016": "lab/model"}
+        GitHubProvider(request_fn=MagicMock(return_value=_repo_response("lab/model", 3, etag='"v1"'))).fetch_batch(
+            ["2606.00016"], repos_by_arxiv_id=repos
+        )
+        _expire_caches()
+
+        request = httpx.Request("GET", "https://api.github.com/repos/lab/model")
+        not_modified = httpx.HTTPStatusError("304", request=request, response=httpx.Response(304, request=request))
+        provider = GitHubProvider(request_fn=MagicMock(side_effect=not_modified))
+        payloads = provider.fetch_batch(["2606.00016"], repos_by_arxiv_id=repos)
+
+        self.assertEqual(payloads["2606.00016"]["github_stars"], 3)
+        self.assertFalse(provider.rate_limited)
+
+
+class GitHubConcurrentFetchTests(FlaskDBTestCase):
+    def setUp(self):
+        super().setUp()
+        PROVIDER_STATS.reset()
+        fast = TokenBucketRateLimiter(requests_per_second=1000, burst=1000)
+        limiter_patch = patch("app.services.http_client.get_shared_rate_limiter", return_value=fast)
+        limiter_patch.start()
+        self.addCleanup(limiter_patch.stop)
+
+    def test_fetches_concurrently_within_the_limit_then_revalidates_with_etags(self):
+        arxiv_ids = [f"2606.{idx:05d}" for idx in range(100, 106)]
+        db.session.add_all([_paper(arxiv_id) for arxiv_id in arxiv_ids])
+        db.session.commit()
+        repos = {arxiv_id: f"lab/repo{idx}" for idx, arxiv_id in enumerate(arxiv_ids)}
+
+        with (
+            _FakeGitHubApi(delay=0.2) as api,
+            patch("app.services.enrichment_providers.github.GITHUB_REPO_API_URL", api.url_template()),
+        ):
+            provider = GitHubProvider(concurrency=3)
+            with requests.Session() as session:
+                first = provider.fetch_batch(arxiv_ids, repos_by_arxiv_id=repos, session=session)
+            self.assertEqual(api.peak_in_flight, 3)
+
+            _expire_caches()
+            with requests.Session() as session:
+                second = provider.fetch_batch(arxiv_ids, repos_by_arxiv_id=repos, session=session)
+
+        self.assertEqual(api.hits, 12)
+        self.assertEqual(api.not_modified, 6)
+        self.assertEqual(second, first)
+        self.assertEqual(second["2606.00103"]["github_repo"], "lab/repo3")
+        stats = PROVIDER_STATS.stats()["github"]
+        self.assertEqual((stats["requests"], stats["not_modified"], stats["errors"]), (12, 6, 0))
+        self.assertGreaterEqual(stats["max_latency_ms"], 200)
+
+    def test_stats_endpoint_reports_provider_counters(self):
+        PROVIDER_STATS.record("github", lookups=4, cache_hits=3)
+        PROVIDER_STATS.record_latency("github", 0.25)
+
+        stats = self.app.test_client().get("/api/enrichment/stats").get_json()
+
+        self.assertEqual(stats["github"]["hit_ratio"], 0.75)
+        self.assertEqual(stats["github"]["avg_latency_ms"], 250.0)
+
 
 if __name__ == "__main__":
     unittest.main()
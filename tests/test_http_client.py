@@ -122,6 +122,28 @@ class HttpClientTests(unittest.TestCase):
 
         self.assertEqual(session._cv_arxiv_rate_limit_settings.profile, "bulk")
 
+    def test_rate_limit_scope_gives_each_host_its_own_bucket(self):
+        semantic = create_session(rate_limit_profile="bulk", rate_limit_scope="api.semanticscholar.org")
+        openalex = create_session(rate_limit_profile="bulk", rate_limit_scope="api.openalex.org")
+        unscoped = create_session(rate_limit_profile="bulk")
+        for session in (semantic, openalex, unscoped):
+            self.addCleanup(session.close)
+
+        self.assertIsNot(semantic._cv_arxiv_rate_limiter, openalex._cv_arxiv_rate_limiter)
+        self.assertIsNot(semantic._cv_arxiv_rate_limiter, unscoped._cv_arxiv_rate_limiter)
+        again = create_session(rate_limit_profile="bulk", rate_limit_scope="api.semanticscholar.org")
+        self.addCleanup(again.close)
+        self.assertIs(again._cv_arxiv_rate_limiter, semantic._cv_arxiv_rate_limiter)
+
+        # Reconfiguring the profile mid-flight keeps the session on its scoped bucket.
+        response = Mock(spec=requests.Response)
+        response.raise_for_status.return_value = None
+        semantic.request = Mock(return_value=response)
+        request_with_backoff("GET", "https://example.invalid/data", session=semantic, rate_limit_profile="interactive")
+        interactive_unscoped = create_session(rate_limit_profile="interactive")
+        self.addCleanup(interactive_unscoped.close)
+        self.assertIsNot(semantic._cv_arxiv_rate_limiter, interactive_unscoped._cv_arxiv_rate_limiter)
+
 
 class RetryPolicyTests(unittest.TestCase):
     # A generous rate limit so the token bucket never sleeps and the tests stay fast;
@@ -9,6 +9,7 @@ import requests
 
 from app.models import EnrichmentCache, Paper, db
 from app.services.enrichment_providers import (
+    PROVIDER_STATS,
     HuggingFaceProvider,
     huggingface_resource_links,
     parse_hf_paper,
@@ -184,6 +185,20 @@ class HuggingFaceProviderTests(FlaskDBTestCase):
         self.assertEqual(payloads, {})
         self.assertEqual(EnrichmentCache.query.filter_by(source="huggingface").count(), 0)
 
+    def test_records_lookup_hit_and_error_counters(self):
+        db.session.add_all([_paper("2606.00010"), _paper("2606.00011"), _paper("2606.00012")])
+        db.session.commit()
+        HuggingFaceProvider(request_fn=MagicMock(return_value=_hf_response())).fetch_batch(["2606.00010"])
+        PROVIDER_STATS.reset()
+
+        request_fn = MagicMock(side_effect=[_http_error(404), _http_error(500)])
+        HuggingFaceProvider(request_fn=request_fn).fetch_batch(["2606.00010", "2606.00011", "2606.00012"])
+
+        stats = PROVIDER_STATS.stats()["huggingface"]
+        # The 404 is HF's normal "not featured" miss, not an error.
+        self.assertEqual((stats["lookups"], stats["cache_hits"], stats["errors"]), (3, 1, 1))
+        self.assertAlmostEqual(stats["hit_ratio"], 0.3333)
+
 
 class ScrapeEnrichmentTests(FlaskDBTestCase):
     @patch("app.services.enrichment_providers.HuggingFaceProvider")
@@ -219,7 +234,7 @@ class ScrapeEnrichmentTests(FlaskDBTestCase):
             },
             {"arxiv_id": "2607.00777", "resource_links": []},
         ]
-        _enrich_results_with_huggingface(self.app, results, None, self.app.config["SCRAPER_CONFIG"])
+        _enrich_results_with_huggingface(self.app, results, self.app.config["SCRAPER_CONFIG"])
 
         stored_existing = Paper.query.filter_by(arxiv_id="2607.00666").one()
         # Fill-only: the pre-existing repo is never overwritten, and the original
@@ -250,7 +265,7 @@ class ScrapeEnrichmentTests(FlaskDBTestCase):
 
         config = dict(self.app.config["SCRAPER_CONFIG"])
         config["huggingface"] = {"enabled": False}
-        _enrich_results_with_huggingface(self.app, [{"arxiv_id": "2607.00888"}], None, config)
+        _enrich_results_with_huggingface(self.app, [{"arxiv_id": "2607.00888"}], config)
 
         mock_provider_cls.assert_not_called()
 
@@ -263,9 +278,7 @@ class ScrapeEnrichmentTests(FlaskDBTestCase):
         mock_provider_cls.return_value.fetch_batch.side_effect = RuntimeError("boom")
 
         # Must not raise: enrichment is best-effort and never crashes the scrape.
-        _enrich_results_with_huggingface(
-            self.app, [{"arxiv_id": "2607.00999"}], None, self.app.config["SCRAPER_CONFIG"]
-        )
+        _enrich_results_with_huggingface(self.app, [{"arxiv_id": "2607.00999"}], self.app.config["SCRAPER_CONFIG"])
 
         self.assertIsNone(Paper.query.filter_by(arxiv_id="2607.00999").one().hf_upvotes)
 
@@ -5,9 +5,14 @@ from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
+from defusedxml import EntitiesForbidden
+from requests.exceptions import ChunkedEncodingError, HTTPError
+
 from app.services.arxiv_adapter import result_to_entry
 from app.services.enrichment import parse_feed_entries, query_arxiv_api
+from app.services.http_client import ResponseTooLargeError
 from app.services.ingest import ArxivApiBackend, PaperCandidate, RssFeedBackend
+from app.services.ingest.arxiv_api_backend import iter_atom_candidates
 from app.services.ingest.base import clean_abstract, parse_publication_dt
 
 RSS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -75,6 +80,14 @@ ARXIV_API_XML_RESUME_SECOND_PAGE = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+def _atom_response(xml: str) -> Mock:
+    """A ``stream=True`` API response that delivers ``xml`` in 64-byte chunks."""
+    body = xml.encode("utf-8")
+    response = Mock(headers={})
+    response.iter_content.side_effect = lambda chunk_size: (body[i : i + 64] for i in range(0, len(body), 64))
+    return response
+
+
 class IngestBaseHelperTests(TestCase):
     def test_parse_publication_dt_handles_rfc2822_rss_dates(self):
         self.assertEqual(
@@ -159,7 +172,7 @@ class RssFeedBackendTests(TestCase):
 class ArxivApiBackendTests(TestCase):
     @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
     def test_fetch_builds_submitted_date_query_and_returns_candidates(self, mock_request):
-        mock_request.return_value = Mock(text=ARXIV_API_XML_PAGE_ONE)
+        mock_request.return_value = _atom_response(ARXIV_API_XML_PAGE_ONE)
         backend = ArxivApiBackend()
         candidates = backend.fetch(
             categories=["cs.CV", "cs.LG"],
@@ -195,6 +208,116 @@ class ArxivApiBackendTests(TestCase):
 
         mock_request.assert_called_once()
 
+    @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
+    def test_iter_pages_requests_the_next_page_only_on_demand(self, mock_request):
+        mock_request.side_effect = [
+            _atom_response(ARXIV_API_XML_RESUME_FIRST_PAGE),
+            _atom_response(ARXIV_API_XML_RESUME_SECOND_PAGE),
+        ]
+        backend = ArxivApiBackend(page_size=2, delay_seconds=0)
+        pages = backend.iter_pages(
+            categories=["cs.CV"],
+            start_dt=date(2026, 4, 1),
+            end_dt=date(2026, 4, 2),
+            max_results=25,
+        )
+
+        first = next(pages)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(first), 2)
+        pages.close()
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_iter_atom_candidates_yields_each_entry_before_the_body_is_consumed(self):
+        body = ARXIV_API_XML_RESUME_FIRST_PAGE.encode("utf-8")
+        chunks = [body[i : i + 32] for i in range(0, len(body), 32)]
+        consumed = []
+
+        def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        candidates = iter_atom_candidates(stream())
+        first = next(candidates)
+
+        self.assertEqual(first.arxiv_id, "2604.00003")
+        self.assertEqual(first.authors_list, ["Author A"])
+        self.assertLess(len(consumed), len(chunks))
+        self.assertEqual([c.arxiv_id for c in candidates], ["2604.00004"])
+        self.assertEqual(len(consumed), len(chunks))
+
+    def test_iter_atom_candidates_rejects_entity_declarations(self):
+        xml = b'<?xml version="1.0"?><!DOCTYPE feed [<!ENTITY x "boom">]><feed>&x;</feed>'
+
+        with self.assertRaises(EntitiesForbidden):
+            list(iter_atom_candidates([xml]))
+
+    @patch("app.services.ingest.arxiv_api_backend.time.sleep")
+    @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
+    def test_page_cut_off_mid_body_is_requested_again(self, mock_request, _sleep):
+        body = ARXIV_API_XML_PAGE_ONE.encode("utf-8")
+
+        def broken_stream(chunk_size):
+            yield body[:100]
+            raise ChunkedEncodingError("connection reset")
+
+        broken = Mock(headers={})
+        broken.iter_content.side_effect = broken_stream
+        mock_request.side_effect = [broken, _atom_response(ARXIV_API_XML_PAGE_ONE)]
+
+        candidates = ArxivApiBackend().fetch(
+            categories=["cs.CV"], start_dt=date(2026, 4, 1), end_dt=date(2026, 4, 2), max_results=25
+        )
+
+        self.assertEqual([c.arxiv_id for c in candidates], ["2604.00002"])
+        self.assertEqual(mock_request.call_count, 2)
+        broken.close.assert_called_once_with()
+
+    @patch("app.services.ingest.arxiv_api_backend.time.sleep")
+    @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
+    def test_failed_page_request_is_not_retried_again(self, mock_request, sleep):
+        # request_with_backoff already retried (or refused to retry) the request;
+        # only a body lost mid-download is worth another request here.
+        mock_request.side_effect = HTTPError("400 Client Error")
+
+        with self.assertRaises(HTTPError):
+            ArxivApiBackend().fetch(
+                categories=["cs.CV"], start_dt=date(2026, 4, 1), end_dt=date(2026, 4, 2), max_results=25
+            )
+        self.assertEqual(mock_request.call_count, 1)
+        sleep.assert_not_called()
+
+    @patch("app.services.ingest.arxiv_api_backend.time.sleep")
+    @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
+    def test_page_cut_off_on_every_attempt_gives_up(self, mock_request, _sleep):
+        def broken_stream(chunk_size):
+            yield b"<feed>"
+            raise ChunkedEncodingError("connection reset")
+
+        broken = Mock(headers={})
+        broken.iter_content.side_effect = broken_stream
+        mock_request.return_value = broken
+
+        with self.assertRaises(ChunkedEncodingError):
+            ArxivApiBackend().fetch(
+                categories=["cs.CV"], start_dt=date(2026, 4, 1), end_dt=date(2026, 4, 2), max_results=25
+            )
+        self.assertEqual(mock_request.call_count, 4)
+        self.assertEqual(broken.close.call_count, 4)
+
+    @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
+    def test_oversized_page_is_rejected_while_streaming(self, mock_request):
+        response = Mock(headers={})
+        response.iter_content.side_effect = lambda chunk_size: iter([b"<feed>" + b" " * (26 * 1024 * 1024)])
+        mock_request.return_value = response
+
+        with self.assertRaises(ResponseTooLargeError):
+            ArxivApiBackend().fetch(
+                categories=["cs.CV"], start_dt=date(2026, 4, 1), end_dt=date(2026, 4, 2), max_results=25
+            )
+        self.assertEqual(mock_request.call_args.kwargs["stream"], True)
+
     @patch("app.services.ingest.arxiv_api_backend.ArxivApiBackend.fetch")
     def test_query_arxiv_api_preserves_legacy_dict_shape(self, mock_fetch):
         mock_fetch.return_value = [
@@ -218,8 +341,8 @@ class ArxivApiBackendTests(TestCase):
     @patch("app.services.ingest.arxiv_api_backend.request_with_backoff")
     def test_fetch_resumes_from_offset_and_skips_processed_cursor(self, mock_request):
         mock_request.side_effect = [
-            Mock(text=ARXIV_API_XML_RESUME_FIRST_PAGE),
-            Mock(text=ARXIV_API_XML_RESUME_SECOND_PAGE),
+            _atom_response(ARXIV_API_XML_RESUME_FIRST_PAGE),
+            _atom_response(ARXIV_API_XML_RESUME_SECOND_PAGE),
         ]
         progress: list[tuple[int, str | None]] = []
 
@@ -245,8 +368,8 @@ class ArxivApiBackendTests(TestCase):
         # withdrawals). The resumed page must still be returned, not silently
         # skipped while waiting to re-find a cursor that is no longer there.
         mock_request.side_effect = [
-            Mock(text=ARXIV_API_XML_RESUME_FIRST_PAGE),
-            Mock(text=ARXIV_API_XML_RESUME_SECOND_PAGE),
+            _atom_response(ARXIV_API_XML_RESUME_FIRST_PAGE),
+            _atom_response(ARXIV_API_XML_RESUME_SECOND_PAGE),
         ]
 
         backend = ArxivApiBackend(page_size=2)
@@ -36,7 +36,7 @@ class ScrapeJobErrorTests(FlaskDBTestCase):
     def test_success_sets_status_to_finished(self):
         """Normal completion should set status to 'finished' with a 'done' event."""
 
-        def fake_scrape(app, event_callback=None, force=False):
+        def fake_scrape(app, event_callback=None, force=False, cancel_event=None):
             event_callback("done", {"new_papers": 1, "duplicates_skipped": 0, "total_matched": 1, "total_in_feed": 5})
             return {}
 
@@ -49,6 +49,28 @@ class ScrapeJobErrorTests(FlaskDBTestCase):
         self.assertIn("done", event_types)
         self.assertNotIn("scrape_error", event_types)
 
+    def test_cancel_sets_the_historical_jobs_cancel_event(self):
+        started = Event()
+
+        def fake_historical(app, categories, start_dt, end_dt, *, event_callback=None, cancel_event=None):
+            started.set()
+            cancel_event.wait(timeout=5)
+            event_callback("done", {"new_papers": 2, "cancelled": cancel_event.is_set()})
+
+        with patch("app.services.jobs.execute_historical_scrape", side_effect=fake_historical):
+            job, _started = self.manager.start_historical(self.app, ["cs.CV"], None, None)
+            self.assertTrue(started.wait(timeout=5))
+            # A second request while one runs gets the active job back.
+            self.assertEqual(self.manager.start_historical(self.app, ["cs.LG"], None, None), (job, False))
+            self.assertIsNone(self.manager.cancel_historical("unknown"))
+            self.assertIs(self.manager.cancel_historical(job.id), job)
+            events = list(self.manager.stream_events(job.id, heartbeat_seconds=1))
+
+        self.assertEqual(events[-1], ("done", {"new_papers": 2, "cancelled": True}))
+        self.assertEqual(job.status, "finished")
+        # A finished historical search never masquerades as the daily scrape's status.
+        self.assertEqual(self.manager.get_status_snapshot(), {"running": False})
+
     def test_stream_events_missing_job_yields_scrape_error_only(self):
         """Streaming a non-existent job should yield scrape_error and stop."""
         events = list(self.manager.stream_events("nonexistent"))
@@ -56,7 +78,7 @@ class ScrapeJobErrorTests(FlaskDBTestCase):
         self.assertEqual(events[0][0], "scrape_error")
 
     def test_skipped_sets_status_and_stream_terminates(self):
-        def fake_scrape(app, event_callback=None, force=False):
+        def fake_scrape(app, event_callback=None, force=False, cancel_event=None):
             event_callback("skipped", {"skipped": True, "reason": "Already scraped today"})
             return {"skipped": True}
 
@@ -72,7 +94,7 @@ class ScrapeJobErrorTests(FlaskDBTestCase):
     def test_force_rerun_after_skipped_creates_new_job(self):
         barrier = Event()
 
-        def fake_scrape(app, event_callback=None, force=False):
+        def fake_scrape(app, event_callback=None, force=False, cancel_event=None):
             if force:
                 event_callback(
                     "done", {"new_papers": 1, "duplicates_skipped": 0, "total_matched": 1, "total_in_feed": 1}
@@ -102,7 +124,7 @@ class ScrapeJobErrorTests(FlaskDBTestCase):
     def test_force_flag_is_forwarded_to_execute_scrape(self):
         observed_forces: list[bool] = []
 
-        def fake_scrape(app, event_callback=None, force=False):
+        def fake_scrape(app, event_callback=None, force=False, cancel_event=None):
             observed_forces.append(force)
             event_callback("done", {"new_papers": 0, "duplicates_skipped": 0, "total_matched": 0, "total_in_feed": 0})
             return {}
@@ -131,7 +153,7 @@ class StatusSnapshotTests(FlaskDBTestCase):
 
         barrier = threading.Event()
 
-        def blocking_scrape(app, event_callback=None, force=False):
+        def blocking_scrape(app, event_callback=None, force=False, cancel_event=None):
             barrier.wait(timeout=5)
             event_callback("done", {"new_papers": 0, "duplicates_skipped": 0, "total_matched": 0, "total_in_feed": 0})
 
@@ -153,7 +175,7 @@ class StatusSnapshotTests(FlaskDBTestCase):
         self.assertEqual(snap["terminal_status"], "error")
 
     def test_snapshot_after_success_returns_terminal_finished(self):
-        def fake_scrape(app, event_callback=None, force=False):
+        def fake_scrape(app, event_callback=None, force=False, cancel_event=None):
             event_callback("done", {"new_papers": 0, "duplicates_skipped": 0, "total_matched": 0, "total_in_feed": 0})
 
         with patch("app.services.jobs.execute_scrape", side_effect=fake_scrape):
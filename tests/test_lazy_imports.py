@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from app.services.lazy_imports import LazyModule, lazy_module
+
+
+def test_lazy_module_defers_import_until_first_attribute_access():
+    proxy = lazy_module("json")
+    assert isinstance(proxy, LazyModule)
+    assert not proxy.is_loaded
+
+    assert proxy.dumps({"a": 1}) == '{"a": 1}'
+    assert proxy.is_loaded
+    assert proxy.loads is json.loads
+
+
+def test_lazy_module_patch_restores_without_touching_real_module():
+    proxy = lazy_module("json")
+    sentinel = object()
+    with patch.object(proxy, "dumps", sentinel):
+        assert proxy.dumps is sentinel
+        assert sys.modules["json"].dumps is not sentinel
+    assert proxy.dumps is json.dumps
+
+
+def test_lazy_module_missing_attribute_raises_attribute_error():
+    proxy = lazy_module("json")
+    with pytest.raises(AttributeError):
+        proxy.no_such_attribute  # noqa: B018
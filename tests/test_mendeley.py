@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 from app.services.mendeley import MendeleyClient
+from tests.helpers import route_session_requests_to_verb_mocks
 
 
 def _make_paper():
@@ -31,6 +32,7 @@ class MendeleyClientTests(unittest.TestCase):
         self.tmpdir = Path(self._tmpdir.name)
         self.creds_path = self.tmpdir / "mendeley_credentials.json"
         self.token_path = self.tmpdir / ".mendeley_token"
+        route_session_requests_to_verb_mocks(self)
 
     def tearDown(self):
         self._tmpdir.cleanup()
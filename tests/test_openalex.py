@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import requests
+
+from app.services.enrichment_providers.openalex_provider import OPENALEX_SELECT_FIELDS, pack_doi_batches
 from app.services.openalex import _parse_openalex_work, fetch_openalex_batch
 
 
@@ -36,6 +39,10 @@ class TestParseOpenalexWork:
         assert result["openalex_cited_by_count"] == 0
         assert result["referenced_works_count"] == 0
 
+    def test_selected_reference_count_is_used_directly(self):
+        work = {"id": "https://openalex.org/W1", "referenced_works_count": 57}
+        assert _parse_openalex_work(work)["referenced_works_count"] == 57
+
     def test_missing_open_access(self):
         work = {"id": "https://openalex.org/W1", "topics": []}
         result = _parse_openalex_work(work)
@@ -59,6 +66,36 @@ class TestParseOpenalexWork:
         assert result["referenced_works_count"] == 0
 
 
+class TestPackDoiBatches:
+    def test_packs_up_to_the_or_filter_value_limit(self):
+        ids = [f"2601.{idx:05d}" for idx in range(250)]
+        assert [len(batch) for batch in pack_doi_batches(ids)] == [100, 100, 50]
+
+    def test_long_ids_split_at_the_url_length_limit(self):
+        ids = [f"hep-th/99{idx:05d}" for idx in range(60)]
+        with patch("app.services.enrichment_providers.openalex_provider._MAX_URL_LENGTH", 1000):
+            batches = pack_doi_batches(ids, email="me@example.com")
+
+        assert sum(batches, []) == ids
+        assert len(batches) == 3
+        for batch in batches:
+            url = (
+                requests.Request(
+                    "GET",
+                    "https://api.openalex.org/works",
+                    params={
+                        "filter": "doi:" + "|".join(f"10.48550/arXiv.{aid}" for aid in batch),
+                        "select": OPENALEX_SELECT_FIELDS,
+                        "per_page": "100",
+                        "mailto": "me@example.com",
+                    },
+                )
+                .prepare()
+                .url
+            )
+            assert len(url) <= 1000
+
+
 class TestFetchOpenalexBatch:
     def test_empty_ids(self):
         assert fetch_openalex_batch([]) == {}
@@ -166,6 +203,19 @@ class TestFetchOpenalexBatch:
         assert "2301.00002" in result
         assert result["2301.00002"]["oa_status"] == "gold"
 
+    @patch("app.services.openalex.request_with_backoff")
+    def test_requests_one_packed_batch_with_projected_fields(self, mock_request):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"results": []}
+        mock_request.return_value = mock_response
+
+        fetch_openalex_batch([f"2301.{idx:05d}" for idx in range(80)])
+
+        assert mock_request.call_count == 1
+        params = mock_request.call_args.kwargs["params"]
+        assert params["filter"].count("|") == 79
+        assert params["select"] == "id,doi,open_access,cited_by_count,referenced_works_count,topics"
+
     @patch("app.services.openalex.request_with_backoff")
     def test_email_parameter(self, mock_request):
         mock_response = MagicMock()
@@ -0,0 +1,107 @@
+"""Tests for the FAISS-backed paper similarity graph (``/api/papers/<id>/graph``)."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+
+from app.models import Paper, db
+from app.services.embeddings import EmbeddingService
+from app.services.paper_graph import build_paper_graph
+from tests.helpers import FlaskDBTestCase
+
+
+def _paper(idx: int, *, score: float) -> Paper:
+    today = date.today()
+    return Paper(
+        arxiv_id=f"2610.{idx:05d}",
+        title=f"Paper {idx}",
+        authors="Jane Doe",
+        link=f"https://arxiv.org/abs/2610.{idx:05d}",
+        pdf_link=f"https://arxiv.org/pdf/2610.{idx:05d}",
+        match_type="Title",
+        matched_terms=[],
+        paper_score=score,
+        publication_date=today.isoformat(),
+        publication_dt=today,
+        scraped_date=today.isoformat(),
+    )
+
+
+class PaperGraphTests(FlaskDBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = self.app.test_client()
+        # Paper scores rise with the index, so the former "top 100 by score" pool is
+        # biased towards the papers least similar to paper 0.
+        papers = [_paper(idx, score=float(idx)) for idx in range(40)]
+        db.session.add_all(papers)
+        db.session.commit()
+        self.ids = [paper.id for paper in papers]
+
+        rng = np.random.default_rng(48)
+        base = rng.standard_normal(768)
+        # Similarity to paper 0 falls off with the index.
+        self.vectors = np.stack([base + 0.15 * idx * rng.standard_normal(768) for idx in range(40)]).astype(np.float32)
+        self.vectors /= np.linalg.norm(self.vectors, axis=1, keepdims=True)
+        self.service = EmbeddingService(str(self.app.instance_path) + "/graph_index")
+        self.service.add_papers(self.ids[:-1], [""] * 39, vectors=list(self.vectors[:-1]))
+        patcher = patch("app.services.embeddings.get_embedding_service", return_value=self.service)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _true_neighbours(self, row: int, k: int) -> list[int]:
+        sims = self.vectors[:-1] @ self.vectors[row]
+        order = [idx for idx in np.argsort(-sims) if idx != row]
+        return [self.ids[idx] for idx in order[:k]]
+
+    def test_one_hop_uses_true_nearest_neighbours(self):
+        graph = build_paper_graph(db.session.get(Paper, self.ids[0]), k=5)
+
+        self.assertEqual(graph["method"], "embedding")
+        self.assertEqual([node["id"] for node in graph["nodes"] if node["hop"] == 1], self._true_neighbours(0, 5))
+        center_edges = [edge for edge in graph["edges"] if edge["source"] == self.ids[0]]
+        self.assertEqual(len(center_edges), 5)
+        first = center_edges[0]
+        expected = float(self.vectors[0] @ self.vectors[self.ids.index(first["target"])])
+        self.assertAlmostEqual(first["similarity"], expected, places=3)
+        # Links among the neighbours come from the pairwise matrix.
+        self.assertTrue(any(edge["source"] != self.ids[0] for edge in graph["edges"]))
+
+    def test_multi_hop_expands_each_neighbour(self):
+        graph = build_paper_graph(db.session.get(Paper, self.ids[0]), k=4, hops=2)
+
+        hops = [node["hop"] for node in graph["nodes"]]
+        self.assertEqual(hops.count(0), 1)
+        self.assertEqual(hops.count(1), 4)
+        self.assertGreater(hops.count(2), 0)
+        self.assertEqual(len({node["id"] for node in graph["nodes"]}), len(graph["nodes"]))
+
+    def test_graph_is_cached_until_data_changes(self):
+        paper = db.session.get(Paper, self.ids[0])
+        with patch.object(self.service, "search_by_id", wraps=self.service.search_by_id) as search:
+            first = build_paper_graph(paper, k=5)
+            self.assertIs(build_paper_graph(paper, k=5), first)
+            self.assertEqual(search.call_count, 1)
+
+            paper.title = "Renamed"
+            db.session.commit()
+            second = build_paper_graph(paper, k=5)
+
+        self.assertEqual(search.call_count, 2)
+        self.assertEqual(second["nodes"][0]["title"], "Renamed")
+
+    def test_unembedded_paper_falls_back_to_token_similarity(self):
+        graph = build_paper_graph(db.session.get(Paper, self.ids[-1]))
+
+        self.assertEqual(graph["method"], "tokens")
+        self.assertEqual(graph["nodes"][0]["id"], self.ids[-1])
+
+    def test_api_validates_graph_params(self):
+        response = self.client.get(f"/api/papers/{self.ids[0]}/graph?k=3&hops=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["method"], "embedding")
+        self.assertEqual(self.client.get(f"/api/papers/{self.ids[0]}/graph?hops=9").status_code, 400)
+        self.assertEqual(self.client.get(f"/api/papers/{self.ids[0]}/graph?k=x").status_code, 400)
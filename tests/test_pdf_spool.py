@@ -0,0 +1,183 @@
+"""Tests for the scrape PDF spool (app.services.pdf_spool) and the pipeline memory budget."""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from app.services.pdf_spool import PdfSpool, SpooledPdf, pdf_head, pdf_source
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class PdfSpoolTests(unittest.TestCase):
+    def test_put_discard_and_close_track_disk_usage(self):
+        spool = PdfSpool()
+        first = spool.put(b"%PDF-1.4 first")
+        second = spool.put(b"%PDF-1.4 second!")
+
+        self.assertEqual(first.read_bytes(), b"%PDF-1.4 first")
+        self.assertEqual(spool.spooled_bytes, first.size + second.size)
+        self.assertEqual(os.fspath(second), second.path)
+
+        spool.discard(first)
+        self.assertFalse(os.path.exists(first.path))
+        self.assertEqual(spool.spooled_bytes, second.size)
+        spool.discard(first)  # already gone: no double count
+        self.assertEqual(spool.spooled_bytes, second.size)
+
+        spool.close()
+        self.assertFalse(os.path.exists(spool.directory))
+        with self.assertRaises(RuntimeError):
+            spool.put(b"late")
+
+    def test_handle_pickles_as_path_not_body(self):
+        with PdfSpool() as spool:
+            pdf = spool.put(b"%PDF-" + b"x" * 100_000)
+            self.assertLess(len(pickle.dumps(pdf)), 1_000)
+            self.assertEqual(pickle.loads(pickle.dumps(pdf)), pdf)
+
+    def test_helpers_accept_bytes_and_handles(self):
+        with PdfSpool() as spool:
+            pdf = spool.put(b"%PDF-1.7 body")
+            self.assertEqual(pdf_source(pdf), pdf.path)
+            self.assertEqual(pdf_head(pdf, 8), b"%PDF-1.7")
+        self.assertEqual(pdf_source(b"%PDF").read(), b"%PDF")
+        self.assertEqual(pdf_head(b"%PDF-1.7 body", 4), b"%PDF")
+        self.assertEqual(pdf_head(None), b"")
+        # The spool is gone: an unreadable handle reads as empty, not an error.
+        self.assertEqual(pdf_head(SpooledPdf(path=pdf.path, size=pdf.size)), b"")
+
+
+class PrefetchSpoolTests(unittest.TestCase):
+    WHITELISTS = {"authors": [], "titles": ["Vision"], "affiliations": ["MIT"]}
+
+    @staticmethod
+    def _entry(suffix: str, *, title: str) -> dict:
+        return {
+            "link": f"https://arxiv.org/abs/{suffix}",
+            "title": title,
+            "authors_list": [],
+            "abstract": "",
+            "api_affiliations": "",
+        }
+
+    def test_kept_pdfs_are_spooled_and_non_candidates_discarded(self):
+        from app.services import scrape_engine
+
+        candidate = self._entry("1", title="A Vision Paper")
+        non_match = self._entry("2", title="Unrelated")
+        seen = []
+
+        def fake_extract(pdfs, **kwargs):
+            seen.extend(pdfs)
+            return ["" for _ in pdfs]
+
+        with (
+            PdfSpool() as spool,
+            patch.object(scrape_engine, "request_with_backoff", return_value=Mock(content=b"%PDF-1.4")),
+            patch.object(scrape_engine, "extract_affiliation_text_batch", side_effect=fake_extract),
+        ):
+            scrape_engine._prefetch_affiliation_text(
+                [candidate, non_match], self.WHITELISTS, {"max_workers": 2}, session=None, spool=spool
+            )
+
+            # The isolated extractor is handed paths, never the bodies themselves.
+            self.assertTrue(all(isinstance(pdf, SpooledPdf) for pdf in seen))
+            self.assertIsInstance(candidate["pdf_content"], SpooledPdf)
+            self.assertEqual(candidate["pdf_content"].read_bytes(), b"%PDF-1.4")
+            self.assertIsNone(non_match["pdf_content"])
+            self.assertEqual(spool.spooled_bytes, len(b"%PDF-1.4"))
+            self.assertEqual(len(os.listdir(spool.directory)), 1)
+
+    def test_download_workers_are_capped_by_memory_budget(self):
+        from app.services import scrape_engine
+
+        self.assertEqual(scrape_engine._pdf_download_workers({"max_workers": 8}), 8)
+        self.assertEqual(scrape_engine._pdf_download_workers({"max_workers": 8, "memory_budget_mb": 100}), 2)
+        self.assertEqual(scrape_engine._pdf_download_workers({"max_workers": 8, "memory_budget_mb": 1}), 1)
+
+
+# Runs in a fresh interpreter so ru_maxrss (a high-water mark) isn't polluted by
+# whatever the test process already allocated.
+_RSS_SCRIPT = textwrap.dedent(
+    """
+    import copy, json, resource, sys
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    from app.services import scrape_engine
+    from app.services.pdf_spool import PdfSpool
+    from tests.helpers import TEST_SCRAPER_CONFIG
+
+    entries_count, pdf_bytes, budget_mb = (int(arg) for arg in sys.argv[1:4])
+    config = copy.deepcopy(TEST_SCRAPER_CONFIG)
+    config["scraper"].update(max_workers=8, memory_budget_mb=budget_mb)
+    entries = [
+        {
+            "arxiv_id": f"2607.{i:05d}",
+            "link": f"https://arxiv.org/abs/2607.{i:05d}",
+            "title": f"Vision paper {i}",
+            "authors_list": ["A"],
+            "abstract": "",
+            "publication_date": "2026-07-01",
+        }
+        for i in range(entries_count)
+    ]
+
+    def fake_download(*args, **kwargs):
+        # A fresh body per call, like a real response.
+        return SimpleNamespace(content=b"%PDF-1.4\\n" + bytes(pdf_bytes))
+
+    def peak_rss():
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    with (
+        patch.object(scrape_engine, "request_with_backoff", side_effect=fake_download),
+        patch.object(scrape_engine, "extract_affiliation_text_batch", side_effect=lambda pdfs, **kw: ["" for _ in pdfs]),
+        patch.object(scrape_engine, "extract_pdf_resource_links_batch", side_effect=lambda pdfs: [[] for _ in pdfs]),
+    ):
+        baseline = peak_rss()
+        with PdfSpool() as spool:
+            scrape_engine._prefetch_affiliation_text(entries, config["whitelists"], config["scraper"], None, spool=spool)
+            results = scrape_engine._collect_matched_results(
+                entries, config["whitelists"], config["scraper"], None, None, "", config, progress_total=len(entries)
+            )
+            scrape_engine._apply_pdf_links(results, scrape_engine._extract_pdf_links(results), config)
+            spooled = spool.spooled_bytes
+    print(json.dumps({"results": len(results), "growth": peak_rss() - baseline, "spooled": spooled}))
+    """
+)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "ru_maxrss is reported in KiB on Linux only")
+class ScrapeMemoryBudgetTests(unittest.TestCase):
+    def test_peak_rss_stays_under_budget_for_1000_entry_scrape(self):
+        entries, pdf_bytes, budget_mb = 1000, 256 * 1024, 128
+        env = {**os.environ, "CV_ARXIV_NATIVE_ISOLATION": "0"}
+        completed = subprocess.run(
+            [sys.executable, "-c", _RSS_SCRIPT, str(entries), str(pdf_bytes), str(budget_mb)],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            env=env,
+            timeout=300,
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr[-2000:])
+        report = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(report["results"], entries)
+        # Every matched entry keeps its PDF (~250 MiB in total) — on disk, not in memory.
+        self.assertGreater(report["spooled"], entries * pdf_bytes)
+        self.assertLess(report["growth"], budget_mb * 1024 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date
+from unittest.mock import patch
 
 from app.services.pipeline import (
     FeatureVector,
@@ -46,6 +47,49 @@ class TestCheckAffiliations:
         assert pdf_content is None
 
 
+class TestMutedTopics:
+    """Topic tags are extracted once per entry and reused by the mute check and enrichment."""
+
+    def _generator(self, topics):
+        return WhitelistCandidateGenerator(
+            whitelists={"authors": [], "titles": ["segmentation"], "affiliations": []},
+            scraper_config={},
+            muted={"authors": [], "affiliations": [], "topics": topics},
+        )
+
+    def _entry(self):
+        return {
+            "link": "https://arxiv.org/abs/4",
+            "title": "Satellite image segmentation",
+            "abstract": "We segment aerial imagery.",
+            "authors_list": ["Author A"],
+            "api_affiliations": "",
+        }
+
+    def test_muted_topic_reads_tags_stored_on_the_entry(self):
+        entry = self._entry()
+        with patch("app.services.summary.extract_topic_tags", wraps=lambda t, a: ["Remote Sensing"]) as extract:
+            assert self._generator(["Remote Sensing"]).process_single(entry) is None
+            assert self._generator(["Remote Sensing"])._is_muted(entry)
+        assert extract.call_count == 1
+        assert entry["topic_tags"] == ["Remote Sensing"]
+
+    def test_enrichment_reuses_tags_from_the_mute_check(self):
+        from app.services.scrape_engine import _enrich_candidate_with_llm
+
+        candidate = self._generator(["Tracking"]).process_single(self._entry())
+        assert candidate is not None
+        with patch("app.services.scrape_engine.extract_topic_tags") as extract:
+            _enrich_candidate_with_llm(candidate, None, "", False)
+        extract.assert_not_called()
+        assert "Remote Sensing" in candidate.entry_data["topic_tags"]
+
+    def test_no_muted_topics_skips_extraction(self):
+        with patch("app.services.summary.extract_topic_tags") as extract:
+            assert self._generator([]).process_single(self._entry()) is not None
+        extract.assert_not_called()
+
+
 def _make_candidate(
     match_types: list[str],
     matched_terms: list[str],
@@ -567,7 +567,7 @@ class PostScrapePipelineTests(FlaskDBTestCase):
             },
         ]
 
-        with patch("app.services.thumbnail_generator.generate_thumbnail") as mock_gen:
+        with patch("app.services.thumbnail_generator.generate_previews") as mock_gen:
             _generate_thumbnails(self.app, results, MagicMock())
 
         self.assertEqual(mock_gen.call_count, 2)
@@ -584,7 +584,7 @@ class PostScrapePipelineTests(FlaskDBTestCase):
             },
         ]
 
-        with patch("app.services.thumbnail_generator.generate_thumbnail"):
+        with patch("app.services.thumbnail_generator.generate_previews"):
             _generate_thumbnails(self.app, results, MagicMock())
 
         self.assertEqual(results[0]["pdf_content"], pdf_content)
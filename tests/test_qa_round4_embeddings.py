@@ -59,7 +59,7 @@ def test_g13_add_sections_keeps_all_sections_of_one_paper_in_single_call(tmp_pat
     assert added == 2
     service._ensure_section_index()
     assert service._section_index.ntotal == 2
-    assert len(service._section_id_map) == 2
+    assert len(service._section_meta) == 2
     # Re-adding the same paper in a LATER call is deduped (already indexed).
     assert service.add_sections([(2, "method", "a"), (2, "results", "b")]) == 0
 
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import unittest
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from tests.helpers import FlaskDBTestCase
 
 
+def _queued_job():
+    return SimpleNamespace(id="job-historical", status="running", started_at=datetime(2026, 1, 1)), True
+
+
 class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
     """Regression tests for G10: POST /api/search/historical must validate the
     ``categories`` field before executing the scrape, so a wrong-typed value
@@ -21,7 +27,7 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
         with self.client.session_transaction() as session:
             return session["settings_csrf_token"]
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_g10_categories_string_returns_400(self, mock_exec):
         response = self.client.post(
             "/api/search/historical",
@@ -36,7 +42,7 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
         self.assertEqual(response.status_code, 400)
         mock_exec.assert_not_called()
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_g10_categories_non_iterable_returns_400_not_502(self, mock_exec):
         response = self.client.post(
             "/api/search/historical",
@@ -50,7 +56,7 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
         self.assertEqual(response.status_code, 400)
         mock_exec.assert_not_called()
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_g10_categories_list_with_non_string_returns_400(self, mock_exec):
         response = self.client.post(
             "/api/search/historical",
@@ -64,9 +70,9 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
         self.assertEqual(response.status_code, 400)
         mock_exec.assert_not_called()
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_g10_valid_categories_list_proceeds(self, mock_exec):
-        mock_exec.return_value = {"new_papers": 0, "total_found": 0}
+        mock_exec.return_value = _queued_job()
         response = self.client.post(
             "/api/search/historical",
             json={
@@ -76,14 +82,14 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
             },
             headers={"X-CSRF-Token": self._csrf_token()},
         )
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
         mock_exec.assert_called_once()
-        # The validated category list reaches the engine unchanged.
+        # The validated category list reaches the job unchanged.
         self.assertEqual(mock_exec.call_args.args[1], ["cs.CV", "cs.LG"])
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_g10_missing_categories_defaults_to_cs_cv(self, mock_exec):
-        mock_exec.return_value = {"new_papers": 0, "total_found": 0}
+        mock_exec.return_value = _queued_job()
         response = self.client.post(
             "/api/search/historical",
             json={
@@ -92,13 +98,13 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
             },
             headers={"X-CSRF-Token": self._csrf_token()},
         )
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
         mock_exec.assert_called_once()
         self.assertEqual(mock_exec.call_args.args[1], ["cs.CV"])
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_g10_empty_categories_list_normalizes_to_default(self, mock_exec):
-        mock_exec.return_value = {"new_papers": 0, "total_found": 0}
+        mock_exec.return_value = _queued_job()
         response = self.client.post(
             "/api/search/historical",
             json={
@@ -108,7 +114,7 @@ class HistoricalSearchCategoriesValidationTests(FlaskDBTestCase):
             },
             headers={"X-CSRF-Token": self._csrf_token()},
         )
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
         mock_exec.assert_called_once()
         self.assertEqual(mock_exec.call_args.args[1], ["cs.CV"])
 
@@ -4,17 +4,19 @@ G16: generate_thumbnail() must create the parent directory of the output path so
 legacy slash-form arXiv ids (e.g. 'cs/9901001') write to a nested 'cs/' folder
 instead of raising a swallowed FileNotFoundError.
 
-G17: _render_thumbnail / extract_teaser_image must render atomically (temp file +
-os.replace) so a crash/timeout mid-save never leaves a truncated PNG at the final
-cache path that would then be served forever.
+G17: _write_missing_renders must write the page-1 and teaser PNGs atomically (temp
+file + os.replace) so a crash/timeout mid-save never leaves a truncated PNG at the
+final cache path that would then be served forever.
 """
 
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from app.services.thumbnail_generator import (
-    _render_thumbnail,
-    extract_teaser_image,
+    DEFAULT_THUMBNAIL_DPI,
+    _write_missing_renders,
     generate_thumbnail,
 )
 
@@ -65,6 +67,7 @@ def test_generate_thumbnail_creates_nested_dir_for_legacy_id_g16(tmp_path):
 def test_render_thumbnail_leaves_no_partial_file_on_save_crash_g17(tmp_path):
     """G17: a crash mid-save must not leave a truncated PNG at the final path."""
     out_path = tmp_path / "1234.5678.png"
+    teaser_path = tmp_path / "1234.5678_teaser.png"
 
     def boom_save(path, **_kwargs):
         # Simulate Pillow writing some bytes then crashing mid-write.
@@ -75,22 +78,20 @@ def test_render_thumbnail_leaves_no_partial_file_on_save_crash_g17(tmp_path):
         ctx, _pages, _mock_image = _mock_pdf_context(save_side_effect=boom_save)
         mock_open.return_value = ctx
 
-        raised = False
-        try:
-            _render_thumbnail(b"%PDF-1.4 fake", out_path)
-        except RuntimeError:
-            raised = True
+        with pytest.raises(RuntimeError):
+            _write_missing_renders(b"%PDF-1.4 fake", out_path, teaser_path, DEFAULT_THUMBNAIL_DPI)
 
-        assert raised
-        # The destination must never hold the truncated render.
-        assert not out_path.exists()
-        # No leftover temp files in the directory either.
-        assert list(tmp_path.iterdir()) == []
+    # The destination must never hold the truncated render.
+    assert not out_path.exists()
+    # No leftover temp files in the directory either.
+    assert list(tmp_path.iterdir()) == []
 
 
 def test_extract_teaser_leaves_no_partial_file_on_save_crash_g17(tmp_path):
-    """G17: teaser extraction must not leave a truncated PNG on a save crash."""
-    out_path = tmp_path / "1234.5678_teaser.png"
+    """G17: a teaser save crash must not leave a truncated PNG behind."""
+    out_path = tmp_path / "1234.5678.png"
+    out_path.touch()  # only the teaser is missing
+    teaser_path = tmp_path / "1234.5678_teaser.png"
 
     def boom_save(path, **_kwargs):
         Path(path).write_bytes(b"\x89PNG truncated")
@@ -114,11 +115,9 @@ def test_extract_teaser_leaves_no_partial_file_on_save_crash_g17(tmp_path):
             "app.services.thumbnail_generator._best_teaser_bbox",
             return_value=(0.0, 0.0, 100.0, 100.0),
         ),
+        pytest.raises(RuntimeError),
     ):
-        # extract_teaser_image swallows exceptions and returns False, but it must
-        # not leave a partial file behind.
-        result = extract_teaser_image(b"%PDF-1.4 fake", out_path)
+        _write_missing_renders(b"%PDF-1.4 fake", out_path, teaser_path, DEFAULT_THUMBNAIL_DPI)
 
-    assert result is False
-    assert not out_path.exists()
-    assert list(tmp_path.iterdir()) == []
+    assert not teaser_path.exists()
+    assert list(tmp_path.iterdir()) == [out_path]
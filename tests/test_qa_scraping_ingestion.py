@@ -62,14 +62,12 @@ class ScrapeApiQaTests(FlaskDBTestCase):
         self.assertEqual(response.get_json()["job_id"], "job-force")
         mock_start.assert_called_once_with(self.app, force=True)
 
-    @patch("app.services.scrape_engine.execute_historical_scrape")
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
     def test_search_historical_forwards_categories_and_dates(self, mock_historical):
-        mock_historical.return_value = {
-            "new_papers": 2,
-            "duplicates_skipped": 1,
-            "total_matched": 3,
-            "total_in_feed": 4,
-        }
+        mock_historical.return_value = (
+            SimpleNamespace(id="job-historical", status="running", started_at=datetime(2026, 4, 7, 9, 0, 0)),
+            True,
+        )
 
         response = self.client.post(
             "/api/search/historical",
@@ -81,14 +79,14 @@ class ScrapeApiQaTests(FlaskDBTestCase):
             headers={"X-CSRF-Token": self._csrf_token()},
         )
 
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
         mock_historical.assert_called_once_with(
             self.app,
             ["cs.CV", "cs.AI"],
             date(2026, 4, 1),
             date(2026, 4, 3),
         )
-        self.assertEqual(response.get_json()["new_papers"], 2)
+        self.assertEqual(response.get_json()["job_id"], "job-historical")
 
     def test_search_historical_rejects_missing_dates(self):
         response = self.client.post(
@@ -100,23 +98,43 @@ class ScrapeApiQaTests(FlaskDBTestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("required", response.get_json()["error"])
 
-    @patch(
-        "app.services.scrape_engine.execute_historical_scrape",
-        side_effect=RuntimeError("arXiv API unavailable"),
-    )
-    def test_search_historical_returns_502_when_fetch_fails(self, mock_historical):
+    @patch("app.routes.api.SCRAPE_JOB_MANAGER.start_historical")
+    def test_search_historical_returns_409_while_one_is_running(self, mock_historical):
+        mock_historical.return_value = (
+            SimpleNamespace(id="job-running", status="running", started_at=datetime(2026, 4, 7, 9, 0, 0)),
+            False,
+        )
+
         response = self.client.post(
             "/api/search/historical",
-            json={
-                "categories": ["cs.CV"],
-                "start_date": "2026-04-01",
-                "end_date": "2026-04-03",
-            },
+            json={"categories": ["cs.CV"], "start_date": "2026-04-01", "end_date": "2026-04-03"},
             headers={"X-CSRF-Token": self._csrf_token()},
         )
 
-        self.assertEqual(response.status_code, 502)
-        self.assertIn("arXiv", response.get_json()["error"])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.get_json()["job_id"], "job-running")
+
+    def test_cancel_historical_returns_404_for_unknown_job(self):
+        response = self.client.post(
+            "/api/search/historical/nope/cancel",
+            headers={"X-CSRF-Token": self._csrf_token()},
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch(
+        "app.services.jobs.execute_historical_scrape",
+        side_effect=RuntimeError("arXiv API unavailable"),
+    )
+    def test_historical_job_reports_fetch_failure(self, _mock_historical):
+        manager = ScrapeJobManager()
+        job, started = manager.start_historical(self.app, ["cs.CV"], date(2026, 4, 1), date(2026, 4, 3))
+        events = list(manager.stream_events(job.id, heartbeat_seconds=1))
+
+        self.assertTrue(started)
+        self.assertEqual(job.status, "error")
+        self.assertEqual(events[-1][0], "scrape_error")
+        self.assertIn("arXiv", events[-1][1]["message"])
 
 
 class ScrapeRunQaTests(FlaskDBTestCase):
@@ -154,7 +172,7 @@ class ScrapeSseQaTests(FlaskDBTestCase):
     def test_stream_for_request_formats_sse_events(self):
         manager = ScrapeJobManager()
 
-        def fake_scrape(app, event_callback=None, force=False):
+        def fake_scrape(app, event_callback=None, force=False, cancel_event=None):
             event_callback("status", {"phase": "processing", "message": "Working..."})
             event_callback("done", {"new_papers": 1, "duplicates_skipped": 0, "total_matched": 1, "total_in_feed": 2})
             return {}
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -13,6 +17,7 @@ import app.routes.api.chat  # noqa: E402,F401  (import-for-side-effect: route re
 from app.enums import FeedbackAction
 from app.models import Paper, PaperFeedback, db
 from app.services import rag
+from app.services.llm_client import LLMClient
 from tests.helpers import FlaskDBTestCase
 
 
@@ -47,6 +52,78 @@ def _save(paper: Paper) -> None:
     db.session.add(PaperFeedback(paper_id=paper.id, action=FeedbackAction.SAVE.value))
 
 
+class _FakeStreamingLLM:
+    """Local OpenAI-compatible endpoint that streams chat-completion chunks as SSE.
+
+    ``tokens`` are sent one per chunk with ``delay`` seconds between them; with
+    ``endless=True`` it keeps streaming until the client hangs up, which sets
+    ``disconnected``.
+    """
+
+    def __init__(self, tokens, *, delay=0.0, endless=False):
+        self.tokens = list(tokens)
+        self.delay = delay
+        self.endless = endless
+        self.requests: list[dict] = []
+        self.disconnected = threading.Event()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                fake.requests.append(json.loads(self.rfile.read(length)))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                try:
+                    index = 0
+                    while fake.endless or index < len(fake.tokens):
+                        token = fake.tokens[index % len(fake.tokens)]
+                        chunk = {
+                            "id": "chatcmpl-fake",
+                            "object": "chat.completion.chunk",
+                            "created": 0,
+                            "model": "fake",
+                            "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                        }
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                        self.wfile.flush()
+                        index += 1
+                        time.sleep(fake.delay)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    fake.disconnected.set()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self, **kwargs) -> LLMClient:
+        host, port = self.server.server_address
+        return LLMClient(api_key="test", model="fake", base_url=f"http://{host}:{port}/v1", **kwargs)
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
 class RetrieveSavedContextTests(FlaskDBTestCase):
     def setUp(self):
         super().setUp()
@@ -166,6 +243,48 @@ class AnswerQueryTests(FlaskDBTestCase):
         self.assertFalse(result["llm_used"])
 
 
+class StreamAnswerTests(FlaskDBTestCase):
+    def setUp(self):
+        super().setUp()
+        paper = _make_paper(0)
+        db.session.add(paper)
+        db.session.commit()
+        _save(paper)
+        db.session.commit()
+
+    def test_sources_precede_the_llm_request_then_tokens_stream_in_order(self):
+        with _FakeStreamingLLM(["Grounded ", "answer ", "here."]) as fake:
+            with patch("app.services.rag._build_client", return_value=fake.client()):
+                events = rag.stream_answer("what did I save?", app=self.app)
+                name, data = next(events)
+                # Retrieval alone produced the first event; the LLM hasn't been called.
+                self.assertEqual(name, "sources")
+                self.assertEqual([s["title"] for s in data["sources"]], ["RAG Paper 0"])
+                self.assertEqual(fake.requests, [])
+                rest = list(events)
+
+        self.assertEqual([e for e, _ in rest], ["token", "token", "token", "done"])
+        self.assertEqual("".join(d["text"] for e, d in rest if e == "token"), "Grounded answer here.")
+        self.assertEqual(rest[-1][1], {"llm_used": True, "error": None})
+        self.assertTrue(fake.requests[0]["stream"])
+
+    def test_closing_the_stream_aborts_the_upstream_request(self):
+        with _FakeStreamingLLM(["tok "], delay=0.02, endless=True) as fake:
+            client = fake.client(max_concurrent=1)
+            tokens = client.complete(system_prompt="s", user_prompt="u", max_tokens=10, temperature=0.0, stream=True)
+            self.assertEqual([next(tokens), next(tokens)], ["tok ", "tok "])
+            tokens.close()
+
+            self.assertTrue(fake.disconnected.wait(5), "upstream kept streaming after close")
+            # The concurrency slot is released with the stream.
+            self.assertTrue(client._semaphore.acquire(blocking=False))
+
+    def test_llm_disabled_sends_sources_then_done(self):
+        events = list(rag.stream_answer("anything", app=self.app))
+        self.assertEqual([e for e, _ in events], ["sources", "done"])
+        self.assertEqual(events[-1][1], {"llm_used": False, "error": None})
+
+
 class ChatEndpointTests(FlaskDBTestCase):
     def setUp(self):
         super().setUp()
@@ -232,3 +351,41 @@ class ChatEndpointTests(FlaskDBTestCase):
         self.assertTrue(data["no_saved_papers"])
         self.assertIn("message", data)
         self.assertEqual(data["sources"], [])
+
+    def test_chat_stream_emits_sse_sources_tokens_done(self):
+        with _FakeStreamingLLM(["Hello", " world"]) as fake:
+            with patch("app.services.rag._build_client", return_value=fake.client()):
+                response = self.client.post(
+                    "/api/corpus/chat/stream",
+                    json={"query": "what did I save?"},
+                    headers={"X-CSRF-Token": self.csrf_token},
+                )
+                body = response.get_data(as_text=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/event-stream")
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+        events = _parse_sse(body)
+        self.assertEqual([e for e, _ in events], ["sources", "token", "token", "done"])
+        self.assertEqual(events[0][1]["sources"][0]["title"], "RAG Paper 0")
+        self.assertTrue(events[-1][1]["llm_used"])
+
+    def test_chat_stream_client_disconnect_aborts_upstream(self):
+        with _FakeStreamingLLM(["tok "], delay=0.02, endless=True) as fake:
+            with patch("app.services.rag._build_client", return_value=fake.client()):
+                response = self.client.post(
+                    "/api/corpus/chat/stream",
+                    json={"query": "what did I save?"},
+                    headers={"X-CSRF-Token": self.csrf_token},
+                    buffered=False,
+                )
+                chunks = response.iter_encoded()
+                self.assertIn(b"event: sources", next(chunks))
+                self.assertIn(b"event: token", next(chunks))
+                response.close()
+
+            self.assertTrue(fake.disconnected.wait(5), "upstream kept streaming after disconnect")
+
+    def test_chat_stream_requires_csrf(self):
+        response = self.client.post("/api/corpus/chat/stream", json={"query": "hi"})
+        self.assertEqual(response.status_code, 400)
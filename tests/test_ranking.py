@@ -1,12 +1,16 @@
+import tempfile
 import unittest
 from datetime import date, timedelta
+from pathlib import Path
 from unittest.mock import patch
 
+from app.services.preferences import get_preferences, preference_snapshot, save_config
 from app.services.ranking import (
     combined_rank_score,
     compute_feedback_delta,
     compute_paper_score,
     recency_multiplier,
+    resolve_ranking_preferences,
 )
 
 
@@ -132,5 +136,68 @@ class RankingTests(unittest.TestCase):
         self.assertEqual(without["venue_bonus"], 0.0)
 
 
+class PreferenceSnapshotTests(unittest.TestCase):
+    def _config(self):
+        return {"preferences": {"ranking": {"author_weight": 40.0}, "muted": {"authors": ["Spam"]}}}
+
+    def test_snapshot_is_reused_until_preferences_change(self):
+        config = self._config()
+        first = preference_snapshot(config)
+        self.assertIs(preference_snapshot(config), first)
+        self.assertEqual(first.ranking["author_weight"], 40.0)
+
+        config["preferences"]["ranking"]["author_weight"] = 12.0
+        second = preference_snapshot(config)
+        self.assertGreater(second.version, first.version)
+        self.assertEqual(second.ranking["author_weight"], 12.0)
+
+    def test_save_config_invalidates_cached_snapshots(self):
+        config = self._config()
+        first = preference_snapshot(config)
+        with tempfile.TemporaryDirectory() as tmp:
+            save_config(Path(tmp) / "config.yaml", config)
+        self.assertIsNot(preference_snapshot(config), first)
+
+    def test_snapshot_is_read_only_and_get_preferences_is_a_copy(self):
+        config = self._config()
+        snapshot = preference_snapshot(config)
+        with self.assertRaises(TypeError):
+            snapshot.ranking["author_weight"] = 1.0
+        self.assertEqual(snapshot.muted["authors"], ("Spam",))
+
+        prefs = get_preferences(config)
+        prefs["ranking"]["author_weight"] = 1.0
+        prefs["muted"]["authors"].append("Other")
+        self.assertEqual(preference_snapshot(config).ranking["author_weight"], 40.0)
+        self.assertEqual(get_preferences(config)["muted"]["authors"], ["Spam"])
+
+    def test_resolved_preferences_match_per_call_resolution(self):
+        config = self._config()
+        preferences = resolve_ranking_preferences(config)
+        self.assertIs(resolve_ranking_preferences(config), preferences)
+        self.assertEqual(preferences["Author"], 40.0)
+        kwargs = {
+            "match_types": ["Author", "Title"],
+            "matched_terms_count": 2,
+            "publication_dt": date.today() - timedelta(days=3),
+            "resource_count": 2,
+            "llm_relevance_score": 7.5,
+            "citation_count": 12,
+            "acceptance_status": "oral",
+            "interest_similarity": 0.6,
+        }
+        self.assertEqual(
+            compute_paper_score(**kwargs, preferences=preferences),
+            compute_paper_score(**kwargs, config=config),
+        )
+
+    def test_ranking_config_overrides_are_part_of_the_resolution(self):
+        config = self._config()
+        base = resolve_ranking_preferences(config)
+        overridden = resolve_ranking_preferences(config, ranking_config={"weights": {"author_weight": 5.0}})
+        self.assertEqual(base["Author"], 40.0)
+        self.assertEqual(overridden["Author"], 5.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from app.services.ranking import generate_ranking_explanation, top_score_contributors
+from app.models import Paper, db
+from app.services.feedback import apply_feedback_action
+from app.services.ranking import generate_ranking_explanation, generate_ranking_explanations, top_score_contributors
+from tests.helpers import FlaskDBTestCase
 
 
 def _make_paper(**kwargs):
@@ -184,3 +187,59 @@ class TestTopScoreContributors:
         # Backward-compatible: without a target the bars are just recency-scaled.
         breakdown = {"match_score": 40.0, "recency_multiplier": 1.0}
         assert top_score_contributors(breakdown)[0]["value"] == 40.0
+
+
+class BatchRankingExplanationTests(FlaskDBTestCase):
+    def _paper(self, title: str) -> Paper:
+        paper = Paper(
+            title=title,
+            authors="A",
+            link=f"https://arxiv.org/abs/{title}",
+            pdf_link=f"https://arxiv.org/pdf/{title}",
+            match_type="Title",
+            matched_terms=["vision"],
+            publication_dt=date.today(),
+            publication_date=date.today().isoformat(),
+            scraped_date=date.today().isoformat(),
+        )
+        db.session.add(paper)
+        db.session.commit()
+        return paper
+
+    def test_page_shares_one_saved_query_and_one_faiss_search(self):
+        saved = self._paper("Saved " + "x" * 60)
+        apply_feedback_action(saved.id, "save")
+        cards = [self._paper(f"Card {idx}") for idx in range(3)]
+        service = MagicMock()
+        service.index_count.return_value = 10
+        service.search_by_ids.return_value = {
+            cards[0].id: [(saved.id, 0.9)],
+            cards[1].id: [(saved.id, 0.3)],  # too weak to mention
+        }
+
+        with patch("app.services.embeddings.get_embedding_service", return_value=service):
+            explanations = generate_ranking_explanations(cards)
+
+        service.search_by_ids.assert_called_once_with([card.id for card in cards], top_k=5)
+        assert explanations[0][-1] == f'Similar to saved: "{saved.title[:50]}..."'
+        assert not any("Similar to saved" in line for line in explanations[1] + explanations[2])
+        assert all("Published very recently" in lines for lines in explanations)
+
+    def test_precomputed_breakdowns_skip_weight_resolution(self):
+        cards = [self._paper("Card")]
+        with (
+            patch("app.services.ranking.resolve_ranking_preferences") as resolve,
+            patch("app.services.embeddings.get_embedding_service", side_effect=RuntimeError("no index")),
+        ):
+            explanations = generate_ranking_explanations(cards, breakdowns=[{"recency_multiplier": 0.5}])
+
+        resolve.assert_not_called()
+        assert "Published very recently" not in explanations[0]
+
+    def test_single_paper_form_matches_batch(self):
+        cards = [self._paper("Card A"), self._paper("Card B")]
+        with patch("app.services.embeddings.get_embedding_service", side_effect=RuntimeError("no index")):
+            batch = generate_ranking_explanations(cards)
+            singles = [generate_ranking_explanation(card) for card in cards]
+
+        assert batch == singles
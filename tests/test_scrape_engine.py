@@ -66,7 +66,7 @@ class ThumbnailTimeoutTests(FlaskDBTestCase):
 
         with (
             patch.object(scrape_engine, "_THUMBNAIL_TIMEOUT_SECONDS", 0.1),
-            patch("app.services.thumbnail_generator.generate_thumbnail", side_effect=slow_thumbnail),
+            patch("app.services.thumbnail_generator.generate_previews", side_effect=slow_thumbnail),
         ):
             start = time.monotonic()
             scrape_engine._generate_thumbnails(self.app, results, Mock())
@@ -547,7 +547,7 @@ class OpenAlexEnrichmentTests(FlaskDBTestCase):
             }
         }
 
-        _enrich_results_with_openalex([result], session=None, config=self.app.config["SCRAPER_CONFIG"])
+        _enrich_results_with_openalex([result], config=self.app.config["SCRAPER_CONFIG"])
 
         self.assertEqual(result["citation_count"], 7)
         self.assertEqual(result["citation_source"], "openalex")
@@ -676,6 +676,104 @@ class PdfLinkEnrichmentTests(FlaskDBTestCase):
         self.assertEqual(result["paper_score"], baseline_score)
 
 
+class FinalizeStageGraphTests(FlaskDBTestCase):
+    def test_post_save_stages_overlap_and_report_critical_path(self):
+        import threading
+
+        from app.services import scrape_engine
+
+        barrier = threading.Barrier(3, timeout=10)
+        seen_saved: list[int] = []
+
+        def post_save_stage(app, results, *_args):
+            # Only passes when thumbnails, embeddings and sections are in flight together.
+            seen_saved.append(len(results))
+            barrier.wait()
+
+        results = [_make_result("https://arxiv.org/abs/0101", "Overlap Paper")]
+        with (
+            patch.object(scrape_engine, "_enrich_results_with_citations"),
+            patch.object(scrape_engine, "_enrich_results_with_openalex"),
+            patch.object(scrape_engine, "_enrich_results_with_huggingface"),
+            patch.object(scrape_engine, "_enrich_results_with_github"),
+            patch.object(scrape_engine, "_generate_thumbnails", side_effect=post_save_stage),
+            patch.object(scrape_engine, "_generate_embeddings", side_effect=post_save_stage),
+            patch.object(scrape_engine, "_extract_sections", side_effect=post_save_stage),
+        ):
+            summary = scrape_engine._finalize_results(
+                self.app, results, Mock(), self.app.config["SCRAPER_CONFIG"], pre_filtered=2, total_entries=5
+            )
+
+        self.assertEqual(summary["new_papers"], 1)
+        self.assertEqual(summary["duplicates_skipped"], 2)
+        self.assertEqual(len(seen_saved), 3)
+        report = summary["stage_report"]
+        self.assertEqual(report["critical_path"][:2], ["citations", "openalex"])
+        self.assertIn("save", report["critical_path"])
+        self.assertEqual({stage["status"] for stage in report["stages"].values()}, {"ok"})
+
+    def test_save_failure_cancels_post_save_stages(self):
+        from app.services import scrape_engine
+
+        results = [_make_result("https://arxiv.org/abs/0102")]
+        with (
+            patch.object(scrape_engine, "_enrich_results_with_citations"),
+            patch.object(scrape_engine, "_enrich_results_with_openalex"),
+            patch.object(scrape_engine, "_save_results", side_effect=RuntimeError("db down")),
+            patch.object(scrape_engine, "_generate_embeddings") as embeddings,
+            patch.object(scrape_engine, "_generate_thumbnails") as thumbnails,
+        ):
+            with self.assertRaises(RuntimeError):
+                scrape_engine._finalize_results(
+                    self.app, results, Mock(), self.app.config["SCRAPER_CONFIG"], pre_filtered=0, total_entries=1
+                )
+
+        embeddings.assert_not_called()
+        thumbnails.assert_not_called()
+
+    def test_cancel_during_save_skips_post_save_stages(self):
+        import threading
+
+        from app.services import scrape_engine
+
+        cancel_event = threading.Event()
+        save_results = scrape_engine._save_results
+
+        def save_then_cancel(app, results):
+            saved = save_results(app, results)
+            cancel_event.set()  # the job is cancelled while the save is still running
+            return saved
+
+        results = [_make_result("https://arxiv.org/abs/0103")]
+        with (
+            patch.object(scrape_engine, "_enrich_results_with_citations"),
+            patch.object(scrape_engine, "_enrich_results_with_openalex"),
+            patch.object(scrape_engine, "_save_results", side_effect=save_then_cancel),
+            patch.object(scrape_engine, "_enrich_results_with_huggingface") as huggingface,
+            patch.object(scrape_engine, "_generate_embeddings") as embeddings,
+            patch.object(scrape_engine, "_generate_thumbnails") as thumbnails,
+            patch.object(scrape_engine, "_extract_sections") as sections,
+        ):
+            summary = scrape_engine._finalize_results(
+                self.app,
+                results,
+                Mock(),
+                self.app.config["SCRAPER_CONFIG"],
+                pre_filtered=0,
+                total_entries=1,
+                cancel_event=cancel_event,
+            )
+
+        self.assertEqual(summary["new_papers"], 1)
+        for stage in (huggingface, embeddings, thumbnails, sections):
+            stage.assert_not_called()
+        report = summary["stage_report"]
+        self.assertTrue(report["cancelled"])
+        self.assertEqual(report["stages"]["save"]["status"], "ok")
+        for name in ("huggingface", "github", "thumbnails", "embeddings", "sections"):
+            self.assertEqual(report["stages"][name]["status"], "cancelled")
+
+
 class PrefetchAffiliationTextTests(unittest.TestCase):
     WHITELISTS = {"authors": [], "titles": ["Vision"], "affiliations": ["MIT"]}
 
@@ -780,18 +878,22 @@ class HistoricalScrapeTests(FlaskDBTestCase):
         self.app.config["SCRAPER_CONFIG"]["ingest"] = {"backends": ["arxiv_api"]}
 
         class FakeOrchestrator:
-            def fetch(self, **kwargs):
+            def iter_pages(self, **kwargs):
                 self.kwargs = kwargs
-                return [
-                    PaperCandidate(
-                        arxiv_id="0007",
-                        link="https://arxiv.org/abs/0007",
-                        title="Historical Paper",
-                        author="Author A",
-                        authors_list=["Author A"],
-                        publication_date="2026-01-01",
-                    )
-                ]
+                return iter(
+                    [
+                        [
+                            PaperCandidate(
+                                arxiv_id="0007",
+                                link="https://arxiv.org/abs/0007",
+                                title="Historical Paper",
+                                author="Author A",
+                                authors_list=["Author A"],
+                                publication_date="2026-01-01",
+                            )
+                        ]
+                    ]
+                )
 
         orchestrator = FakeOrchestrator()
 
@@ -821,6 +923,143 @@ class HistoricalScrapeTests(FlaskDBTestCase):
         self.assertIn("new_papers", summary)
 
 
+class HistoricalChunkingTests(FlaskDBTestCase):
+    """execute_historical_scrape saves each chunk before requesting more pages."""
+
+    def _run(self, pages_per_call: int, *, cancel_after_chunk: int | None = None, cancel_in_stage: str | None = None):
+        from threading import Event
+
+        from app.services import scrape_engine
+        from app.services.ingest import PaperCandidate
+
+        self.app.config["SCRAPER_CONFIG"]["ingest"] = {"backends": ["arxiv_api"]}
+        saved_before_page: list[int] = []
+        cancel_event = Event()
+        finalized = 0
+
+        def pages():
+            for page in range(pages_per_call):
+                saved_before_page.append(Paper.query.count())
+                yield [
+                    PaperCandidate(
+                        arxiv_id=f"2601.{page}{i}",
+                        link=f"https://arxiv.org/abs/2601.{page}{i}",
+                        title=f"Historical Paper {page}-{i}",
+                        author="Author A",
+                        authors_list=["Author A"],
+                        publication_date="2026-01-01",
+                    )
+                    for i in range(2)
+                ]
+
+        orchestrator = Mock()
+        orchestrator.iter_pages.return_value = pages()
+
+        def fake_process(entries, *args, **kwargs):
+            for i, entry in enumerate(entries, 1):
+                yield i, i, _make_result(entry["link"], entry["title"])
+
+        def fake_finalize(app, results, session, config, *, pre_filtered, total_entries, **kwargs):
+            nonlocal finalized
+            new_count, skipped = scrape_engine._save_results(app, results)
+            finalized += 1
+            if finalized == cancel_after_chunk:
+                cancel_event.set()
+            return scrape_engine._build_summary(new_count, skipped + pre_filtered, len(results), total_entries)
+
+        save_results = scrape_engine._save_results
+
+        def cancelling_stage(*args, **kwargs):
+            # Cancels the job from inside the real finalize graph of the first chunk.
+            outcome = save_results(*args, **kwargs) if cancel_in_stage == "_save_results" else None
+            cancel_event.set()
+            return outcome
+
+        if cancel_in_stage is None:
+            finalize_patch = patch.object(scrape_engine, "_finalize_results", side_effect=fake_finalize)
+        else:
+            finalize_patch = patch.object(scrape_engine, cancel_in_stage, side_effect=cancelling_stage)
+
+        events: list[tuple[str, dict]] = []
+        with (
+            patch.object(scrape_engine, "_build_ingest_orchestrator", return_value=orchestrator),
+            patch.object(scrape_engine, "enrich_entries_with_api_metadata"),
+            patch.object(scrape_engine, "_prefetch_affiliation_text"),
+            patch.object(scrape_engine, "_process_entries_with_pipeline", side_effect=fake_process),
+            patch.object(scrape_engine, "_enrich_results_with_citations"),
+            patch.object(scrape_engine, "_enrich_results_with_openalex"),
+            patch.object(scrape_engine, "_extract_pdf_links", return_value=None),
+            patch.object(scrape_engine, "_enrich_results_with_huggingface"),
+            patch.object(scrape_engine, "_enrich_results_with_github"),
+            patch.object(scrape_engine, "_generate_thumbnails", return_value={}),
+            patch.object(scrape_engine, "_generate_embeddings"),
+            patch.object(scrape_engine, "_extract_sections"),
+            finalize_patch,
+        ):
+            summary = scrape_engine.execute_historical_scrape(
+                self.app,
+                ["cs.CV"],
+                date(2026, 1, 1),
+                date(2026, 1, 2),
+                event_callback=lambda event, data: events.append((event, data)),
+                cancel_event=cancel_event,
+                chunk_size=2,
+            )
+        return summary, saved_before_page, events
+
+    def test_each_chunk_is_saved_before_the_next_page_is_requested(self):
+        summary, saved_before_page, events = self._run(3)
+
+        self.assertEqual(saved_before_page, [0, 2, 4])
+        self.assertEqual(Paper.query.count(), 6)
+        self.assertEqual(summary["new_papers"], 6)
+        self.assertEqual(summary["total_in_feed"], 6)
+        self.assertEqual(summary["chunks"], 3)
+        self.assertFalse(summary["cancelled"])
+        chunk_events = [data for event, data in events if event == "status" and data.get("phase") == "chunk"]
+        self.assertEqual([data["new_papers"] for data in chunk_events], [2, 4, 6])
+        self.assertEqual(events[-1], ("done", summary))
+
+    def test_cancel_keeps_saved_chunks_and_stops_fetching(self):
+        summary, saved_before_page, events = self._run(3, cancel_after_chunk=1)
+
+        self.assertTrue(summary["cancelled"])
+        self.assertEqual(summary["chunks"], 1)
+        # The first chunk stays in the library; no further page was requested.
+        self.assertEqual(Paper.query.count(), 2)
+        self.assertEqual(saved_before_page, [0])
+        self.assertEqual(events[-1][0], "done")
+        self.assertTrue(events[-1][1]["cancelled"])
+
+    def test_cancel_after_save_records_the_partial_chunk(self):
+        summary, saved_before_page, _events = self._run(3, cancel_in_stage="_save_results")
+
+        self.assertTrue(summary["cancelled"])
+        self.assertEqual(saved_before_page, [0])
+        # The chunk's papers are saved and counted, so a re-run skips rather than redoes them.
+        self.assertEqual(Paper.query.count(), 2)
+        self.assertEqual(summary["chunks"], 1)
+        self.assertEqual(summary["new_papers"], 2)
+        self.assertEqual(summary["total_in_feed"], 2)
+        self.assertEqual(summary["partial_chunk"]["chunk"], 1)
+        self.assertTrue(summary["partial_chunk"]["saved"])
+        self.assertIn("embeddings", summary["partial_chunk"]["skipped_stages"])
+        self.assertIn("thumbnails", summary["partial_chunk"]["skipped_stages"])
+
+    def test_cancel_before_save_leaves_the_chunk_for_a_rerun(self):
+        summary, saved_before_page, _events = self._run(3, cancel_in_stage="_enrich_results_with_citations")
+
+        self.assertTrue(summary["cancelled"])
+        self.assertEqual(saved_before_page, [0])
+        self.assertEqual(Paper.query.count(), 0)
+        # Nothing from the chunk reached the library, so the summary doesn't claim it.
+        self.assertEqual(summary["chunks"], 0)
+        self.assertEqual(summary["total_in_feed"], 0)
+        self.assertEqual(summary["new_papers"], 0)
+        self.assertFalse(summary["partial_chunk"]["saved"])
+        self.assertIn("save", summary["partial_chunk"]["skipped_stages"])
+
+
 class DownloadProgressEventTests(FlaskDBTestCase):
     """The PDF-download pre-pass should stream per-paper progress events."""
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import random
+import threading
 from unittest.mock import patch
 
 from app.services.search import RRF_K, search_hybrid
@@ -76,3 +78,80 @@ class TestRRFFusion:
         # Paper at rank 1 in both systems
         expected = bm25_weight / (RRF_K + 1) + semantic_weight / (RRF_K + 1)
         assert abs(expected - (1.0 / (RRF_K + 1))) < 1e-9
+
+
+class TestConcurrentLegs:
+    def test_semantic_leg_runs_while_bm25_runs(self):
+        semantic_started = threading.Event()
+
+        def bm25(query, limit, prefix=False):
+            # Sequential legs would wait here for a semantic search that hasn't started.
+            assert semantic_started.wait(timeout=5)
+            return [(1, 2.0)]
+
+        def semantic(query, top_k):
+            semantic_started.set()
+            return [(2, 0.9)]
+
+        with (
+            patch("app.services.search.search_bm25", side_effect=bm25),
+            patch("app.services.search.search_semantic", side_effect=semantic),
+        ):
+            results = search_hybrid("vision", top_k=5)
+
+        assert {r["paper_id"] for r in results} == {1, 2}
+
+
+class TestFilterPushdown:
+    def test_paper_ids_reach_both_legs(self):
+        eligible = frozenset({3, 4})
+        with (
+            patch("app.services.search.search_bm25", return_value=[(3, 2.0)]) as bm25,
+            patch("app.services.search.search_semantic", return_value=[(4, 0.9)]) as semantic,
+        ):
+            results = search_hybrid("vision", top_k=5, paper_ids=eligible)
+
+        assert {r["paper_id"] for r in results} == {3, 4}
+        assert bm25.call_args.kwargs["paper_ids"] is eligible
+        assert semantic.call_args.kwargs["paper_ids"] is eligible
+
+
+class TestEarlyTermination:
+    @staticmethod
+    def _run(bm25, semantic, top_k, *, early):
+        pages_read = []
+
+        def pages(query, limit, page_size, prefix=False):
+            rows = bm25[:limit]
+            for start in range(0, len(rows), page_size):
+                pages_read.append(start)
+                yield rows[start : start + page_size]
+
+        with (
+            patch("app.services.search.search_bm25", return_value=bm25[: top_k * 2]),
+            patch("app.services.search._iter_bm25_pages", side_effect=pages),
+            patch("app.services.search.search_semantic", return_value=semantic[: top_k * 2]),
+        ):
+            results = search_hybrid("q", top_k=top_k, early_termination=early)
+        return [r["paper_id"] for r in results], len(pages_read)
+
+    def test_stops_reading_once_top_k_is_settled(self):
+        # Both legs agree on the head, so the fused top 4 is fixed after one page.
+        bm25 = [(pid, 100.0 - pid) for pid in range(1, 41)]
+        semantic = [(pid, 1.0 - pid / 100) for pid in range(1, 41)]
+
+        full, _ = self._run(bm25, semantic, 4, early=False)
+        early, pages = self._run(bm25, semantic, 4, early=True)
+
+        assert early == full
+        assert pages < 4
+
+    def test_matches_full_depth_ranking(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            top_k = rng.randint(1, 12)
+            ids = list(range(1, 60))
+            bm25 = [(pid, 1.0) for pid in rng.sample(ids, rng.randint(0, 30))]
+            semantic = [(pid, 1.0) for pid in rng.sample(ids, rng.randint(0, 30))]
+
+            assert self._run(bm25, semantic, top_k, early=True)[0] == self._run(bm25, semantic, top_k, early=False)[0]
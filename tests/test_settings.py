@@ -84,6 +84,79 @@ class ZoteroSyncDedupTests(FlaskDBTestCase):
         self.assertEqual(len(sync_calls), 1)
         self.assertEqual(len(sync_calls[0]), 2)
 
+    def test_resync_sends_only_papers_changed_since_their_last_push(self):
+        from app.models import Paper, db
+
+        ids = self._seed_saved_papers(3)
+        sync_calls = []
+
+        class _FakeClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def check_connection(self):
+                return {"status": "connected", "message": "ok"}
+
+            def list_collections(self):
+                return []
+
+            def sync_saved_papers(self, papers, collection_key=None):
+                sync_calls.append([p.id for p in papers])
+                return {
+                    "success": True,
+                    "message": f"Synced {len(papers)} papers to Zotero.",
+                    "synced_count": len(papers),
+                    "item_keys": {i: f"KEY{p.id}" for i, p in enumerate(papers)},
+                    "item_versions": {i: len(sync_calls) for i in range(len(papers))},
+                }
+
+        with patch("app.services.zotero.ZoteroClient", _FakeClient):
+            token = self._csrf_token()
+            self.client.post("/settings/zotero-sync", data={"csrf_token": token})
+            self.client.post("/settings/zotero-sync", data={"csrf_token": token})
+            db.session.get(Paper, ids[2]).title = "Paper 2, revised"
+            db.session.commit()
+            self.client.post("/settings/zotero-sync", data={"csrf_token": token})
+
+        self.assertEqual(sync_calls, [ids, [ids[2]]])
+        revised = db.session.get(Paper, ids[2])
+        self.assertEqual((revised.zotero_item_key, revised.zotero_item_version), (f"KEY{ids[2]}", 2))
+        self.assertIsNotNone(revised.zotero_synced_hash)
+
+    def test_conflicted_paper_is_not_marked_synced(self):
+        from app.models import Paper, db
+        from app.services.zotero import needs_zotero_sync
+
+        ids = self._seed_saved_papers(2)
+
+        class _FakeClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def check_connection(self):
+                return {"status": "connected", "message": "ok"}
+
+            def sync_saved_papers(self, papers, collection_key=None):
+                # Paper 1 was edited in Zotero: its update was refused and only the
+                # server's current version comes back.
+                return {
+                    "success": False,
+                    "message": "Synced 1 of 2 papers; Zotero rejected 1.",
+                    "synced_count": 1,
+                    "item_keys": {i: f"KEY{p.id}" for i, p in enumerate(papers)},
+                    "item_versions": {0: 3, 1: 7},
+                    "conflicts": [1],
+                }
+
+        with patch("app.services.zotero.ZoteroClient", _FakeClient):
+            self.client.post("/settings/zotero-sync", data={"csrf_token": self._csrf_token()})
+
+        synced, conflicted = db.session.get(Paper, ids[0]), db.session.get(Paper, ids[1])
+        self.assertFalse(needs_zotero_sync(synced))
+        self.assertEqual(conflicted.zotero_item_version, 7)
+        self.assertIsNone(conflicted.zotero_synced_hash)
+        self.assertTrue(needs_zotero_sync(conflicted))
+
 
 class SettingsRouteTests(FlaskDBTestCase):
     def setUp(self):
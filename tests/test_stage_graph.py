@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.services.stage_graph import STATUS_CANCELLED, STATUS_OK, Stage, StageGraph
+
+
+def test_independent_stages_run_concurrently_after_shared_dependency():
+    barrier = threading.Barrier(3, timeout=5)
+    order: list[str] = []
+
+    def root(_ctx):
+        order.append("root")
+        return {"saved": 7}
+
+    def leaf(_ctx):
+        assert _ctx.inputs["saved"] == 7
+        barrier.wait()  # only passes if all three leaves are in flight together
+
+    graph = StageGraph(
+        [Stage("save", root, outputs=("saved",))]
+        + [Stage(name, leaf, inputs=("saved",)) for name in ("thumbs", "embed", "sections")],
+        max_workers=4,
+    )
+    artifacts, report = graph.run()
+
+    assert artifacts["saved"] == 7
+    assert order == ["root"]
+    assert {t.status for t in report.timings.values()} == {STATUS_OK}
+    assert report.critical_path[0] == "save"
+
+
+def test_pool_limit_caps_concurrency():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(_ctx):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    graph = StageGraph(
+        [Stage(f"s{i}", work, pool="native") for i in range(4)],
+        pool_limits={"native": 1},
+        max_workers=4,
+    )
+    graph.run()
+    assert peak == 1
+
+
+def test_failure_cancels_dependents_and_reraises():
+    ran: list[str] = []
+
+    def boom(_ctx):
+        raise RuntimeError("save failed")
+
+    graph = StageGraph(
+        [
+            Stage("save", boom, outputs=("saved",)),
+            Stage("embed", lambda _ctx: ran.append("embed"), inputs=("saved",)),
+        ]
+    )
+    with pytest.raises(RuntimeError, match="save failed"):
+        graph.run()
+    assert ran == []
+
+
+def test_undeclared_output_fails_the_stage_and_cancels():
+    cancel = threading.Event()
+    ran: list[str] = []
+
+    def sibling(ctx):
+        # Still running when "save" fails; it must see the cancel and drain.
+        assert ctx.cancel_event.wait(timeout=5)
+
+    graph = StageGraph(
+        [
+            Stage("save", lambda _ctx: {"saved": 1, "stray": 2}, outputs=("saved",)),
+            Stage("sibling", sibling),
+            Stage("embed", lambda _ctx: ran.append("embed"), inputs=("saved",)),
+        ],
+        max_workers=2,
+    )
+    with pytest.raises(ValueError, match="undeclared outputs: stray"):
+        graph.run(cancel_event=cancel)
+    assert cancel.is_set()
+    assert ran == []
+
+
+def test_external_cancel_skips_unstarted_stages():
+    cancel = threading.Event()
+
+    def first(ctx):
+        ctx.cancel_event.set()
+
+    graph = StageGraph([Stage("a", first, outputs=("x",)), Stage("b", lambda _ctx: None, inputs=("x",))])
+    _, report = graph.run(cancel_event=cancel)
+
+    assert report.cancelled
+    assert report.timings["b"].status == STATUS_CANCELLED
+    assert report.as_dict()["stages"]["a"]["status"] == STATUS_OK
+
+
+def test_critical_path_follows_longest_chain():
+    def sleeper(seconds):
+        return lambda _ctx: time.sleep(seconds)
+
+    graph = StageGraph(
+        [
+            Stage("save", sleeper(0.01), outputs=("saved",)),
+            Stage("hf", sleeper(0.01), inputs=("saved",), outputs=("hf",)),
+            Stage("github", sleeper(0.01), inputs=("hf",)),
+            Stage("embed", sleeper(0.15), inputs=("saved",)),
+        ]
+    )
+    _, report = graph.run()
+    assert report.critical_path == ["save", "embed"]
+    assert report.critical_path_seconds >= 0.15
+
+
+def test_invalid_graphs_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph(
+            [
+                Stage("a", lambda _c: None, inputs=("y",), outputs=("x",)),
+                Stage("b", lambda _c: None, inputs=("x",), outputs=("y",)),
+            ]
+        )
+    with pytest.raises(ValueError, match="produced by both"):
+        StageGraph([Stage("a", lambda _c: None, outputs=("x",)), Stage("b", lambda _c: None, outputs=("x",))])
+    with pytest.raises(ValueError, match="unprovided"):
+        StageGraph([Stage("a", lambda _c: None, inputs=("missing",))]).run()
@@ -1,7 +1,14 @@
 import unittest
 from unittest.mock import Mock
 
-from app.services.summary import extract_topic_tags, generate_llm_summary, generate_summary
+from app.services.summary import (
+    TOPIC_HINTS,
+    _compile_hints,
+    extract_topic_tags,
+    generate_llm_summary,
+    generate_summary,
+)
+from app.services.text import normalize, tokenize
 
 
 class SummaryTests(unittest.TestCase):
@@ -21,6 +28,25 @@ class SummaryTests(unittest.TestCase):
         self.assertIn("Remote Sensing", tags)
         self.assertIn("Segmentation", tags)
 
+    def test_extract_topic_tags_keeps_hint_order_then_frequent_tokens(self):
+        tags = extract_topic_tags(
+            "Diffusion segmentation", "Segmentation segmentation benchmark benchmark benchmark datasets."
+        )
+
+        self.assertEqual(tags, ["Segmentation", "Generative Models", "Benchmark", "Diffusion", "Datasets"])
+
+    def test_compiled_hints_drop_hints_covered_by_shorter_ones(self):
+        compiled = dict(_compile_hints({"Segmentation": ("Segmentation", "segment", "segment"), "Few": ("few shot",)}))
+
+        self.assertEqual(compiled, {"Segmentation": ("segment",), "Few": ("few shot",)})
+        self.assertEqual(list(dict(_compile_hints(TOPIC_HINTS))), list(TOPIC_HINTS))
+
+    def test_tokenize_folds_accents_and_passes_ascii_through(self):
+        self.assertEqual(tokenize("Médical Zürich naïve-bayes"), ["medical", "zurich", "naive-bayes"])
+        text = "Plain ASCII abstract."
+        self.assertIs(normalize(text), text)
+        self.assertEqual(normalize(None), "")
+
     def test_generate_llm_summary_uses_llm_result(self):
         llm_client = Mock()
         llm_client.generate_tldr.return_value = "A concise model summary."
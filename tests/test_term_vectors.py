@@ -0,0 +1,180 @@
+"""Tests for the persisted TF-IDF term vectors: upkeep on save, sparse cosine, rebuild."""
+
+from __future__ import annotations
+
+import math
+import unittest
+from datetime import date
+
+import numpy as np
+from sqlalchemy import text
+
+from app.models import Paper, PaperTermVector, TermDocumentFrequency, db
+from app.schema import ensure_schema
+from app.services.related import build_vector, cosine_similarity, find_duplicates, top_related_papers
+from app.services.term_vectors import (
+    TermMatrix,
+    TitleIndex,
+    load_term_matrix,
+    load_title_index,
+    rebuild_term_vectors,
+    term_counts,
+    term_hash,
+)
+from tests.helpers import FlaskDBTestCase
+
+
+def _paper(idx: int, title: str, abstract: str = "", **fields) -> Paper:
+    today = date.today()
+    return Paper(
+        arxiv_id=f"2611.{idx:05d}",
+        title=title,
+        authors="Jane Doe",
+        link=f"https://arxiv.org/abs/2611.{idx:05d}",
+        pdf_link=f"https://arxiv.org/pdf/2611.{idx:05d}",
+        abstract_text=abstract,
+        match_type="Title",
+        matched_terms=[],
+        paper_score=1.0,
+        publication_date=today.isoformat(),
+        publication_dt=today,
+        scraped_date=today.isoformat(),
+        **fields,
+    )
+
+
+def _frequency(token: str) -> int:
+    row = db.session.get(TermDocumentFrequency, term_hash(token))
+    return 0 if row is None else row.doc_count
+
+
+class TermMatrixTests(unittest.TestCase):
+    TEXTS = (
+        "vision transformer segmentation remote sensing",
+        "transformer segmentation for satellite imagery imagery",
+        "language model for code generation",
+        "",
+    )
+
+    def _rows(self):
+        return [(idx, *term_counts(value)) for idx, value in enumerate(self.TEXTS, start=1)]
+
+    def test_raw_counts_match_the_dict_cosine(self):
+        matrix = TermMatrix.from_counts(self._rows())
+
+        scores = matrix.similarities(1)
+        for idx, value in enumerate(self.TEXTS, start=1):
+            expected = cosine_similarity(build_vector(self.TEXTS[0]), build_vector(value))
+            self.assertAlmostEqual(scores[idx - 1], expected, places=12)
+
+    def test_idf_weights_rescale_each_term(self):
+        idf = {term_hash("transformer"): 1.0, term_hash("segmentation"): 3.0}
+        matrix = TermMatrix.from_counts(self._rows()[:2], idf=lambda vocab: np.array([idf.get(h, 2.0) for h in vocab]))
+
+        # Shared terms weigh 1 and 3; each paper has three more terms of weight 2
+        # (paper 2 counts "imagery" twice).
+        expected = (1 + 9) / (math.sqrt(1 + 9 + 3 * 4) * math.sqrt(1 + 9 + 4 + 16))
+        self.assertAlmostEqual(matrix.similarities(1)[1], expected, places=12)
+
+    def test_most_similar_skips_self_and_empty_rows(self):
+        matrix = TermMatrix.from_counts(self._rows())
+
+        self.assertEqual([pid for pid, _sim in matrix.most_similar(1, top_k=5, min_similarity=0.1)], [2])
+        self.assertEqual(matrix.most_similar(4, top_k=5), [(3, 0.0), (2, 0.0), (1, 0.0)])
+        self.assertEqual(matrix.most_similar(99, top_k=5), [])
+
+    def test_title_index_matches_find_duplicates_on_dicts(self):
+        titles = {
+            1: "Vision Transformers for Object Detection",
+            2: "Diffusion Models",
+            3: "Vision transformers: object detection",
+        }
+        index = TitleIndex.from_titles(titles)
+
+        self.assertEqual(
+            [pid for pid, _sim in index.find("vision transformers for object detection", threshold=0.92)], [1, 3]
+        )
+        self.assertEqual(
+            find_duplicates("Vision Transformers for Object Detection", titles),
+            index.find("Vision Transformers for Object Detection", threshold=0.92),
+        )
+        self.assertEqual(index.find("the of and", threshold=0.5), [])
+
+
+class TermVectorStoreTests(FlaskDBTestCase):
+    def test_vectors_and_frequencies_follow_inserts_edits_and_deletes(self):
+        first = _paper(1, "Sparse attention", "sparse attention for video")
+        second = _paper(2, "Dense video prediction", "video")
+        db.session.add_all([first, second])
+        db.session.commit()
+        self.assertEqual(PaperTermVector.query.count(), 2)
+        self.assertEqual((_frequency("video"), _frequency("sparse"), _frequency("dense")), (2, 1, 1))
+
+        first.abstract_text = "graph attention"
+        first.topic_tags = ["Graphs"]
+        db.session.commit()
+        self.assertEqual((_frequency("video"), _frequency("sparse"), _frequency("graphs")), (1, 1, 1))
+
+        db.session.delete(second)
+        db.session.commit()
+        self.assertEqual(PaperTermVector.query.count(), 1)
+        self.assertEqual((_frequency("video"), _frequency("dense")), (0, 0))
+        self.assertIsNone(db.session.get(TermDocumentFrequency, term_hash("dense")))
+
+    def test_non_text_edit_keeps_the_stored_vector(self):
+        paper = _paper(1, "Sparse attention")
+        db.session.add(paper)
+        db.session.commit()
+        db.session.execute(text("UPDATE paper_term_vectors SET term_counts = x'07000000'"))
+        db.session.commit()
+
+        paper.paper_score = 5.0
+        db.session.commit()
+
+        self.assertEqual(db.session.get(PaperTermVector, paper.id).term_counts, b"\x07\x00\x00\x00")
+
+    def test_rolled_back_save_leaves_frequencies_untouched(self):
+        db.session.add(_paper(1, "Sparse attention"))
+        db.session.flush()
+        db.session.rollback()
+
+        self.assertEqual(TermDocumentFrequency.query.count(), 0)
+
+    def test_related_papers_rank_by_stored_tfidf(self):
+        papers = [
+            _paper(1, "Remote sensing segmentation", "transformer segmentation of satellite imagery"),
+            _paper(2, "Satellite segmentation", "segmentation transformer for satellite images"),
+            _paper(3, "Code generation", "language model for code generation"),
+            _paper(4, "Transformer language model", "transformer"),
+        ]
+        db.session.add_all(papers)
+        db.session.commit()
+
+        matrix = load_term_matrix([paper.id for paper in papers])
+
+        # "transformer" is in three of four papers, so it adds little next to the
+        # rarer "satellite" and "segmentation"; the code-generation paper shares nothing.
+        self.assertEqual(top_related_papers(papers[0].id, matrix, top_k=3), [papers[1].id, papers[3].id])
+
+    def test_core_inserts_are_vectorized_on_read_and_by_rebuild(self):
+        db.session.add(_paper(1, "Sparse attention", "sparse attention"))
+        db.session.commit()
+        row = {column.name: getattr(_paper(2, "Sparse attention"), column.name) for column in Paper.__table__.columns}
+        row.pop("id")
+        row.pop("rank_score")
+        db.session.execute(db.insert(Paper), [row])
+        db.session.commit()
+        ids = [paper_id for (paper_id,) in db.session.query(Paper.id).order_by(Paper.id)]
+
+        self.assertEqual(len(load_term_matrix(ids)), 2)
+        self.assertEqual([pid for pid, _sim in load_title_index().find("sparse attention", threshold=0.92)], ids)
+
+        self.assertEqual(rebuild_term_vectors(), 2)
+        self.assertEqual(_frequency("sparse"), 2)
+
+        db.session.execute(text("DELETE FROM paper_term_vectors"))
+        db.session.execute(text("DELETE FROM term_document_frequency"))
+        db.session.commit()
+        ensure_schema()
+        self.assertEqual(PaperTermVector.query.count(), 2)
+        self.assertEqual(_frequency("attention"), 2)
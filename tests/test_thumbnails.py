@@ -1,7 +1,17 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from app.services.thumbnail_generator import extract_teaser_image, generate_thumbnail
+import pytest
+
+from app.services.thumbnail_generator import (
+    DEFAULT_THUMBNAIL_DPI,
+    VARIANT_WIDTHS,
+    _write_missing_renders,
+    generate_previews,
+    generate_thumbnail,
+    preview_formats,
+    variant_path,
+)
 
 
 def _touching_save(path, **_kwargs):
@@ -86,6 +96,20 @@ def test_generate_thumbnail_backfills_missing_teaser(tmp_path):
         assert (thumbnails_dir / "1234.5678_teaser.png").exists()
 
 
+def test_generate_previews_skips_pdf_from_a_removed_spool(tmp_path):
+    from app.services.pdf_spool import PdfSpool
+
+    spool = PdfSpool(root=tmp_path)
+    pdf = spool.put(b"%PDF-1.4 spooled pdf content")
+    spool.close()  # the scrape finished while this render was still queued
+
+    with patch("app.services.thumbnail_generator.request_with_backoff") as mock_req:
+        stats = generate_previews("1234.5678", "http://fake.pdf", tmp_path / "static", pdf_content=pdf)
+
+    assert not stats.ok
+    mock_req.assert_not_called()
+
+
 def test_generate_thumbnail_failure(tmp_path):
     static_dir = tmp_path / "static"
 
@@ -165,26 +189,104 @@ def _text_pdf() -> bytes:
         os.unlink(tmp.name)
 
 
+def _render_with_teaser_spy(pdf_content: bytes, tmp_path: Path) -> tuple[Path, Path, list]:
+    """Run _write_missing_renders, recording what the teaser search returned."""
+    import app.services.thumbnail_generator as tg
+
+    found: list = []
+    real_find = tg._find_teaser
+
+    def spy(pdf, resolution):
+        found.append(real_find(pdf, resolution))
+        return found[-1]
+
+    out_path = tmp_path / "1234.5678.png"
+    teaser_path = tmp_path / "1234.5678_teaser.png"
+    with patch.object(tg, "_find_teaser", side_effect=spy):
+        _write_missing_renders(pdf_content, out_path, teaser_path, DEFAULT_THUMBNAIL_DPI)
+    return out_path, teaser_path, found
+
+
 def test_extract_teaser_picks_dominant_image(tmp_path):
-    out_path = tmp_path / "teaser.png"
+    _out_path, teaser_path, found = _render_with_teaser_spy(_image_pdf(600, 400), tmp_path)
 
-    assert extract_teaser_image(_image_pdf(600, 400), out_path) is True
-    assert out_path.exists()
-    assert out_path.stat().st_size > 0
+    assert found and found[0] is not None
+    assert teaser_path.stat().st_size > 0
 
 
 def test_extract_teaser_rejects_text_only_pdf(tmp_path):
-    out_path = tmp_path / "teaser.png"
+    out_path, teaser_path, found = _render_with_teaser_spy(_text_pdf(), tmp_path)
 
-    assert extract_teaser_image(_text_pdf(), out_path) is False
-    assert not out_path.exists()
+    # No qualifying figure: the teaser falls back to the page-1 render.
+    assert found == [None]
+    assert teaser_path.read_bytes() == out_path.read_bytes()
 
 
 def test_extract_teaser_handles_invalid_bytes(tmp_path):
-    out_path = tmp_path / "teaser.png"
+    out_path = tmp_path / "1234.5678.png"
+    teaser_path = tmp_path / "1234.5678_teaser.png"
+
+    with pytest.raises(Exception):
+        _write_missing_renders(b"not a pdf", out_path, teaser_path, DEFAULT_THUMBNAIL_DPI)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rerender_replaces_stale_variants(tmp_path):
+    static_dir = tmp_path / "static"
+    generate_previews("1234.5678", "http://fake.pdf", static_dir, pdf_content=_image_pdf(1200, 800))
+    out_path = static_dir / "thumbnails" / "1234.5678.png"
+    stale = {path: path.read_bytes() for path in out_path.parent.glob("1234.5678-*w.*")}
+    assert stale
 
-    assert extract_teaser_image(b"not a pdf", out_path) is False
-    assert not out_path.exists()
+    # A re-render (the PNG was dropped) must not keep the old render's variants.
+    out_path.unlink()
+    generate_previews("1234.5678", "http://fake.pdf", static_dir, pdf_content=_image_pdf(1200, 400))
+
+    for path, old_bytes in stale.items():
+        assert path.read_bytes() != old_bytes
+        assert path.stat().st_mtime_ns <= out_path.stat().st_mtime_ns
+
+
+def test_generate_previews_opens_pdf_once_and_writes_variants(tmp_path):
+    import app.services.thumbnail_generator as tg
+
+    static_dir = tmp_path / "static"
+    real_open = tg.pdfplumber.open
+    with patch("app.services.thumbnail_generator.pdfplumber.open", side_effect=real_open) as spy_open:
+        stats = generate_previews("1234.5678", "http://fake.pdf", static_dir, pdf_content=_image_pdf(1200, 800))
+
+    assert stats.ok and stats.rendered
+    spy_open.assert_called_once()
+    thumbnails_dir = static_dir / "thumbnails"
+    for image_path in (thumbnails_dir / "1234.5678.png", thumbnails_dir / "1234.5678_teaser.png"):
+        assert image_path.exists()
+        for width in VARIANT_WIDTHS:
+            for fmt in preview_formats():
+                assert variant_path(image_path, width, fmt).stat().st_size > 0
+    assert stats.variant_bytes > 0
+    assert stats.png_bytes > stats.bytes_saved > 0
+    assert stats.render_seconds > 0
+
+
+def test_generate_previews_encodes_variants_for_existing_pngs_without_download(tmp_path):
+    from PIL import Image
+
+    static_dir = tmp_path / "static"
+    thumbnails_dir = static_dir / "thumbnails"
+    thumbnails_dir.mkdir(parents=True)
+    for name in ("1234.5678.png", "1234.5678_teaser.png"):
+        Image.new("RGB", (1000, 1300), color=(240, 240, 240)).save(thumbnails_dir / name)
+
+    with patch("app.services.thumbnail_generator.request_with_backoff") as mock_req:
+        stats = generate_previews("1234.5678", "http://fake.pdf", static_dir)
+        again = generate_previews("1234.5678", "http://fake.pdf", static_dir)
+
+    mock_req.assert_not_called()
+    assert stats.rendered and stats.variant_bytes > 0
+    assert again.ok and not again.rendered  # everything cached now
+    with Image.open(variant_path(thumbnails_dir / "1234.5678.png", VARIANT_WIDTHS[0], "webp")) as small:
+        assert small.width == VARIANT_WIDTHS[0]
 
 
 def test_thumbnail_warmer_dedupes_in_flight_keys(monkeypatch):
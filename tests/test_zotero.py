@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import json
 import tempfile
+import threading
+import time
 import unittest
 from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlsplit
 
-from app.services.zotero import ZoteroClient
+import requests
+
+from app.services.zotero import ZoteroClient, needs_zotero_sync, zotero_fingerprint
+from tests.helpers import route_session_requests_to_verb_mocks
 
 
 def _make_paper():
@@ -22,6 +30,9 @@ def _make_paper():
     paper.pdf_link = "https://arxiv.org/pdf/2603.12345"
     paper.abstract_text = "An abstract."
     paper.publication_dt = date(2026, 3, 13)
+    paper.zotero_item_key = None
+    paper.zotero_item_version = None
+    paper.zotero_synced_hash = None
     return paper
 
 
@@ -30,6 +41,7 @@ class ZoteroClientTests(unittest.TestCase):
         self._tmpdir = tempfile.TemporaryDirectory()
         self.tmpdir = Path(self._tmpdir.name)
         self.creds_path = self.tmpdir / ".zotero_credentials"
+        route_session_requests_to_verb_mocks(self)
 
     def tearDown(self):
         self._tmpdir.cleanup()
@@ -155,13 +167,42 @@ class ZoteroClientTests(unittest.TestCase):
 
         self.assertTrue(result["success"])
         self.assertEqual(result["synced_count"], 75)
-        # Should be 2 batches: 50 + 25
+        # Should be 2 batches: 50 + 25 (posted concurrently, so in either order)
         self.assertEqual(mock_post.call_count, 2)
+        batch_sizes = sorted(len(call.kwargs["json"]) for call in mock_post.call_args_list)
+        self.assertEqual(batch_sizes, [25, 50])
+
+    @patch("app.services.zotero.requests.post")
+    def test_sync_stops_after_failed_batch_without_hanging(self, mock_post):
+        # More batches than workers: the queued ones must be skipped, not cancelled
+        # underneath as_completed (which then waited forever on them).
+        self._write_creds()
+        ok = Mock(status_code=200)
+        ok.raise_for_status = Mock()
+        denied = Mock(status_code=403)
+        denied.raise_for_status = Mock(side_effect=requests.HTTPError("403 Forbidden"))
+        calls = []
+
+        def post(*args, **kwargs):
+            calls.append(kwargs["json"])
+            return denied if len(calls) == 1 else ok
+
+        mock_post.side_effect = post
+        client = ZoteroClient(credentials_path=self.creds_path, concurrency=1)
+
+        result_box = {}
+        worker = threading.Thread(
+            target=lambda: result_box.update(result=client.sync_saved_papers([_make_paper() for _ in range(500)]))
+        )
+        worker.start()
+        worker.join(timeout=10)
 
-        first_batch = mock_post.call_args_list[0].kwargs.get("json") or mock_post.call_args_list[0][1].get("json")
-        second_batch = mock_post.call_args_list[1].kwargs.get("json") or mock_post.call_args_list[1][1].get("json")
-        self.assertEqual(len(first_batch), 50)
-        self.assertEqual(len(second_batch), 25)
+        self.assertFalse(worker.is_alive(), "sync hung after a failed batch")
+        result = result_box["result"]
+        self.assertFalse(result["success"])
+        self.assertIn("403 Forbidden", result["message"])
+        self.assertEqual(result["synced_count"], 0)
+        self.assertEqual(len(calls), 1)
 
     @patch("app.services.zotero.requests.post")
     def test_sync_returns_created_item_keys(self, mock_post):
@@ -211,3 +252,248 @@ class ZoteroClientTests(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertEqual(result["synced_count"], 0)
         mock_post.assert_not_called()
+
+
+class _FakeZoteroLibrary:
+    """In-memory Zotero user library behind a local HTTP server (Web API v3 write semantics)."""
+
+    def __init__(self, api_key="test-key", user_id="12345"):
+        self.api_key = api_key
+        self.user_id = user_id
+        self.items: dict[str, dict] = {}
+        self.library_version = 0
+        self.writes: list[list[dict]] = []
+        self.write_tokens: set[str] = set()
+        self.client_ports: set[int] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.version_requests = 0
+        self.lock = threading.Lock()
+
+    def write(self, items: list[dict]) -> dict:
+        result: dict = {"successful": {}, "unchanged": {}, "failed": {}}
+        with self.lock:
+            self.writes.append(items)
+            self.library_version += 1
+            for idx, item in enumerate(items):
+                idx = str(idx)
+                key = item.get("key")
+                if key is None:
+                    key = f"ITEM{len(self.items):04d}"
+                    self.items[key] = {"version": self.library_version, "data": item}
+                    result["successful"][idx] = {"key": key, "version": self.library_version}
+                    continue
+                stored = self.items.get(key)
+                if stored is None:
+                    result["failed"][idx] = {"key": key, "code": 404, "message": "Item not found"}
+                elif item.get("version") != stored["version"]:
+                    result["failed"][idx] = {"key": key, "code": 412, "message": "Item has been modified"}
+                else:
+                    fields = {k: v for k, v in item.items() if k not in ("key", "version")}
+                    if all(stored["data"].get(k) == v for k, v in fields.items()):
+                        result["unchanged"][idx] = key
+                        continue
+                    stored["data"] = {**stored["data"], **fields}
+                    stored["version"] = self.library_version
+                    result["successful"][idx] = {"key": key, "version": self.library_version}
+        return result
+
+    def serve(self) -> ThreadingHTTPServer:
+        library = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _authorized(self):
+                library.client_ports.add(self.client_address[1])
+                if self.headers.get("Zotero-API-Key") != library.api_key:
+                    self._reply(403, {"message": "Forbidden"})
+                    return False
+                return True
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                query = parse_qs(urlsplit(self.path).query)
+                if query.get("format") == ["versions"]:
+                    keys = query.get("itemKey", [""])[0].split(",")
+                    with library.lock:
+                        versions = {key: library.items[key]["version"] for key in keys if key in library.items}
+                    library.version_requests += 1
+                    self._reply(200, versions)
+                    return
+                self._reply(200, [])
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not self._authorized():
+                    return
+                if self.path != f"/users/{library.user_id}/items":
+                    self._reply(404, {"message": "Not found"})
+                    return
+                token = self.headers.get("Zotero-Write-Token")
+                with library.lock:
+                    if token in library.write_tokens:
+                        replay = True
+                    else:
+                        replay = False
+                        library.write_tokens.add(token)
+                        library.in_flight += 1
+                        library.max_in_flight = max(library.max_in_flight, library.in_flight)
+                if replay:
+                    self._reply(412, {"message": "Write token already used"})
+                    return
+                try:
+                    time.sleep(0.1)  # long enough for concurrent batches to overlap
+                    self._reply(200, library.write(json.loads(body)))
+                finally:
+                    with library.lock:
+                        library.in_flight -= 1
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _paper(idx: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        title=f"Paper {idx}",
+        authors="Alice Smith, Bob Jones",
+        arxiv_id=f"2603.{idx:05d}",
+        link=f"https://arxiv.org/abs/2603.{idx:05d}",
+        abstract_text="An abstract.",
+        publication_dt=date(2026, 3, 13),
+        zotero_item_key=None,
+        zotero_item_version=None,
+        zotero_synced_hash=None,
+    )
+
+
+class FakeZoteroApiSyncTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.creds_path = Path(self._tmpdir.name) / ".zotero_credentials"
+        self.creds_path.write_text(json.dumps({"api_key": "test-key", "user_id": "12345"}), encoding="utf-8")
+        self.library = _FakeZoteroLibrary()
+        server = self.library.serve()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.client = ZoteroClient(
+            credentials_path=self.creds_path,
+            api_base=f"http://127.0.0.1:{server.server_port}",
+            concurrency=2,
+        )
+        self.addCleanup(self.client.session.close)
+
+    def _sync(self, papers):
+        """Push the papers that need it and record the outcome the way the settings route does."""
+        pending = [paper for paper in papers if needs_zotero_sync(paper)]
+        result = self.client.sync_saved_papers(pending, collection_key="COL1")
+        for idx, key in result["item_keys"].items():
+            pending[idx].zotero_item_key = key
+            pending[idx].zotero_item_version = result["item_versions"].get(idx, pending[idx].zotero_item_version)
+            if idx not in result["conflicts"]:
+                pending[idx].zotero_synced_hash = zotero_fingerprint(pending[idx])
+        return pending, result
+
+    def test_sync_posts_batches_concurrently_over_pooled_connections(self):
+        papers = [_paper(i) for i in range(120)]
+
+        _pending, result = self._sync(papers)
+
+        self.assertTrue(result["success"], result["message"])
+        self.assertEqual(result["synced_count"], 120)
+        self.assertEqual(sorted(len(batch) for batch in self.library.writes), [20, 50, 50])
+        self.assertEqual(len(self.library.items), 120)
+        self.assertEqual({paper.zotero_item_key for paper in papers}, set(self.library.items))
+        self.assertTrue(all(paper.zotero_item_version for paper in papers))
+        self.assertTrue(all(item["data"]["collections"] == ["COL1"] for item in self.library.items.values()))
+        # Bounded: at most `concurrency` batches in flight, each on a kept-alive pooled connection.
+        self.assertEqual(self.library.max_in_flight, 2)
+        self.assertLessEqual(len(self.library.client_ports), 2)
+
+    def test_resync_pushes_only_changed_papers_as_versioned_updates(self):
+        papers = [_paper(i) for i in range(3)]
+        self._sync(papers)
+        self.library.writes.clear()
+
+        pending, _result = self._sync(papers)
+        self.assertEqual(pending, [])
+        self.assertEqual(self.library.writes, [])
+
+        papers[1].title = "Paper 1 (v2)"
+        old_version = papers[1].zotero_item_version
+        pending, result = self._sync(papers)
+
+        self.assertEqual(pending, [papers[1]])
+        self.assertTrue(result["success"], result["message"])
+        (write,) = self.library.writes
+        self.assertEqual(len(write), 1)
+        self.assertEqual(write[0]["key"], papers[1].zotero_item_key)
+        self.assertEqual(write[0]["version"], old_version)
+        self.assertNotIn("collections", write[0])
+        stored = self.library.items[papers[1].zotero_item_key]
+        self.assertEqual(stored["data"]["title"], "Paper 1 (v2)")
+        self.assertEqual(stored["data"]["collections"], ["COL1"])
+        self.assertGreater(papers[1].zotero_item_version, old_version)
+        self.assertEqual(len(self.library.items), 3)
+        self.assertFalse(any(needs_zotero_sync(paper) for paper in papers))
+
+    def test_update_rejected_when_item_changed_in_zotero(self):
+        papers = [_paper(0)]
+        self._sync(papers)
+        self.library.items[papers[0].zotero_item_key]["version"] += 5
+        papers[0].title = "Edited locally"
+
+        _pending, result = self._sync(papers)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["synced_count"], 0)
+        self.assertIn("rejected 1", result["message"])
+
+    def test_rejected_update_adopts_zotero_version_and_reports_the_conflict(self):
+        papers = [_paper(0)]
+        self._sync(papers)
+        key = papers[0].zotero_item_key
+        self.library.items[key]["version"] += 5
+        self.library.items[key]["data"]["title"] = "Edited in Zotero"
+        papers[0].title = "Edited locally"
+
+        _pending, result = self._sync(papers)
+
+        self.assertEqual(result["conflicts"], [0])
+        self.assertIn("1 were edited in Zotero", result["message"])
+        self.assertEqual(self.library.version_requests, 1)
+        self.assertEqual(papers[0].zotero_item_version, self.library.items[key]["version"])
+        self.assertEqual(self.library.items[key]["data"]["title"], "Edited in Zotero")
+        # The local edit was never pushed, so it isn't marked as synced...
+        self.assertTrue(needs_zotero_sync(papers[0]))
+
+        # ...and the next sync sends it as an update of Zotero's current version.
+        _pending, result = self._sync(papers)
+
+        self.assertTrue(result["success"], result["message"])
+        self.assertEqual(result["conflicts"], [])
+        self.assertEqual(self.library.items[key]["data"]["title"], "Edited locally")
+        self.assertFalse(needs_zotero_sync(papers[0]))
+
+        self.library.writes.clear()
+        papers[0].title = "Edited locally again"
+        pending, result = self._sync(papers)
+
+        self.assertEqual(pending, papers)
+        self.assertTrue(result["success"], result["message"])
+        self.assertEqual(self.library.items[key]["data"]["title"], "Edited locally again")